@@ -0,0 +1,291 @@
+"""Serialize-once, per-client-queued WebSocket fan-out.
+
+A broadcast encodes its frame once and drops it into every client's bounded
+outbound queue; each client has its own writer task draining that queue.
+Broadcasting never awaits a socket, so one slow client cannot stall the
+state loop or the other clients.
+
+Slow clients lose frames rather than fall behind:
+- Keyed frames (e.g. ``bear_state``) are latest-wins: a newer frame with the
+  same key replaces the queued one in place.
+- When the queue is full the oldest frame is dropped.
+- A client whose pending send makes no progress for ``heartbeat_timeout``
+  seconds is disconnected.
+
+Clients choose which topics they receive (``TOPICS``), optionally with a
+per-topic rate cap; periodic producers ask ``due`` before sending a topic
+update to a client and ``mark_sent`` after.
+"""
+
+import asyncio
+import json
+import logging
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+from fastapi import WebSocket
+
+from backend.core.metrics import metrics
+
+# Optional orjson import (several times faster than json for state frames)
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+FRAMES_SENT = metrics.counter("ruxpin_websocket_frames_sent_total", "WebSocket frames sent")
+BYTES_SENT = metrics.counter(
+    "ruxpin_websocket_bytes_sent_total",
+    "WebSocket payload bytes sent (text frames counted UTF-8 encoded)",
+)
+
+DEFAULT_QUEUE_SIZE = 64
+DEFAULT_HEARTBEAT_TIMEOUT = 5.0
+
+# Topics a client can subscribe to
+TOPICS = ("state", "gpio", "logs", "metrics", "jobs")
+
+# Topics a client receives until it subscribes explicitly
+DEFAULT_TOPICS = ("state", "gpio", "logs")
+
+# Early-arrival allowance for rate-capped topics, so a producer's tick jitter
+# doesn't push a due update to the following tick
+_RATE_SLACK = 0.01
+
+
+def encode_frame(message: dict[str, Any]) -> str:
+    """Serialize a message to a JSON text frame.
+
+    Args:
+        message: JSON-compatible message
+
+    Returns:
+        Encoded frame
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(message, separators=(",", ":"), default=str)
+
+
+def frame_size(frame: str | bytes) -> int:
+    """Get the size of a frame on the wire.
+
+    Args:
+        frame: Encoded frame (text, or bytes for a binary frame)
+
+    Returns:
+        Payload size in bytes (text frames are sent UTF-8 encoded)
+    """
+    if isinstance(frame, bytes) or frame.isascii():
+        # isascii() is a flag check on str, so ASCII frames are not re-encoded
+        return len(frame)
+    return len(frame.encode("utf-8"))
+
+
+class ClientChannel:
+    """Bounded outbound queue and writer task for one WebSocket client.
+
+    Attributes:
+        websocket: Client connection
+        telemetry: Telemetry format the client negotiated ("json" or "binary")
+        max_size: Maximum number of queued frames
+        heartbeat_timeout: Seconds a send may stall before the client is dropped
+        sent: Frames written to the socket
+        dropped: Frames discarded because the queue was full
+        coalesced: Keyed frames replaced by a newer frame before being sent
+        topics: Minimum seconds between updates (0 = uncapped) per subscribed topic
+        state_seq: State sequence number the client was last brought up to
+        telemetry_sent: ``(seq, amplitude)`` carried by the last binary telemetry frame
+        log_level: Least severe log level streamed to the client
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        on_close: Callable[["ClientChannel"], None],
+        max_size: int = DEFAULT_QUEUE_SIZE,
+        heartbeat_timeout: float = DEFAULT_HEARTBEAT_TIMEOUT,
+    ) -> None:
+        """Initialize the channel and start its writer.
+
+        Args:
+            websocket: Accepted client connection
+            on_close: Called once when the writer stops for any reason
+            max_size: Maximum number of queued frames
+            heartbeat_timeout: Seconds a send may stall before the client is dropped
+        """
+        self.websocket = websocket
+        self.telemetry = "json"
+        self.max_size = max_size
+        self.heartbeat_timeout = heartbeat_timeout
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.topics: dict[str, float] = dict.fromkeys(DEFAULT_TOPICS, 0.0)
+        self.state_seq: int | None = None
+        self.telemetry_sent: tuple[int, int] | None = None
+        self.log_level = logging.INFO
+        self._topic_sent: dict[str, float] = {}
+
+        # Queue entries are frames, or keys into _keyed for latest-wins frames
+        self._queue: deque[tuple[str | None, str | bytes]] = deque()
+        self._keyed: dict[str, str | bytes] = {}
+        self._ready = asyncio.Event()
+        self._on_close = on_close
+        self._closed = False
+        self._writer = asyncio.create_task(self._write_loop())
+
+    @property
+    def closed(self) -> bool:
+        """Whether the channel has stopped accepting frames."""
+        return self._closed
+
+    def __len__(self) -> int:
+        """Get the number of queued frames."""
+        return len(self._queue)
+
+    def subscribe(self, topic: str, max_rate: float | None = None) -> None:
+        """Start receiving a topic (or change its rate cap).
+
+        Args:
+            topic: Topic name
+            max_rate: Maximum updates per second, or None for every update
+        """
+        self.topics[topic] = 1.0 / max_rate if max_rate else 0.0
+        self._topic_sent.pop(topic, None)
+
+    def unsubscribe(self, topic: str) -> None:
+        """Stop receiving a topic.
+
+        Args:
+            topic: Topic name
+        """
+        self.topics.pop(topic, None)
+        self._topic_sent.pop(topic, None)
+        if topic == "state":
+            # Bring the client back with a snapshot if it resubscribes
+            self.state_seq = None
+            self.telemetry_sent = None
+
+    def due(self, topic: str, now: float) -> bool:
+        """Check whether the client should get a topic update now.
+
+        Args:
+            topic: Topic name
+            now: Current loop time
+
+        Returns:
+            True if the client subscribes to the topic and its rate cap allows
+            an update
+        """
+        interval = self.topics.get(topic)
+        if interval is None:
+            return False
+        if not interval:
+            return True
+        last = self._topic_sent.get(topic)
+        return last is None or now - last >= interval - _RATE_SLACK
+
+    def mark_sent(self, topic: str, now: float) -> None:
+        """Record that a rate-capped topic update was queued.
+
+        Args:
+            topic: Topic name
+            now: Current loop time
+        """
+        if self.topics.get(topic):
+            self._topic_sent[topic] = now
+
+    def enqueue(self, frame: str | bytes, key: str | None = None) -> None:
+        """Queue a frame without waiting for the socket.
+
+        Args:
+            frame: Encoded frame (text, or bytes for a binary frame)
+            key: Latest-wins key; replaces a queued frame with the same key
+        """
+        if self._closed:
+            return
+
+        if key is not None and key in self._keyed:
+            self._keyed[key] = frame
+            self.coalesced += 1
+            return
+
+        if len(self._queue) >= self.max_size:
+            old_key, _ = self._queue.popleft()
+            if old_key is not None:
+                del self._keyed[old_key]
+            self.dropped += 1
+
+        if key is not None:
+            self._keyed[key] = frame
+        self._queue.append((key, frame))
+        self._ready.set()
+
+    def _next_frame(self) -> str | bytes:
+        """Pop the oldest queued frame."""
+        key, frame = self._queue.popleft()
+        if key is not None:
+            frame = self._keyed.pop(key)
+        return frame
+
+    async def _write_loop(self) -> None:
+        """Drain the queue to the socket until closed or the client stalls."""
+        try:
+            while True:
+                await self._ready.wait()
+                while self._queue:
+                    frame = self._next_frame()
+                    if isinstance(frame, bytes):
+                        send = self.websocket.send_bytes(frame)
+                    else:
+                        send = self.websocket.send_text(frame)
+                    await asyncio.wait_for(send, timeout=self.heartbeat_timeout)
+                    self.sent += 1
+                    FRAMES_SENT.inc()
+                    BYTES_SENT.inc(frame_size(frame))
+                self._ready.clear()
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"WebSocket client stalled for {self.heartbeat_timeout}s, disconnecting "
+                f"({len(self._queue)} frames queued)"
+            )
+            await self._abort()
+        except Exception as e:
+            logger.debug(f"WebSocket send failed: {e}")
+            await self._abort()
+        finally:
+            self._closed = True
+            self._on_close(self)
+
+    async def _abort(self) -> None:
+        """Close the underlying socket after a failed or stalled send."""
+        try:
+            await asyncio.wait_for(self.websocket.close(code=1011), timeout=1.0)
+        except Exception:
+            pass
+
+    def close(self) -> None:
+        """Stop the writer and discard queued frames."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.clear()
+        self._keyed.clear()
+        self._writer.cancel()
+
+    def stats(self) -> dict[str, int]:
+        """Get per-client delivery statistics."""
+        return {
+            "queued": len(self._queue),
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+        }
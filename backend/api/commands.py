@@ -0,0 +1,76 @@
+"""Per-connection background command execution.
+
+Long-running commands (speech, playback, replay, servo moves) run as tasks
+owned by the connection that sent them instead of being awaited in its
+receive loop, so control messages (volume, blink, GPIO status, ...) are
+still read and answered while the bear talks.
+
+Each connection may run a bounded number of commands at once; further
+commands are rejected rather than queued. Commands still running when the
+client disconnects are cancelled.
+"""
+
+import asyncio
+import logging
+from collections.abc import Coroutine
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COMMAND_LIMIT = 4
+
+
+class CommandRunner:
+    """Tracks the background commands of one WebSocket connection.
+
+    Attributes:
+        limit: Maximum number of commands running at once
+    """
+
+    def __init__(self, limit: int = DEFAULT_COMMAND_LIMIT) -> None:
+        """Initialize an idle runner.
+
+        Args:
+            limit: Maximum number of commands running at once
+        """
+        self.limit = limit
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    @property
+    def running(self) -> int:
+        """Get the number of commands still running."""
+        return len(self._tasks)
+
+    def submit(self, name: str, command: Coroutine[Any, Any, None]) -> asyncio.Task[None] | None:
+        """Start a command in the background.
+
+        Args:
+            name: Command name (used for the task name and logging)
+            command: Coroutine running the command
+
+        Returns:
+            The command task, or None if the connection is at its limit
+            (the coroutine is closed without running)
+        """
+        if len(self._tasks) >= self.limit:
+            command.close()
+            logger.warning(f"Rejected '{name}': {self.limit} commands already running")
+            return None
+
+        task = asyncio.create_task(command, name=f"command:{name}")
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def cancel_all(self) -> None:
+        """Cancel all running commands.
+
+        Does not wait for them: this runs while a connection is being torn
+        down, when the endpoint itself may already be cancelled. The
+        commands unwind on their next await.
+        """
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            logger.info(f"Cancelled {len(tasks)} running commands")
@@ -0,0 +1,60 @@
+"""Admin endpoints, authenticated with the admin token."""
+
+import asyncio
+import threading
+import time
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+
+from backend.core.exceptions import ProfilerError
+from backend.core.profiler import DEFAULT_INTERVAL, MAX_SECONDS, MIN_INTERVAL, profiler
+from backend.dependencies import AdminDep
+
+router = APIRouter(prefix="/api", tags=["admin"])
+
+
+@router.post("/admin/profile", response_class=PlainTextResponse)
+async def profile(
+    _: AdminDep,
+    seconds: float = Query(default=10.0, gt=0, le=MAX_SECONDS, description="Capture length"),
+    interval_ms: float = Query(
+        default=1000 * DEFAULT_INTERVAL,
+        ge=1000 * MIN_INTERVAL,
+        le=1000,
+        description="Time between samples",
+    ),
+) -> PlainTextResponse:
+    """Sample the stacks of every thread of the running process.
+
+    The request returns when the capture ends. The response is a
+    flamegraph-ready file in the collapsed stack format, e.g. for
+    ``flamegraph.pl profile.folded > profile.svg`` or speedscope.
+
+    Args:
+        seconds: How long to sample
+        interval_ms: Time between samples, in milliseconds
+
+    Returns:
+        Collapsed stacks, with sample count and sampling overhead in headers
+
+    Raises:
+        HTTPException: 409 if another capture is running
+    """
+    loop_thread = threading.get_ident()
+    try:
+        result = await asyncio.to_thread(
+            profiler.capture, seconds, interval_ms / 1000, loop_thread=loop_thread
+        )
+    except ProfilerError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    filename = time.strftime("ruxpin-%Y%m%d-%H%M%S.folded")
+    return PlainTextResponse(
+        result.collapsed(),
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "X-Profile-Samples": str(result.samples),
+            "X-Profile-Overhead": f"{result.overhead:.4f}",
+        },
+    )
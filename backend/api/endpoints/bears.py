@@ -0,0 +1,51 @@
+"""Multi-bear endpoints."""
+
+from typing import Any
+
+from fastapi import APIRouter, HTTPException
+
+from backend.dependencies import BearRegistryDep
+
+router = APIRouter(prefix="/api/bears", tags=["bears"])
+
+
+@router.get("")
+async def list_bears(bear_registry: BearRegistryDep) -> dict[str, Any]:
+    """List the bears hosted by this process.
+
+    Args:
+        bear_registry: Bear registry
+
+    Returns:
+        Bear IDs and the ID served on the unaddressed API
+    """
+    return {
+        "bears": bear_registry.ids(),
+        "default": bear_registry.default.bear_id,
+        "audio_cache": bear_registry.audio_cache.stats(),
+    }
+
+
+@router.get("/{bear_id}/status")
+async def bear_status(bear_id: str, bear_registry: BearRegistryDep) -> dict[str, Any]:
+    """Get the status of one bear.
+
+    Args:
+        bear_id: Bear ID
+        bear_registry: Bear registry
+
+    Returns:
+        Bear state and drift statistics
+
+    Raises:
+        HTTPException: If no bear has this ID
+    """
+    if bear_id not in bear_registry.bears:
+        raise HTTPException(status_code=404, detail=f"Unknown bear: {bear_id}")
+
+    bear_service = bear_registry.get(bear_id)
+    return {
+        "id": bear_id,
+        "bear": bear_service.get_snapshot().data,
+        "drift": bear_service.get_drift_stats(),
+    }
@@ -4,9 +4,13 @@ import platform
 from typing import Any
 
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
 
 from backend import __version__
-from backend.dependencies import BearServiceDep, SettingsDep
+from backend.api.websocket import get_manager
+from backend.core.watchdog import watchdog
+from backend.dependencies import BearRegistryDep, BearServiceDep, SettingsDep
+from backend.services.qos import qos
 
 router = APIRouter(prefix="/api", tags=["health"])
 
@@ -24,6 +28,25 @@ async def health_check() -> dict[str, str]:
     }
 
 
+@router.get("/ready")
+async def readiness(bear_registry: BearRegistryDep) -> JSONResponse:
+    """Readiness endpoint: whether startup has finished.
+
+    The service answers requests as soon as every bear takes commands;
+    opening the eyes, loading phrases, syncing the mixer and warming up
+    TTS finish afterwards.
+
+    Args:
+        bear_registry: Bear registry
+
+    Returns:
+        Overall readiness and each startup step's state and timing, with
+        status 200 once ready and 503 until then (or if a step failed)
+    """
+    status = bear_registry.startup.status()
+    return JSONResponse(status, status_code=200 if status["ready"] else 503)
+
+
 @router.get("/status")
 async def system_status(
     settings: SettingsDep,
@@ -38,7 +61,7 @@ async def system_status(
     Returns:
         System status information
     """
-    bear_state = bear_service.get_state()
+    bear_state = bear_service.get_snapshot().data
 
     return {
         "version": __version__,
@@ -46,4 +69,10 @@ async def system_status(
         "platform": platform.system(),
         "bear": bear_state,
         "phrases_count": len(bear_service.get_phrases()),
+        "drift": bear_service.get_drift_stats(),
+        "websocket": get_manager(bear_service.bear_id).stats(),
+        "puppet": bear_service.puppet_channel.stats(),
+        "power": bear_service.get_power_stats(),
+        "qos": qos.stats(),
+        "watchdog": watchdog.stats(),
     }
@@ -0,0 +1,36 @@
+"""Log history endpoints."""
+
+from typing import Any
+
+from fastapi import APIRouter, Query
+
+from backend.logging_config import DEFAULT_LOG_CAPACITY, log_store
+
+router = APIRouter(prefix="/api", tags=["logs"])
+
+
+@router.get("/logs")
+async def log_history(
+    after: int | None = Query(default=None, ge=0, description="Read records after this seq"),
+    before: int | None = Query(default=None, ge=1, description="Read records before this seq"),
+    limit: int = Query(default=100, ge=1, le=DEFAULT_LOG_CAPACITY),
+) -> dict[str, Any]:
+    """Get a page of recent log records.
+
+    Without a cursor this returns the newest records. Page forward by
+    passing the last returned ``seq`` as ``after``, or backward by passing
+    the first returned ``seq`` as ``before``.
+
+    Args:
+        after: Return the oldest records newer than this sequence number
+        before: Return the newest records older than this sequence number
+        limit: Maximum number of records
+
+    Returns:
+        Records (oldest first) and the range of sequence numbers still kept
+    """
+    return {
+        "records": log_store.read(after=after, before=before, limit=limit),
+        "first_seq": log_store.first_seq,
+        "last_seq": log_store.last_seq,
+    }
@@ -0,0 +1,22 @@
+"""Prometheus metrics endpoint."""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from backend.core.metrics import metrics
+
+router = APIRouter(prefix="/api", tags=["metrics"])
+
+# Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics() -> PlainTextResponse:
+    """Get the process's metrics in the Prometheus text format.
+
+    Returns:
+        Counters, gauges and histograms of the hot paths (TTS, audio,
+        servos, GPIO, WebSocket delivery, control loop lag)
+    """
+    return PlainTextResponse(metrics.exposition(), media_type=CONTENT_TYPE)
@@ -0,0 +1,46 @@
+"""Job trace endpoints."""
+
+from typing import Any
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import JSONResponse
+
+from backend.core.tracing import tracer
+
+router = APIRouter(prefix="/api", tags=["traces"])
+
+
+@router.get("/traces")
+async def list_traces() -> dict[str, Any]:
+    """List the recent jobs whose traces are kept.
+
+    Returns:
+        One summary per job (ID, command, start time, duration), newest first
+    """
+    return {"traces": tracer.recent()}
+
+
+@router.get("/traces/{job_id}")
+async def get_trace(job_id: str) -> JSONResponse:
+    """Export a recent job's trace in the Chrome trace event format.
+
+    Open the file with ``chrome://tracing`` or https://ui.perfetto.dev.
+
+    Args:
+        job_id: ID of the job (the command's ``id``)
+
+    Returns:
+        Chrome trace of the job's steps
+
+    Raises:
+        HTTPException: If the job is unknown or no longer kept
+    """
+    trace = tracer.get(job_id)
+    if trace is None:
+        raise HTTPException(status_code=404, detail=f"No trace for job '{job_id}'")
+
+    filename = "".join(c if c.isalnum() or c in "-_" else "_" for c in job_id)
+    return JSONResponse(
+        trace.chrome(),
+        headers={"Content-Disposition": f'attachment; filename="trace-{filename}.json"'},
+    )
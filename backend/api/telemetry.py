@@ -0,0 +1,154 @@
+"""Compact binary telemetry frames.
+
+Position telemetry is the highest-volume traffic on the WebSocket. Clients
+that send ``set_telemetry`` with ``format: "binary"`` receive it as
+fixed-layout binary frames instead of JSON; control messages stay JSON.
+
+Frame layout (little-endian)::
+
+    u8   version          TELEMETRY_VERSION
+    u8   flags            bit 0: bear is busy
+    u16  actuator count   N
+    u32  seq              state sequence number
+    u32  base             sequence number the previous telemetry frame carried
+    f64  timestamp        Unix time in seconds
+    u16  amplitude        current audio amplitude (clamped)
+    N x (u8 position, u8 state)   in ``telemetry_schema`` actuator order
+    u32  active pins      bit n set: GPIO n is set up
+    u32  high pins        bit n set: GPIO n is driven high
+
+Actuator names and the state codes are sent once as a ``telemetry_schema``
+JSON message when the client switches to binary.
+"""
+
+import struct
+import time
+from typing import Any
+
+from backend.core.enums import State
+
+TELEMETRY_VERSION = 1
+
+# State codes in telemetry frames
+STATE_CODES = {State.CLOSED: 0, State.OPEN: 1, State.UNKNOWN: 2}
+_STATES = {code: state for state, code in STATE_CODES.items()}
+
+_HEADER = "<BBHIIdH"
+_PINS = "II"
+
+# State fields carried by binary telemetry (omitted from binary clients' JSON deltas)
+TELEMETRY_FIELDS = frozenset({"eyes", "mouth", "eyes_position", "mouth_position", "actuators"})
+
+
+class TelemetryCodec:
+    """Encoder/decoder for one bear's telemetry frames.
+
+    The struct layout depends on the number of actuators, so it is compiled
+    once per rig.
+
+    Attributes:
+        actuator_names: Actuator order within frames
+    """
+
+    def __init__(self, actuator_names: list[str]) -> None:
+        """Compile the frame layout for a rig.
+
+        Args:
+            actuator_names: Actuator names in frame order
+        """
+        self.actuator_names = list(actuator_names)
+        count = len(self.actuator_names)
+        self._struct = struct.Struct(_HEADER + "BB" * count + _PINS)
+
+    @property
+    def size(self) -> int:
+        """Get the frame size in bytes."""
+        return self._struct.size
+
+    def schema(self) -> dict[str, Any]:
+        """Describe the frame layout for clients.
+
+        Returns:
+            Schema sent as the ``telemetry_schema`` message
+        """
+        return {
+            "version": TELEMETRY_VERSION,
+            "format": self._struct.format,
+            "size": self.size,
+            "actuators": self.actuator_names,
+            "states": {state.value: code for state, code in STATE_CODES.items()},
+        }
+
+    def encode(
+        self,
+        seq: int,
+        base: int,
+        positions: list[tuple[int, State]],
+        amplitude: int = 0,
+        pins: dict[int, bool] | None = None,
+        busy: bool = False,
+        timestamp: float | None = None,
+    ) -> bytes:
+        """Pack one telemetry frame.
+
+        Args:
+            seq: State sequence number
+            base: Sequence number of the previous state
+            positions: ``(position_percent, state)`` per actuator, in frame order
+            amplitude: Current audio amplitude
+            pins: GPIO pin levels keyed by BCM pin number
+            busy: Whether the bear is busy
+            timestamp: Unix time in seconds (defaults to now)
+
+        Returns:
+            Encoded frame
+        """
+        active = high = 0
+        for pin, level in (pins or {}).items():
+            active |= 1 << pin
+            if level:
+                high |= 1 << pin
+
+        values: list[int] = []
+        for position, state in positions:
+            values.append(max(0, min(100, int(position))))
+            values.append(STATE_CODES[state])
+
+        return self._struct.pack(
+            TELEMETRY_VERSION,
+            1 if busy else 0,
+            len(positions),
+            seq & 0xFFFFFFFF,
+            base & 0xFFFFFFFF,
+            time.time() if timestamp is None else timestamp,
+            max(0, min(0xFFFF, int(amplitude))),
+            *values,
+            active,
+            high,
+        )
+
+    def decode(self, frame: bytes) -> dict[str, Any]:
+        """Unpack a telemetry frame (used by tests and Python clients).
+
+        Args:
+            frame: Encoded frame
+
+        Returns:
+            Decoded fields, with actuators keyed by name
+        """
+        version, flags, count, seq, base, timestamp, amplitude, *rest = self._struct.unpack(frame)
+        active, high = rest[-2:]
+        values = rest[:-2]
+        return {
+            "version": version,
+            "busy": bool(flags & 1),
+            "seq": seq,
+            "base": base,
+            "timestamp": timestamp,
+            "amplitude": amplitude,
+            "actuators": {
+                name: {"position": values[2 * i], "state": _STATES[values[2 * i + 1]].value}
+                for i, name in enumerate(self.actuator_names[:count])
+            },
+            "pins": {pin: bool(high >> pin & 1) for pin in range(32) if active >> pin & 1},
+        }
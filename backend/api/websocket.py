@@ -6,15 +6,38 @@ handling bidirectional communication between the frontend and backend.
 
 import asyncio
 import logging
-import queue
-from typing import Any, Literal
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from typing import Annotated, Any, Literal
 
 from fastapi import WebSocket, WebSocketDisconnect
-from pydantic import BaseModel, Field, ValidationError
-
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError, model_validator
+
+from backend.api.broadcast import (
+    DEFAULT_HEARTBEAT_TIMEOUT,
+    DEFAULT_QUEUE_SIZE,
+    DEFAULT_TOPICS,
+    TOPICS,
+    ClientChannel,
+    encode_frame,
+)
+from backend.api.commands import CommandRunner
+from backend.api.telemetry import TELEMETRY_FIELDS, TelemetryCodec
 from backend.core.enums import State
-from backend.logging_config import log_queue, set_log_level
+from backend.core.metrics import metrics
+from backend.core.scheduler import scheduler
+from backend.core.tracing import span, tracer
+from backend.core.watchdog import watchdog
+from backend.logging_config import (
+    DEFAULT_LOG_CAPACITY,
+    log_store,
+    set_log_level,
+    set_stream_level,
+)
 from backend.services.bear_service import BearService
+from backend.services.qos import qos
+from backend.services.state_history import StateSnapshot
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +49,21 @@ class UpdateBearMessage(BaseModel):
     type: Literal["update_bear"] = "update_bear"
     eyes: State | None = None
     mouth: State | None = None
+    actuators: dict[str, State] | None = Field(
+        default=None, description="Target positions keyed by actuator name"
+    )
+    id: str | None = Field(
+        default=None, max_length=64, description="Client ID echoed in ack and command_complete"
+    )
+
+
+class PuppetMessage(BaseModel):
+    """High-rate continuous puppet input (latest target per actuator wins)."""
+
+    type: Literal["puppet"] = "puppet"
+    targets: dict[str, Annotated[int, Field(ge=0, le=100)]] = Field(
+        ..., description="Position percent keyed by actuator name"
+    )
 
 
 class SpeakMessage(BaseModel):
@@ -33,6 +71,9 @@ class SpeakMessage(BaseModel):
 
     type: Literal["speak"] = "speak"
     text: str = Field(..., min_length=1, max_length=500)
+    id: str | None = Field(
+        default=None, max_length=64, description="Client ID echoed in ack and command_complete"
+    )
 
 
 class PlayMessage(BaseModel):
@@ -40,6 +81,9 @@ class PlayMessage(BaseModel):
 
     type: Literal["play"] = "play"
     sound: str = Field(..., min_length=1)
+    id: str | None = Field(
+        default=None, max_length=64, description="Client ID echoed in ack and command_complete"
+    )
 
 
 class SetVolumeMessage(BaseModel):
@@ -84,11 +128,168 @@ class GetGPIOStatusMessage(BaseModel):
     type: Literal["get_gpio_status"] = "get_gpio_status"
 
 
+class StartRecordingMessage(BaseModel):
+    """Message to start recording the session."""
+
+    type: Literal["start_recording"] = "start_recording"
+
+
+class StopRecordingMessage(BaseModel):
+    """Message to stop recording and optionally save it."""
+
+    type: Literal["stop_recording"] = "stop_recording"
+    name: str | None = Field(
+        default=None, pattern=r"^[A-Za-z0-9_-]+$", description="Name to save the recording under"
+    )
+
+
+class ReplayMessage(BaseModel):
+    """Message to replay a saved recording."""
+
+    type: Literal["replay"] = "replay"
+    name: str = Field(..., pattern=r"^[A-Za-z0-9_-]+$", description="Recording name")
+    id: str | None = Field(
+        default=None, max_length=64, description="Client ID echoed in ack and command_complete"
+    )
+
+
+class ResumeMessage(BaseModel):
+    """Message to catch up from the last applied state sequence number."""
+
+    type: Literal["resume"] = "resume"
+    epoch: str = Field(..., description="State epoch from the last full snapshot")
+    seq: int = Field(..., ge=0, description="Last applied sequence number")
+
+
+class SetTelemetryMessage(BaseModel):
+    """Message to choose how high-rate telemetry is delivered."""
+
+    type: Literal["set_telemetry"] = "set_telemetry"
+    format: Literal["json", "binary"] = Field(..., description="Telemetry frame format")
+
+
+Topic = Literal["state", "gpio", "logs", "metrics", "jobs"]
+
+# Periodic topics, which accept a per-client rate cap
+RatedTopic = Literal["state", "gpio", "metrics"]
+
+
+class SubscribeMessage(BaseModel):
+    """Message to start receiving topics (or change their rate caps)."""
+
+    type: Literal["subscribe"] = "subscribe"
+    topics: list[Topic] = Field(..., min_length=1, description="Topics to receive")
+    max_rate: dict[RatedTopic, Annotated[float, Field(gt=0)]] = Field(
+        default_factory=dict, description="Maximum updates per second keyed by topic"
+    )
+    log_history: int = Field(
+        default=0,
+        ge=0,
+        le=DEFAULT_LOG_CAPACITY,
+        description="Recent log records to replay when subscribing to logs",
+    )
+    log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] | None = Field(
+        default=None, description="Least severe log level streamed when subscribing to logs"
+    )
+
+    @model_validator(mode="after")
+    def rates_for_listed_topics(self) -> "SubscribeMessage":
+        """Ensure rate caps only name topics being subscribed."""
+        unlisted = set(self.max_rate) - set(self.topics)
+        if unlisted:
+            raise ValueError(f"max_rate for topics not subscribed: {', '.join(sorted(unlisted))}")
+        return self
+
+
+class UnsubscribeMessage(BaseModel):
+    """Message to stop receiving topics."""
+
+    type: Literal["unsubscribe"] = "unsubscribe"
+    topics: list[Topic] = Field(..., min_length=1, description="Topics to stop receiving")
+
+
+# Every client message, discriminated on ``type``
+ClientMessage = Annotated[
+    UpdateBearMessage
+    | PuppetMessage
+    | SpeakMessage
+    | PlayMessage
+    | SetVolumeMessage
+    | FetchPhrasesMessage
+    | SetBlinkEnabledMessage
+    | SetCharacterMessage
+    | SetLogLevelMessage
+    | GetGPIOStatusMessage
+    | SetTelemetryMessage
+    | SubscribeMessage
+    | UnsubscribeMessage
+    | ResumeMessage
+    | StartRecordingMessage
+    | StopRecordingMessage
+    | ReplayMessage,
+    Field(discriminator="type"),
+]
+
+# Built once at import; parsing is a tag lookup plus one model validation
+client_message_adapter: TypeAdapter[ClientMessage] = TypeAdapter(ClientMessage)
+
+
+def parse_message(raw: str | bytes) -> ClientMessage:
+    """Parse a raw WebSocket frame into its message model.
+
+    Args:
+        raw: JSON text of one client message
+
+    Returns:
+        Validated message model selected by its ``type``
+
+    Raises:
+        ValidationError: If the frame is not JSON, has a missing or unknown
+            ``type``, or fails validation for its type
+    """
+    return client_message_adapter.validate_json(raw)
+
+
+def describe_validation_error(error: ValidationError) -> str:
+    """Summarize a message validation error for the client.
+
+    Args:
+        error: Error raised by ``parse_message``
+
+    Returns:
+        One-line error description
+    """
+    details = error.errors(include_url=False)
+    first = details[0]
+    if first["type"] == "union_tag_invalid":
+        return f"Unknown message type: {first['ctx']['tag']}"
+    if first["type"] == "union_tag_not_found":
+        return "Invalid message: missing 'type'"
+
+    problems = []
+    for detail in details:
+        # First loc entry is the message type tag
+        field = ".".join(str(part) for part in detail["loc"][1:])
+        problems.append(f"{field}: {detail['msg']}" if field else detail["msg"])
+    return f"Invalid message: {'; '.join(problems)}"
+
+
 # Response models
 class BearStateResponse(BaseModel):
-    """Bear state response."""
+    """Bear state response (full snapshot)."""
 
     type: Literal["bear_state"] = "bear_state"
+    seq: int | None = None
+    epoch: str | None = None
+    data: dict[str, Any]
+
+
+class BearStateDeltaResponse(BaseModel):
+    """Changed state fields, applying on top of state ``base``."""
+
+    type: Literal["bear_state_delta"] = "bear_state_delta"
+    seq: int
+    base: int
     data: dict[str, Any]
 
 
@@ -113,11 +314,44 @@ class SuccessResponse(BaseModel):
     message: str
 
 
-class LogMessageResponse(BaseModel):
-    """Log message response."""
+class CommandAckResponse(BaseModel):
+    """Acknowledges that a background command was accepted."""
 
-    type: Literal["log"] = "log"
-    data: dict[str, Any]  # Contains: timestamp, level, logger, message, module, function, line
+    type: Literal["ack"] = "ack"
+    id: str
+    command: str
+
+
+class CommandCompleteResponse(BaseModel):
+    """Reports how a background command ended."""
+
+    type: Literal["command_complete"] = "command_complete"
+    id: str
+    command: str
+    status: Literal["done", "failed", "rejected"]
+    error: str | None = None
+
+
+class TelemetrySchemaResponse(BaseModel):
+    """Binary telemetry layout, sent when a client switches to binary frames."""
+
+    type: Literal["telemetry_schema"] = "telemetry_schema"
+    data: dict[str, Any]
+
+
+class LogBatchResponse(BaseModel):
+    """Log records streamed since the previous batch."""
+
+    type: Literal["log_batch"] = "log_batch"
+    data: list[dict[str, Any]]  # Entries: seq, timestamp, level, logger, message, module, ...
+    dropped: int = 0  # Records lost since the previous batch (backlog overflow)
+
+
+class LogHistoryResponse(BaseModel):
+    """Recent log records replayed to a client subscribing to logs."""
+
+    type: Literal["log_history"] = "log_history"
+    data: list[dict[str, Any]]  # Log entries, oldest first
 
 
 class GPIOStatusResponse(BaseModel):
@@ -127,19 +361,68 @@ class GPIOStatusResponse(BaseModel):
     data: dict[str, Any]  # Contains: pins: dict[int, bool]
 
 
+class SubscriptionsResponse(BaseModel):
+    """The client's topics after a subscription change."""
+
+    type: Literal["subscriptions"] = "subscriptions"
+    data: dict[str, float | None]  # Topic -> rate cap in Hz (None = every update)
+
+
+class MetricsResponse(BaseModel):
+    """Periodic service metrics (``metrics`` topic)."""
+
+    type: Literal["metrics"] = "metrics"
+    data: dict[str, Any]
+
+
+class JobEventResponse(BaseModel):
+    """A background command started or ended on any connection (``jobs`` topic)."""
+
+    type: Literal["job"] = "job"
+    id: str | None = None
+    command: str
+    status: Literal["running", "done", "failed"]
+
+
+# Topic each broadcast message type belongs to
+MESSAGE_TOPICS = {
+    "bear_state": "state",
+    "bear_state_delta": "state",
+    "gpio_status": "gpio",
+    "log_batch": "logs",
+    "metrics": "metrics",
+    "job": "jobs",
+}
+
+
 class ConnectionManager:
-    """Manages WebSocket connections.
+    """Manages WebSocket connections for one bear.
 
     This class handles multiple WebSocket connections and provides
-    methods for broadcasting messages to all connected clients.
+    methods for broadcasting messages to all connected clients. Every
+    client is served by a ``ClientChannel`` (bounded queue plus writer
+    task), so sending never blocks on a slow socket.
 
     Attributes:
         active_connections: List of active WebSocket connections
+        channels: Outbound channel per connection
     """
 
-    def __init__(self) -> None:
-        """Initialize connection manager."""
+    def __init__(
+        self,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        heartbeat_timeout: float = DEFAULT_HEARTBEAT_TIMEOUT,
+    ) -> None:
+        """Initialize connection manager.
+
+        Args:
+            queue_size: Maximum frames queued per client
+            heartbeat_timeout: Seconds a send may stall before the client is dropped
+        """
         self.active_connections: list[WebSocket] = []
+        self.channels: dict[WebSocket, ClientChannel] = {}
+        self.queue_size = queue_size
+        self.heartbeat_timeout = heartbeat_timeout
 
     async def connect(self, websocket: WebSocket) -> None:
         """Accept and register a new WebSocket connection.
@@ -149,16 +432,30 @@ class ConnectionManager:
         """
         await websocket.accept()
         self.active_connections.append(websocket)
+        self.channels[websocket] = ClientChannel(
+            websocket,
+            on_close=lambda channel: self.disconnect(channel.websocket),
+            max_size=self.queue_size,
+            heartbeat_timeout=self.heartbeat_timeout,
+        )
+        update_log_threshold()
+        WEBSOCKET_CLIENTS.inc()
         logger.info(f"WebSocket connected. Total connections: {len(self.active_connections)}")
 
     def disconnect(self, websocket: WebSocket) -> None:
-        """Unregister a WebSocket connection.
+        """Unregister a WebSocket connection and stop its writer.
 
         Args:
             websocket: WebSocket connection to remove
         """
+        channel = self.channels.pop(websocket, None)
+        if channel is not None:
+            channel.close()
+            update_log_threshold()
+
         if websocket in self.active_connections:
             self.active_connections.remove(websocket)
+            WEBSOCKET_CLIENTS.dec()
             logger.info(
                 f"WebSocket disconnected. Total connections: {len(self.active_connections)}"
             )
@@ -168,68 +465,454 @@ class ConnectionManager:
     async def send_personal(self, message: dict[str, Any], websocket: WebSocket) -> None:
         """Send a message to a specific client.
 
+        The frame is queued behind anything already broadcast to the client,
+        so replies keep their order relative to broadcasts. Replies are sent
+        regardless of the client's topics.
+
         Args:
             message: Message to send
             websocket: Target WebSocket connection
         """
+        channel = self.channels.get(websocket)
+        if channel is not None:
+            channel.enqueue(encode_frame(message))
+            _track_state(channel, message)
+            return
+
         try:
-            await websocket.send_json(message)
+            await websocket.send_text(encode_frame(message))
         except Exception as e:
             logger.error(f"Error sending personal message: {e}")
 
-    async def broadcast(self, message: dict[str, Any]) -> None:
-        """Broadcast a message to all connected clients.
+    async def broadcast(self, message: dict[str, Any], key: str | None = None) -> None:
+        """Broadcast a message to all clients subscribed to its topic.
+
+        The message is serialized once (and only if anyone subscribes) and
+        queued for every subscriber; this never waits on a socket. Message
+        types without a topic go to every client.
 
         Args:
             message: Message to broadcast
+            key: Latest-wins key; a queued frame with the same key is replaced
         """
-        disconnected = []
+        topic = MESSAGE_TOPICS.get(message.get("type", ""))
+        channels = self.subscribers(topic) if topic else list(self.channels.values())
+        if not channels:
+            return
 
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error(f"Error broadcasting to connection: {e}")
-                disconnected.append(connection)
+        frame = encode_frame(message)
+        for channel in channels:
+            channel.enqueue(frame, key)
+            _track_state(channel, message)
+
+    def broadcast_state(self, snapshot: StateSnapshot) -> None:
+        """Send a full state snapshot to the ``state`` subscribers.
+
+        The snapshot's frame is encoded once and shared by every broadcast
+        until the state changes.
+
+        Args:
+            snapshot: State snapshot
+        """
+        channels = self.subscribers("state")
+        if not channels:
+            return
 
-        # Remove disconnected clients
-        for connection in disconnected:
-            self.disconnect(connection)
+        frame = snapshot_frame(snapshot)
+        for channel in channels:
+            channel.enqueue(frame)
+            channel.state_seq = snapshot.seq
 
+    def send_state(self, snapshot: StateSnapshot, websocket: WebSocket) -> None:
+        """Send a full state snapshot to one client.
 
-# Global connection manager
-manager = ConnectionManager()
+        Args:
+            snapshot: State snapshot
+            websocket: Target WebSocket connection
+        """
+        channel = self.channels.get(websocket)
+        if channel is not None:
+            channel.enqueue(snapshot_frame(snapshot))
+            channel.state_seq = snapshot.seq
+
+    def broadcast_frame(
+        self,
+        frame: str | bytes,
+        key: str | None = None,
+        telemetry: str | None = None,
+        topic: str | None = None,
+    ) -> None:
+        """Queue an already-encoded frame for all connected clients.
+
+        Args:
+            frame: Encoded frame
+            key: Latest-wins key; a queued frame with the same key is replaced
+            telemetry: Only send to clients using this telemetry format
+            topic: Only send to clients subscribed to this topic
+        """
+        for channel in list(self.channels.values()):
+            if telemetry is not None and channel.telemetry != telemetry:
+                continue
+            if topic is not None and topic not in channel.topics:
+                continue
+            channel.enqueue(frame, key)
+
+    def subscribers(self, topic: str) -> list[ClientChannel]:
+        """Get the channels of clients subscribed to a topic.
+
+        Args:
+            topic: Topic name
+
+        Returns:
+            Subscribed channels
+        """
+        return [channel for channel in self.channels.values() if topic in channel.topics]
+
+    def due_channels(self, topic: str, now: float) -> list[ClientChannel]:
+        """Get the channels due a periodic topic update.
+
+        Args:
+            topic: Topic name
+            now: Current loop time
+
+        Returns:
+            Subscribed channels whose rate cap allows an update now
+        """
+        return [channel for channel in list(self.channels.values()) if channel.due(topic, now)]
+
+    def subscribe(self, websocket: WebSocket, topic: str, max_rate: float | None = None) -> None:
+        """Subscribe a client to a topic.
+
+        Args:
+            websocket: Client connection
+            topic: Topic name
+            max_rate: Maximum updates per second, or None for every update
+        """
+        channel = self.channels.get(websocket)
+        if channel is not None:
+            channel.subscribe(topic, max_rate)
+            update_log_threshold()
+
+    def unsubscribe(self, websocket: WebSocket, topic: str) -> None:
+        """Unsubscribe a client from a topic.
+
+        Args:
+            websocket: Client connection
+            topic: Topic name
+        """
+        channel = self.channels.get(websocket)
+        if channel is not None:
+            channel.unsubscribe(topic)
+            update_log_threshold()
+
+    def set_log_level(self, websocket: WebSocket, level: int) -> None:
+        """Set the least severe log level streamed to a client.
+
+        Args:
+            websocket: Client connection
+            level: Logging level number
+        """
+        channel = self.channels.get(websocket)
+        if channel is not None:
+            channel.log_level = level
+            update_log_threshold()
+
+    def set_telemetry(self, websocket: WebSocket, telemetry: str) -> None:
+        """Switch a client's telemetry format.
+
+        Args:
+            websocket: Client connection
+            telemetry: "json" or "binary"
+        """
+        channel = self.channels.get(websocket)
+        if channel is not None:
+            channel.telemetry = telemetry
+
+    def count_telemetry(self, telemetry: str) -> int:
+        """Count clients using a telemetry format."""
+        return sum(1 for channel in self.channels.values() if channel.telemetry == telemetry)
+
+    def stats(self) -> dict[str, Any]:
+        """Get delivery statistics summed over clients.
+
+        Returns:
+            Client count and total queued/sent/dropped/coalesced frames
+        """
+        totals = {
+            "clients": len(self.channels),
+            "queued": 0,
+            "sent": 0,
+            "dropped": 0,
+            "coalesced": 0,
+        }
+        for channel in self.channels.values():
+            for name, value in channel.stats().items():
+                totals[name] += value
+        return totals
+
+
+def _track_state(channel: ClientChannel, message: dict[str, Any]) -> None:
+    """Record the state sequence number a queued state message brings a client to.
+
+    Args:
+        channel: Client the message was queued for
+        message: Queued message
+    """
+    if message.get("seq") is not None and MESSAGE_TOPICS.get(message.get("type", "")) == "state":
+        channel.state_seq = message["seq"]
+
+
+# Connection managers keyed by bear ID
+managers: dict[str, ConnectionManager] = {}
 
 # Background tasks
-_broadcast_task: asyncio.Task[None] | None = None
+_broadcast_tasks: dict[str, asyncio.Task[None]] = {}
 _log_stream_task: asyncio.Task[None] | None = None
+_qos_task: asyncio.Task[None] | None = None
 
+# Sequence number of the last log record streamed to clients
+_log_cursor = 0
 
-async def state_broadcast_loop(bear_service: BearService) -> None:
-    """Periodically broadcast bear state to all connected clients.
+# Log streaming: a burst is sent as one batch per flush interval, keeping at
+# most LOG_BACKLOG records (older ones are counted as dropped)
+LOG_FLUSH_INTERVAL = 0.05
+LOG_BACKLOG = 200
+log_stream_stats = {"batches": 0, "streamed": 0, "dropped": 0}
+
+WEBSOCKET_CLIENTS = metrics.gauge("ruxpin_websocket_clients", "Connected WebSocket clients")
+LOG_RECORDS_DROPPED = metrics.counter(
+    "ruxpin_log_records_dropped_total", "Log records dropped from the stream backlog"
+)
+BROADCAST_FANOUT_SECONDS = metrics.histogram(
+    "ruxpin_broadcast_fanout_seconds",
+    "Time a state broadcast tick spent building and queueing frames",
+    buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1),
+)
+
+# State broadcast ticks per second
+STATE_BROADCAST_RATE = 10.0
+
+
+def update_log_threshold() -> None:
+    """Capture logs down to the most verbose level any client streams.
 
-    This runs at 10Hz to provide smooth visual updates of mouth movements.
+    With no ``logs`` subscribers the streaming handler drops everything
+    below its history level before formatting it.
     """
+    levels = [c.log_level for m in list(managers.values()) for c in m.subscribers("logs")]
+    set_stream_level(min(levels) if levels else None)
+
+
+def get_manager(bear_id: str) -> ConnectionManager:
+    """Get (or create) the connection manager for a bear.
+
+    Args:
+        bear_id: Bear ID
+
+    Returns:
+        Connection manager for the bear's clients
+    """
+    if bear_id not in managers:
+        managers[bear_id] = ConnectionManager()
+    return managers[bear_id]
+
+
+def total_connections() -> int:
+    """Count connected clients across all bears."""
+    return sum(len(m.active_connections) for m in managers.values())
+
+
+def state_response(bear_service: BearService) -> BearStateResponse:
+    """Build a full state snapshot response with its sequence number.
+
+    Args:
+        bear_service: Bear service instance
+
+    Returns:
+        Bear state response
+    """
+    snapshot = bear_service.get_snapshot()
+    return BearStateResponse(seq=snapshot.seq, epoch=snapshot.epoch, data=snapshot.data)
+
+
+def snapshot_frame(snapshot: StateSnapshot) -> str:
+    """Get the ``bear_state`` frame of a snapshot, encoding it once per snapshot.
+
+    Args:
+        snapshot: State snapshot
+
+    Returns:
+        Encoded full state frame
+    """
+    frame = snapshot.encoded.get("bear_state")
+    if frame is None:
+        # Same shape as BearStateResponse, without copying the state
+        frame = snapshot.encoded["bear_state"] = encode_frame(
+            {
+                "type": "bear_state",
+                "seq": snapshot.seq,
+                "epoch": snapshot.epoch,
+                "data": snapshot.data,
+            }
+        )
+    return frame
+
+
+def resume_response(
+    bear_service: BearService, epoch: str, seq: int
+) -> BearStateResponse | BearStateDeltaResponse:
+    """Build the catch-up response for a client at ``epoch``/``seq``.
+
+    Args:
+        bear_service: Bear service instance
+        epoch: State epoch the client's sequence number belongs to
+        seq: Last sequence number the client applied
+
+    Returns:
+        A delta from ``seq`` when history reaches back that far, otherwise
+        a full snapshot
+    """
+    changes = bear_service.get_state_since(epoch, seq)
+    if changes is None:
+        return state_response(bear_service)
+    return BearStateDeltaResponse(seq=bear_service.state_history.seq, base=seq, data=changes)
+
+
+def state_update_frame(
+    bear_service: BearService,
+    base: int | None,
+    published: tuple[int, dict[str, Any]] | None,
+    binary: bool,
+) -> str | None:
+    """Build the frame bringing a client from ``base`` to the current state.
+
+    Args:
+        bear_service: Bear service instance
+        base: State sequence number the client is at (None for a new client)
+        published: Result of this tick's ``publish_state``
+        binary: Whether the client gets positions through binary telemetry
+
+    Returns:
+        A delta (control fields only for binary clients, None if there are
+        none), or a full snapshot when the client can't be caught up
+    """
+    if base is None:
+        return snapshot_frame(bear_service.get_snapshot())
+
+    if published and published[0] == base:
+        changes = published[1]
+    else:
+        changes = bear_service.get_state_since(bear_service.state_epoch, base)
+        if changes is None:
+            return snapshot_frame(bear_service.get_snapshot())
+
+    if binary:
+        changes = {k: v for k, v in changes.items() if k not in TELEMETRY_FIELDS}
+        if not changes:
+            return None
+    response = BearStateDeltaResponse(seq=bear_service.state_history.seq, base=base, data=changes)
+    return encode_frame(response.model_dump())
+
+
+async def state_broadcast_loop(bear_service: BearService) -> None:
+    """Periodically broadcast bear state changes to the bear's subscribed clients.
+
+    This runs on the shared 10Hz ticks to provide smooth visual updates of
+    mouth movements.
+    Each topic is only computed and serialized when a client subscribes to
+    it and is due under its rate cap:
+
+    - ``state``: changed fields as a ``bear_state_delta`` from the client's
+      last sequence number. Clients at the same sequence number share one
+      encoded frame; a rate-capped client gets everything it skipped merged
+      into its next delta. Ticks where nothing changed send nothing.
+      Clients on binary telemetry get positions, amplitude and pins as a
+      latest-wins binary frame instead, plus deltas of the control fields.
+    - ``gpio``: pin levels at 1Hz.
+    - ``metrics``: delivery, puppet and drift statistics at 1Hz.
+
+    Under CPU pressure the QoS controller lowers the state/telemetry rate
+    to every Nth tick; GPIO status and metrics keep their 1Hz.
+    """
+    manager = get_manager(bear_service.bear_id)
+    codec = TelemetryCodec(list(bear_service.actuators))
+    loop = asyncio.get_running_loop()
+    ticker = scheduler.ticker(STATE_BROADCAST_RATE, f"broadcast:{bear_service.bear_id}")
+    slow_counter = 0
+    state_counter = 0
+
     try:
         while True:
-            if manager.active_connections:
-                state = bear_service.get_state()
-                response = BearStateResponse(data=state)
-                await manager.broadcast(response.model_dump())
-
-                # Also broadcast GPIO status (every 10 iterations = 1Hz for efficiency)
-                if hasattr(state_broadcast_loop, '_gpio_counter'):
-                    state_broadcast_loop._gpio_counter += 1
-                else:
-                    state_broadcast_loop._gpio_counter = 0
-
-                if state_broadcast_loop._gpio_counter >= 10:
-                    state_broadcast_loop._gpio_counter = 0
-                    gpio_states = bear_service.gpio_manager.get_pin_states()
-                    gpio_response = GPIOStatusResponse(data={"pins": gpio_states})
-                    await manager.broadcast(gpio_response.model_dump())
-
-            await asyncio.sleep(0.1)  # 10Hz update rate
+            now = loop.time()
+            started = time.perf_counter()
+            state_counter = (state_counter + 1) % qos.policy.telemetry_divisor
+            state_due = manager.due_channels("state", now) if state_counter == 0 else []
+            if state_due:
+                published = bear_service.publish_state()
+                seq = bear_service.state_history.seq
+                amplitude = bear_service.audio_player.current_amplitude
+
+                # Encoded once per distinct (base, format) / telemetry base this tick
+                deltas: dict[tuple[int | None, bool], str | None] = {}
+                telemetry: dict[int | None, bytes] = {}
+                for channel in state_due:
+                    binary = channel.telemetry == "binary"
+                    sent = False
+
+                    if channel.state_seq != seq:
+                        key = (channel.state_seq, binary)
+                        if key not in deltas:
+                            deltas[key] = state_update_frame(
+                                bear_service, channel.state_seq, published, binary
+                            )
+                        if deltas[key] is not None:
+                            channel.enqueue(deltas[key])
+                            sent = True
+                        channel.state_seq = seq
+
+                    if binary and channel.telemetry_sent != (seq, amplitude):
+                        base = channel.telemetry_sent[0] if channel.telemetry_sent else None
+                        if base not in telemetry:
+                            telemetry[base] = codec.encode(
+                                seq=seq,
+                                base=seq if base is None else base,
+                                positions=[
+                                    (servo.position_percent, servo.state)
+                                    for servo in bear_service.actuators.values()
+                                ],
+                                amplitude=amplitude,
+                                pins=bear_service.gpio_manager.get_pin_states(),
+                                busy=bear_service.is_busy,
+                            )
+                        channel.enqueue(telemetry[base], key="telemetry")
+                        channel.telemetry_sent = (seq, amplitude)
+                        sent = True
+
+                    if sent:
+                        channel.mark_sent("state", now)
+                BROADCAST_FANOUT_SECONDS.observe(time.perf_counter() - started)
+
+            # GPIO status and metrics at 1Hz (every 10 ticks)
+            slow_counter += 1
+            if slow_counter >= 10:
+                slow_counter = 0
+                gpio_due = manager.due_channels("gpio", now)
+                if gpio_due:
+                    pins = bear_service.gpio_manager.get_pin_states()
+                    frame = encode_frame(GPIOStatusResponse(data={"pins": pins}).model_dump())
+                    for channel in gpio_due:
+                        channel.enqueue(frame, key="gpio_status")
+                        channel.mark_sent("gpio", now)
+
+                metrics_due = manager.due_channels("metrics", now)
+                if metrics_due:
+                    response = MetricsResponse(data=service_metrics(bear_service))
+                    frame = encode_frame(response.model_dump())
+                    for channel in metrics_due:
+                        channel.enqueue(frame, key="metrics")
+                        channel.mark_sent("metrics", now)
+
+            await ticker.tick()
     except asyncio.CancelledError:
         logger.info("State broadcast loop cancelled")
         raise
@@ -237,29 +920,112 @@ async def state_broadcast_loop(bear_service: BearService) -> None:
         logger.error(f"State broadcast loop error: {e}")
 
 
+def service_metrics(bear_service: BearService) -> dict[str, Any]:
+    """Collect the statistics sent on the ``metrics`` topic.
+
+    Args:
+        bear_service: Bear service instance
+
+    Returns:
+        WebSocket delivery, log streaming, puppet, servo drift, control
+        loop tick, idle power mode, QoS and watchdog statistics
+    """
+    return {
+        "websocket": get_manager(bear_service.bear_id).stats(),
+        "logs": dict(log_stream_stats),
+        "puppet": bear_service.puppet_channel.stats(),
+        "drift": bear_service.get_drift_stats(),
+        "scheduler": scheduler.stats(),
+        "power": bear_service.get_power_stats(),
+        "qos": qos.stats(),
+        "watchdog": watchdog.stats(),
+    }
+
+
 async def log_stream_loop() -> None:
-    """Stream log messages to all connected clients.
+    """Stream log records to the ``logs`` subscribers of every bear.
+
+    Sleeps until the log store signals a new record (the handler may run on
+    any thread, so the signal crosses over with ``call_soon_threadsafe``,
+    at most once per batch). It then waits for the next flush tick so a burst
+    goes out as one ``log_batch`` frame, filtered per client level and
+    encoded once per distinct level. Beyond ``LOG_BACKLOG`` records per
+    batch the oldest are dropped and counted.
 
-    This continuously monitors the log queue and broadcasts new log entries.
+    Under CPU pressure the QoS controller flushes less often, raises the
+    least severe level streamed, or pauses streaming until load eases.
+
+    Follows the log store from the newest record at start-up; earlier
+    history is available through replay and ``/api/logs``.
     """
+    global _log_cursor
+
+    loop = asyncio.get_running_loop()
+    ready = asyncio.Event()
+    scheduled = False
+
+    def wake() -> None:
+        nonlocal scheduled
+        if not scheduled:
+            scheduled = True
+            try:
+                loop.call_soon_threadsafe(ready.set)
+            except RuntimeError:
+                pass  # Loop already closed
+
+    ticker = scheduler.ticker(1 / LOG_FLUSH_INTERVAL, "logs")
+    _log_cursor = log_store.last_seq
+    log_store.on_append = wake
     try:
         while True:
-            if manager.active_connections:
-                try:
-                    # Get log entry from queue (non-blocking)
-                    log_entry = log_queue.get_nowait()
-                    response = LogMessageResponse(data=log_entry)
-                    await manager.broadcast(response.model_dump())
-                except queue.Empty:
-                    # No logs available, wait a bit
-                    await asyncio.sleep(0.05)
-            else:
-                await asyncio.sleep(0.1)
+            await ready.wait()
+            for _ in range(qos.policy.log_divisor or 1):
+                await ticker.tick()
+            while qos.policy.log_divisor is None:
+                await qos.changed()
+            ready.clear()
+            scheduled = False
+
+            start = max(_log_cursor, log_store.last_seq - LOG_BACKLOG)
+            entries = log_store.read(after=start, limit=LOG_BACKLOG)
+            if not entries:
+                continue
+            dropped = entries[0]["seq"] - _log_cursor - 1
+            _log_cursor = entries[-1]["seq"]
+            log_stream_stats["dropped"] += dropped
+            LOG_RECORDS_DROPPED.inc(dropped)
+            if dropped:
+                logger.debug(f"Dropped {dropped} log records from the stream backlog")
+
+            # One frame per distinct client level
+            frames: dict[int, str | None] = {}
+            for manager in list(managers.values()):
+                for channel in manager.subscribers("logs"):
+                    level = max(channel.log_level, qos.policy.log_level)
+                    if level not in frames:
+                        batch = [
+                            entry
+                            for entry in entries
+                            if logging.getLevelName(entry["level"]) >= level
+                        ]
+                        response = LogBatchResponse(data=batch, dropped=dropped)
+                        frames[level] = (
+                            encode_frame(response.model_dump()) if batch or dropped else None
+                        )
+                    frame = frames[level]
+                    if frame is not None:
+                        channel.enqueue(frame)
+            if frames:
+                log_stream_stats["batches"] += 1
+                log_stream_stats["streamed"] += len(entries)
     except asyncio.CancelledError:
         logger.debug("Log stream loop cancelled")
         raise
     except Exception as e:
         logger.error(f"Log stream loop error: {e}")
+    finally:
+        if log_store.on_append is wake:
+            log_store.on_append = None
 
 
 async def handle_update_bear(
@@ -272,17 +1038,41 @@ async def handle_update_bear(
         bear_service: Bear service instance
         websocket: WebSocket connection
     """
+    manager = get_manager(bear_service.bear_id)
+
     try:
-        state = await bear_service.update_positions(
+        await bear_service.update_positions(
             eyes_position=message.eyes,
             mouth_position=message.mouth,
+            actuators=message.actuators,
         )
 
-        response = BearStateResponse(data=state)
-        await manager.broadcast(response.model_dump())
+        manager.broadcast_state(bear_service.get_snapshot())
     except Exception as e:
         error = ErrorResponse(message=str(e))
         await manager.send_personal(error.model_dump(), websocket)
+        raise
+
+
+async def handle_puppet(
+    message: PuppetMessage, bear_service: BearService, websocket: WebSocket
+) -> None:
+    """Handle puppet message.
+
+    Targets are applied on the next control tick; there is no reply, and
+    state changes reach clients through the state stream. Input sent while
+    the bear is busy is ignored.
+
+    Args:
+        message: Puppet message
+        bear_service: Bear service instance
+        websocket: WebSocket connection
+    """
+    try:
+        bear_service.puppet(message.targets)
+    except Exception as e:
+        error = ErrorResponse(message=str(e))
+        await get_manager(bear_service.bear_id).send_personal(error.model_dump(), websocket)
 
 
 async def handle_speak(
@@ -295,28 +1085,22 @@ async def handle_speak(
         bear_service: Bear service instance
         websocket: WebSocket connection
     """
-    try:
-        # Notify all clients that bear is busy
-        busy_state = bear_service.get_state()
-        busy_state["is_busy"] = True
-        response = BearStateResponse(data=busy_state)
-        await manager.broadcast(response.model_dump())
+    manager = get_manager(bear_service.bear_id)
 
+    try:
+        # Clients see the bear go busy through the sequenced state stream
         # Speak (this will block until complete)
         await bear_service.speak(message.text)
 
         # Notify all clients of new state
-        final_state = bear_service.get_state()
-        response = BearStateResponse(data=final_state)
-        await manager.broadcast(response.model_dump())
+        manager.broadcast_state(bear_service.get_snapshot())
     except Exception as e:
         error = ErrorResponse(message=str(e))
         await manager.send_personal(error.model_dump(), websocket)
 
         # Reset busy state on error
-        state = bear_service.get_state()
-        response = BearStateResponse(data=state)
-        await manager.broadcast(response.model_dump())
+        manager.broadcast_state(bear_service.get_snapshot())
+        raise
 
 
 async def handle_play(
@@ -329,28 +1113,22 @@ async def handle_play(
         bear_service: Bear service instance
         websocket: WebSocket connection
     """
-    try:
-        # Notify all clients that bear is busy
-        busy_state = bear_service.get_state()
-        busy_state["is_busy"] = True
-        response = BearStateResponse(data=busy_state)
-        await manager.broadcast(response.model_dump())
+    manager = get_manager(bear_service.bear_id)
 
+    try:
+        # Clients see the bear go busy through the sequenced state stream
         # Play audio (this will block until complete)
         await bear_service.play_audio(message.sound)
 
         # Notify all clients of new state
-        final_state = bear_service.get_state()
-        response = BearStateResponse(data=final_state)
-        await manager.broadcast(response.model_dump())
+        manager.broadcast_state(bear_service.get_snapshot())
     except Exception as e:
         error = ErrorResponse(message=str(e))
         await manager.send_personal(error.model_dump(), websocket)
 
         # Reset busy state on error
-        state = bear_service.get_state()
-        response = BearStateResponse(data=state)
-        await manager.broadcast(response.model_dump())
+        manager.broadcast_state(bear_service.get_snapshot())
+        raise
 
 
 async def handle_set_volume(
@@ -363,12 +1141,12 @@ async def handle_set_volume(
         bear_service: Bear service instance
         websocket: WebSocket connection
     """
+    manager = get_manager(bear_service.bear_id)
+
     try:
         await bear_service.set_volume(message.level)
 
-        state = bear_service.get_state()
-        response = BearStateResponse(data=state)
-        await manager.broadcast(response.model_dump())
+        manager.broadcast_state(bear_service.get_snapshot())
     except Exception as e:
         error = ErrorResponse(message=str(e))
         await manager.send_personal(error.model_dump(), websocket)
@@ -384,6 +1162,8 @@ async def handle_fetch_phrases(
         bear_service: Bear service instance
         websocket: WebSocket connection
     """
+    manager = get_manager(bear_service.bear_id)
+
     try:
         phrases = bear_service.get_phrases()
         response = PhrasesResponse(data=phrases)
@@ -403,12 +1183,12 @@ async def handle_set_blink_enabled(
         bear_service: Bear service instance
         websocket: WebSocket connection
     """
+    manager = get_manager(bear_service.bear_id)
+
     try:
         bear_service.set_blink_enabled(message.enabled)
 
-        state = bear_service.get_state()
-        response = BearStateResponse(data=state)
-        await manager.broadcast(response.model_dump())
+        manager.broadcast_state(bear_service.get_snapshot())
     except Exception as e:
         error = ErrorResponse(message=str(e))
         await manager.send_personal(error.model_dump(), websocket)
@@ -424,24 +1204,29 @@ async def handle_set_character(
         bear_service: Bear service instance
         websocket: WebSocket connection
     """
+    manager = get_manager(bear_service.bear_id)
+
     try:
         bear_service.set_character(message.character)
 
-        state = bear_service.get_state()
-        response = BearStateResponse(data=state)
-        await manager.broadcast(response.model_dump())
+        manager.broadcast_state(bear_service.get_snapshot())
     except Exception as e:
         error = ErrorResponse(message=str(e))
         await manager.send_personal(error.model_dump(), websocket)
 
 
-async def handle_set_log_level(message: SetLogLevelMessage, websocket: WebSocket) -> None:
+async def handle_set_log_level(
+    message: SetLogLevelMessage, bear_service: BearService, websocket: WebSocket
+) -> None:
     """Handle set_log_level message.
 
     Args:
         message: Set log level message
+        bear_service: Bear service instance
         websocket: WebSocket connection
     """
+    manager = get_manager(bear_service.bear_id)
+
     try:
         set_log_level(message.level)
         logger.info(f"Log level changed to {message.level} via WebSocket")
@@ -463,6 +1248,8 @@ async def handle_get_gpio_status(
         bear_service: Bear service instance
         websocket: WebSocket connection
     """
+    manager = get_manager(bear_service.bear_id)
+
     try:
         gpio_manager = bear_service.gpio_manager
         pin_states = gpio_manager.get_pin_states()
@@ -474,105 +1261,410 @@ async def handle_get_gpio_status(
         await manager.send_personal(error.model_dump(), websocket)
 
 
-async def websocket_endpoint(websocket: WebSocket, bear_service: BearService) -> None:
-    """WebSocket endpoint for bear control.
+async def handle_set_telemetry(
+    message: SetTelemetryMessage, bear_service: BearService, websocket: WebSocket
+) -> None:
+    """Handle set_telemetry message.
 
     Args:
+        message: Set telemetry message
+        bear_service: Bear service instance
         websocket: WebSocket connection
+    """
+    manager = get_manager(bear_service.bear_id)
+
+    manager.set_telemetry(websocket, message.format)
+    if message.format == "binary":
+        codec = TelemetryCodec(list(bear_service.actuators))
+        response = TelemetrySchemaResponse(data=codec.schema())
+    else:
+        response = SuccessResponse(message="Telemetry format set to json")
+    await manager.send_personal(response.model_dump(), websocket)
+
+
+def subscriptions_response(
+    manager: ConnectionManager, websocket: WebSocket
+) -> SubscriptionsResponse:
+    """Describe a client's current topics.
+
+    Args:
+        manager: Connection manager of the client's bear
+        websocket: Client connection
+
+    Returns:
+        Subscriptions response with each topic's rate cap
+    """
+    channel = manager.channels.get(websocket)
+    topics = channel.topics if channel is not None else {}
+    return SubscriptionsResponse(
+        data={
+            topic: round(1 / interval, 3) if interval else None
+            for topic, interval in topics.items()
+        }
+    )
+
+
+async def handle_subscribe(
+    message: SubscribeMessage, bear_service: BearService, websocket: WebSocket
+) -> None:
+    """Handle subscribe message.
+
+    A client subscribing to ``state`` gets a full snapshot on the next tick.
+    A client subscribing to ``logs`` can set its level filter, and with
+    ``log_history`` first gets the most recent records already streamed
+    (at its level); newer ones follow on the stream, so none is missed or
+    repeated.
+
+    Args:
+        message: Subscribe message
         bear_service: Bear service instance
+        websocket: WebSocket connection
     """
-    global _broadcast_task, _log_stream_task
+    manager = get_manager(bear_service.bear_id)
+
+    if "logs" in message.topics and message.log_level:
+        manager.set_log_level(websocket, logging.getLevelName(message.log_level))
+    for topic in message.topics:
+        manager.subscribe(websocket, topic, message.max_rate.get(topic))
+
+    channel = manager.channels.get(websocket)
+    if "logs" in message.topics and message.log_history and channel is not None:
+        history = [
+            entry
+            for entry in log_store.read(before=_log_cursor + 1, limit=DEFAULT_LOG_CAPACITY)
+            if logging.getLevelName(entry["level"]) >= channel.log_level
+        ][-message.log_history :]
+        await manager.send_personal(LogHistoryResponse(data=history).model_dump(), websocket)
+    await manager.send_personal(subscriptions_response(manager, websocket).model_dump(), websocket)
+
+
+async def handle_unsubscribe(
+    message: UnsubscribeMessage, bear_service: BearService, websocket: WebSocket
+) -> None:
+    """Handle unsubscribe message.
 
-    await manager.connect(websocket)
-    logger.info(f"WebSocket connected from {websocket.client.host}:{websocket.client.port}")
+    Args:
+        message: Unsubscribe message
+        bear_service: Bear service instance
+        websocket: WebSocket connection
+    """
+    manager = get_manager(bear_service.bear_id)
 
-    # Start state broadcast task if this is the first connection
-    if len(manager.active_connections) == 1 and (_broadcast_task is None or _broadcast_task.done()):
-        _broadcast_task = asyncio.create_task(state_broadcast_loop(bear_service))
-        logger.info("Started state broadcast loop")
+    for topic in message.topics:
+        manager.unsubscribe(websocket, topic)
+    await manager.send_personal(subscriptions_response(manager, websocket).model_dump(), websocket)
 
-    # Start log streaming task if this is the first connection
-    if len(manager.active_connections) == 1 and (
-        _log_stream_task is None or _log_stream_task.done()
-    ):
-        _log_stream_task = asyncio.create_task(log_stream_loop())
-        logger.info("Started log stream loop")
-        logger.info("Log streaming is now active - you should see this message in the frontend!")
+
+async def handle_resume(
+    message: ResumeMessage, bear_service: BearService, websocket: WebSocket
+) -> None:
+    """Handle resume message.
+
+    Args:
+        message: Resume message
+        bear_service: Bear service instance
+        websocket: WebSocket connection
+    """
+    manager = get_manager(bear_service.bear_id)
+
+    response = resume_response(bear_service, message.epoch, message.seq)
+    await manager.send_personal(response.model_dump(), websocket)
+
+
+async def handle_start_recording(
+    message: StartRecordingMessage, bear_service: BearService, websocket: WebSocket
+) -> None:
+    """Handle start_recording message.
+
+    Args:
+        message: Start recording message
+        bear_service: Bear service instance
+        websocket: WebSocket connection
+    """
+    manager = get_manager(bear_service.bear_id)
+
+    try:
+        bear_service.start_recording()
+
+        manager.broadcast_state(bear_service.get_snapshot())
+    except Exception as e:
+        error = ErrorResponse(message=str(e))
+        await manager.send_personal(error.model_dump(), websocket)
+
+
+async def handle_stop_recording(
+    message: StopRecordingMessage, bear_service: BearService, websocket: WebSocket
+) -> None:
+    """Handle stop_recording message.
+
+    Args:
+        message: Stop recording message
+        bear_service: Bear service instance
+        websocket: WebSocket connection
+    """
+    manager = get_manager(bear_service.bear_id)
+
+    try:
+        timeline = await bear_service.stop_recording(message.name)
+
+        saved = f", saved as '{message.name}'" if message.name else ""
+        success = SuccessResponse(
+            message=f"Recorded {len(timeline)} cues over {timeline.duration:.1f}s{saved}"
+        )
+        await manager.send_personal(success.model_dump(), websocket)
+
+        manager.broadcast_state(bear_service.get_snapshot())
+    except Exception as e:
+        error = ErrorResponse(message=str(e))
+        await manager.send_personal(error.model_dump(), websocket)
+
+
+async def handle_replay(
+    message: ReplayMessage, bear_service: BearService, websocket: WebSocket
+) -> None:
+    """Handle replay message.
+
+    Args:
+        message: Replay message
+        bear_service: Bear service instance
+        websocket: WebSocket connection
+    """
+    manager = get_manager(bear_service.bear_id)
 
     try:
-        # Send initial state
-        state = bear_service.get_state()
-        response = BearStateResponse(data=state)
+        # Clients see the bear go busy through the sequenced state stream
+        # Replay (this will block until complete)
+        await bear_service.replay(message.name)
+
+        # Notify all clients of new state
+        manager.broadcast_state(bear_service.get_snapshot())
+    except Exception as e:
+        error = ErrorResponse(message=str(e))
+        await manager.send_personal(error.model_dump(), websocket)
+
+        # Reset busy state on error
+        manager.broadcast_state(bear_service.get_snapshot())
+        raise
+
+
+MessageHandler = Callable[[Any, BearService, WebSocket], Awaitable[None]]
+
+# Long-running message types, run in the background so the connection keeps
+# reading control messages. Their handlers raise after reporting an error.
+BACKGROUND_COMMANDS = frozenset({"update_bear", "speak", "play", "replay"})
+
+# Handler for each client message type
+MESSAGE_HANDLERS: dict[str, MessageHandler] = {
+    "update_bear": handle_update_bear,
+    "puppet": handle_puppet,
+    "speak": handle_speak,
+    "play": handle_play,
+    "set_volume": handle_set_volume,
+    "fetch_phrases": handle_fetch_phrases,
+    "set_blink_enabled": handle_set_blink_enabled,
+    "set_character": handle_set_character,
+    "set_log_level": handle_set_log_level,
+    "get_gpio_status": handle_get_gpio_status,
+    "set_telemetry": handle_set_telemetry,
+    "subscribe": handle_subscribe,
+    "unsubscribe": handle_unsubscribe,
+    "resume": handle_resume,
+    "start_recording": handle_start_recording,
+    "stop_recording": handle_stop_recording,
+    "replay": handle_replay,
+}
+
+
+async def run_command(
+    message: Any,
+    handler: MessageHandler,
+    bear_service: BearService,
+    websocket: WebSocket,
+    received_at: float | None = None,
+) -> None:
+    """Run a background command and report its completion.
+
+    ``command_complete`` is only sent for messages that carry an ``id``.
+    Its start and end are also broadcast to the bear's ``jobs`` subscribers.
+    The command is traced under its ``id`` (or a generated one, see
+    ``/api/traces``).
+
+    Args:
+        message: Parsed command message
+        handler: Handler for the message type
+        bear_service: Bear service instance
+        websocket: WebSocket connection
+        received_at: ``time.perf_counter()`` the frame was received at
+    """
+    manager = get_manager(bear_service.bear_id)
+    if manager.subscribers("jobs"):
+        job = JobEventResponse(id=message.id, command=message.type, status="running")
+        await manager.broadcast(job.model_dump())
+
+    job_id = message.id or f"{message.type}-{uuid.uuid4().hex[:8]}"
+    status, error = "done", None
+    with tracer.trace(job_id, message.type, start=received_at) as trace:
+        if received_at is not None:
+            trace.record("websocket.receive", "websocket", received_at, time.perf_counter())
+        try:
+            with span(message.type, "websocket", bear=bear_service.bear_id):
+                await handler(message, bear_service, websocket)
+        except Exception as e:
+            # The handler already sent the error response
+            status, error = "failed", str(e)
+            logger.debug(f"Command '{message.type}' failed: {e}")
+
+    if manager.subscribers("jobs"):
+        job = JobEventResponse(id=message.id, command=message.type, status=status)
+        await manager.broadcast(job.model_dump())
+
+    if message.id is not None:
+        response = CommandCompleteResponse(
+            id=message.id, command=message.type, status=status, error=error
+        )
         await manager.send_personal(response.model_dump(), websocket)
 
-        # Message handling loop
-        while True:
-            data = await websocket.receive_json()
 
-            # Route message based on type
-            message_type = data.get("type")
+async def dispatch_message(
+    raw: str,
+    bear_service: BearService,
+    websocket: WebSocket,
+    commands: CommandRunner | None = None,
+) -> None:
+    """Parse one client frame and run its handler.
 
-            if message_type == "update_bear":
-                msg = UpdateBearMessage(**data)
-                await handle_update_bear(msg, bear_service, websocket)
+    An invalid message is answered with an error and does not end the
+    session. With a ``commands`` runner, long-running commands are started
+    in the background (acknowledged with ``ack`` when they carry an ``id``)
+    and this returns immediately.
 
-            elif message_type == "speak":
-                msg = SpeakMessage(**data)
-                await handle_speak(msg, bear_service, websocket)
+    Args:
+        raw: JSON text of one client message
+        bear_service: Bear service instance
+        websocket: WebSocket connection
+        commands: The connection's background command runner
+    """
+    received_at = time.perf_counter()
+    manager = get_manager(bear_service.bear_id)
 
-            elif message_type == "play":
-                msg = PlayMessage(**data)
-                await handle_play(msg, bear_service, websocket)
+    try:
+        message = parse_message(raw)
+    except ValidationError as e:
+        error = ErrorResponse(message=describe_validation_error(e))
+        await manager.send_personal(error.model_dump(), websocket)
+        return
 
-            elif message_type == "set_volume":
-                msg = SetVolumeMessage(**data)
-                await handle_set_volume(msg, bear_service, websocket)
+    handler = MESSAGE_HANDLERS[message.type]
+    if commands is None or message.type not in BACKGROUND_COMMANDS:
+        try:
+            await handler(message, bear_service, websocket)
+        except Exception as e:
+            # Background-command handlers re-raise after sending the error
+            logger.debug(f"Command '{message.type}' failed: {e}")
+        return
 
-            elif message_type == "fetch_phrases":
-                msg = FetchPhrasesMessage(**data)
-                await handle_fetch_phrases(msg, bear_service, websocket)
+    task = commands.submit(
+        message.type, run_command(message, handler, bear_service, websocket, received_at)
+    )
+    if task is None:
+        reason = f"Too many commands in progress (limit {commands.limit})"
+        if message.id is not None:
+            response = CommandCompleteResponse(
+                id=message.id, command=message.type, status="rejected", error=reason
+            )
+            await manager.send_personal(response.model_dump(), websocket)
+        else:
+            await manager.send_personal(ErrorResponse(message=reason).model_dump(), websocket)
+    elif message.id is not None:
+        ack = CommandAckResponse(id=message.id, command=message.type)
+        await manager.send_personal(ack.model_dump(), websocket)
 
-            elif message_type == "set_blink_enabled":
-                msg = SetBlinkEnabledMessage(**data)
-                await handle_set_blink_enabled(msg, bear_service, websocket)
 
-            elif message_type == "set_character":
-                msg = SetCharacterMessage(**data)
-                await handle_set_character(msg, bear_service, websocket)
+async def websocket_endpoint(websocket: WebSocket, bear_service: BearService) -> None:
+    """WebSocket endpoint for bear control.
 
-            elif message_type == "set_log_level":
-                msg = SetLogLevelMessage(**data)
-                await handle_set_log_level(msg, websocket)
+    Args:
+        websocket: WebSocket connection
+        bear_service: Bear service the connection controls
+    """
+    global _log_stream_task, _qos_task
+
+    bear_id = bear_service.bear_id
+    manager = get_manager(bear_id)
+    commands = CommandRunner()
+
+    await manager.connect(websocket)
+    bear_service.client_connected()
+    # Clients can pick their topics up front with ?topics=state,logs
+    topics = websocket.query_params.get("topics")
+    if topics is not None:
+        for topic in DEFAULT_TOPICS:
+            manager.unsubscribe(websocket, topic)
+        for topic in topics.split(","):
+            if topic in TOPICS:
+                manager.subscribe(websocket, topic)
+    logger.info(
+        f"WebSocket connected from {websocket.client.host}:{websocket.client.port} "
+        f"to bear '{bear_id}'"
+    )
+
+    # Start this bear's state broadcast task if this is its first connection
+    broadcast_task = _broadcast_tasks.get(bear_id)
+    if len(manager.active_connections) == 1 and (broadcast_task is None or broadcast_task.done()):
+        _broadcast_tasks[bear_id] = asyncio.create_task(state_broadcast_loop(bear_service))
+        logger.info(f"Started state broadcast loop for bear '{bear_id}'")
+
+    # Start log streaming task if this is the first connection
+    if total_connections() == 1 and (_log_stream_task is None or _log_stream_task.done()):
+        _log_stream_task = asyncio.create_task(log_stream_loop())
+        logger.info("Started log stream loop")
+        logger.info("Log streaming is now active - you should see this message in the frontend!")
 
-            elif message_type == "get_gpio_status":
-                msg = GetGPIOStatusMessage(**data)
-                await handle_get_gpio_status(msg, bear_service, websocket)
+    # Watch load while there are clients to shed work for
+    if total_connections() == 1 and (_qos_task is None or _qos_task.done()):
+        _qos_task = asyncio.create_task(qos.run())
 
+    try:
+        # Send initial state (only what changed if the client is resuming)
+        if "state" in manager.channels[websocket].topics:
+            epoch = websocket.query_params.get("epoch")
+            since = websocket.query_params.get("since")
+            if epoch and since and since.isdigit():
+                response = resume_response(bear_service, epoch, int(since))
+                await manager.send_personal(response.model_dump(), websocket)
             else:
-                error = ErrorResponse(message=f"Unknown message type: {message_type}")
-                await manager.send_personal(error.model_dump(), websocket)
+                manager.send_state(bear_service.get_snapshot(), websocket)
+
+        # Message handling loop
+        while True:
+            raw = await websocket.receive_text()
+            await dispatch_message(raw, bear_service, websocket, commands)
 
     except WebSocketDisconnect:
         manager.disconnect(websocket)
-    except ValidationError as e:
-        error = ErrorResponse(message=f"Invalid message: {e}")
-        await manager.send_personal(error.model_dump(), websocket)
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
         manager.disconnect(websocket)
     finally:
         logger.debug(f"WebSocket disconnected from {websocket.client.host}:{websocket.client.port}")
 
-        # Stop broadcast tasks if this was the last connection
+        # Stop commands this client started
+        commands.cancel_all()
+        bear_service.client_disconnected()
+
+        # Stop this bear's broadcast task if this was its last connection
         if len(manager.active_connections) == 0:
-            if _broadcast_task and not _broadcast_task.done():
-                _broadcast_task.cancel()
+            broadcast_task = _broadcast_tasks.pop(bear_id, None)
+            if broadcast_task and not broadcast_task.done():
+                broadcast_task.cancel()
                 try:
-                    await _broadcast_task
+                    await broadcast_task
                 except asyncio.CancelledError:
                     pass
-                logger.info("Stopped state broadcast loop")
+                logger.info(f"Stopped state broadcast loop for bear '{bear_id}'")
 
+        # Stop log streaming if this was the last connection of any bear
+        if total_connections() == 0:
             if _log_stream_task and not _log_stream_task.done():
                 _log_stream_task.cancel()
                 try:
@@ -580,3 +1672,10 @@ async def websocket_endpoint(websocket: WebSocket, bear_service: BearService) ->
                 except asyncio.CancelledError:
                     pass
                 logger.info("Stopped log stream loop")
+
+            if _qos_task and not _qos_task.done():
+                _qos_task.cancel()
+                try:
+                    await _qos_task
+                except asyncio.CancelledError:
+                    pass
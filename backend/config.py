@@ -8,11 +8,12 @@ import platform
 from pathlib import Path
 from typing import Any
 
-import yaml
-from pydantic import Field, field_validator
+from pydantic import BaseModel, Field, SecretStr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from backend.core.enums import ActuatorRole
 from backend.core.exceptions import ConfigurationError
+from backend.hardware.models import PinSet, ServoConfig
 
 
 class HardwareSettings(BaseSettings):
@@ -41,6 +42,24 @@ class HardwareSettings(BaseSettings):
         default=0.3, gt=0, le=2.0, description="Default duration for mouth movement (slower for 40+ year old servos)"
     )
 
+    # Re-homing policy (bounds dead-reckoning drift of the position estimate)
+    rehome_threshold: float = Field(
+        default=10.0, ge=0, le=100, description="Position uncertainty (percent) that triggers a re-home"
+    )
+    rehome_min_silence: float = Field(
+        default=0.2, ge=0, le=5.0, description="Seconds of envelope silence before re-homing the mouth"
+    )
+
+    # Idle power mode (parks control loops and releases PWM when nobody uses the bear)
+    idle_timeout: float = Field(
+        default=300.0, ge=0, description="Seconds without jobs or clients before idling (0 disables)"
+    )
+
+    # Declarative actuator rig (overrides the eyes_*/mouth_* fields when set)
+    actuators: list[ServoConfig] = Field(
+        default_factory=list, description="Actuator registry; empty means the classic eyes/mouth rig"
+    )
+
     # Platform detection
     use_mock_gpio: bool = Field(
         default_factory=lambda: platform.system() == "Darwin",
@@ -55,6 +74,62 @@ class HardwareSettings(BaseSettings):
             raise ValueError("Duration must be between 0 and 2.0 seconds")
         return v
 
+    @field_validator("actuators")
+    @classmethod
+    def validate_actuators(cls, v: list[ServoConfig]) -> list[ServoConfig]:
+        """Ensure actuator names are unique and no GPIO pin is shared."""
+        names = [a.name for a in v]
+        if len(set(names)) != len(names):
+            raise ValueError("Actuator names must be unique")
+
+        pins = [p for a in v for p in (a.pins.pwm, a.pins.dir, a.pins.cdir)]
+        if len(set(pins)) != len(pins):
+            raise ValueError("Actuators must not share GPIO pins")
+        return v
+
+    def get_actuator_configs(self) -> list[ServoConfig]:
+        """Get the actuator rig.
+
+        Returns:
+            Configured actuators, or the classic eyes and mouth servos built
+            from the flat eyes_*/mouth_* fields when none are declared
+        """
+        if self.actuators:
+            return list(self.actuators)
+
+        return [
+            ServoConfig(
+                name="eyes",
+                role=ActuatorRole.EYES,
+                pins=PinSet(pwm=self.eyes_pwm, dir=self.eyes_dir, cdir=self.eyes_cdir),
+                speed=self.eyes_speed,
+                duration=self.eyes_duration,
+            ),
+            ServoConfig(
+                name="mouth",
+                role=ActuatorRole.MOUTH,
+                pins=PinSet(pwm=self.mouth_pwm, dir=self.mouth_dir, cdir=self.mouth_cdir),
+                speed=self.mouth_speed,
+                duration=self.mouth_duration,
+            ),
+        ]
+
+
+class BearSettings(BaseModel):
+    """One puppet hosted by this process."""
+
+    id: str = Field(..., min_length=1, pattern=r"^[A-Za-z0-9_-]+$", description="Bear ID used in URLs")
+    actuators: list[ServoConfig] = Field(..., min_length=1, description="Actuator rig for this bear")
+    audio_device: str | None = Field(default=None, description="ALSA device for this bear's speaker")
+    audio_card_index: int | None = Field(default=None, ge=0, description="ALSA card index for mixer")
+    audio_mixer: str | None = Field(default=None, description="ALSA mixer name (defaults to audio.mixer)")
+
+    @field_validator("actuators")
+    @classmethod
+    def validate_actuators(cls, v: list[ServoConfig]) -> list[ServoConfig]:
+        """Apply the same uniqueness rules as a single-bear rig."""
+        return HardwareSettings.validate_actuators(v)
+
 
 class AudioSettings(BaseSettings):
     """Audio playback settings."""
@@ -135,18 +210,30 @@ class AppSettings(BaseSettings):
     debug: bool = Field(default=False, description="Enable debug mode")
     host: str = Field(default="0.0.0.0", description="Server host")
     port: int = Field(default=8080, ge=1, le=65535, description="Server port")
+    admin_token: SecretStr | None = Field(
+        default=None, description="Bearer token for the admin API (disabled when unset)"
+    )
 
     # Nested settings
     hardware: HardwareSettings = Field(default_factory=HardwareSettings)
     audio: AudioSettings = Field(default_factory=AudioSettings)
     tts: TTSSettings = Field(default_factory=TTSSettings)
 
+    # Multiple puppets (empty means a single "default" bear built from hardware/audio)
+    bears: list[BearSettings] = Field(default_factory=list, description="Bears hosted by this process")
+
     # Configuration files
     config_dir: Path = Field(default=Path("config"), description="Configuration directory")
     phrases_file: Path = Field(default=Path("config/phrases.json"), description="Phrases JSON file")
     hardware_config_file: Path | None = Field(
         default=None, description="Optional YAML hardware config override"
     )
+    calibration_file: Path = Field(
+        default=Path("config/calibration.yaml"), description="Per-servo calibration YAML file"
+    )
+    recordings_dir: Path = Field(
+        default=Path("recordings"), description="Directory for recorded session timelines"
+    )
 
     @field_validator("environment")
     @classmethod
@@ -157,6 +244,29 @@ class AppSettings(BaseSettings):
             raise ValueError(f"Environment must be one of: {valid_envs}")
         return v.lower()
 
+    @field_validator("admin_token")
+    @classmethod
+    def disable_empty_admin_token(cls, v: SecretStr | None) -> SecretStr | None:
+        """Treat an empty admin token (e.g. ``ADMIN_TOKEN=``) as unset."""
+        if v is not None and not v.get_secret_value().strip():
+            return None
+        return v
+
+    @field_validator("bears")
+    @classmethod
+    def validate_bears(cls, v: list[BearSettings]) -> list[BearSettings]:
+        """Ensure bear IDs are unique and bears do not share GPIO pins."""
+        ids = [b.id for b in v]
+        if len(set(ids)) != len(ids):
+            raise ValueError("Bear IDs must be unique")
+
+        pins = [
+            p for b in v for a in b.actuators for p in (a.pins.pwm, a.pins.dir, a.pins.cdir)
+        ]
+        if len(set(pins)) != len(pins):
+            raise ValueError("Bears must not share GPIO pins")
+        return v
+
     @field_validator("config_dir")
     @classmethod
     def ensure_config_dir(cls, v: Path) -> Path:
@@ -173,6 +283,8 @@ class AppSettings(BaseSettings):
         if not yaml_file.exists():
             return
 
+        import yaml  # Only needed when there is a file to read
+
         try:
             with open(yaml_file, "r", encoding="utf-8") as f:
                 yaml_data = yaml.safe_load(f)
@@ -184,9 +296,19 @@ class AppSettings(BaseSettings):
             if "hardware" in yaml_data:
                 hw_data = yaml_data["hardware"]
                 for key, value in hw_data.items():
+                    if key == "actuators":
+                        value = HardwareSettings.validate_actuators(
+                            [ServoConfig(**a) for a in value or []]
+                        )
                     if hasattr(self.hardware, key):
                         setattr(self.hardware, key, value)
 
+            # Apply multi-bear configuration
+            if "bears" in yaml_data:
+                self.bears = AppSettings.validate_bears(
+                    [BearSettings(**b) for b in yaml_data["bears"] or []]
+                )
+
             # Apply audio overrides
             if "audio" in yaml_data:
                 audio_data = yaml_data["audio"]
@@ -206,6 +328,26 @@ class AppSettings(BaseSettings):
         except Exception as e:
             raise ConfigurationError(f"Failed to load YAML config: {e}") from e
 
+    def get_bear_configs(self) -> list[BearSettings]:
+        """Get the bears hosted by this process.
+
+        Returns:
+            Configured bears, or a single "default" bear using the hardware
+            actuator rig and audio device when none are declared
+        """
+        if self.bears:
+            return list(self.bears)
+
+        return [
+            BearSettings(
+                id="default",
+                actuators=self.hardware.get_actuator_configs(),
+                audio_device=self.audio.device,
+                audio_card_index=self.audio.card_index,
+                audio_mixer=self.audio.mixer,
+            )
+        ]
+
     @property
     def is_production(self) -> bool:
         """Check if running in production."""
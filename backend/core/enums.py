@@ -19,6 +19,37 @@ class State(str, Enum):
     UNKNOWN = "unknown"
 
 
+class ActuatorRole(str, Enum):
+    """What part of the puppet an actuator drives."""
+
+    MOUTH = "mouth"
+    EYES = "eyes"
+    HEAD = "head"
+    ARMS = "arms"
+
+
+class RezeroStrategy(str, Enum):
+    """How end-stop moves re-zero a servo's position estimate."""
+
+    FULL_TRAVEL = "full_travel"  # Always drive the full calibrated travel into the stop
+    REMAINING = "remaining"  # Drive only the estimated remaining travel plus overdrive
+
+
+class CueKind(str, Enum):
+    """Kinds of cue captured in a recorded session timeline."""
+
+    SERVO = "servo"  # Actuator position command
+    PLAY = "play"  # Sound file playback
+    SPEAK = "speak"  # Text-to-speech
+
+
+class PowerState(str, Enum):
+    """Power states of a bear's control loops and PWM."""
+
+    ACTIVE = "active"  # Control loops running, PWM instances held
+    IDLE = "idle"  # Loops parked and PWM released until the next command
+
+
 class Mode(str, Enum):
     """UI mode states."""
 
@@ -37,7 +37,19 @@ class ConfigurationError(RaspiRuxpinError):
     pass
 
 
+class RecordingError(RaspiRuxpinError):
+    """Raised when recording or replaying a session fails."""
+
+    pass
+
+
 class ValidationError(RaspiRuxpinError):
     """Raised when validation fails."""
 
     pass
+
+
+class ProfilerError(RaspiRuxpinError):
+    """Raised when a profile capture cannot run."""
+
+    pass
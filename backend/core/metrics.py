@@ -0,0 +1,402 @@
+"""Process-wide metrics in the Prometheus text exposition format.
+
+Hot paths (servo moves, GPIO writes, WebSocket sends, TTS) record into
+counters, gauges and histograms defined at module level next to the code
+they measure::
+
+    SERVO_MOVES = metrics.counter("ruxpin_servo_moves_total", "Servo moves", ["servo"])
+    SERVO_MOVES.labels("mouth").inc()
+
+Recording is a plain attribute update (and a bisect for histograms) with
+no locking: a concurrent update from another thread can at worst lose an
+increment, which is acceptable for monitoring. Label children are created
+once and can be kept by the caller to skip the label lookup.
+
+``/api/metrics`` renders the registry with ``MetricsRegistry.exposition``.
+"""
+
+from bisect import bisect_left
+from collections.abc import Sequence
+from typing import Any, Generic, TypeVar
+
+# Histogram bucket upper bounds in seconds, for timings from 1ms to 10s
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class CounterValue:
+    """One labelled series of a counter.
+
+    Attributes:
+        value: Total so far
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        """Initialize at zero."""
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Add to the counter.
+
+        Args:
+            amount: Non-negative amount to add
+        """
+        self.value += amount
+
+
+class GaugeValue:
+    """One labelled series of a gauge.
+
+    Attributes:
+        value: Current value
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        """Initialize at zero."""
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        """Set the gauge.
+
+        Args:
+            value: New value
+        """
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Raise the gauge.
+
+        Args:
+            amount: Amount to add
+        """
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Lower the gauge.
+
+        Args:
+            amount: Amount to subtract
+        """
+        self.value -= amount
+
+
+class HistogramValue:
+    """One labelled series of a histogram.
+
+    Attributes:
+        bounds: Bucket upper bounds, ascending
+        counts: Observations per bucket (not cumulative); the last entry
+            counts observations above every bound
+        sum: Sum of all observations
+        count: Number of observations
+    """
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        """Initialize with no observations.
+
+        Args:
+            bounds: Bucket upper bounds, ascending
+        """
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Record an observation.
+
+        Args:
+            value: Observed value (seconds for timings)
+        """
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+S = TypeVar("S", CounterValue, GaugeValue, HistogramValue)
+
+
+class _Metric(Generic[S]):
+    """Named metric family with optional labels, one series per label set."""
+
+    kind = ""
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()) -> None:
+        """Initialize a family without series.
+
+        Args:
+            name: Metric name
+            help: One-line description
+            labels: Label names
+        """
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+        self._series: dict[tuple[str, ...], S] = {}
+        if not self.label_names:
+            self._unlabelled = self.labels()
+
+    def _new(self) -> S:
+        """Create an empty series."""
+        raise NotImplementedError
+
+    def labels(self, *values: str) -> S:
+        """Get (or create) the series for a set of label values.
+
+        Args:
+            *values: One value per label name, in order
+
+        Returns:
+            The series
+
+        Raises:
+            ValueError: If the number of values doesn't match the labels
+        """
+        series = self._series.get(values)
+        if series is None:
+            if len(values) != len(self.label_names):
+                raise ValueError(
+                    f"Metric {self.name} takes labels {self.label_names}, got {values}"
+                )
+            series = self._series[values] = self._new()
+        return series
+
+    def _label_text(self, values: tuple[str, ...], extra: str = "") -> str:
+        """Render a label set, e.g. ``{servo="mouth"}``."""
+        pairs = [f'{name}="{_escape(value)}"' for name, value in zip(self.label_names, values)]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def samples(self) -> list[str]:
+        """Render the family's sample lines."""
+        raise NotImplementedError
+
+    def exposition(self) -> str:
+        """Render the family with its HELP and TYPE lines."""
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self.samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric[CounterValue]):
+    """Monotonically increasing count."""
+
+    kind = "counter"
+
+    def _new(self) -> CounterValue:
+        """Create an empty series."""
+        return CounterValue()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Add to an unlabelled counter.
+
+        Args:
+            amount: Non-negative amount to add
+        """
+        self._unlabelled.value += amount
+
+    def samples(self) -> list[str]:
+        """Render one line per series."""
+        return [
+            f"{self.name}{self._label_text(values)} {_number(series.value)}"
+            for values, series in list(self._series.items())
+        ]
+
+
+class Gauge(_Metric[GaugeValue]):
+    """Value that goes up and down."""
+
+    kind = "gauge"
+
+    def _new(self) -> GaugeValue:
+        """Create an empty series."""
+        return GaugeValue()
+
+    def set(self, value: float) -> None:
+        """Set an unlabelled gauge.
+
+        Args:
+            value: New value
+        """
+        self._unlabelled.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Raise an unlabelled gauge.
+
+        Args:
+            amount: Amount to add
+        """
+        self._unlabelled.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Lower an unlabelled gauge.
+
+        Args:
+            amount: Amount to subtract
+        """
+        self._unlabelled.value -= amount
+
+    def samples(self) -> list[str]:
+        """Render one line per series."""
+        return [
+            f"{self.name}{self._label_text(values)} {_number(series.value)}"
+            for values, series in list(self._series.items())
+        ]
+
+
+class Histogram(_Metric[HistogramValue]):
+    """Distribution of observations over fixed buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        """Initialize a histogram family without series.
+
+        Args:
+            name: Metric name
+            help: One-line description
+            labels: Label names
+            buckets: Bucket upper bounds
+        """
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, help, labels)
+
+    def _new(self) -> HistogramValue:
+        """Create an empty series."""
+        return HistogramValue(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """Record an observation in an unlabelled histogram.
+
+        Args:
+            value: Observed value (seconds for timings)
+        """
+        self._unlabelled.observe(value)
+
+    def samples(self) -> list[str]:
+        """Render cumulative buckets, sum and count per series."""
+        lines = []
+        for values, series in list(self._series.items()):
+            counts = list(series.counts)
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                le = self._label_text(values, f'le="{_number(bound)}"')
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            labels = self._label_text(values)
+            lines.append(f"{self.name}_sum{labels} {_number(series.sum)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+M = TypeVar("M", Counter, Gauge, Histogram)
+
+
+class MetricsRegistry:
+    """Metric families of the process, rendered together."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._metrics: dict[str, _Metric[Any]] = {}
+
+    def _register(self, metric: M) -> M:
+        """Add a family, or return the existing one of the same name and type.
+
+        Raises:
+            ValueError: If the name is taken by a different type or label set
+        """
+        existing = self._metrics.get(metric.name)
+        if existing is None:
+            self._metrics[metric.name] = metric
+            return metric
+        if not isinstance(existing, type(metric)) or existing.label_names != metric.label_names:
+            raise ValueError(f"Metric {metric.name} already registered differently")
+        return existing
+
+    def counter(self, name: str, help: str, labels: Sequence[str] = ()) -> Counter:
+        """Define a counter.
+
+        Args:
+            name: Metric name (by convention ending in ``_total``)
+            help: One-line description
+            labels: Label names
+
+        Returns:
+            The counter
+        """
+        return self._register(Counter(name, help, labels))
+
+    def gauge(self, name: str, help: str, labels: Sequence[str] = ()) -> Gauge:
+        """Define a gauge.
+
+        Args:
+            name: Metric name
+            help: One-line description
+            labels: Label names
+
+        Returns:
+            The gauge
+        """
+        return self._register(Gauge(name, help, labels))
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Define a histogram.
+
+        Args:
+            name: Metric name (by convention ending in the unit, e.g. ``_seconds``)
+            help: One-line description
+            labels: Label names
+            buckets: Bucket upper bounds
+
+        Returns:
+            The histogram
+        """
+        return self._register(Histogram(name, help, labels, buckets))
+
+    def get(self, name: str) -> _Metric[Any] | None:
+        """Get a registered family by name."""
+        return self._metrics.get(name)
+
+    def exposition(self) -> str:
+        """Render every family in the Prometheus text format (version 0.0.4).
+
+        Returns:
+            Exposition text, ending in a newline
+        """
+        return "".join(metric.exposition() + "\n" for metric in list(self._metrics.values()))
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    """Format a sample value."""
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+# Registry shared by the whole process
+metrics = MetricsRegistry()
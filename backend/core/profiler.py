@@ -0,0 +1,218 @@
+"""Sampling profiler for the live process.
+
+When the mouth stutters on a running show there is no attaching a profiler
+to the service on the Pi. ``SamplingProfiler`` samples the Python stack of
+every thread of the process (the event loop, the executor threads running
+TTS, audio and GPIO calls, the watchdog) with ``sys._current_frames`` at a
+fixed rate, from a thread of its own, and counts identical stacks.
+
+The result is in the collapsed ("folded") stack format read by
+``flamegraph.pl``, speedscope and most flamegraph viewers, one line per
+distinct stack with the thread as its root frame::
+
+    event-loop;__main__:<module>;...;backend.hardware.servo:Servo.move 42
+
+Sampling never stops the other threads beyond the interpreter lock it
+holds to walk their frames (a few microseconds per thread), and a capture
+is bounded: in duration, in the depth of every stack, and in the number of
+distinct stacks kept (later new stacks are counted as ``[truncated]``).
+Only one capture runs at a time.
+
+Threads running native code only (the software PWM threads of RPi.GPIO)
+have no Python frames and do not appear.
+"""
+
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from types import CodeType, FrameType
+
+from backend.core.exceptions import ProfilerError
+
+# Longest capture, in seconds
+MAX_SECONDS = 60.0
+
+# Default and shortest time between samples, in seconds
+DEFAULT_INTERVAL = 0.01
+MIN_INTERVAL = 0.001
+
+# Distinct stacks kept per capture, and frames kept per stack (innermost first)
+MAX_STACKS = 5000
+MAX_DEPTH = 64
+
+# Stand-in for samples of new stacks past MAX_STACKS, and for frames past MAX_DEPTH
+TRUNCATED = "[truncated]"
+ELIDED = "[...]"
+
+# Samples between refreshes of the thread names
+_NAME_REFRESH = 50
+
+
+@dataclass(frozen=True)
+class Profile:
+    """Result of a capture.
+
+    Attributes:
+        stacks: Samples per collapsed stack
+        samples: Number of times every thread was sampled
+        seconds: Wall time the capture ran
+        interval: Requested time between samples, in seconds
+        cpu_seconds: CPU time the sampling itself used
+    """
+
+    stacks: dict[str, int]
+    samples: int
+    seconds: float
+    interval: float
+    cpu_seconds: float
+
+    @property
+    def overhead(self) -> float:
+        """Fraction of one CPU the sampling used."""
+        return self.cpu_seconds / self.seconds if self.seconds else 0.0
+
+    def collapsed(self) -> str:
+        """Render the stacks in the collapsed stack format, most sampled first.
+
+        Returns:
+            One ``frame;frame;... count`` line per stack, ending in a newline
+        """
+        ordered = sorted(self.stacks.items(), key=lambda item: item[1], reverse=True)
+        return "".join(f"{stack} {count}\n" for stack, count in ordered)
+
+
+class SamplingProfiler:
+    """Samples the stacks of every thread of the process.
+
+    Attributes:
+        max_stacks: Distinct stacks kept per capture
+        max_depth: Frames kept per stack
+    """
+
+    def __init__(self, max_stacks: int = MAX_STACKS, max_depth: int = MAX_DEPTH) -> None:
+        """Initialize an idle profiler.
+
+        Args:
+            max_stacks: Distinct stacks kept per capture
+            max_depth: Frames kept per stack
+        """
+        self.max_stacks = max_stacks
+        self.max_depth = max_depth
+        self._lock = threading.Lock()
+        self._labels: dict[CodeType, str] = {}
+
+    @property
+    def busy(self) -> bool:
+        """Whether a capture is running."""
+        return self._lock.locked()
+
+    def capture(
+        self,
+        seconds: float,
+        interval: float = DEFAULT_INTERVAL,
+        loop_thread: int | None = None,
+    ) -> Profile:
+        """Sample every other thread for a while.
+
+        Blocks for ``seconds``: call it from a thread of its own (e.g. with
+        ``asyncio.to_thread``), never on the event loop.
+
+        Args:
+            seconds: How long to sample
+            interval: Time between samples, in seconds
+            loop_thread: Ident of the event loop's thread, labelled
+                ``event-loop`` in the stacks
+
+        Returns:
+            The sampled stacks
+
+        Raises:
+            ValueError: If the duration or interval is out of range
+            ProfilerError: If another capture is running
+        """
+        if not 0 < seconds <= MAX_SECONDS:
+            raise ValueError(f"Capture must last between 0 and {MAX_SECONDS:.0f} seconds")
+        if interval < MIN_INTERVAL:
+            raise ValueError(f"Sampling interval must be at least {1000 * MIN_INTERVAL:.0f}ms")
+        if not self._lock.acquire(blocking=False):
+            raise ProfilerError("A profile capture is already running")
+        try:
+            return self._sample(seconds, interval, loop_thread)
+        finally:
+            self._labels.clear()
+            self._lock.release()
+
+    def _sample(self, seconds: float, interval: float, loop_thread: int | None) -> Profile:
+        """Sample at a fixed rate until the capture ends."""
+        own = threading.get_ident()
+        stacks: dict[str, int] = {}
+        names: dict[int, str] = {}
+        samples = 0
+
+        start = time.monotonic()
+        cpu_start = time.thread_time()
+        deadline = start + seconds
+        next_sample = start
+        while next_sample < deadline:
+            if samples % _NAME_REFRESH == 0:
+                names = self._thread_names(loop_thread)
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = self._collapse(frame, names.get(ident, f"thread-{ident}"))
+                if stack not in stacks and len(stacks) >= self.max_stacks:
+                    stack = TRUNCATED
+                stacks[stack] = stacks.get(stack, 0) + 1
+            samples += 1
+
+            # Skip samples missed while descheduled rather than bunching them up
+            next_sample = max(next_sample + interval, time.monotonic())
+            time.sleep(max(0.0, min(next_sample, deadline) - time.monotonic()))
+
+        return Profile(
+            stacks=stacks,
+            samples=samples,
+            seconds=time.monotonic() - start,
+            interval=interval,
+            cpu_seconds=time.thread_time() - cpu_start,
+        )
+
+    def _collapse(self, frame: FrameType | None, thread: str) -> str:
+        """Render one thread's stack as ``thread;outermost;...;innermost``."""
+        frames: list[str] = []
+        while frame is not None and len(frames) < self.max_depth:
+            frames.append(self._label(frame))
+            frame = frame.f_back
+        if frame is not None:
+            frames.append(ELIDED)
+        frames.append(thread)
+        frames.reverse()
+        return ";".join(frames)
+
+    def _label(self, frame: FrameType) -> str:
+        """Name a frame's function as ``module:qualname``."""
+        code = frame.f_code
+        label = self._labels.get(code)
+        if label is None:
+            module = frame.f_globals.get("__name__", "?")
+            # Semicolons and spaces separate frames and counts in the format
+            label = f"{module}:{code.co_qualname}".replace(";", ",").replace(" ", "_")
+            self._labels[code] = label
+        return label
+
+    @staticmethod
+    def _thread_names(loop_thread: int | None) -> dict[int, str]:
+        """Name the live threads, the event loop's as ``event-loop``."""
+        names = {
+            thread.ident: thread.name.replace(";", ",").replace(" ", "_")
+            for thread in threading.enumerate()
+            if thread.ident is not None
+        }
+        if loop_thread is not None:
+            names[loop_thread] = "event-loop"
+        return names
+
+
+# Profiler shared by the whole process
+profiler = SamplingProfiler()
@@ -0,0 +1,316 @@
+"""Shared tick scheduler for the periodic control loops.
+
+The control loops (mouth sync, servo position tracking, amplitude
+playback, state broadcast, log flushing, blinking) used to each sleep
+their own interval. Their phases drifted against each other, so the CPU
+woke up separately for every loop.
+
+Loops now wait for ticks of a ``RateGroup``, one group per rate. All
+group ticks are aligned to multiples of the group period on the loop
+clock. Faster groups' ticks therefore coincide with slower ones (a 10Hz
+tick is also a 20, 25 and 50Hz tick), and the CPU wakes once for all of
+them.
+
+A group only holds a timer while a loop is waiting on it, so with no
+loop waiting the process sleeps until something else happens. Each
+group tracks how late its ticks fire (jitter), ticks lost to a stalled
+event loop, and overruns of loops whose work spilled past the next tick.
+"""
+
+import asyncio
+import math
+from collections import deque
+from typing import Any
+
+from backend.core.metrics import metrics
+
+# Jitter samples kept per group for statistics
+_JITTER_SAMPLES = 256
+
+LOOP_LAG_SECONDS = metrics.histogram(
+    "ruxpin_loop_lag_seconds",
+    "Time control loops resumed after their tick",
+    buckets=(0.0005, 0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+
+
+class RateGroup:
+    """Phase-aligned ticks at one rate, shared by every loop running at it.
+
+    Attributes:
+        rate: Ticks per second
+        period: Seconds between ticks
+        members: Names of the loops that wait on this group
+        ticks: Ticks fired
+        missed: Ticks skipped because the event loop was stalled past them
+        overruns: Waits that started after the tick following the waiter's
+            previous tick (the loop's work took longer than a period)
+        peak_lateness: Latest a loop resumed after a tick (including time
+            spent behind other loops woken by the same tick) since
+            ``TickScheduler.take_peak_lateness``
+    """
+
+    def __init__(self, rate: float) -> None:
+        """Initialize a group with no waiters.
+
+        Args:
+            rate: Ticks per second
+        """
+        self.rate = rate
+        self.period = 1.0 / rate
+        self.members: set[str] = set()
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._waiters: set[asyncio.Future[int | None]] = set()
+        self._handle: asyncio.TimerHandle | None = None
+        self._deadline = 0.0
+
+        self.ticks = 0
+        self.missed = 0
+        self.overruns = 0
+        self.peak_lateness = 0.0
+        self._jitter: deque[float] = deque(maxlen=_JITTER_SAMPLES)
+
+    def index(self, when: float) -> int:
+        """Get the number of the tick period a loop time falls into.
+
+        Args:
+            when: Loop time
+
+        Returns:
+            Tick index (tick ``n`` fires at ``n * period``)
+        """
+        return math.floor(when / self.period)
+
+    def next_tick(self, until: float | None = None) -> asyncio.Future[int | None]:
+        """Register for the group's next tick.
+
+        Args:
+            until: Loop time to give up waiting at, if that comes first
+
+        Returns:
+            Future resolving to the index of the tick that fired, or to
+            None if ``until`` came first (callers may also resolve it
+            early with None to wake the waiter)
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Timers of a previous event loop (tests run one per test) are gone
+            self._loop = loop
+            self._waiters = set()
+            self._handle = None
+
+        if self._handle is None:
+            self._deadline = (self.index(loop.time()) + 1) * self.period
+            self._handle = loop.call_at(self._deadline, self._fire)
+
+        future: asyncio.Future[int | None] = loop.create_future()
+        self._waiters.add(future)
+        future.add_done_callback(self._discard)
+
+        if until is not None and until < self._deadline:
+            timer = loop.call_at(until, _resolve, future, None)
+            future.add_done_callback(lambda _: timer.cancel())
+
+        return future
+
+    def overdue(self, loop: asyncio.AbstractEventLoop, now: float) -> float | None:
+        """Get how far past its pending tick the group's timer is.
+
+        Only reads attributes, so it is safe to call from other threads.
+
+        Args:
+            loop: Event loop the caller watches
+            now: Current loop time
+
+        Returns:
+            Seconds the pending tick is overdue (0 if not due yet), or None if
+            no loop of ``loop`` waits on the group
+        """
+        if self._loop is not loop or self._handle is None:
+            return None
+        return max(0.0, now - self._deadline)
+
+    def _discard(self, future: asyncio.Future[int | None]) -> None:
+        """Forget a finished waiter, dropping the timer when nobody waits."""
+        self._waiters.discard(future)
+        if not self._waiters and self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _fire(self) -> None:
+        """Wake every waiter of the tick that is due."""
+        lateness = self._loop.time() - self._deadline  # type: ignore[union-attr]
+        self.ticks += 1
+        self.missed += int(lateness // self.period)
+        self._jitter.append(lateness)
+
+        index = round(self._deadline / self.period)
+        waiters, self._waiters = self._waiters, set()
+        self._handle = None
+        for future in waiters:
+            _resolve(future, index)
+
+    def stats(self) -> dict[str, Any]:
+        """Get tick statistics.
+
+        Returns:
+            Rate, members, waiting loops, tick/missed/overrun counts and the
+            mean and max tick lateness over recent ticks, in ms
+        """
+        jitter = self._jitter
+        return {
+            "rate": self.rate,
+            "members": sorted(self.members),
+            "waiting": len(self._waiters),
+            "ticks": self.ticks,
+            "missed": self.missed,
+            "overruns": self.overruns,
+            "jitter_mean_ms": round(1000 * sum(jitter) / len(jitter), 2) if jitter else None,
+            "jitter_max_ms": round(1000 * max(jitter), 2) if jitter else None,
+        }
+
+
+class Ticker:
+    """One loop's handle on a rate group, tracking its overruns.
+
+    Attributes:
+        group: Rate group the loop waits on
+        name: Loop name (listed in the group's members)
+    """
+
+    def __init__(self, group: RateGroup, name: str) -> None:
+        """Initialize a ticker.
+
+        Args:
+            group: Rate group to wait on
+            name: Loop name
+        """
+        self.group = group
+        self.name = name
+        self._last: int | None = None
+        group.members.add(name)
+
+    def next_tick(self, until: float | None = None) -> asyncio.Future[int | None]:
+        """Register for the next tick (see ``RateGroup.next_tick``).
+
+        Counts an overrun when the loop's previous tick is more than one
+        period ago, i.e. the work done since then skipped a tick.
+
+        Args:
+            until: Loop time to give up waiting at, if that comes first
+
+        Returns:
+            Future resolving to the tick index, or None if woken otherwise
+        """
+        if self._last is not None:
+            now = asyncio.get_running_loop().time()
+            if self.group.index(now) > self._last:
+                self.group.overruns += 1
+            self._last = None
+
+        future = self.group.next_tick(until)
+        future.add_done_callback(self._record)
+        return future
+
+    def _record(self, future: asyncio.Future[int | None]) -> None:
+        """Remember the tick the loop woke at and how late it got to run."""
+        if future.cancelled():
+            return
+        self._last = future.result()
+        if self._last is not None:
+            group = self.group
+            lateness = asyncio.get_running_loop().time() - self._last * group.period
+            group.peak_lateness = max(group.peak_lateness, lateness)
+            LOOP_LAG_SECONDS.observe(lateness)
+
+    async def tick(self, until: float | None = None) -> bool:
+        """Wait for the next tick.
+
+        Args:
+            until: Loop time to stop waiting at, if that comes first
+
+        Returns:
+            True if woken by a tick, False if ``until`` came first
+        """
+        return await self.next_tick(until) is not None
+
+
+class TickScheduler:
+    """Rate groups of the periodic loops, keyed by rate."""
+
+    def __init__(self) -> None:
+        """Initialize a scheduler without groups."""
+        self.groups: dict[float, RateGroup] = {}
+
+    def group(self, rate: float) -> RateGroup:
+        """Get (or create) the group ticking at a rate.
+
+        Args:
+            rate: Ticks per second
+
+        Returns:
+            Rate group
+        """
+        if rate not in self.groups:
+            self.groups[rate] = RateGroup(rate)
+        return self.groups[rate]
+
+    def ticker(self, rate: float, name: str) -> Ticker:
+        """Create a loop's ticker on the group for a rate.
+
+        Args:
+            rate: Ticks per second
+            name: Loop name
+
+        Returns:
+            Ticker for the loop
+        """
+        return Ticker(self.group(rate), name)
+
+    def take_peak_lateness(self) -> float:
+        """Get the latest any tick fired since the previous call, and reset it.
+
+        Returns:
+            Worst tick lateness across all groups in seconds (the event
+            loop lag the control loops actually saw)
+        """
+        peak = 0.0
+        for group in self.groups.values():
+            peak = max(peak, group.peak_lateness)
+            group.peak_lateness = 0.0
+        return peak
+
+    def overdue(self, loop: asyncio.AbstractEventLoop, now: float) -> float | None:
+        """Get the event loop's lag from the most overdue pending tick.
+
+        Safe to call from other threads.
+
+        Args:
+            loop: Event loop the caller watches
+            now: Current loop time
+
+        Returns:
+            Seconds the loop is behind (0 if no tick is overdue), or None if
+            no loop waits for a tick
+        """
+        pending = [
+            lag
+            for group in list(self.groups.values())
+            if (lag := group.overdue(loop, now)) is not None
+        ]
+        return max(pending) if pending else None
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Get statistics of every group, keyed like ``"25Hz"``."""
+        return {f"{rate:g}Hz": group.stats() for rate, group in sorted(self.groups.items())}
+
+
+def _resolve(future: asyncio.Future[int | None], result: int | None) -> None:
+    """Resolve a waiter unless it is already done."""
+    if not future.done():
+        future.set_result(result)
+
+
+# Scheduler shared by all loops of the process
+scheduler = TickScheduler()
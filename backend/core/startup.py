@@ -0,0 +1,293 @@
+"""Concurrent startup and shutdown steps ordered by their dependencies.
+
+Bringing the service up is a handful of independent jobs per bear
+(initializing the servos, opening the eyes, loading phrases, syncing the
+mixer) plus a few shared ones (warming up the TTS engine, analyzing the
+sound envelopes). Run one after another, their times add up; most only
+depend on one or two others.
+
+A ``StepGraph`` runs every step as soon as the steps it comes ``after``
+have finished, all others concurrently::
+
+    graph = StepGraph("startup")
+    graph.add("servos", init_servos)
+    graph.add("eyes", open_eyes, after=["servos"])
+    graph.add("phrases", load_phrases, required=False)
+    await graph.run()
+
+A failed step skips the steps depending on it. A failed ``required`` step
+fails the graph; an optional one is logged and reported, and its
+dependents run anyway. ``status`` reports every step's state and timing
+(served by ``/api/ready``), and ``notify_when_ready`` tells systemd when
+the whole graph is done.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any, Literal
+
+from backend.core.exceptions import RaspiRuxpinError
+
+logger = logging.getLogger(__name__)
+
+StepState = Literal["pending", "running", "ready", "failed", "skipped"]
+
+
+class Step:
+    """One step of a graph and its outcome.
+
+    Attributes:
+        name: Step name
+        after: Names of the steps that must finish first
+        required: Whether the graph fails if this step fails
+        state: Current state of the step
+        started: ``time.perf_counter()`` the step started at
+        duration: Seconds the step took (None until it finishes)
+        error: Why the step failed or was skipped
+    """
+
+    def __init__(
+        self,
+        name: str,
+        run: Callable[[], Awaitable[Any]],
+        after: tuple[str, ...],
+        required: bool,
+    ) -> None:
+        """Initialize a pending step.
+
+        Args:
+            name: Step name
+            run: Coroutine function doing the step's work
+            after: Names of the steps that must finish first
+            required: Whether the graph fails if this step fails
+        """
+        self.name = name
+        self.run = run
+        self.after = after
+        self.required = required
+        self.state: StepState = "pending"
+        self.started: float | None = None
+        self.duration: float | None = None
+        self.error: str | None = None
+        self.done = asyncio.Event()
+
+    @property
+    def ok(self) -> bool:
+        """Whether dependents may run (the step succeeded or is optional)."""
+        return self.state == "ready" or (self.state == "failed" and not self.required)
+
+
+class StepGraph:
+    """Steps run concurrently in dependency order.
+
+    Attributes:
+        name: Graph name (for logging)
+        steps: Steps in the order they were added
+        started: ``time.perf_counter()`` the graph started at
+        finished: ``time.perf_counter()`` the last step finished at
+    """
+
+    def __init__(self, name: str) -> None:
+        """Initialize an empty graph.
+
+        Args:
+            name: Graph name (for logging)
+        """
+        self.name = name
+        self.steps: dict[str, Step] = {}
+        self.started: float | None = None
+        self.finished: float | None = None
+        self._tasks: list[asyncio.Task[None]] = []
+
+    def add(
+        self,
+        name: str,
+        run: Callable[[], Awaitable[Any]],
+        after: Iterable[str] = (),
+        required: bool = True,
+    ) -> None:
+        """Add a step.
+
+        Steps can only come after steps already added, so the graph has
+        no cycles.
+
+        Args:
+            name: Step name
+            run: Coroutine function doing the step's work
+            after: Names of the steps that must finish first
+            required: Whether the graph fails if this step fails
+
+        Raises:
+            ValueError: If the name is taken or a dependency is unknown
+        """
+        if name in self.steps:
+            raise ValueError(f"Step '{name}' already added to {self.name}")
+        after = tuple(after)
+        unknown = [dep for dep in after if dep not in self.steps]
+        if unknown:
+            raise ValueError(f"Step '{name}' comes after unknown steps {unknown}")
+        self.steps[name] = Step(name, run, after, required)
+
+    def start(self) -> None:
+        """Start every step in the background (steps wait for their dependencies)."""
+        if self._tasks:
+            return
+        self.started = time.perf_counter()
+        if not self.steps:
+            self.finished = self.started
+        self._tasks = [
+            asyncio.create_task(self._run_step(step), name=f"{self.name}:{step.name}")
+            for step in self.steps.values()
+        ]
+
+    async def wait(self, names: Iterable[str] | None = None) -> None:
+        """Wait for steps to finish.
+
+        Args:
+            names: Steps to wait for (defaults to all of them)
+
+        Raises:
+            RaspiRuxpinError: If one of them is required and did not succeed
+        """
+        steps = [self.steps[name] for name in names] if names is not None else self.steps.values()
+        for step in steps:
+            await step.done.wait()
+        failed = [step for step in steps if step.required and step.state != "ready"]
+        if failed:
+            errors = "; ".join(f"{step.name}: {step.error}" for step in failed)
+            raise RaspiRuxpinError(f"{self.name.capitalize()} failed: {errors}")
+
+    async def run(self) -> None:
+        """Run every step and wait for all of them.
+
+        Raises:
+            RaspiRuxpinError: If a required step did not succeed
+        """
+        self.start()
+        await self.wait()
+
+    async def cancel(self) -> None:
+        """Cancel the steps still running or waiting (e.g. shutting down mid-startup)."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _run_step(self, step: Step) -> None:
+        """Run one step once its dependencies have finished."""
+        try:
+            for name in step.after:
+                dependency = self.steps[name]
+                await dependency.done.wait()
+                if not dependency.ok:
+                    step.state, step.error = "skipped", f"{name} {dependency.state}"
+                    logger.warning(f"{self.name}: skipped {step.name} ({step.error})")
+                    return
+
+            step.state = "running"
+            step.started = time.perf_counter()
+            try:
+                await step.run()
+            except Exception as e:
+                step.state, step.error = "failed", str(e) or type(e).__name__
+                log = logger.error if step.required else logger.warning
+                log(f"{self.name}: {step.name} failed: {step.error}")
+            else:
+                step.state = "ready"
+            step.duration = time.perf_counter() - step.started
+            logger.debug(f"{self.name}: {step.name} {step.state} in {1000 * step.duration:.0f}ms")
+        except asyncio.CancelledError:
+            if step.state in ("pending", "running"):
+                step.state, step.error = "skipped", "cancelled"
+            raise
+        finally:
+            step.done.set()
+            if all(s.done.is_set() for s in self.steps.values()):
+                self.finished = time.perf_counter()
+
+    @property
+    def done(self) -> bool:
+        """Whether every step has finished."""
+        return self.finished is not None
+
+    @property
+    def ready(self) -> bool:
+        """Whether every step has finished and every required one succeeded."""
+        return self.done and all(step.ok for step in self.steps.values())
+
+    def status(self) -> dict[str, Any]:
+        """Report every step's state and timing.
+
+        Returns:
+            Overall readiness, total time so far and per-step state, start
+            offset, duration and error
+        """
+        origin = self.started
+        end = self.finished if self.finished is not None else time.perf_counter()
+        return {
+            "ready": self.ready,
+            "elapsed_ms": round(1000 * (end - origin), 1) if origin is not None else None,
+            "steps": {
+                step.name: {
+                    "state": step.state,
+                    "required": step.required,
+                    "after": list(step.after),
+                    "start_ms": (
+                        round(1000 * (step.started - origin), 1)
+                        if step.started is not None and origin is not None
+                        else None
+                    ),
+                    "duration_ms": (
+                        round(1000 * step.duration, 1) if step.duration is not None else None
+                    ),
+                    "error": step.error,
+                }
+                for step in self.steps.values()
+            },
+        }
+
+
+def notify_systemd(*assignments: str) -> bool:
+    """Send a state update to systemd, for ``Type=notify`` units.
+
+    Args:
+        *assignments: Variable assignments, e.g. ``READY=1``
+
+    Returns:
+        True if the update was sent (False when not run by systemd)
+    """
+    address = os.environ.get("NOTIFY_SOCKET")
+    if not address:
+        return False
+    if address.startswith("@"):
+        # Abstract namespace socket
+        address = "\0" + address[1:]
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+            sock.sendto("\n".join(assignments).encode(), address)
+    except OSError as e:
+        logger.warning(f"Failed to notify systemd: {e}")
+        return False
+    return True
+
+
+async def notify_when_ready(graph: StepGraph) -> None:
+    """Tell systemd the service is ready once every startup step is done.
+
+    On a failed required step only the status is updated, so a
+    ``Type=notify`` unit times out and is restarted.
+
+    Args:
+        graph: Startup graph
+    """
+    try:
+        await graph.wait()
+    except RaspiRuxpinError as e:
+        notify_systemd(f"STATUS={e}")
+        return
+    elapsed = graph.status()["elapsed_ms"]
+    logger.info(f"Ready after {elapsed:.0f}ms")
+    notify_systemd("READY=1", f"STATUS=Ready after {elapsed:.0f}ms")
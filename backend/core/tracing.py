@@ -0,0 +1,326 @@
+"""Span tracing of background commands, exportable as Chrome traces.
+
+The time from a ``speak`` command to the first sound is spread over many
+steps (opening the eyes, TTS, envelope analysis, the pre-roll, starting
+the audio player, servo moves). Each job records the steps it goes through
+as spans::
+
+    with tracer.trace(job_id, "speak"):
+        ...
+        with span("tts.synthesize", "audio", engine="espeak"):
+            ...
+
+The job's trace is carried in a context variable, so spans opened anywhere
+below it (in other coroutines, child tasks and ``asyncio.to_thread``
+workers) join it without being passed around. Outside a traced job a span
+is a context variable lookup and nothing else.
+
+The most recent ``MAX_TRACES`` jobs are kept in memory, each with at most
+``MAX_SPANS`` spans. ``Trace.chrome`` exports one as a Chrome trace event
+file, opened with ``chrome://tracing`` or https://ui.perfetto.dev. Spans
+are laid out in one row per task or thread they ran in.
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any
+
+# Jobs whose traces are kept, and spans kept per job
+MAX_TRACES = 64
+MAX_SPANS = 512
+
+
+@dataclass(frozen=True)
+class SpanRecord:
+    """One finished step of a job.
+
+    Attributes:
+        name: Step name, e.g. ``tts.synthesize``
+        category: Component the step belongs to (websocket, bear, audio, servo)
+        start: ``time.perf_counter()`` the step started at
+        duration: Seconds the step took (0 for an instant event)
+        lane: Task or thread the step ran in
+        args: Extra details of the step
+    """
+
+    name: str
+    category: str
+    start: float
+    duration: float
+    lane: str
+    args: dict[str, Any]
+
+
+class Trace:
+    """Spans recorded for one job.
+
+    Attributes:
+        job_id: ID of the job (the command's ``id``, or one generated for it)
+        command: Command type, e.g. ``speak``
+        started_at: Wall-clock time the job started
+        start: ``time.perf_counter()`` the job started at
+        end: ``time.perf_counter()`` the job ended at (None while running)
+        spans: Finished spans, in the order they ended
+        dropped: Spans not kept because the trace was full
+    """
+
+    def __init__(self, job_id: str, command: str, start: float | None = None) -> None:
+        """Initialize a trace without spans.
+
+        Args:
+            job_id: ID of the job
+            command: Command type
+            start: ``time.perf_counter()`` the job started at (defaults to now)
+        """
+        self.job_id = job_id
+        self.command = command
+        self.started_at = time.time()
+        self.start = time.perf_counter() if start is None else start
+        self.end: float | None = None
+        self.spans: list[SpanRecord] = []
+        self.dropped = 0
+        self.max_spans = MAX_SPANS
+
+    def record(self, name: str, category: str, start: float, end: float, **args: Any) -> None:
+        """Add a finished span.
+
+        Args:
+            name: Step name
+            category: Component the step belongs to
+            start: ``time.perf_counter()`` the step started at
+            end: ``time.perf_counter()`` the step ended at
+            **args: Extra details of the step
+        """
+        if len(self.spans) >= self.max_spans:
+            self.dropped += 1
+            return
+        self.spans.append(SpanRecord(name, category, start, end - start, _lane(), args))
+
+    def summary(self) -> dict[str, Any]:
+        """Describe the job without its spans.
+
+        Returns:
+            Job ID, command, start time, duration and span count
+        """
+        end = time.perf_counter() if self.end is None else self.end
+        return {
+            "job_id": self.job_id,
+            "command": self.command,
+            "started_at": self.started_at,
+            "duration_ms": round(1000 * (end - self.start), 1),
+            "running": self.end is None,
+            "spans": len(self.spans),
+            "dropped": self.dropped,
+        }
+
+    def chrome(self) -> dict[str, Any]:
+        """Export the trace in the Chrome trace event format.
+
+        Returns:
+            JSON-serializable trace with one complete (``X``) or instant
+            (``i``) event per span, timestamps in microseconds from the job
+            start, and one named thread row per task or thread
+        """
+        lanes: dict[str, int] = {}
+        events: list[dict[str, Any]] = []
+        for span in sorted(self.spans, key=lambda s: s.start):
+            tid = lanes.setdefault(span.lane, len(lanes) + 1)
+            event: dict[str, Any] = {
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X" if span.duration else "i",
+                "ts": round(1e6 * (span.start - self.start), 1),
+                "pid": 1,
+                "tid": tid,
+                "args": span.args,
+            }
+            if span.duration:
+                event["dur"] = round(1e6 * span.duration, 1)
+            else:
+                event["s"] = "t"
+            events.append(event)
+
+        process = f"{self.command} {self.job_id}"
+        metadata = [{"name": "process_name", "ph": "M", "pid": 1, "args": {"name": process}}]
+        metadata.extend(
+            {"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": lane}}
+            for lane, tid in lanes.items()
+        )
+        return {
+            "traceEvents": metadata + events,
+            "displayTimeUnit": "ms",
+            "otherData": self.summary(),
+        }
+
+
+class Span:
+    """Context manager recording a step into the current job's trace."""
+
+    __slots__ = ("name", "category", "args", "_trace", "_start")
+
+    def __init__(self, name: str, category: str, **args: Any) -> None:
+        """Prepare a span (recorded only inside a traced job).
+
+        Args:
+            name: Step name
+            category: Component the step belongs to
+            **args: Extra details of the step
+        """
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self) -> "Span":
+        """Start the step."""
+        self._trace = _current.get()
+        if self._trace is not None:
+            self._start = time.perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """End the step, noting the exception that ended it, if any."""
+        if self._trace is None:
+            return
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self._trace.record(self.name, self.category, self._start, time.perf_counter(), **self.args)
+
+
+def span(name: str, category: str, **args: Any) -> Span:
+    """Record a step of the current job.
+
+    Args:
+        name: Step name
+        category: Component the step belongs to
+        **args: Extra details of the step
+
+    Returns:
+        Context manager timing the step
+    """
+    return Span(name, category, **args)
+
+
+def mark(name: str, category: str, **args: Any) -> None:
+    """Record an instant event (e.g. the audio starting) in the current job.
+
+    Args:
+        name: Event name
+        category: Component the event belongs to
+        **args: Extra details of the event
+    """
+    trace = _current.get()
+    if trace is not None:
+        now = time.perf_counter()
+        trace.record(name, category, now, now, **args)
+
+
+def current_trace() -> Trace | None:
+    """Get the trace of the job running in this context, if any."""
+    return _current.get()
+
+
+@contextmanager
+def use_trace(trace: Trace | None) -> Iterator[None]:
+    """Record spans into a job's trace from code not started by the job.
+
+    The mouth sync loops run for the bear's lifetime, outside any job's
+    context; they join the trace of the job they are moving the mouth for.
+
+    Args:
+        trace: Trace to record into (None records nothing)
+    """
+    token = _current.set(trace)
+    try:
+        yield
+    finally:
+        _current.reset(token)
+
+
+class Tracer:
+    """Keeps the traces of the most recent jobs."""
+
+    def __init__(self, max_traces: int = MAX_TRACES) -> None:
+        """Initialize without traces.
+
+        Args:
+            max_traces: Jobs whose traces are kept
+        """
+        self.max_traces = max_traces
+        self._traces: OrderedDict[str, Trace] = OrderedDict()
+
+    @contextmanager
+    def trace(self, job_id: str, command: str, start: float | None = None) -> Iterator[Trace]:
+        """Trace a job: spans opened in this context are recorded into it.
+
+        Args:
+            job_id: ID of the job (a newer job with the same ID replaces it)
+            command: Command type
+            start: ``time.perf_counter()`` the job started at (defaults to now)
+
+        Yields:
+            The job's trace
+        """
+        trace = Trace(job_id, command, start)
+        self._traces.pop(job_id, None)
+        self._traces[job_id] = trace
+        while len(self._traces) > self.max_traces:
+            self._traces.popitem(last=False)
+
+        token = _current.set(trace)
+        try:
+            yield trace
+        finally:
+            trace.end = time.perf_counter()
+            _current.reset(token)
+
+    def get(self, job_id: str) -> Trace | None:
+        """Get a recent job's trace.
+
+        Args:
+            job_id: ID of the job
+
+        Returns:
+            The trace, or None if the job is unknown or too old
+        """
+        return self._traces.get(job_id)
+
+    def recent(self) -> list[dict[str, Any]]:
+        """Describe the kept traces, newest first.
+
+        Returns:
+            One summary per job
+        """
+        return [trace.summary() for trace in reversed(list(self._traces.values()))]
+
+    def clear(self) -> None:
+        """Forget every trace."""
+        self._traces.clear()
+
+
+def _lane() -> str:
+    """Name the task (on the event loop) or thread a span ran in."""
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    if task is not None:
+        return task.get_name()
+    return threading.current_thread().name
+
+
+_current: ContextVar[Trace | None] = ContextVar("trace", default=None)
+
+# Traces of the whole process
+tracer = Tracer()
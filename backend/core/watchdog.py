@@ -0,0 +1,262 @@
+"""Watchdog for event-loop stalls and overrunning servo moves.
+
+A blocking call on the event loop (a synchronous file read, a slow ALSA
+mixer call) stops every coroutine at once, including the one due to stop a
+servo, which keeps driving until the loop comes back.
+
+The ``Watchdog`` runs in its own thread, so it keeps working while the loop
+is stalled:
+
+- Loop lag: the shared scheduler's pending tick timers tell how far behind
+  the loop is, at no cost to the loop itself. A loop more than
+  ``stall_threshold`` behind is stalled; the stall is logged with the stack
+  of the code blocking it (the running coroutine's frames included).
+- Deadlines: servo moves arm the watchdog with the loop time they must stop
+  by. A move still armed ``grace`` past its deadline is braked from the
+  watchdog thread, through ``GPIOManager``, without waiting for the loop.
+
+While no control loop is waiting for a tick (an idle bear) there is nothing
+time-critical to protect: only armed deadlines are watched, and the thread
+polls slowly.
+"""
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+from backend.core.scheduler import TickScheduler, scheduler
+
+logger = logging.getLogger(__name__)
+
+# Seconds between checks while a deadline is armed, while control loops
+# wait for ticks, and while neither (an idle bear)
+DEADLINE_INTERVAL = 0.01
+LAG_INTERVAL = 0.05
+IDLE_INTERVAL = 0.5
+
+# Innermost frames of the blocking stack that are logged
+STACK_DEPTH = 12
+
+# Stall and brake events kept for statistics
+_HISTORY = 32
+
+
+class Watchdog:
+    """Thread watching event-loop lag and servo move deadlines.
+
+    Attributes:
+        stall_threshold: Loop lag (seconds) that counts as a stall
+        grace: Time (seconds) a move may run past its deadline before it is
+            braked from the watchdog thread
+        lag: Loop lag at the latest check, in seconds
+        max_lag: Worst loop lag seen, in seconds
+        stalls: Stalls detected
+        forced_brakes: Moves braked by the watchdog
+    """
+
+    def __init__(
+        self,
+        stall_threshold: float = 0.1,
+        grace: float = 0.05,
+        ticks: TickScheduler = scheduler,
+    ) -> None:
+        """Initialize a stopped watchdog.
+
+        Args:
+            stall_threshold: Loop lag (seconds) that counts as a stall
+            grace: Time (seconds) a move may run past its deadline before it
+                is braked from the watchdog thread
+            ticks: Scheduler whose pending ticks measure loop lag
+        """
+        self.stall_threshold = stall_threshold
+        self.grace = grace
+        self._ticks = ticks
+
+        self._lock = threading.Lock()
+        self._deadlines: dict[str, tuple[float, Callable[[], None]]] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: int | None = None
+        self._thread: threading.Thread | None = None
+        self._stopping = threading.Event()
+
+        self.lag = 0.0
+        self.max_lag = 0.0
+        self.stalls = 0
+        self.forced_brakes = 0
+        self._longest_stall = 0.0
+        self._stall: dict[str, Any] | None = None
+        self._events: deque[dict[str, Any]] = deque(maxlen=_HISTORY)
+
+    @property
+    def running(self) -> bool:
+        """Whether the watchdog thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start watching the running event loop from a new thread.
+
+        Must be called from the event loop's thread.
+        """
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="watchdog", daemon=True)
+        self._thread.start()
+        logger.info("Watchdog started")
+
+    def stop(self) -> None:
+        """Stop the watchdog thread."""
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._thread.join()
+        self._thread = None
+        logger.info("Watchdog stopped")
+
+    def arm(self, key: str, deadline: float, brake: Callable[[], None]) -> None:
+        """Watch a move that must stop by a deadline.
+
+        Args:
+            key: Name of the moving actuator (one deadline per key)
+            deadline: Loop time the move must have stopped by
+            brake: Stops the actuator; called from the watchdog thread, so it
+                must be safe to call from any thread
+        """
+        with self._lock:
+            self._deadlines[key] = (deadline, brake)
+
+    def disarm(self, key: str) -> None:
+        """Stop watching a move (it stopped on its own).
+
+        Args:
+            key: Name the move was armed with
+        """
+        with self._lock:
+            self._deadlines.pop(key, None)
+
+    def _run(self) -> None:
+        """Check until stopped, polling only as often as there is something to watch."""
+        interval = LAG_INTERVAL
+        while not self._stopping.wait(interval):
+            try:
+                watching_lag = self.check()
+            except Exception as e:
+                logger.error(f"Watchdog check failed: {e}")
+                watching_lag = True
+            if self._deadlines:
+                interval = DEADLINE_INTERVAL
+            else:
+                interval = LAG_INTERVAL if watching_lag else IDLE_INTERVAL
+
+    def check(self, now: float | None = None) -> bool:
+        """Brake overdue moves and track loop lag once.
+
+        Args:
+            now: Loop time to check at (defaults to the current time)
+
+        Returns:
+            True if control loops are waiting for ticks, so loop lag can be
+            measured
+        """
+        # The default event loop's clock is time.monotonic()
+        now = time.monotonic() if now is None else now
+        self._brake_overdue(now)
+        lag = None if self._loop is None else self._ticks.overdue(self._loop, now)
+        self._track_lag(now, lag or 0.0)
+        return lag is not None
+
+    def _brake_overdue(self, now: float) -> None:
+        """Brake moves still running past their deadline plus grace."""
+        with self._lock:
+            overdue = [
+                (key, deadline, brake)
+                for key, (deadline, brake) in self._deadlines.items()
+                if now > deadline + self.grace
+            ]
+            for key, _, _ in overdue:
+                del self._deadlines[key]
+
+        for key, deadline, brake in overdue:
+            try:
+                brake()
+            except Exception as e:
+                logger.error(f"Watchdog failed to brake {key}: {e}")
+                continue
+            overrun = now - deadline
+            self.forced_brakes += 1
+            self._record("brake", key=key, overrun_ms=round(1000 * overrun, 1))
+            logger.warning(
+                f"Watchdog braked {key}: still driving {1000 * overrun:.0f}ms past its stop time"
+            )
+
+    def _track_lag(self, now: float, lag: float) -> None:
+        """Detect stalls from the loop lag and log them when they end."""
+        self.lag = lag
+        self.max_lag = max(self.max_lag, lag)
+
+        if lag >= self.stall_threshold:
+            if self._stall is None:
+                self.stalls += 1
+                self._stall = {"start": now - lag, **self._blocking_stack()}
+                logger.warning(
+                    f"Event loop stalled for {1000 * lag:.0f}ms in {self._stall['task']}:\n"
+                    f"{self._stall['stack']}"
+                )
+            return
+
+        if self._stall is not None:
+            stall, self._stall = self._stall, None
+            duration = now - stall["start"]
+            self._longest_stall = max(self._longest_stall, duration)
+            self._record("stall", task=stall["task"], duration_ms=round(1000 * duration, 1))
+            logger.warning(f"Event loop recovered after a {1000 * duration:.0f}ms stall")
+
+    def _blocking_stack(self) -> dict[str, str]:
+        """Capture the stack of the event loop's thread and its running task."""
+        task_name = "callback"
+        try:
+            task = asyncio.current_task(self._loop)
+        except RuntimeError:
+            task = None
+        if task is not None:
+            task_name = f"task '{task.get_name()}' ({task.get_coro().__qualname__})"
+
+        frame = sys._current_frames().get(self._loop_thread)  # type: ignore[arg-type]
+        if frame is None:
+            return {"task": task_name, "stack": "<no stack>"}
+        stack = traceback.format_stack(frame)[-STACK_DEPTH:]
+        return {"task": task_name, "stack": "".join(stack).rstrip()}
+
+    def _record(self, kind: str, **fields: Any) -> None:
+        """Keep an event for statistics."""
+        self._events.append({"time": time.time(), "kind": kind, **fields})
+
+    def stats(self) -> dict[str, Any]:
+        """Get watchdog statistics.
+
+        Returns:
+            Running state, loop lag, stall and forced-brake counts, armed
+            deadlines and recent events
+        """
+        return {
+            "running": self.running,
+            "lag_ms": round(1000 * self.lag, 2),
+            "max_lag_ms": round(1000 * self.max_lag, 2),
+            "stalls": self.stalls,
+            "longest_stall_ms": round(1000 * self._longest_stall, 1),
+            "forced_brakes": self.forced_brakes,
+            "armed": len(self._deadlines),
+            "events": list(self._events),
+        }
+
+
+# Watchdog shared by every bear of the process
+watchdog = Watchdog()
@@ -4,11 +4,13 @@ This module provides DI functions for accessing application services
 and settings throughout the FastAPI application.
 """
 
+import secrets
 from typing import Annotated
 
-from fastapi import Depends, Request
+from fastapi import Depends, Header, HTTPException, Request
 
 from backend.config import AppSettings
+from backend.services.bear_registry import BearRegistry
 from backend.services.bear_service import BearService
 
 
@@ -36,6 +38,48 @@ def get_bear_service(request: Request) -> BearService:
     return request.app.state.bear_service
 
 
+def get_bear_registry(request: Request) -> BearRegistry:
+    """Get bear registry from request state.
+
+    Args:
+        request: FastAPI request
+
+    Returns:
+        Bear registry instance
+    """
+    return request.app.state.bear_registry
+
+
 # Type aliases for dependency injection
 SettingsDep = Annotated[AppSettings, Depends(get_settings)]
 BearServiceDep = Annotated[BearService, Depends(get_bear_service)]
+BearRegistryDep = Annotated[BearRegistry, Depends(get_bear_registry)]
+
+
+def require_admin(
+    settings: SettingsDep, authorization: Annotated[str | None, Header()] = None
+) -> None:
+    """Check the request carries the admin token as a bearer token.
+
+    Args:
+        settings: Application settings
+        authorization: Authorization header
+
+    Raises:
+        HTTPException: 403 if no (or an empty) admin token is configured, 401 if the
+            request's token is missing or wrong
+    """
+    # An empty token must never match an empty bearer credential
+    expected = settings.admin_token.get_secret_value() if settings.admin_token else ""
+    if not expected:
+        raise HTTPException(status_code=403, detail="Admin API is disabled (set ADMIN_TOKEN)")
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not secrets.compare_digest(token.encode(), expected.encode()):
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid admin token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+AdminDep = Annotated[None, Depends(require_admin)]
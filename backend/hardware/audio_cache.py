@@ -0,0 +1,221 @@
+"""Shared audio caches and worker pools for Raspi Ruxpin.
+
+Every ``AudioPlayer`` in the process (one per bear) shares a single
+``AudioCache``, so a phrase synthesized for one bear is not synthesized again
+for another, a sound's amplitude envelope is analyzed once, and TTS
+subprocesses and envelope analysis are bounded process-wide instead of
+per bear.
+"""
+
+import asyncio
+import contextvars
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Coroutine
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from backend.core.metrics import metrics
+from backend.core.tracing import span
+
+logger = logging.getLogger(__name__)
+
+TTS_QUEUE_WAIT_SECONDS = metrics.histogram(
+    "ruxpin_tts_queue_wait_seconds", "Time a synthesis waited for a free TTS slot"
+)
+CACHE_ENTRIES = metrics.gauge("ruxpin_audio_cache_entries", "Entries in the audio caches", ["cache"])
+
+
+@dataclass(frozen=True)
+class Envelope:
+    """Amplitude envelope of an audio file.
+
+    Attributes:
+        amplitudes: Absolute sample amplitudes
+        duration: Playback duration in seconds
+    """
+
+    amplitudes: list[int]
+    duration: float
+
+
+class AudioCache:
+    """Process-wide TTS cache, envelope cache and audio worker pools.
+
+    Attributes:
+        max_tts_entries: Maximum number of cached TTS files
+        max_envelopes: Maximum number of cached amplitude envelopes
+        executor: Thread pool for blocking audio work (WAV decoding)
+    """
+
+    def __init__(
+        self,
+        max_tts_entries: int = 256,
+        max_envelopes: int = 64,
+        tts_concurrency: int = 1,
+        analysis_workers: int = 2,
+    ) -> None:
+        """Initialize the shared cache.
+
+        Args:
+            max_tts_entries: Maximum number of cached TTS files
+            max_envelopes: Maximum number of cached amplitude envelopes
+            tts_concurrency: Maximum TTS syntheses running at once
+            analysis_workers: Threads used for envelope analysis
+        """
+        self.max_tts_entries = max_tts_entries
+        self.max_envelopes = max_envelopes
+        self.executor = ThreadPoolExecutor(
+            max_workers=analysis_workers, thread_name_prefix="audio-worker"
+        )
+
+        self._tts: OrderedDict[str, Path] = OrderedDict()
+        self._envelopes: OrderedDict[tuple[str, int, int], Envelope] = OrderedDict()
+        self._pending: dict[Any, asyncio.Task[Any]] = {}
+        self._tts_semaphore = asyncio.Semaphore(tts_concurrency)
+
+        self.tts_hits = 0
+        self.tts_misses = 0
+        self.envelope_hits = 0
+        self.envelope_misses = 0
+
+        logger.info(
+            f"AudioCache initialized: tts_entries={max_tts_entries}, "
+            f"envelopes={max_envelopes}, tts_concurrency={tts_concurrency}"
+        )
+
+    @staticmethod
+    def tts_key(text: str, *params: Any) -> str:
+        """Build a stable cache key for a synthesis request.
+
+        Args:
+            text: Text to synthesize
+            *params: Engine, voice and any other parameters affecting output
+
+        Returns:
+            Hex digest identifying the request
+        """
+        raw = "\x1f".join([text, *(str(p) for p in params)])
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    async def get_tts(self, key: str, synthesize: Callable[[], Awaitable[Path]]) -> Path:
+        """Get a synthesized file, running ``synthesize`` only on a miss.
+
+        Concurrent requests for the same key share one synthesis.
+
+        Args:
+            key: Cache key from ``tts_key``
+            synthesize: Coroutine factory producing the audio file
+
+        Returns:
+            Path to the synthesized audio file
+        """
+        path = self._tts.get(key)
+        if path is not None and path.exists():
+            self._tts.move_to_end(key)
+            self.tts_hits += 1
+            return path
+
+        self.tts_misses += 1
+
+        async def run() -> Path:
+            queued = time.perf_counter()
+            with span("tts.queue", "audio"):
+                await self._tts_semaphore.acquire()
+            try:
+                TTS_QUEUE_WAIT_SECONDS.observe(time.perf_counter() - queued)
+                path = await synthesize()
+            finally:
+                self._tts_semaphore.release()
+
+            # Cached here, so the file is tracked even if every caller left
+            self._tts[key] = path
+            self._tts.move_to_end(key)
+            while len(self._tts) > self.max_tts_entries:
+                _, evicted = self._tts.popitem(last=False)
+                evicted.unlink(missing_ok=True)
+            CACHE_ENTRIES.labels("tts").set(len(self._tts))
+            return path
+
+        return await self._dedupe(("tts", key), run)
+
+    async def get_envelope(self, audio_file: Path, analyze: Callable[[Path], Envelope]) -> Envelope:
+        """Get an amplitude envelope, analyzing the file only on a miss.
+
+        Entries are keyed by path, size and modification time so a rewritten
+        file (e.g. regenerated TTS) is analyzed again.
+
+        Args:
+            audio_file: Audio file to analyze
+            analyze: Blocking analysis function, run on the worker pool
+
+        Returns:
+            Envelope of the file
+        """
+        stat = audio_file.stat()
+        key = (str(audio_file), stat.st_size, stat.st_mtime_ns)
+
+        envelope = self._envelopes.get(key)
+        if envelope is not None:
+            self._envelopes.move_to_end(key)
+            self.envelope_hits += 1
+            return envelope
+
+        self.envelope_misses += 1
+        loop = asyncio.get_running_loop()
+
+        async def run() -> Envelope:
+            # Carry the job's trace into the worker, as asyncio.to_thread does
+            context = contextvars.copy_context()
+            envelope = await loop.run_in_executor(self.executor, context.run, analyze, audio_file)
+            self._envelopes[key] = envelope
+            while len(self._envelopes) > self.max_envelopes:
+                self._envelopes.popitem(last=False)
+            CACHE_ENTRIES.labels("envelope").set(len(self._envelopes))
+            return envelope
+
+        return await self._dedupe(("envelope", key), run)
+
+    async def _dedupe(self, key: Any, factory: Callable[[], Coroutine[Any, Any, Any]]) -> Any:
+        """Share one in-flight computation between concurrent callers.
+
+        The computation runs in its own task, so a caller that is cancelled
+        (e.g. its client disconnected) leaves it running for the others.
+        """
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.create_task(factory())
+            self._pending[key] = task
+            task.add_done_callback(lambda done: self._finish_pending(key, done))
+        return await asyncio.shield(task)
+
+    def _finish_pending(self, key: Any, task: asyncio.Task[Any]) -> None:
+        """Forget a finished computation."""
+        if self._pending.get(key) is task:
+            del self._pending[key]
+        if not task.cancelled():
+            # Mark retrieved so a failure nobody awaited any more does not warn
+            task.exception()
+
+    def stats(self) -> dict[str, int]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary of cache sizes and hit/miss counters
+        """
+        return {
+            "tts_entries": len(self._tts),
+            "tts_hits": self.tts_hits,
+            "tts_misses": self.tts_misses,
+            "envelope_entries": len(self._envelopes),
+            "envelope_hits": self.envelope_hits,
+            "envelope_misses": self.envelope_misses,
+        }
+
+    def shutdown(self) -> None:
+        """Stop the worker pool."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -9,23 +9,42 @@ import logging
 import platform
 import struct
 import subprocess
+import time
 from pathlib import Path
-from typing import Callable
+from typing import Any, Callable
 
 import wave
 
 from backend.core.exceptions import AudioError
-
-# Optional piper import (only available on Pi with [hardware] dependencies)
-try:
-    from piper import PiperVoice
-
-    PIPER_AVAILABLE = True
-except ImportError:
-    PIPER_AVAILABLE = False
+from backend.core.metrics import metrics
+from backend.core.scheduler import scheduler
+from backend.core.tracing import mark, span
+from backend.hardware.audio_cache import AudioCache, Envelope
 
 logger = logging.getLogger(__name__)
 
+# Amplitude updates per second during playback
+AMPLITUDE_RATE = 50.0
+
+# Phrase synthesized at startup to warm up the TTS engine
+WARM_UP_TEXT = "Hello"
+
+TTS_SECONDS = metrics.histogram(
+    "ruxpin_tts_synthesis_seconds",
+    "Time to synthesize a phrase (cache misses only)",
+    ["engine"],
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 32.0),
+)
+ENVELOPE_SECONDS = metrics.histogram(
+    "ruxpin_envelope_analysis_seconds", "Time to read a WAV file's amplitude envelope"
+)
+FIRST_AUDIO_SECONDS = metrics.histogram(
+    "ruxpin_time_to_first_audio_seconds",
+    "Time from a speak/play request to starting the audio player",
+    ["kind"],
+    buckets=(0.1, 0.15, 0.2, 0.3, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 32.0),
+)
+
 
 class AudioPlayer:
     """Async audio player with amplitude tracking.
@@ -44,6 +63,7 @@ class AudioPlayer:
         tts_speed: Speaking speed for TTS
         current_amplitude: Current audio amplitude (thread-safe)
         volume: Current volume level (0-100)
+        cache: TTS/envelope cache and worker pools (shared between bears)
     """
 
     def __init__(
@@ -60,6 +80,7 @@ class AudioPlayer:
         alsa_device: str | None = None,
         alsa_card_index: int | None = None,
         alsa_mixer: str = "PCM",
+        cache: AudioCache | None = None,
     ) -> None:
         """Initialize audio player.
 
@@ -76,6 +97,7 @@ class AudioPlayer:
             alsa_device: ALSA device name (e.g., 'hw:1,0', 'plughw:1,0')
             alsa_card_index: ALSA card index for mixer control
             alsa_mixer: ALSA mixer name (default 'PCM')
+            cache: Shared audio cache; a private one is created if omitted
         """
         self.sample_rate = sample_rate
         self.amplitude_threshold = amplitude_threshold
@@ -88,14 +110,15 @@ class AudioPlayer:
         self.alsa_device = alsa_device
         self.alsa_card_index = alsa_card_index
         self.alsa_mixer = alsa_mixer
+        self.cache = cache or AudioCache()
 
         self._current_amplitude = 0
         self._amplitude_lock = asyncio.Lock()
         self._volume = start_volume
+        self._start_volume = start_volume
         self._platform = platform.system()
-
-        # Read current system volume and sync
-        asyncio.create_task(self._initialize_volume(start_volume))
+        self._listeners: list[Callable[["AudioPlayer"], None]] = []
+        self._ticker = scheduler.ticker(AMPLITUDE_RATE, "amplitude")
 
         device_info = f", device={alsa_device}" if alsa_device else ""
         card_info = f", card={alsa_card_index}" if alsa_card_index is not None else ""
@@ -115,6 +138,56 @@ class AudioPlayer:
         """Get current volume level."""
         return self._volume
 
+    def add_listener(self, callback: Callable[["AudioPlayer"], None]) -> None:
+        """Register a callback run whenever the volume changes.
+
+        Args:
+            callback: Called with this player after each change
+        """
+        self._listeners.append(callback)
+
+    def _notify(self) -> None:
+        """Run change listeners."""
+        for callback in self._listeners:
+            callback(self)
+
+    async def initialize(self) -> None:
+        """Open the mixer and sync the volume with the system's.
+
+        Called once at startup (the bear's ``mixer`` step).
+        """
+        await self._initialize_volume(self._start_volume)
+
+    async def warm_up(self) -> None:
+        """Synthesize a throwaway phrase so the first real one starts warm.
+
+        The first run of the TTS engine loads its binary and voice data from
+        the SD card, which can take seconds on a Pi Zero.
+
+        Raises:
+            AudioError: If the TTS engine fails
+        """
+        output_file = self.tts_output_dir / "warm_up.wav"
+        try:
+            await self._synthesize(WARM_UP_TEXT, output_file)
+        finally:
+            output_file.unlink(missing_ok=True)
+
+    async def preload_envelopes(self) -> int:
+        """Analyze the sound files into the envelope cache ahead of their first play.
+
+        Stops at the cache's capacity, so nothing analyzed here is evicted
+        by the rest of the preload.
+
+        Returns:
+            Number of sound files analyzed
+        """
+        sounds = await asyncio.to_thread(lambda: sorted(self.sounds_dir.glob("*.wav")))
+        sounds = sounds[: self.cache.max_envelopes]
+        await asyncio.gather(*(self.cache.get_envelope(path, self._analyze) for path in sounds))
+        logger.info(f"Preloaded {len(sounds)} sound envelopes")
+        return len(sounds)
+
     async def _initialize_volume(self, fallback_volume: int) -> None:
         """Initialize volume by reading system volume or using fallback.
 
@@ -126,6 +199,7 @@ class AudioPlayer:
             system_volume = await self.get_system_volume()
             if system_volume is not None:
                 self._volume = system_volume
+                self._notify()
                 logger.info(f"Synced with system volume: {system_volume}%")
             else:
                 # Use fallback and set it
@@ -155,15 +229,9 @@ class AudioPlayer:
                 volume = int(stdout.decode().strip())
                 return volume
             else:
-                # Linux: Read ALSA volume
+                # Linux: Read ALSA volume (mixer calls block, so off the event loop)
                 try:
-                    import alsaaudio
-
-                    if self.alsa_card_index is not None:
-                        mixer = alsaaudio.Mixer(self.alsa_mixer, cardindex=self.alsa_card_index)
-                    else:
-                        mixer = alsaaudio.Mixer(self.alsa_mixer)
-                    volumes = mixer.getvolume()
+                    volumes = await asyncio.to_thread(lambda: self._alsa_mixer().getvolume())
                     return volumes[0] if volumes else None
                 except ImportError:
                     logger.debug("alsaaudio not available")
@@ -172,6 +240,21 @@ class AudioPlayer:
             logger.debug(f"Failed to read system volume: {e}")
             return None
 
+    def _alsa_mixer(self) -> Any:
+        """Open this player's ALSA mixer (blocking).
+
+        Returns:
+            alsaaudio Mixer
+
+        Raises:
+            ImportError: If alsaaudio is not installed
+        """
+        import alsaaudio
+
+        if self.alsa_card_index is not None:
+            return alsaaudio.Mixer(self.alsa_mixer, cardindex=self.alsa_card_index)
+        return alsaaudio.Mixer(self.alsa_mixer)
+
     async def set_volume(self, level: int) -> None:
         """Set system volume level.
 
@@ -196,19 +279,14 @@ class AudioPlayer:
                 )
                 await process.wait()
             else:
-                # Linux: Use ALSA
+                # Linux: Use ALSA (mixer calls block, so off the event loop)
                 try:
-                    import alsaaudio
-
-                    if self.alsa_card_index is not None:
-                        mixer = alsaaudio.Mixer(self.alsa_mixer, cardindex=self.alsa_card_index)
-                    else:
-                        mixer = alsaaudio.Mixer(self.alsa_mixer)
-                    mixer.setvolume(level)
+                    await asyncio.to_thread(lambda: self._alsa_mixer().setvolume(level))
                 except ImportError:
                     logger.warning("alsaaudio not available, skipping volume control")
 
             self._volume = level
+            self._notify()
             logger.info(f"Volume set to {level}%")
         except Exception as e:
             raise AudioError(f"Failed to set volume: {e}") from e
@@ -216,6 +294,9 @@ class AudioPlayer:
     async def generate_tts(self, text: str, output_file: Path | None = None) -> Path:
         """Generate TTS audio file from text.
 
+        Without an explicit output file, results are served from the shared
+        TTS cache keyed by text and voice parameters.
+
         Args:
             text: Text to synthesize
             output_file: Optional output file path
@@ -226,10 +307,36 @@ class AudioPlayer:
         Raises:
             AudioError: If TTS generation fails
         """
-        if self.tts_engine == "piper":
-            return await self._generate_tts_piper(text, output_file)
-        else:
-            return await self._generate_tts_espeak(text, output_file)
+        if output_file:
+            return await self._synthesize(text, output_file)
+
+        key = AudioCache.tts_key(
+            text, self.tts_engine, self.tts_voice, self.tts_speed, self.tts_pitch, self._platform
+        )
+        safe_text = "".join(c if c.isalnum() else "_" for c in text[:30])
+        cached_file = self.tts_output_dir / f"{safe_text}_{key[:10]}.wav"
+
+        with span("tts", "audio", chars=len(text)):
+            return await self.cache.get_tts(key, lambda: self._synthesize(text, cached_file))
+
+    async def _synthesize(self, text: str, output_file: Path | None) -> Path:
+        """Run the configured TTS engine.
+
+        Args:
+            text: Text to synthesize
+            output_file: Optional output file path
+
+        Returns:
+            Path to generated audio file
+        """
+        start = time.perf_counter()
+        with span("tts.synthesize", "audio", engine=self.tts_engine):
+            if self.tts_engine == "piper":
+                path = await self._generate_tts_piper(text, output_file)
+            else:
+                path = await self._generate_tts_espeak(text, output_file)
+        TTS_SECONDS.labels(self.tts_engine).observe(time.perf_counter() - start)
+        return path
 
     async def _generate_tts_piper(self, text: str, output_file: Path | None = None) -> Path:
         """Generate TTS using Piper CLI (neural TTS).
@@ -432,11 +539,38 @@ class AudioPlayer:
         except Exception as e:
             raise AudioError(f"Failed to read amplitude from {audio_file}: {e}") from e
 
+    def _analyze(self, audio_file: Path) -> Envelope:
+        """Read the amplitude envelope and duration of a WAV file.
+
+        Args:
+            audio_file: Path to WAV file
+
+        Returns:
+            Envelope of the file
+
+        Raises:
+            AudioError: If file reading fails
+        """
+        start = time.perf_counter()
+        with span("envelope.analyze", "audio", file=audio_file.name):
+            amplitudes = self._read_amplitude(audio_file)
+            try:
+                with wave.open(str(audio_file), "rb") as wf:
+                    duration = wf.getnframes() / wf.getframerate()
+            except Exception as e:
+                raise AudioError(f"Failed to read duration of {audio_file}: {e}") from e
+        ENVELOPE_SECONDS.observe(time.perf_counter() - start)
+        return Envelope(amplitudes=amplitudes, duration=duration)
+
     async def _update_amplitude_loop(
         self, amplitudes: list[int], duration: float, callback: Callable[[], None] | None
     ) -> None:
         """Update amplitude values during playback.
 
+        Runs on the shared amplitude ticks; each update averages the samples
+        at the current playback position, so late ticks don't slip the
+        envelope behind the audio.
+
         Args:
             amplitudes: List of amplitude values
             duration: Total playback duration
@@ -445,12 +579,16 @@ class AudioPlayer:
         if not amplitudes:
             return
 
-        samples_per_update = max(1, len(amplitudes) // int(duration * 50))  # 50Hz update rate
-        update_interval = duration / (len(amplitudes) / samples_per_update)
+        loop = asyncio.get_running_loop()
+        samples_per_second = len(amplitudes) / duration
+        window = max(1, int(samples_per_second / AMPLITUDE_RATE))
+        start = loop.time()
+        end = start + duration
 
         try:
-            for i in range(0, len(amplitudes), samples_per_update):
-                chunk = amplitudes[i : i + samples_per_update]
+            while (now := loop.time()) < end:
+                index = int((now - start) * samples_per_second)
+                chunk = amplitudes[index : index + window]
                 avg_amplitude = sum(chunk) // len(chunk) if chunk else 0
 
                 async with self._amplitude_lock:
@@ -459,33 +597,40 @@ class AudioPlayer:
                 if callback:
                     callback()
 
-                await asyncio.sleep(update_interval)
+                await self._ticker.tick(until=end)
         finally:
             async with self._amplitude_lock:
                 self._current_amplitude = 0
 
     async def play_file(
-        self, audio_file: Path, amplitude_callback: Callable[[], None] | None = None
+        self,
+        audio_file: Path,
+        amplitude_callback: Callable[[], None] | None = None,
+        *,
+        requested_at: float | None = None,
+        kind: str = "file",
     ) -> None:
         """Play audio file with amplitude tracking.
 
         Args:
             audio_file: Path to audio file
             amplitude_callback: Optional callback for amplitude updates
+            requested_at: ``time.perf_counter()`` of the request being
+                served, for the time-to-first-audio metric (defaults to now)
+            kind: Request kind the metric is labelled with
 
         Raises:
             AudioError: If playback fails
         """
+        requested_at = time.perf_counter() if requested_at is None else requested_at
         if not audio_file.exists():
             raise AudioError(f"Audio file not found: {audio_file}")
 
         try:
-            # Read amplitude data
-            amplitudes = await asyncio.to_thread(self._read_amplitude, audio_file)
-
-            # Get audio duration
-            with wave.open(str(audio_file), "rb") as wf:
-                duration = wf.getnframes() / wf.getframerate()
+            # Read amplitude data and duration (cached, analyzed off the event loop)
+            with span("envelope", "audio"):
+                envelope = await self.cache.get_envelope(audio_file, self._analyze)
+            amplitudes, duration = envelope.amplitudes, envelope.duration
 
             # Set initial amplitude to trigger mouth movement before audio starts
             # This gives the mouth a "head start" to begin opening
@@ -498,7 +643,8 @@ class AudioPlayer:
                     self._current_amplitude = initial_amplitude
 
             # Give mouth time to start moving (monitor checks every 0.04s + servo needs ~0.1s)
-            await asyncio.sleep(0.10)
+            with span("pre_roll", "audio"):
+                await asyncio.sleep(0.10)
 
             # Now start both amplitude tracking and audio together (in sync)
             amplitude_task = asyncio.create_task(
@@ -506,35 +652,48 @@ class AudioPlayer:
             )
 
             # Play audio (platform-specific)
-            if self._platform == "Darwin":
-                # macOS: Use afplay
-                process = await asyncio.create_subprocess_exec(
-                    "afplay",
-                    str(audio_file),
-                    stdout=asyncio.subprocess.DEVNULL,
-                    stderr=asyncio.subprocess.PIPE,
-                )
-            else:
-                # Linux: Use aplay
-                if self.alsa_device:
+            with span("player.spawn", "audio"):
+                if self._platform == "Darwin":
+                    # macOS: Use afplay
                     process = await asyncio.create_subprocess_exec(
-                        "aplay",
-                        "-D",
-                        self.alsa_device,
+                        "afplay",
                         str(audio_file),
                         stdout=asyncio.subprocess.DEVNULL,
                         stderr=asyncio.subprocess.PIPE,
                     )
                 else:
-                    process = await asyncio.create_subprocess_exec(
-                        "aplay",
-                        str(audio_file),
-                        stdout=asyncio.subprocess.DEVNULL,
-                        stderr=asyncio.subprocess.PIPE,
-                    )
-
-            # Wait for playback to complete
-            _, stderr = await process.communicate()
+                    # Linux: Use aplay
+                    if self.alsa_device:
+                        process = await asyncio.create_subprocess_exec(
+                            "aplay",
+                            "-D",
+                            self.alsa_device,
+                            str(audio_file),
+                            stdout=asyncio.subprocess.DEVNULL,
+                            stderr=asyncio.subprocess.PIPE,
+                        )
+                    else:
+                        process = await asyncio.create_subprocess_exec(
+                            "aplay",
+                            str(audio_file),
+                            stdout=asyncio.subprocess.DEVNULL,
+                            stderr=asyncio.subprocess.PIPE,
+                        )
+
+            FIRST_AUDIO_SECONDS.labels(kind).observe(time.perf_counter() - requested_at)
+            mark("audio.started", "audio", file=audio_file.name)
+
+            # Wait for playback to complete (stop the player if cancelled)
+            try:
+                with span("playback", "audio", duration=round(duration, 3)):
+                    _, stderr = await process.communicate()
+            except asyncio.CancelledError:
+                amplitude_task.cancel()
+                if process.returncode is None:
+                    process.kill()
+                    await process.wait()
+                logger.info(f"Playback cancelled: {audio_file}")
+                raise
 
             if process.returncode != 0:
                 raise AudioError(f"Audio playback failed: {stderr.decode()}")
@@ -558,8 +717,11 @@ class AudioPlayer:
         Raises:
             AudioError: If sound file not found or playback fails
         """
+        requested_at = time.perf_counter()
         sound_file = self.sounds_dir / f"{sound_name}.wav"
-        await self.play_file(sound_file, amplitude_callback)
+        await self.play_file(
+            sound_file, amplitude_callback, requested_at=requested_at, kind="sound"
+        )
 
     async def speak(self, text: str, amplitude_callback: Callable[[], None] | None = None) -> None:
         """Synthesize and play speech.
@@ -571,11 +733,13 @@ class AudioPlayer:
         Raises:
             AudioError: If TTS or playback fails
         """
+        requested_at = time.perf_counter()
+
         # Generate TTS
         tts_file = await self.generate_tts(text)
 
         # Play the generated file
-        await self.play_file(tts_file, amplitude_callback)
+        await self.play_file(tts_file, amplitude_callback, requested_at=requested_at, kind="speak")
 
     def is_mouth_open_threshold(self) -> bool:
         """Check if current amplitude exceeds mouth threshold.
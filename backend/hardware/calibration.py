@@ -0,0 +1,337 @@
+"""Per-servo calibration for Raspi Ruxpin.
+
+The original Teddy Ruxpin motors are neither linear nor symmetric: the jaw
+opens slower than it closes, and both directions lose time to gear slack
+whenever the motor starts or reverses. This module models each servo with
+separate open/close travel curves so move durations can be computed by table
+lookup instead of assuming ``duration * delta / 100``.
+
+Calibrations are persisted in ``config/calibration.yaml``::
+
+    servos:
+      mouth:
+        open_curve: [[0, 0.0], [50, 0.12], [100, 0.30]]
+        close_curve: [[0, 0.24], [50, 0.10], [100, 0.0]]
+        startup_slack: 0.02
+        reversal_slack: 0.015
+        deadband: 4
+        rezero: remaining
+        rezero_overdrive: 0.05
+        drift_per_move: 0.5
+        drift_per_travel: 0.02
+
+In a multi-bear process an entry named ``<bear_id>.<servo>`` takes precedence
+over the plain servo name for that bear.
+"""
+
+import logging
+from bisect import bisect_right
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, ValidationInfo, field_validator
+
+from backend.core.enums import Direction, RezeroStrategy
+from backend.core.exceptions import ConfigurationError
+
+logger = logging.getLogger(__name__)
+
+# Longest single move the servo driver accepts (see Servo._move)
+MAX_MOVE_DURATION = 2.0
+
+
+def _interpolate(xs: list[float], ys: list[float], x: float) -> float:
+    """Piecewise-linear lookup of ``x`` in a sorted table."""
+    if x <= xs[0]:
+        return ys[0]
+    if x >= xs[-1]:
+        return ys[-1]
+
+    i = bisect_right(xs, x) - 1
+    span = xs[i + 1] - xs[i]
+    if span == 0:
+        return ys[i + 1]
+    return ys[i] + (ys[i + 1] - ys[i]) * (x - xs[i]) / span
+
+
+class ServoCalibration(BaseModel):
+    """Travel-time model for a single servo.
+
+    Both curves map position percent to seconds of travel measured from the
+    end-stop the move starts at: ``open_curve`` from fully closed (0%) and
+    ``close_curve`` from fully open (100%). Travel time between two positions
+    is the difference of the curve values.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    open_curve: list[tuple[int, float]] = Field(
+        ..., min_length=2, description="(percent, seconds from closed) points for opening"
+    )
+    close_curve: list[tuple[int, float]] = Field(
+        ..., min_length=2, description="(percent, seconds from open) points for closing"
+    )
+    startup_slack: float = Field(
+        default=0.0, ge=0, le=0.5, description="Seconds lost to static friction on every move"
+    )
+    reversal_slack: float = Field(
+        default=0.0, ge=0, le=0.5, description="Extra seconds of gear backlash on direction change"
+    )
+    deadband: int = Field(
+        default=8, ge=0, le=50, description="Skip moves smaller than this many percent"
+    )
+    rezero: RezeroStrategy = Field(
+        default=RezeroStrategy.FULL_TRAVEL, description="End-stop re-zero strategy"
+    )
+    rezero_overdrive: float = Field(
+        default=0.0, ge=0, le=0.5, description="Extra seconds to drive into an end-stop"
+    )
+    drift_per_move: float = Field(
+        default=0.5, ge=0, le=20, description="Estimate error (percent) added by each partial move"
+    )
+    drift_per_travel: float = Field(
+        default=0.02, ge=0, le=1, description="Estimate error added per percent of partial travel"
+    )
+
+    _open_pct: list[float] = PrivateAttr(default_factory=list)
+    _open_sec: list[float] = PrivateAttr(default_factory=list)
+    _close_pct: list[float] = PrivateAttr(default_factory=list)
+    _close_sec: list[float] = PrivateAttr(default_factory=list)
+
+    @field_validator("open_curve", "close_curve")
+    @classmethod
+    def validate_curve(
+        cls, v: list[tuple[int, float]], info: ValidationInfo
+    ) -> list[tuple[int, float]]:
+        """Ensure a curve spans 0-100% and is monotonic in its direction."""
+        points = sorted(v)
+        percents = [p for p, _ in points]
+        if percents[0] != 0 or percents[-1] != 100:
+            raise ValueError("Calibration curve must include 0 and 100 percent")
+        if len(set(percents)) != len(percents):
+            raise ValueError("Calibration curve has duplicate percent points")
+        if any(s < 0 for _, s in points):
+            raise ValueError("Calibration curve times must be non-negative")
+
+        times = [s for _, s in points]
+        if max(times) <= 0:
+            raise ValueError("Calibration curve must have a positive full travel time")
+        if info.field_name == "open_curve" and any(b < a for a, b in zip(times, times[1:])):
+            raise ValueError("open_curve times must increase with percent")
+        if info.field_name == "close_curve" and any(b > a for a, b in zip(times, times[1:])):
+            raise ValueError("close_curve times must decrease with percent")
+        return points
+
+    def model_post_init(self, __context: Any) -> None:
+        """Pre-split curves into lookup tables."""
+        self._open_pct = [float(p) for p, _ in self.open_curve]
+        self._open_sec = [s for _, s in self.open_curve]
+        self._close_pct = [float(p) for p, _ in self.close_curve]
+        self._close_sec = [s for _, s in self.close_curve]
+
+    @classmethod
+    def linear(cls, full_travel: float) -> "ServoCalibration":
+        """Build the legacy linear, symmetric model.
+
+        Args:
+            full_travel: Seconds for a full 0-100% move in either direction
+
+        Returns:
+            Calibration equivalent to ``duration * delta / 100`` timing
+        """
+        return cls(
+            open_curve=[(0, 0.0), (100, full_travel)],
+            close_curve=[(0, full_travel), (100, 0.0)],
+        )
+
+    def full_travel(self, direction: Direction) -> float:
+        """Get seconds for a full end-stop to end-stop move.
+
+        Args:
+            direction: OPENING or CLOSING
+
+        Returns:
+            Full travel time in seconds
+        """
+        if direction == Direction.OPENING:
+            return self._open_sec[-1]
+        return self._close_sec[0]
+
+    def travel_time(self, start: float, target: float) -> float:
+        """Look up pure travel time between two positions.
+
+        Args:
+            start: Starting position percent
+            target: Target position percent
+
+        Returns:
+            Travel time in seconds (no slack)
+        """
+        if target > start:
+            return _interpolate(self._open_pct, self._open_sec, target) - _interpolate(
+                self._open_pct, self._open_sec, start
+            )
+        return _interpolate(self._close_pct, self._close_sec, target) - _interpolate(
+            self._close_pct, self._close_sec, start
+        )
+
+    def move_duration(
+        self,
+        start: float,
+        target: float,
+        reversing: bool = False,
+        scale: float = 1.0,
+        uncertainty: float = 0.0,
+    ) -> float:
+        """Compute the commanded duration for a move, including slack.
+
+        End-stop targets (0% or 100%) also get ``rezero_overdrive`` plus a
+        margin covering ``uncertainty`` so the motor lands against the stop
+        and the estimate is exact afterwards.
+
+        Args:
+            start: Starting position percent
+            target: Target position percent
+            reversing: Whether the move reverses the previous direction
+            scale: Multiplier applied to the curve travel time
+            uncertainty: Estimated position error in percent
+
+        Returns:
+            Move duration in seconds
+        """
+        duration = self.travel_time(start, target) * scale + self.startup_slack
+        if reversing:
+            duration += self.reversal_slack
+        if target in (0, 100):
+            direction = Direction.OPENING if target > start else Direction.CLOSING
+            duration += self.rezero_overdrive + self.margin_time(direction, uncertainty) * scale
+        return min(duration, MAX_MOVE_DURATION)
+
+    def endstop_duration(
+        self, direction: Direction, start: float, known: bool, uncertainty: float = 0.0
+    ) -> float:
+        """Compute the duration for an explicit open()/close() move.
+
+        Args:
+            direction: OPENING or CLOSING
+            start: Current estimated position percent
+            known: Whether the current estimate can be trusted
+            uncertainty: Estimated position error in percent, covered by
+                extra drive time under the REMAINING strategy
+
+        Returns:
+            Move duration in seconds
+        """
+        target = 100 if direction == Direction.OPENING else 0
+        if self.rezero == RezeroStrategy.REMAINING and known:
+            travel = self.travel_time(start, target) + self.margin_time(direction, uncertainty)
+        else:
+            travel = self.full_travel(direction)
+        return min(travel + self.startup_slack + self.rezero_overdrive, MAX_MOVE_DURATION)
+
+    def margin_time(self, direction: Direction, uncertainty: float) -> float:
+        """Get extra drive time that covers an estimate error near an end-stop.
+
+        Args:
+            direction: OPENING or CLOSING
+            uncertainty: Estimated position error in percent
+
+        Returns:
+            Seconds of additional travel
+        """
+        return self.full_travel(direction) * min(max(uncertainty, 0.0), 100.0) / 100
+
+    def drift_for_move(self, delta: float) -> float:
+        """Get the estimate error a partial move of ``delta`` percent adds.
+
+        Args:
+            delta: Size of the move in percent
+
+        Returns:
+            Added position uncertainty in percent
+        """
+        return self.drift_per_move + self.drift_per_travel * abs(delta)
+
+    def position_at(self, direction: Direction, start: float, elapsed: float) -> float:
+        """Estimate position after moving for ``elapsed`` seconds.
+
+        This is the inverse lookup used to animate the position estimate
+        along the calibrated (non-linear) curve.
+
+        Args:
+            direction: OPENING or CLOSING
+            start: Position percent when the move started
+            elapsed: Seconds of actual travel (slack already removed)
+
+        Returns:
+            Estimated position percent, clamped to 0-100
+        """
+        if direction == Direction.OPENING:
+            t = _interpolate(self._open_pct, self._open_sec, start) + max(elapsed, 0.0)
+            return _interpolate(self._open_sec, self._open_pct, t)
+
+        # Close curve times decrease with percent; invert on reversed tables
+        t = _interpolate(self._close_pct, self._close_sec, start) + max(elapsed, 0.0)
+        return _interpolate(self._close_sec[::-1], self._close_pct[::-1], t)
+
+
+def load_calibrations(path: Path) -> dict[str, ServoCalibration]:
+    """Load servo calibrations from YAML.
+
+    Args:
+        path: Calibration YAML file
+
+    Returns:
+        Mapping of servo name to calibration (empty if the file is missing)
+
+    Raises:
+        ConfigurationError: If the file cannot be parsed or is invalid
+    """
+    if not path.exists():
+        logger.debug(f"No calibration file at {path}, using linear timing")
+        return {}
+
+    import yaml  # Only needed when there is a file to read
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = yaml.safe_load(f) or {}
+
+        servos = data.get("servos", {}) or {}
+        calibrations = {name: ServoCalibration(**values) for name, values in servos.items()}
+        logger.info(f"Loaded calibration for {len(calibrations)} servos from {path}")
+        return calibrations
+    except yaml.YAMLError as e:
+        raise ConfigurationError(f"Failed to parse calibration file: {e}") from e
+    except Exception as e:
+        raise ConfigurationError(f"Failed to load calibration file: {e}") from e
+
+
+def save_calibrations(path: Path, calibrations: dict[str, ServoCalibration]) -> None:
+    """Persist servo calibrations to YAML.
+
+    Args:
+        path: Calibration YAML file
+        calibrations: Mapping of servo name to calibration
+
+    Raises:
+        ConfigurationError: If the file cannot be written
+    """
+    servos = {
+        name: {
+            **cal.model_dump(mode="json"),
+            "open_curve": [list(p) for p in cal.open_curve],
+            "close_curve": [list(p) for p in cal.close_curve],
+        }
+        for name, cal in calibrations.items()
+    }
+
+    import yaml
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            yaml.safe_dump({"servos": servos}, f, sort_keys=False)
+        logger.info(f"Saved calibration for {len(calibrations)} servos to {path}")
+    except Exception as e:
+        raise ConfigurationError(f"Failed to save calibration file: {e}") from e
@@ -10,9 +10,12 @@ import platform
 from typing import Any, Literal, Protocol
 
 from backend.core.exceptions import GPIOError
+from backend.core.metrics import metrics
 
 logger = logging.getLogger(__name__)
 
+GPIO_WRITES = metrics.counter("ruxpin_gpio_writes_total", "GPIO output writes")
+
 
 class PWM(Protocol):
     """Protocol for PWM objects."""
@@ -185,6 +188,7 @@ class GPIOManager:
             gpio_value = self.gpio.HIGH if value else self.gpio.LOW
             self.gpio.output(pin, gpio_value)
             self.pin_states[pin] = value  # Track the state
+            GPIO_WRITES.inc()
             logger.debug(f"Pin {pin} set to {'HIGH' if value else 'LOW'}")
         except Exception as e:
             raise GPIOError(f"Failed to set output on pin {pin}: {e}") from e
@@ -221,6 +225,43 @@ class GPIOManager:
         except Exception as e:
             raise GPIOError(f"Failed to create PWM on pin {pin}: {e}") from e
 
+    def release_pwm(self, pin: int) -> None:
+        """Stop and drop the PWM instance of a pin, keeping the pin set up.
+
+        Output levels set on the pin's other channels (e.g. a servo's brake)
+        stay as they are. ``create_pwm`` makes a new instance when needed.
+
+        Args:
+            pin: GPIO pin number (BCM numbering)
+        """
+        pwm = self.active_pwms.pop(pin, None)
+        if pwm is None:
+            return
+        try:
+            pwm.stop()
+            logger.debug(f"Released PWM on pin {pin}")
+        except Exception as e:
+            logger.error(f"Error releasing PWM on pin {pin}: {e}")
+
+    def brake(self, pwm_pin: int, *direction_pins: int) -> None:
+        """Stop a motor immediately: stop its PWM and drive its direction pins low.
+
+        Works on the pins directly, without waiting for whoever is driving
+        the motor, so it may be called from any thread (e.g. the watchdog's).
+
+        Args:
+            pwm_pin: GPIO pin of the motor's PWM (BCM numbering)
+            direction_pins: GPIO pins of the motor's direction inputs
+
+        Raises:
+            GPIOError: If a pin is not set up or output fails
+        """
+        pwm = self.active_pwms.get(pwm_pin)
+        if pwm is not None:
+            pwm.stop()
+        for pin in direction_pins:
+            self.output(pin, False)
+
     def cleanup_pin(self, pin: int) -> None:
         """Clean up a specific GPIO pin.
 
@@ -2,6 +2,8 @@
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from backend.core.enums import ActuatorRole
+
 
 class PinSet(BaseModel):
     """Represents a set of GPIO pins for a servo motor."""
@@ -16,10 +18,19 @@ class PinSet(BaseModel):
 
 
 class ServoConfig(BaseModel):
-    """Configuration for a single servo motor."""
+    """Configuration for a single servo motor.
+
+    A list of these declares the puppet's actuator rig. The role decides which
+    control loop drives the actuator (mouth sync, blinking, manual only).
+    """
 
     model_config = ConfigDict(frozen=True)
 
+    name: str = Field(..., min_length=1, description="Unique actuator name (e.g. 'mouth')")
+    role: ActuatorRole = Field(..., description="Part of the puppet this actuator drives")
     pins: PinSet = Field(..., description="GPIO pins for this servo")
     speed: int = Field(default=100, ge=1, le=1000, description="PWM frequency in Hz")
     duration: float = Field(default=0.4, gt=0, le=2.0, description="Default movement duration")
+    update_rate: float = Field(
+        default=25.0, gt=0, le=100, description="Control loop update rate in Hz"
+    )
@@ -6,15 +6,36 @@ dependency injection, and type safety.
 
 import asyncio
 import logging
-from typing import Literal
+import time
+from collections.abc import Callable
+from typing import Any, Literal
 
 from backend.core.enums import Direction, State
 from backend.core.exceptions import ServoError
+from backend.core.metrics import metrics
+from backend.core.scheduler import scheduler
+from backend.core.tracing import span
+from backend.core.watchdog import watchdog
+from backend.hardware.calibration import ServoCalibration
 from backend.hardware.gpio_manager import GPIOManager
 from backend.hardware.models import PinSet
 
 logger = logging.getLogger(__name__)
 
+# Position estimate updates per second during a move
+TRACK_RATE = 20.0
+
+SERVO_MOVES = metrics.counter("ruxpin_servo_moves_total", "Servo moves driven", ["servo"])
+SERVO_MOVE_SECONDS = metrics.histogram(
+    "ruxpin_servo_move_seconds", "Time servo moves drove the motor", ["servo"]
+)
+SERVO_MOVE_OVERRUN_SECONDS = metrics.histogram(
+    "ruxpin_servo_move_overrun_seconds",
+    "Time completed servo moves drove past their planned duration",
+    ["servo"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.02, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+
 
 class Servo:
     """Async servo motor controller.
@@ -28,7 +49,11 @@ class Servo:
         speed: PWM frequency in Hz
         default_duration: Default movement duration in seconds
         gpio_manager: GPIO manager for hardware control
+        calibration: Travel-time model used to compute move durations
         state: Current servo state (OPEN, CLOSED, UNKNOWN)
+        position_percent: Estimated position (0 = fully closed, 100 = fully open)
+        position_uncertainty: Estimated dead-reckoning error in percent
+        last_move_start: Loop time the most recent move started driving
         pwm: PWM instance for speed control
     """
 
@@ -39,6 +64,7 @@ class Servo:
         speed: int,
         default_duration: float,
         gpio_manager: GPIOManager,
+        calibration: ServoCalibration | None = None,
     ) -> None:
         """Initialize servo controller.
 
@@ -48,6 +74,8 @@ class Servo:
             speed: PWM frequency (1-1000 Hz)
             default_duration: Default movement duration (0-2.0 seconds)
             gpio_manager: Initialized GPIO manager
+            calibration: Optional travel-time model. Defaults to linear
+                timing with ``default_duration`` for a full move.
 
         Raises:
             ServoError: If parameters are invalid
@@ -63,16 +91,88 @@ class Servo:
         self.speed = speed
         self.default_duration = default_duration
         self.gpio_manager = gpio_manager
-        self.state = State.UNKNOWN
-        self.position_percent = 0  # 0 = fully closed, 100 = fully open
+        self.calibration = calibration or ServoCalibration.linear(default_duration)
+        self._listeners: list[Callable[["Servo"], None]] = []
+        self._state = State.UNKNOWN
+        self._position_percent = 0  # 0 = fully closed, 100 = fully open
         self.pwm = None
         self._lock = asyncio.Lock()
+        self._last_direction: Direction | None = None
+        self.last_move_start: float | None = None
+
+        # Preemptive moves: each request bumps the generation; a move stops
+        # as soon as the generation it was requested at is superseded (a
+        # new request wakes the move's pending tracking step)
+        self._generation = 0
+        self._step: asyncio.Future[int | None] | None = None
+        self._ticker = scheduler.ticker(TRACK_RATE, f"servo:{name}")
+        self._watch_key = f"servo '{name}' (pin {pins.pwm})"
+        self._moves_metric = SERVO_MOVES.labels(name)
+        self._move_seconds = SERVO_MOVE_SECONDS.labels(name)
+        self._overrun_seconds = SERVO_MOVE_OVERRUN_SECONDS.labels(name)
+
+        # Dead-reckoning drift tracking (unknown until the first end-stop move)
+        self.position_uncertainty = 100.0
+        self._moves_total = 0
+        self._moves_since_home = 0
+        self._rehome_count = 0
+        self._max_uncertainty = 0.0
+        self._drift_corrected = 0.0
+        self._last_home_time: float | None = None
 
         logger.info(
             f"Servo '{name}' initialized: pins={pins.model_dump()}, "
-            f"speed={speed}Hz, duration={default_duration}s"
+            f"speed={speed}Hz, duration={default_duration}s, "
+            f"calibrated={calibration is not None}"
         )
 
+    @property
+    def state(self) -> State:
+        """Current servo state (OPEN, CLOSED, UNKNOWN)."""
+        return self._state
+
+    @state.setter
+    def state(self, value: State) -> None:
+        if value != self._state:
+            self._state = value
+            self._notify()
+
+    @property
+    def position_percent(self) -> int:
+        """Estimated position (0 = fully closed, 100 = fully open)."""
+        return self._position_percent
+
+    @position_percent.setter
+    def position_percent(self, value: int) -> None:
+        if value != self._position_percent:
+            self._position_percent = value
+            self._notify()
+
+    @property
+    def moving(self) -> bool:
+        """Whether a move is in progress."""
+        return self._lock.locked()
+
+    @property
+    def released(self) -> bool:
+        """Whether the PWM instance is released (see ``release``)."""
+        return self.pwm is None
+
+    def add_listener(self, callback: Callable[["Servo"], None]) -> None:
+        """Register a callback run whenever state or position changes.
+
+        Callbacks run synchronously inside the move, so they must be cheap.
+
+        Args:
+            callback: Called with this servo after each change
+        """
+        self._listeners.append(callback)
+
+    def _notify(self) -> None:
+        """Run change listeners."""
+        for callback in self._listeners:
+            callback(self)
+
     async def initialize(self) -> None:
         """Initialize GPIO pins and PWM.
 
@@ -97,6 +197,42 @@ class Servo:
         except Exception as e:
             raise ServoError(f"Failed to initialize servo '{self.name}': {e}") from e
 
+    def release(self) -> None:
+        """Release the PWM instance while the servo is parked.
+
+        The servo stays braked and keeps its position estimate. Call
+        ``resume`` before moving it again. Must not be called during a move.
+        """
+        if self.pwm is None:
+            return
+        self.gpio_manager.release_pwm(self.pins.pwm)
+        self.pwm = None
+        logger.debug(f"Servo '{self.name}' released PWM")
+
+    def resume(self) -> None:
+        """Recreate the PWM instance after ``release``.
+
+        Raises:
+            ServoError: If PWM creation fails
+        """
+        if self.pwm is not None:
+            return
+        try:
+            self.pwm = self.gpio_manager.create_pwm(self.pins.pwm, self.speed)
+        except Exception as e:
+            raise ServoError(f"Failed to resume servo '{self.name}': {e}") from e
+        logger.debug(f"Servo '{self.name}' resumed PWM")
+
+    def force_brake(self) -> None:
+        """Stop driving right away, bypassing the move in progress.
+
+        Safe to call from any thread. A cancelled or failed move brakes with
+        it right away; the watchdog uses it as a backstop when a stalled
+        event loop leaves the servo driving past its stop time. A stalled
+        move still stops and brakes normally once the loop resumes.
+        """
+        self.gpio_manager.brake(self.pins.pwm, self.pins.dir, self.pins.cdir)
+
     async def _set_direction(self, direction: Direction) -> None:
         """Set servo direction.
 
@@ -115,12 +251,13 @@ class Servo:
 
         logger.debug(f"Servo '{self.name}' direction set to {direction.value}")
 
-    async def _move(self, direction: Direction, duration: float) -> None:
+    async def _move(self, direction: Direction, duration: float, scale: float = 1.0) -> None:
         """Move servo in specified direction for given duration.
 
         Args:
             direction: Direction to move (OPENING or CLOSING)
             duration: Movement duration in seconds
+            scale: Ratio of this move's speed profile to the calibrated one
 
         Raises:
             ServoError: If duration is invalid or PWM not initialized
@@ -133,59 +270,172 @@ class Servo:
 
         async with self._lock:
             try:
-                # Set direction and start PWM
+                # Watch before driving, so a move cut off while starting is still braked
+                self._start_watch(duration)
                 await self._set_direction(direction)
                 await asyncio.to_thread(self.pwm.start, 50)
+                started = self._rearm_watch(duration)
 
                 # Animate position during movement
-                start_position = self.position_percent
                 target_position = 100 if direction == Direction.OPENING else 0
-                start_time = asyncio.get_event_loop().time()
-
-                # Update position in small increments during movement
-                update_interval = 0.05  # 20Hz updates
-                while True:
-                    elapsed = asyncio.get_event_loop().time() - start_time
-                    if elapsed >= duration:
-                        self.position_percent = target_position
-                        break
-
-                    # Linear interpolation of position
-                    progress = elapsed / duration
-                    self.position_percent = int(
-                        start_position + (target_position - start_position) * progress
-                    )
-
-                    await asyncio.sleep(update_interval)
+                await self._track_position(direction, target_position, duration, scale)
 
                 # Stop and brake
                 await asyncio.to_thread(self.pwm.stop)
                 await self._set_direction(Direction.BRAKE)
+                self._end_watch(started, duration, reached=True)
+                self._last_direction = direction
 
                 logger.debug(
                     f"Servo '{self.name}' moved {direction.value} for {duration}s to {self.position_percent}%"
                 )
+            except asyncio.CancelledError:
+                # Cancelled mid-move (e.g. its client disconnected): brake before unwinding
+                self._abort_move()
+                raise
             except Exception as e:
                 # Ensure we brake on error
-                if self.pwm:
-                    try:
-                        await asyncio.to_thread(self.pwm.stop)
-                        await self._set_direction(Direction.BRAKE)
-                    except Exception:
-                        pass
+                self._abort_move()
                 raise ServoError(f"Servo '{self.name}' movement failed: {e}") from e
 
+    def _abort_move(self) -> None:
+        """Stop the PWM, brake and disarm the watchdog when a move ends early.
+
+        Synchronous, so it runs to completion even while the move's task is
+        being cancelled.
+        """
+        try:
+            self.force_brake()
+        except Exception as e:
+            logger.error(f"Servo '{self.name}' failed to brake: {e}")
+        watchdog.disarm(self._watch_key)
+
+    def _start_watch(self, duration: float) -> float:
+        """Have the watchdog brake the move if it runs past its duration.
+
+        Args:
+            duration: Planned move duration in seconds
+
+        Returns:
+            Loop time the move started (just before it drives)
+        """
+        started = asyncio.get_running_loop().time()
+        watchdog.arm(self._watch_key, started + duration, self.force_brake)
+        self._moves_metric.inc()
+        return started
+
+    def _rearm_watch(self, duration: float) -> float:
+        """Move the watchdog deadline to count from when the PWM actually started.
+
+        Starting the PWM runs on the shared thread pool, which TTS and WAV
+        work can hold up for longer than the watchdog's grace.
+
+        Args:
+            duration: Planned move duration in seconds
+
+        Returns:
+            Loop time the servo started driving
+        """
+        started = asyncio.get_running_loop().time()
+        watchdog.arm(self._watch_key, started + duration, self.force_brake)
+        return started
+
+    def _end_watch(self, started: float, duration: float, reached: bool) -> None:
+        """Disarm the watchdog after braking and record the move's timing.
+
+        Args:
+            started: Loop time the move started driving
+            duration: Planned move duration in seconds
+            reached: Whether the move ran to its end (not preempted)
+        """
+        watchdog.disarm(self._watch_key)
+        driven = asyncio.get_running_loop().time() - started
+        self._move_seconds.observe(driven)
+        if reached:
+            self._overrun_seconds.observe(driven - duration)
+
+    async def _track_position(
+        self,
+        direction: Direction,
+        target: int,
+        duration: float,
+        scale: float = 1.0,
+        generation: int | None = None,
+    ) -> bool:
+        """Animate the position estimate along the calibrated curve.
+
+        Args:
+            direction: Direction of travel
+            target: Position percent the move ends at
+            duration: Commanded move duration in seconds
+            scale: Ratio of this move's speed profile to the calibrated one
+            generation: For preemptive moves, the generation the move was
+                requested at; the move stops once a newer one is requested
+
+        Returns:
+            True if the move ran to the end, False if it was preempted (the
+            estimate is left where the servo got to)
+        """
+        loop = asyncio.get_running_loop()
+        start_position = self.position_percent
+        start_time = loop.time()
+        end_time = start_time + duration
+
+        # Slack is spent before the jaw actually starts travelling
+        slack = self.calibration.startup_slack
+        if self._last_direction is not None and direction != self._last_direction:
+            slack += self.calibration.reversal_slack
+
+        # Update position on the shared tracking ticks; the move itself
+        # still ends exactly at its duration
+        while True:
+            elapsed = loop.time() - start_time
+            if elapsed >= duration:
+                self.position_percent = target
+                break
+
+            position = self.calibration.position_at(
+                direction, start_position, (elapsed - slack) / scale
+            )
+            if direction == Direction.OPENING:
+                position = min(position, target)
+            else:
+                position = max(position, target)
+            self.position_percent = int(position)
+
+            if generation is None:
+                await self._ticker.tick(until=end_time)
+                continue
+
+            if generation != self._generation:
+                return False
+            self._step = self._ticker.next_tick(until=end_time)
+            await self._step
+
+        return True
+
     async def open(self, duration: float | None = None) -> None:
         """Open the servo (move to open position).
 
+        Without an explicit duration the move time comes from the
+        calibration's end-stop re-zero strategy.
+
         Args:
             duration: Optional override for movement duration
 
         Raises:
             ServoError: If movement fails
         """
-        duration = duration or self.default_duration
-        await self._move(Direction.OPENING, duration)
+        scale = duration / self.calibration.full_travel(Direction.OPENING) if duration else 1.0
+        duration = duration or self.calibration.endstop_duration(
+            Direction.OPENING,
+            self.position_percent,
+            self.state != State.UNKNOWN,
+            self.position_uncertainty,
+        )
+        with span("servo.open", "servo", servo=self.name, duration=round(duration, 3)):
+            await self._move(Direction.OPENING, duration, scale)
+        self._mark_homed()
         self.state = State.OPEN
         self.position_percent = 100
         logger.info(f"Servo '{self.name}' opened to 100%")
@@ -193,14 +443,25 @@ class Servo:
     async def close(self, duration: float | None = None) -> None:
         """Close the servo (move to closed position).
 
+        Without an explicit duration the move time comes from the
+        calibration's end-stop re-zero strategy.
+
         Args:
             duration: Optional override for movement duration
 
         Raises:
             ServoError: If movement fails
         """
-        duration = duration or self.default_duration
-        await self._move(Direction.CLOSING, duration)
+        scale = duration / self.calibration.full_travel(Direction.CLOSING) if duration else 1.0
+        duration = duration or self.calibration.endstop_duration(
+            Direction.CLOSING,
+            self.position_percent,
+            self.state != State.UNKNOWN,
+            self.position_uncertainty,
+        )
+        with span("servo.close", "servo", servo=self.name, duration=round(duration, 3)):
+            await self._move(Direction.CLOSING, duration, scale)
+        self._mark_homed()
         self.state = State.CLOSED
         self.position_percent = 0
         logger.info(f"Servo '{self.name}' closed to 0%")
@@ -222,12 +483,24 @@ class Servo:
         else:
             raise ServoError(f"Invalid position: {position}")
 
-    async def set_position_percent(self, target_percent: int, duration: float = 0.05) -> None:
+    async def set_position_percent(
+        self, target_percent: int, duration: float | None = None, preempt: bool = False
+    ) -> float | None:
         """Set servo to specific percentage position (0-100).
 
+        The move duration is looked up from the calibration curves for the
+        direction of travel, plus startup/reversal slack.
+
         Args:
             target_percent: Target position as percentage (0=closed, 100=open)
-            duration: Movement duration in seconds (default 0.05 for quick response)
+            duration: Optional full-travel time in seconds. When given, the
+                calibration curve is scaled so a full move takes this long.
+            preempt: Stop a preemptive move in progress where it has got to
+                and head for this target instead. Preemptive moves that are
+                superseded before they start are skipped.
+
+        Returns:
+            Loop time the move started, or None if it was skipped
 
         Raises:
             ServoError: If position is invalid or movement fails
@@ -238,83 +511,192 @@ class Servo:
         if not self.pwm:
             raise ServoError(f"Servo '{self.name}' not initialized")
 
-        current = self.position_percent
+        generation = None
+        if preempt:
+            self._generation += 1
+            generation = self._generation
+            if self._step is not None:
+                _wake(self._step)
 
-        # Skip if already close to target (within 8% to reduce jitter)
-        if abs(current - target_percent) < 8:
-            return
+        async with self._lock:
+            if generation is not None:
+                if generation != self._generation:
+                    return None
+
+            current = self.position_percent
+
+            # Skip if already close to target (dead-band reduces jitter)
+            if abs(current - target_percent) < self.calibration.deadband:
+                return None
+
+            # Determine direction
+            direction = Direction.OPENING if target_percent > current else Direction.CLOSING
+            reversing = self._last_direction is not None and direction != self._last_direction
+            scale = duration / self.calibration.full_travel(direction) if duration else 1.0
+            move_duration = self.calibration.move_duration(
+                current,
+                target_percent,
+                reversing=reversing,
+                scale=scale,
+                uncertainty=self.position_uncertainty,
+            )
+
+            # Move to target position
+            with span("servo.move", "servo", servo=self.name, start=current, target=target_percent):
+                reached = await self._move_to_percent(
+                    direction, target_percent, move_duration, scale, generation
+                )
 
-        # Determine direction
-        if target_percent > current:
-            direction = Direction.OPENING
-            move_duration = duration * (target_percent - current) / 100
-        else:
-            direction = Direction.CLOSING
-            move_duration = duration * (current - target_percent) / 100
+            # End-stop moves include a margin for drift and re-zero the estimate
+            if reached and target_percent in (0, 100):
+                self._mark_homed()
+            else:
+                self._add_drift(self.calibration.drift_for_move(self.position_percent - current))
 
-        # Move to target position
-        await self._move_to_percent(direction, target_percent, move_duration)
+            return self.last_move_start
 
-    async def _move_to_percent(
-        self, direction: Direction, target_percent: int, duration: float
-    ) -> None:
-        """Move servo to specific percentage.
+    def needs_rehome(self, threshold: float) -> bool:
+        """Check whether the position estimate has drifted past a threshold.
 
         Args:
-            direction: Direction to move
-            target_percent: Target position percentage
-            duration: Movement duration
+            threshold: Maximum tolerated uncertainty in percent
+
+        Returns:
+            True if a re-home is due
         """
-        if duration < 0.01:
-            duration = 0.01  # Minimum duration
+        return self.position_uncertainty >= threshold
 
-        async with self._lock:
-            try:
-                # Set direction and start PWM
-                await self._set_direction(direction)
-                await asyncio.to_thread(self.pwm.start, 50)
+    async def rehome(self, endstop: State = State.CLOSED) -> None:
+        """Drive into an end-stop to re-zero the position estimate.
 
-                # Animate position during movement
-                start_position = self.position_percent
-                start_time = asyncio.get_event_loop().time()
+        The move covers the remaining estimated travel plus the accumulated
+        uncertainty, so when the servo already rests near the end-stop it is
+        a short, invisible push against the stop.
+
+        Args:
+            endstop: End-stop to drive to (OPEN or CLOSED)
 
-                # Update position in small increments
-                update_interval = 0.05  # 20Hz updates for smooth animation
-                while True:
-                    elapsed = asyncio.get_event_loop().time() - start_time
-                    if elapsed >= duration:
-                        self.position_percent = target_percent
-                        break
+        Raises:
+            ServoError: If endstop is invalid or movement fails
+        """
+        if endstop not in (State.OPEN, State.CLOSED):
+            raise ServoError(f"Invalid end-stop: {endstop}")
+
+        direction = Direction.OPENING if endstop == State.OPEN else Direction.CLOSING
+        target = 100 if endstop == State.OPEN else 0
+        duration = (
+            self.calibration.travel_time(self.position_percent, target)
+            + self.calibration.margin_time(direction, self.position_uncertainty)
+            + self.calibration.startup_slack
+            + self.calibration.rezero_overdrive
+        )
+        duration = min(max(duration, 0.01), 2.0)
+
+        uncertainty = self.position_uncertainty
+        await self._move(direction, duration)
+        self.state = endstop
+        self._rehome_count += 1
+        self._mark_homed()
+        logger.debug(
+            f"Servo '{self.name}' re-homed to {endstop.value} in {duration:.3f}s "
+            f"(uncertainty was {uncertainty:.1f}%)"
+        )
 
-                    # Linear interpolation
-                    progress = elapsed / duration
-                    self.position_percent = int(
-                        start_position + (target_percent - start_position) * progress
-                    )
+    def _add_drift(self, amount: float) -> None:
+        """Accumulate estimate error after a partial move."""
+        self._moves_total += 1
+        self._moves_since_home += 1
+        self.position_uncertainty = min(self.position_uncertainty + amount, 100.0)
+        self._max_uncertainty = max(self._max_uncertainty, self.position_uncertainty)
+
+    def _mark_homed(self) -> None:
+        """Reset the estimate error after the servo reached an end-stop."""
+        self._moves_total += 1
+        if self._last_home_time is not None:
+            self._drift_corrected += self.position_uncertainty
+        self._moves_since_home = 0
+        self.position_uncertainty = 0.0
+        self._last_home_time = time.monotonic()
+
+    def drift_stats(self) -> dict[str, Any]:
+        """Get dead-reckoning drift statistics.
+
+        Returns:
+            Dictionary with uncertainty, move counts and re-home history
+        """
+        since_home = (
+            time.monotonic() - self._last_home_time if self._last_home_time is not None else None
+        )
+        return {
+            "uncertainty": round(self.position_uncertainty, 2),
+            "max_uncertainty": round(self._max_uncertainty, 2),
+            "moves_total": self._moves_total,
+            "moves_since_home": self._moves_since_home,
+            "rehome_count": self._rehome_count,
+            "drift_corrected": round(self._drift_corrected, 2),
+            "seconds_since_home": round(since_home, 2) if since_home is not None else None,
+        }
 
-                    await asyncio.sleep(update_interval)
+    async def _move_to_percent(
+        self,
+        direction: Direction,
+        target_percent: int,
+        duration: float,
+        scale: float = 1.0,
+        generation: int | None = None,
+    ) -> bool:
+        """Move servo to specific percentage (caller holds the move lock).
 
-                # Stop and brake
-                await asyncio.to_thread(self.pwm.stop)
-                await self._set_direction(Direction.BRAKE)
+        Args:
+            direction: Direction to move
+            target_percent: Target position percentage
+            duration: Movement duration
+            scale: Ratio of this move's speed profile to the calibrated one
+            generation: Generation of a preemptive move (None if not preemptible)
 
-                # Update state
-                if target_percent == 0:
-                    self.state = State.CLOSED
-                elif target_percent == 100:
-                    self.state = State.OPEN
-                else:
-                    self.state = State.UNKNOWN
+        Returns:
+            True if the target was reached, False if the move was preempted
+        """
+        if duration < 0.01:
+            duration = 0.01  # Minimum duration
 
-            except Exception as e:
-                # Ensure we brake on error
-                if self.pwm:
-                    try:
-                        await asyncio.to_thread(self.pwm.stop)
-                        await self._set_direction(Direction.BRAKE)
-                    except Exception:
-                        pass
-                raise ServoError(f"Servo '{self.name}' movement failed: {e}") from e
+        try:
+            # Set direction and start PWM
+            self.last_move_start = asyncio.get_running_loop().time()
+            # Watch before driving, so a move cut off while starting is still braked
+            self._start_watch(duration)
+            await self._set_direction(direction)
+            await asyncio.to_thread(self.pwm.start, 50)
+            started = self._rearm_watch(duration)
+
+            # Animate position during movement
+            reached = await self._track_position(
+                direction, target_percent, duration, scale, generation
+            )
+
+            # Stop and brake
+            await asyncio.to_thread(self.pwm.stop)
+            await self._set_direction(Direction.BRAKE)
+            self._end_watch(started, duration, reached)
+            self._last_direction = direction
+
+            # Update state
+            if reached and target_percent == 0:
+                self.state = State.CLOSED
+            elif reached and target_percent == 100:
+                self.state = State.OPEN
+            else:
+                self.state = State.UNKNOWN
+
+            return reached
+        except asyncio.CancelledError:
+            # Cancelled mid-move (e.g. a puppet stream ending): brake before unwinding
+            self._abort_move()
+            raise
+        except Exception as e:
+            # Ensure we brake on error
+            self._abort_move()
+            raise ServoError(f"Servo '{self.name}' movement failed: {e}") from e
 
     async def cleanup(self) -> None:
         """Clean up servo resources.
@@ -337,3 +719,9 @@ class Servo:
             f"position={self.position_percent}%, "
             f"speed={self.speed}Hz, duration={self.default_duration}s)"
         )
+
+
+def _wake(step: asyncio.Future[int | None]) -> None:
+    """Wake a move waiting for its next tracking step."""
+    if not step.done():
+        step.set_result(None)
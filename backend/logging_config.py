@@ -1,18 +1,132 @@
 """Centralized logging configuration with WebSocket streaming support."""
 
 import logging
-import queue
-from typing import Optional
+import threading
+from collections.abc import Callable
+from typing import Any, Optional
 
-# Queue for streaming logs to WebSocket clients
-log_queue: queue.Queue = queue.Queue(maxsize=1000)
+DEFAULT_LOG_CAPACITY = 1000
+
+
+class LogStore:
+    """Fixed-size ring buffer of structured log records.
+
+    Every record is stamped with a sequence number that increases by one per
+    record, so readers keep a cursor (the last sequence number they saw) and
+    read without consuming anything; any number of readers can follow the
+    same records. When full, the oldest record is overwritten.
+
+    Records are appended from whichever thread logs, so access is locked.
+
+    Attributes:
+        capacity: Number of records kept
+        last_seq: Sequence number of the newest record (0 when empty)
+        on_append: Called after every append, on the appending thread
+    """
+
+    def __init__(self, capacity: int = DEFAULT_LOG_CAPACITY) -> None:
+        """Initialize an empty store.
+
+        Args:
+            capacity: Number of records kept
+        """
+        self.capacity = capacity
+        self.last_seq = 0
+        self._slots: list[dict[str, Any] | None] = [None] * capacity
+        self._lock = threading.Lock()
+        self.on_append: Callable[[], None] | None = None
+
+    @property
+    def first_seq(self) -> int:
+        """Get the sequence number of the oldest kept record."""
+        return max(1, self.last_seq - self.capacity + 1)
+
+    def __len__(self) -> int:
+        """Get the number of kept records."""
+        return min(self.last_seq, self.capacity)
+
+    def append(self, record: dict[str, Any]) -> int:
+        """Add a record, stamping it with the next sequence number.
+
+        Args:
+            record: Structured log record (gains a ``seq`` field)
+
+        Returns:
+            The record's sequence number
+        """
+        with self._lock:
+            self.last_seq += 1
+            seq = record["seq"] = self.last_seq
+            self._slots[seq % self.capacity] = record
+
+        on_append = self.on_append
+        if on_append is not None:
+            on_append()
+        return seq
+
+    def read(
+        self, after: int | None = None, before: int | None = None, limit: int = 100
+    ) -> list[dict[str, Any]]:
+        """Read records without removing them, oldest first.
+
+        Args:
+            after: Only records newer than this sequence number; reads the
+                oldest ``limit`` of them (forward paging / following)
+            before: Only records older than this sequence number; reads the
+                newest ``limit`` of them (backward paging)
+            limit: Maximum number of records
+
+        Returns:
+            Matching records, oldest first. A cursor older than the kept
+            history reads from the oldest kept record.
+        """
+        with self._lock:
+            first = self.first_seq
+            last = self.last_seq if before is None else min(self.last_seq, before - 1)
+            if after is not None:
+                start = max(first, after + 1)
+                end = min(last, start + limit - 1)
+            else:
+                end = last
+                start = max(first, end - limit + 1)
+            return [self._slots[seq % self.capacity] for seq in range(start, end + 1)]
+
+
+# Log records for WebSocket streaming and the log history API
+log_store = LogStore()
 
 
 class WebSocketHandler(logging.Handler):
-    """Custom logging handler that sends logs to a queue for WebSocket streaming."""
+    """Custom logging handler that stores logs for WebSocket streaming.
+
+    The handler's level follows its audience: records below the most verbose
+    level a subscribed client streams are rejected by the handler's level
+    check, so ``emit`` formats nothing. With no subscribers only
+    ``history_level`` and above are kept, for the log history API.
+
+    Attributes:
+        history_level: Level always kept, whether or not anyone subscribes
+    """
+
+    def __init__(self, history_level: int = logging.WARNING) -> None:
+        """Initialize the handler with no subscribers.
+
+        Args:
+            history_level: Level always kept, whether or not anyone subscribes
+        """
+        super().__init__(level=history_level)
+        self.history_level = history_level
+
+    def set_listener_level(self, level: int | None) -> None:
+        """Set the most verbose level any subscribed client streams.
+
+        Args:
+            level: Lowest subscribed level, or None when nobody subscribes
+        """
+        self.setLevel(self.history_level if level is None else min(level, self.history_level))
 
     def emit(self, record: logging.LogRecord) -> None:
-        """Send log record to queue for WebSocket clients."""
+        """Store a log record for WebSocket clients."""
         try:
             log_entry = {
                 "timestamp": record.created,
@@ -30,16 +144,7 @@ class WebSocketHandler(logging.Handler):
 
                 log_entry["exception"] = "".join(traceback.format_exception(*record.exc_info))
 
-            # Put in queue (non-blocking, drop oldest if full)
-            try:
-                log_queue.put_nowait(log_entry)
-            except queue.Full:
-                # Drop oldest log and try again
-                try:
-                    log_queue.get_nowait()
-                    log_queue.put_nowait(log_entry)
-                except:
-                    pass
+            log_store.append(log_entry)
         except Exception:
             self.handleError(record)
 
@@ -69,11 +174,9 @@ def setup_logging(level: str = "INFO", enable_websocket_streaming: bool = True)
     console_handler.setFormatter(console_formatter)
     root_logger.addHandler(console_handler)
 
-    # WebSocket handler for frontend streaming
+    # WebSocket handler for frontend streaming (level follows the subscribed clients)
     if enable_websocket_streaming:
-        ws_handler = WebSocketHandler()
-        ws_handler.setLevel(logging.DEBUG)  # Capture all levels, filter on frontend
-        root_logger.addHandler(ws_handler)
+        root_logger.addHandler(WebSocketHandler())
 
     # Set specific loggers to appropriate levels
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
@@ -99,32 +202,25 @@ def set_log_level(level: str) -> None:
     logging.info(f"Log level changed to {level.upper()}")
 
 
+def set_stream_level(level: int | None) -> None:
+    """Set the most verbose level WebSocket clients stream.
+
+    Args:
+        level: Lowest level any subscribed client wants, or None when no
+            client subscribes to logs
+    """
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, WebSocketHandler):
+            handler.set_listener_level(level)
+
+
 def get_recent_logs(count: int = 100) -> list[dict]:
-    """Get recent logs from the queue without removing them.
+    """Get recent logs without removing them.
 
     Args:
         count: Maximum number of logs to return
 
     Returns:
-        List of recent log entries
+        List of recent log entries, oldest first
     """
-    logs = []
-    temp_queue = queue.Queue()
-
-    # Extract logs
-    while not log_queue.empty() and len(logs) < count:
-        try:
-            log = log_queue.get_nowait()
-            logs.append(log)
-            temp_queue.put(log)
-        except queue.Empty:
-            break
-
-    # Put them back
-    while not temp_queue.empty():
-        try:
-            log_queue.put_nowait(temp_queue.get_nowait())
-        except queue.Full:
-            break
-
-    return logs
+    return log_store.read(limit=count)
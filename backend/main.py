@@ -1,26 +1,40 @@
 """FastAPI application for Raspi Ruxpin.
 
-This is the main entry point for the backend server. It sets up the FastAPI
-application with WebSocket support, CORS, static file serving, and lifecycle management.
+This is the main entry point for the backend server. ``create_app`` builds the
+FastAPI application with WebSocket support, CORS, static file serving, and
+lifecycle management.
+
+Importing this module has no side effects: settings are loaded (and their
+directories created) when the application is created, by
+``uvicorn --factory backend.main:create_app`` or on first access of
+``backend.main:app``.
 """
 
+import asyncio
 import logging
 import sys
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 
 from fastapi import FastAPI, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
+from backend.api.endpoints.admin import router as admin_router
+from backend.api.endpoints.bears import router as bears_router
 from backend.api.endpoints.health import router as health_router
+from backend.api.endpoints.logs import router as logs_router
+from backend.api.endpoints.metrics import router as metrics_router
+from backend.api.endpoints.traces import router as traces_router
 from backend.api.websocket import websocket_endpoint
-from backend.config import get_settings
-from backend.hardware.audio_player import AudioPlayer
+from backend.config import AppSettings, get_settings
+from backend.core.startup import notify_systemd, notify_when_ready
+from backend.core.watchdog import watchdog
+from backend.hardware.audio_cache import AudioCache
 from backend.hardware.gpio_manager import GPIOManager
 from backend.logging_config import setup_logging
-from backend.services.bear_service import BearService
+from backend.services.bear_registry import BearRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -30,8 +44,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan manager.
 
     Handles startup and shutdown tasks:
-    - Initialize settings, GPIO, audio player, and bear service
-    - Start bear service background tasks
+    - Initialize logging, GPIO, and the bear registry
+    - Start each bear's background tasks and the watchdog thread
     - Clean up on shutdown
 
     Args:
@@ -41,10 +55,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         None
     """
     # Startup
+    ready_task: asyncio.Task[None] | None = None
     try:
-        # Load settings first
-        settings = get_settings()
-        app.state.settings = settings
+        settings: AppSettings = app.state.settings
 
         # Initialize logging with appropriate level
         log_level = "DEBUG" if settings.debug else "INFO"
@@ -60,31 +73,23 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         gpio_manager.initialize()
         app.state.gpio_manager = gpio_manager
 
-        # Initialize audio player
-        audio_player = AudioPlayer(
-            sample_rate=settings.audio.sample_rate,
-            amplitude_threshold=settings.audio.amplitude_threshold,
-            sounds_dir=settings.audio.sounds_dir,
-            tts_output_dir=settings.tts.output_dir,
-            tts_engine=settings.tts.engine,
-            tts_voice=settings.tts.voice,
-            tts_speed=settings.tts.speed,
-            tts_pitch=settings.tts.pitch,
-            start_volume=settings.audio.start_volume,
-            alsa_device=settings.audio.device,
-            alsa_card_index=settings.audio.card_index,
-            alsa_mixer=settings.audio.mixer,
-        )
-        app.state.audio_player = audio_player
-
-        # Initialize bear service
-        bear_service = BearService(
+        # Initialize bears (each with its own audio player, sharing one audio cache)
+        bear_registry = BearRegistry(
             settings=settings,
             gpio_manager=gpio_manager,
-            audio_player=audio_player,
+            audio_cache=AudioCache(),
         )
-        await bear_service.start()
-        app.state.bear_service = bear_service
+        app.state.bear_registry = bear_registry
+        app.state.bear_service = bear_registry.default
+        app.state.audio_player = bear_registry.default.audio_player
+
+        # Serve once every bear takes commands; the rest of startup (eyes,
+        # phrases, mixer, TTS warm-up) finishes in the background (/api/ready)
+        await bear_registry.start(wait_for_ready=False)
+        ready_task = asyncio.create_task(notify_when_ready(bear_registry.startup))
+
+        # Watch for event-loop stalls and servo moves overrunning their stop time
+        watchdog.start()
 
         logger.info("Raspi Ruxpin backend started successfully")
 
@@ -97,10 +102,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     finally:
         # Shutdown
         logger.info("Shutting down Raspi Ruxpin backend...")
+        notify_systemd("STOPPING=1")
 
         try:
-            if hasattr(app.state, "bear_service"):
-                await app.state.bear_service.stop()
+            if ready_task is not None:
+                ready_task.cancel()
+
+            if hasattr(app.state, "bear_registry"):
+                await app.state.bear_registry.stop()
+
+            watchdog.stop()
 
             if hasattr(app.state, "gpio_manager"):
                 app.state.gpio_manager.cleanup_all()
@@ -110,53 +121,100 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             logger.error(f"Shutdown error: {e}")
 
 
-# Create FastAPI application
-app = FastAPI(
-    title="Raspi Ruxpin",
-    description="Modern animatronic bear control system",
-    version="2.0.0",
-    lifespan=lifespan,
-)
-
-# Configure CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["http://localhost:5173", "http://localhost:8080"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Include routers
-app.include_router(health_router)
-
-
-# WebSocket endpoint
-@app.websocket("/ws")
-async def websocket_route(websocket: WebSocket):
-    """WebSocket endpoint for real-time communication."""
-    bear_service = app.state.bear_service
+async def websocket_route(websocket: WebSocket) -> None:
+    """WebSocket endpoint for real-time communication with the default bear."""
+    bear_service = websocket.app.state.bear_service
     await websocket_endpoint(websocket, bear_service)
 
 
-# Serve static files in production
-settings = get_settings()
-if settings.is_production and settings.frontend_dist_dir.exists():
-    app.mount(
-        "/",
-        StaticFiles(directory=str(settings.frontend_dist_dir), html=True),
-        name="frontend",
+async def bear_websocket_route(websocket: WebSocket, bear_id: str) -> None:
+    """WebSocket endpoint for real-time communication with a specific bear."""
+    bear_registry = websocket.app.state.bear_registry
+    if bear_id not in bear_registry.bears:
+        await websocket.close(code=4404, reason=f"Unknown bear: {bear_id}")
+        return
+    await websocket_endpoint(websocket, bear_registry.get(bear_id))
+
+
+def create_app(settings: AppSettings | None = None) -> FastAPI:
+    """Create the FastAPI application.
+
+    Args:
+        settings: Application settings (defaults to the settings singleton)
+
+    Returns:
+        Application with its routes and static files, starting the bears on
+        startup
+    """
+    settings = settings or get_settings()
+
+    app = FastAPI(
+        title="Raspi Ruxpin",
+        description="Modern animatronic bear control system",
+        version="2.0.0",
+        lifespan=lifespan,
     )
-    logger.info(f"Serving frontend from {settings.frontend_dist_dir}")
-
-# Serve sounds directory
-if settings.audio.sounds_dir.exists():
-    app.mount(
-        "/sounds",
-        StaticFiles(directory=str(settings.audio.sounds_dir)),
-        name="sounds",
+    app.state.settings = settings
+
+    # Configure CORS
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["http://localhost:5173", "http://localhost:8080"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
     )
-    logger.info(f"Serving sounds from {settings.audio.sounds_dir}")
+
+    # Include routers
+    app.include_router(health_router)
+    app.include_router(bears_router)
+    app.include_router(logs_router)
+    app.include_router(metrics_router)
+    app.include_router(traces_router)
+    app.include_router(admin_router)
+
+    # WebSocket endpoints
+    app.add_api_websocket_route("/ws", websocket_route)
+    app.add_api_websocket_route("/ws/{bear_id}", bear_websocket_route)
+
+    # Serve static files in production
+    if settings.is_production and settings.frontend_dist_dir.exists():
+        app.mount(
+            "/",
+            StaticFiles(directory=str(settings.frontend_dist_dir), html=True),
+            name="frontend",
+        )
+        logger.info(f"Serving frontend from {settings.frontend_dist_dir}")
+
+    # Serve sounds directory
+    if settings.audio.sounds_dir.exists():
+        app.mount(
+            "/sounds",
+            StaticFiles(directory=str(settings.audio.sounds_dir)),
+            name="sounds",
+        )
+        logger.info(f"Serving sounds from {settings.audio.sounds_dir}")
+
+    return app
+
+
+def __getattr__(name: str) -> Any:
+    """Create ``app`` on first access, for ``uvicorn backend.main:app`` and tests.
+
+    Args:
+        name: Module attribute name
+
+    Returns:
+        The application created with the settings singleton
+
+    Raises:
+        AttributeError: For any other attribute
+    """
+    if name == "app":
+        global app
+        app = create_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def main() -> None:
@@ -166,7 +224,8 @@ def main() -> None:
     settings = get_settings()
 
     uvicorn.run(
-        "backend.main:app",
+        "backend.main:create_app",
+        factory=True,
         host=settings.host,
         port=settings.port,
         reload=settings.is_development,
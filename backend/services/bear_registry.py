@@ -0,0 +1,156 @@
+"""Registry of bears hosted by one process.
+
+A single Raspberry Pi can drive several puppets. Each bear gets its own
+``BearService`` and ``AudioPlayer`` (its own pins and speaker), while the GPIO
+manager and the ``AudioCache`` (TTS cache, envelope cache and worker pools)
+are shared by all of them.
+"""
+
+import logging
+
+from backend.config import AppSettings, BearSettings
+from backend.core.exceptions import RaspiRuxpinError
+from backend.core.startup import StepGraph
+from backend.hardware.audio_cache import AudioCache
+from backend.hardware.audio_player import AudioPlayer
+from backend.hardware.gpio_manager import GPIOManager
+from backend.services.bear_service import BearService
+
+logger = logging.getLogger(__name__)
+
+
+class BearRegistry:
+    """Hosts N bears with shared audio and TTS infrastructure.
+
+    Attributes:
+        settings: Application settings
+        gpio_manager: GPIO manager shared by all bears
+        audio_cache: Audio cache and worker pools shared by all bears
+        bears: Bear services keyed by bear ID, in configuration order
+        startup: Startup steps of every bear and the shared audio (readiness)
+    """
+
+    def __init__(
+        self,
+        settings: AppSettings,
+        gpio_manager: GPIOManager,
+        audio_cache: AudioCache | None = None,
+    ) -> None:
+        """Initialize the registry and build one service per configured bear.
+
+        Args:
+            settings: Application settings
+            gpio_manager: Initialized GPIO manager
+            audio_cache: Shared audio cache; created if omitted
+        """
+        self.settings = settings
+        self.gpio_manager = gpio_manager
+        self.audio_cache = audio_cache or AudioCache()
+        self.bears: dict[str, BearService] = {}
+        self.startup = StepGraph("startup")
+
+        for bear_config in settings.get_bear_configs():
+            self.bears[bear_config.id] = BearService(
+                settings=settings,
+                gpio_manager=gpio_manager,
+                audio_player=self._create_audio_player(bear_config),
+                bear_id=bear_config.id,
+                actuators=bear_config.actuators,
+            )
+
+        logger.info(f"BearRegistry initialized with bears: {list(self.bears)}")
+
+    def _create_audio_player(self, bear_config: BearSettings) -> AudioPlayer:
+        """Create the audio player for one bear's speaker.
+
+        Args:
+            bear_config: Bear configuration
+
+        Returns:
+            Audio player using the shared cache
+        """
+        settings = self.settings
+        return AudioPlayer(
+            sample_rate=settings.audio.sample_rate,
+            amplitude_threshold=settings.audio.amplitude_threshold,
+            sounds_dir=settings.audio.sounds_dir,
+            tts_output_dir=settings.tts.output_dir,
+            tts_engine=settings.tts.engine,
+            tts_voice=settings.tts.voice,
+            tts_speed=settings.tts.speed,
+            tts_pitch=settings.tts.pitch,
+            start_volume=settings.audio.start_volume,
+            alsa_device=bear_config.audio_device,
+            alsa_card_index=bear_config.audio_card_index,
+            alsa_mixer=bear_config.audio_mixer or settings.audio.mixer,
+            cache=self.audio_cache,
+        )
+
+    @property
+    def default(self) -> BearService:
+        """Get the first configured bear (served on the unaddressed API)."""
+        return next(iter(self.bears.values()))
+
+    def get(self, bear_id: str) -> BearService:
+        """Get a bear by ID.
+
+        Args:
+            bear_id: Bear ID
+
+        Returns:
+            Bear service
+
+        Raises:
+            RaspiRuxpinError: If no bear has this ID
+        """
+        try:
+            return self.bears[bear_id]
+        except KeyError:
+            raise RaspiRuxpinError(f"Unknown bear: {bear_id}") from None
+
+    def ids(self) -> list[str]:
+        """Get all bear IDs in configuration order."""
+        return list(self.bears)
+
+    async def start(self, wait_for_ready: bool = True) -> None:
+        """Start all bears and warm up the shared audio infrastructure.
+
+        Every step (see ``BearService.add_startup_steps``, plus the shared
+        ``tts`` warm-up and ``envelopes`` preload) runs as soon as the steps
+        it depends on are done; ``startup`` reports their progress.
+
+        Args:
+            wait_for_ready: Wait for every step; otherwise return as soon as
+                every bear can take commands and finish the rest (eyes,
+                phrases, mixer, warm-up) in the background
+
+        Raises:
+            RaspiRuxpinError: If a step needed by the wait fails
+        """
+        serving: list[str] = []
+        for bear in self.bears.values():
+            serving.extend(bear.add_startup_steps(self.startup))
+        player = self.default.audio_player
+        self.startup.add("tts", player.warm_up, required=False)
+        self.startup.add("envelopes", player.preload_envelopes, required=False)
+
+        self.startup.start()
+        await self.startup.wait(None if wait_for_ready else serving)
+        logger.info(f"Started {len(self.bears)} bears")
+
+    async def stop(self) -> None:
+        """Stop all bears and release the shared worker pools.
+
+        Startup steps still running are cancelled first. Bears shut down
+        concurrently; the worker pools close once no bear runs jobs.
+        """
+        await self.startup.cancel()
+
+        shutdown = StepGraph("shutdown")
+        loops = [bear.add_shutdown_steps(shutdown) for bear in self.bears.values()]
+        shutdown.add("audio", self._shutdown_audio, after=loops, required=False)
+        await shutdown.run()
+
+    async def _shutdown_audio(self) -> None:
+        """Stop the shared worker pools."""
+        self.audio_cache.shutdown()
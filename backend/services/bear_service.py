@@ -8,39 +8,65 @@ import asyncio
 import json
 import logging
 import random
+import uuid
 from pathlib import Path
 from typing import Any
 
 from backend.config import AppSettings
-from backend.core.enums import State
+from backend.core.enums import ActuatorRole, PowerState, State
 from backend.core.exceptions import RaspiRuxpinError
+from backend.core.scheduler import scheduler
+from backend.core.startup import StepGraph
+from backend.core.tracing import Trace, current_trace, span, use_trace
 from backend.hardware.audio_player import AudioPlayer
+from backend.hardware.calibration import load_calibrations
 from backend.hardware.gpio_manager import GPIOManager
-from backend.hardware.models import PinSet
+from backend.hardware.models import ServoConfig
 from backend.hardware.servo import Servo
+from backend.services.puppet import PuppetChannel
+from backend.services.recorder import SessionRecorder, Timeline, TimelinePlayer, recording_path
+from backend.services.state_history import StateHistory, StateSnapshot
 
 logger = logging.getLogger(__name__)
 
+# Blink condition checks per second while blinking can't start
+BLINK_POLL_RATE = 2.0
+
 
 class BearService:
     """Orchestrates the animatronic bear behavior.
 
     This service manages:
-    - Servo control for eyes and mouth
+    - Servo control for every actuator in the rig
     - Audio playback with mouth synchronization
     - Random eye blinking
     - Phrase management
+    - Idle power mode: after ``idle_timeout`` seconds without jobs, commands
+      or connected clients, blinking is suspended and PWM released until
+      the next command (the other loops already sleep while idle)
 
     Attributes:
+        bear_id: ID of this bear (addresses it in the API)
         settings: Application settings
         gpio_manager: GPIO manager instance
         audio_player: Audio player instance
-        eyes: Eyes servo controller
-        mouth: Mouth servo controller
+        actuators: Servo controllers keyed by actuator name
+        actuator_configs: Actuator configuration keyed by actuator name
+        eyes: Primary eyes servo controller (None if the rig has no eyes)
+        mouth: Primary mouth servo controller (None if the rig has no mouth)
         phrases: Dictionary of available phrases
         is_busy: Whether bear is currently performing an action
+        recorder: Active session recorder (None when not recording)
+        puppet_channel: Latest-wins analog targets from puppet input
+        state_epoch: Random ID of this service instance (sequence numbers restart with it)
+        state_seq: Sequence number bumped on every state mutation
+        state_history: Last published state and recent deltas
+        power_state: Whether control loops and PWM are active or parked
+        clients: Number of connected clients
         _talk_task: Background task for mouth sync
         _blink_task: Background task for eye blinks
+        _puppet_task: Background task dispatching puppet targets
+        _idle_task: Background task entering idle mode after a quiet period
     """
 
     def __init__(
@@ -48,82 +74,184 @@ class BearService:
         settings: AppSettings,
         gpio_manager: GPIOManager,
         audio_player: AudioPlayer,
+        bear_id: str = "default",
+        actuators: list[ServoConfig] | None = None,
     ) -> None:
         """Initialize bear service.
 
         Args:
             settings: Application settings
-            gpio_manager: Initialized GPIO manager
-            audio_player: Initialized audio player
+            gpio_manager: Initialized GPIO manager (may be shared between bears)
+            audio_player: Initialized audio player for this bear's speaker
+            bear_id: ID of this bear
+            actuators: Actuator rig; defaults to the rig in hardware settings
         """
+        self.bear_id = bear_id
         self.settings = settings
         self.gpio_manager = gpio_manager
         self.audio_player = audio_player
 
-        # Initialize servos
-        eyes_pins = PinSet(
-            pwm=settings.hardware.eyes_pwm,
-            dir=settings.hardware.eyes_dir,
-            cdir=settings.hardware.eyes_cdir,
-        )
-        self.eyes = Servo(
-            name="eyes",
-            pins=eyes_pins,
-            speed=settings.hardware.eyes_speed,
-            default_duration=settings.hardware.eyes_duration,
-            gpio_manager=gpio_manager,
-        )
-
-        mouth_pins = PinSet(
-            pwm=settings.hardware.mouth_pwm,
-            dir=settings.hardware.mouth_dir,
-            cdir=settings.hardware.mouth_cdir,
-        )
-        self.mouth = Servo(
-            name="mouth",
-            pins=mouth_pins,
-            speed=settings.hardware.mouth_speed,
-            default_duration=settings.hardware.mouth_duration,
-            gpio_manager=gpio_manager,
-        )
+        # Per-servo calibration, "<bear_id>.<name>" before "<name>"
+        # (missing entries fall back to linear timing)
+        calibrations = load_calibrations(settings.calibration_file)
+
+        # Build the actuator rig (classic eyes/mouth unless declared in settings)
+        self.actuators: dict[str, Servo] = {}
+        self.actuator_configs: dict[str, ServoConfig] = {}
+        for config in actuators or settings.hardware.get_actuator_configs():
+            self.actuators[config.name] = Servo(
+                name=config.name,
+                pins=config.pins,
+                speed=config.speed,
+                default_duration=config.duration,
+                gpio_manager=gpio_manager,
+                calibration=calibrations.get(f"{bear_id}.{config.name}")
+                or calibrations.get(config.name),
+            )
+            self.actuator_configs[config.name] = config
+            self.actuators[config.name].add_listener(self._touch)
+        self.audio_player.add_listener(self._touch)
+
+        # Primary actuators back the classic eyes/mouth API and state fields
+        self.eyes = next(iter(self.by_role(ActuatorRole.EYES)), None)
+        self.mouth = next(iter(self.by_role(ActuatorRole.MOUTH)), None)
+
+        # Versioned state (every mutation bumps state_seq)
+        self.state_epoch = uuid.uuid4().hex[:8]
+        self.state_seq = 0
+        self.state_history = StateHistory()
+        self._checked_seq = -1
+        self._snapshot: StateSnapshot
 
         # State
         self.phrases: dict[str, str] = {}
-        self.is_busy = False
+        self._is_busy = False
+        self._busy_event = asyncio.Event()
+        self._replaying = False
+        self._job_trace: Trace | None = None
         self.blink_enabled = False  # Eye blinking disabled by default
         self.character = "teddy"  # Default character
+        self.recorder: SessionRecorder | None = None
         self._talk_task: asyncio.Task[None] | None = None
         self._blink_task: asyncio.Task[None] | None = None
+        self._puppet_task: asyncio.Task[None] | None = None
+        self._idle_task: asyncio.Task[None] | None = None
         self._shutdown = False
 
-        logger.info("BearService initialized")
+        # Idle power mode (any activity restarts the quiet period)
+        self.power_state = PowerState.ACTIVE
+        self.clients = 0
+        self._activity = asyncio.Event()
+        self._idle_since: float | None = None
+        self._idle_entries = 0
+        self._idle_seconds = 0.0
+
+        # Puppet input is dispatched at the fastest actuator control rate
+        self.puppet_channel = PuppetChannel(
+            self.actuators,
+            tick_rate=max(config.update_rate for config in self.actuator_configs.values()),
+            on_move=self._record_puppet_move,
+        )
+
+        # Publish the initial state so there is always a snapshot to share
+        self.publish_state()
+
+        logger.info(f"BearService '{bear_id}' initialized with actuators: {list(self.actuators)}")
+
+    @property
+    def is_busy(self) -> bool:
+        """Whether bear is currently performing an action."""
+        return self._is_busy
+
+    @is_busy.setter
+    def is_busy(self, value: bool) -> None:
+        if value != self._is_busy:
+            self._is_busy = value
+            # Mouth moves made for the job are recorded in its trace
+            self._job_trace = current_trace() if value else None
+            # A replay drives the mouth from its own cues, not the sound level
+            if value and not self._replaying:
+                self._busy_event.set()
+            else:
+                self._busy_event.clear()
+            self._activity.set()
+            self._touch()
+
+    def _touch(self, *_: Any) -> None:
+        """Record a state mutation."""
+        self.state_seq += 1
+
+    def by_role(self, role: ActuatorRole) -> list[Servo]:
+        """Get all actuators with a given role.
+
+        Args:
+            role: Actuator role
+
+        Returns:
+            Servos in declaration order
+        """
+        return [
+            self.actuators[name]
+            for name, config in self.actuator_configs.items()
+            if config.role == role
+        ]
 
     async def start(self) -> None:
         """Start the bear service.
 
-        Initializes hardware, opens eyes, and starts background tasks.
+        Initializes hardware, opens eyes, loads phrases, syncs the mixer and
+        starts background tasks, concurrently where they don't depend on
+        each other (see ``add_startup_steps``).
 
         Raises:
             RaspiRuxpinError: If startup fails
         """
+        graph = StepGraph(f"bear '{self.bear_id}' startup")
+        self.add_startup_steps(graph)
         try:
-            # Initialize servos
-            await self.eyes.initialize()
-            await self.mouth.initialize()
+            await graph.run()
+            logger.info("BearService started successfully")
+        except Exception as e:
+            raise RaspiRuxpinError(f"Failed to start BearService: {e}") from e
 
-            # Open eyes on startup
-            await self.eyes.open()
+    def add_startup_steps(self, graph: StepGraph) -> list[str]:
+        """Add this bear's startup steps, named ``<bear_id>.<step>``, to a graph.
 
-            # Load phrases
-            await self._load_phrases()
+        The control loops start as soon as the servos are initialized; the
+        eyes open, phrases load and the mixer syncs alongside them. The
+        quiet period of idle power mode starts once all of them are done.
 
-            # Start background tasks
-            self._talk_task = asyncio.create_task(self._talk_monitor())
-            self._blink_task = asyncio.create_task(self._blink_monitor())
+        Args:
+            graph: Startup graph
 
-            logger.info("BearService started successfully")
-        except Exception as e:
-            raise RaspiRuxpinError(f"Failed to start BearService: {e}") from e
+        Returns:
+            Names of the steps the bear needs before it can take commands
+        """
+        servos, loops = f"{self.bear_id}.servos", f"{self.bear_id}.loops"
+        graph.add(servos, self._initialize_servos)
+        graph.add(loops, self._start_loops, after=[servos])
+        eyes, phrases, mixer = (f"{self.bear_id}.{step}" for step in ("eyes", "phrases", "mixer"))
+        graph.add(eyes, self._open_eyes, after=[servos])
+        graph.add(phrases, self._load_phrases, required=False)
+        graph.add(mixer, self.audio_player.initialize, required=False)
+        graph.add(
+            f"{self.bear_id}.idle", self._start_idle_monitor, after=[loops, eyes, phrases, mixer]
+        )
+        return [servos, loops]
+
+    async def _initialize_servos(self) -> None:
+        """Set up every actuator's pins and PWM."""
+        await asyncio.gather(*(servo.initialize() for servo in self.actuators.values()))
+
+    async def _start_loops(self) -> None:
+        """Start the background tasks."""
+        self._talk_task = asyncio.create_task(self._talk_monitor())
+        self._blink_task = asyncio.create_task(self._blink_monitor())
+        self._puppet_task = asyncio.create_task(self.puppet_channel.run())
+
+    async def _start_idle_monitor(self) -> None:
+        """Start counting the quiet period towards idle power mode."""
+        self._idle_task = asyncio.create_task(self._idle_monitor())
 
     async def stop(self) -> None:
         """Stop the bear service.
@@ -131,38 +259,65 @@ class BearService:
         Cancels background tasks, closes servos, and cleans up hardware.
         """
         logger.info("Stopping BearService...")
-        self._shutdown = True
+        graph = StepGraph(f"bear '{self.bear_id}' shutdown")
+        self.add_shutdown_steps(graph)
+        await graph.run()
+        logger.info("BearService stopped")
 
-        # Cancel background tasks
-        if self._talk_task and not self._talk_task.done():
-            self._talk_task.cancel()
-            try:
-                await self._talk_task
-            except asyncio.CancelledError:
-                pass
+    def add_shutdown_steps(self, graph: StepGraph) -> str:
+        """Add this bear's shutdown steps, named ``<bear_id>.<step>``, to a graph.
 
-        if self._blink_task and not self._blink_task.done():
-            self._blink_task.cancel()
-            try:
-                await self._blink_task
-            except asyncio.CancelledError:
-                pass
+        Background tasks are cancelled together, then every servo closes at
+        once before the pins are released. Failures are logged and don't
+        stop the later steps.
 
-        # Close servos
-        try:
-            await self.eyes.close()
-            await self.mouth.close()
-        except Exception as e:
-            logger.error(f"Error closing servos: {e}")
+        Args:
+            graph: Shutdown graph
 
-        # Cleanup
-        await self.eyes.cleanup()
-        await self.mouth.cleanup()
+        Returns:
+            Name of the step after which the bear runs no more jobs
+        """
+        loops, servos = f"{self.bear_id}.loops", f"{self.bear_id}.servos"
+        graph.add(loops, self._stop_loops, required=False)
+        graph.add(servos, self._close_servos, after=[loops], required=False)
+        graph.add(f"{self.bear_id}.cleanup", self._cleanup_servos, after=[servos], required=False)
+        return loops
+
+    async def _stop_loops(self) -> None:
+        """Cancel the background tasks and wait for them to end."""
+        self._shutdown = True
 
-        logger.info("BearService stopped")
+        # Resume PWM first so the servos can close
+        self.wake()
+        tasks = [
+            task
+            for task in (self._idle_task, self._talk_task, self._blink_task, self._puppet_task)
+            if task and not task.done()
+        ]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _close_servos(self) -> None:
+        """Close every servo at once."""
+        results = await asyncio.gather(
+            *(servo.close() for servo in self.actuators.values()), return_exceptions=True
+        )
+        for servo, result in zip(self.actuators.values(), results):
+            if isinstance(result, Exception):
+                logger.error(f"Error closing servo '{servo.name}': {result}")
+
+    async def _cleanup_servos(self) -> None:
+        """Release every servo's PWM."""
+        for servo in self.actuators.values():
+            await servo.cleanup()
 
     async def _load_phrases(self) -> None:
-        """Load phrases from JSON file."""
+        """Load phrases from JSON file.
+
+        Raises:
+            RaspiRuxpinError: If the file exists but can't be read
+        """
         phrases_file = self.settings.phrases_file
 
         if not phrases_file.exists():
@@ -170,40 +325,107 @@ class BearService:
             return
 
         try:
-            with open(phrases_file, "r", encoding="utf-8") as f:
-                self.phrases = json.load(f)
+            # Read off the event loop so a slow SD card doesn't stall the control loops
+            self.phrases = await asyncio.to_thread(
+                lambda: json.loads(phrases_file.read_text(encoding="utf-8"))
+            )
 
             logger.info(f"Loaded {len(self.phrases)} phrases")
         except Exception as e:
-            logger.error(f"Failed to load phrases: {e}")
+            raise RaspiRuxpinError(f"Failed to load phrases: {e}") from e
 
     async def _talk_monitor(self) -> None:
         """Monitor audio amplitude and sync mouth movement proportionally.
 
-        This task runs continuously, checking audio amplitude and setting
-        mouth position proportionally to the sound level for natural animation.
+        This task runs continuously, driving every mouth-role actuator at its
+        own configured update rate while the bear is busy.
         """
         logger.info("Talk monitor started")
 
         try:
-            while not self._shutdown:
-                if self.is_busy:
-                    # Get proportional mouth position based on amplitude
-                    target_position = self.audio_player.get_mouth_position()
-
-                    # Use configured duration from settings for all movements
-                    duration = self.settings.hardware.mouth_duration
-
-                    await self.mouth.set_position_percent(target_position, duration=duration)
-
-                # 25Hz update rate for smooth animation
-                await asyncio.sleep(0.04)
+            await asyncio.gather(
+                *(
+                    asyncio.create_task(
+                        self._mouth_sync_loop(servo, self.actuator_configs[servo.name].update_rate),
+                        name=f"mouth:{self.bear_id}.{servo.name}",
+                    )
+                    for servo in self.by_role(ActuatorRole.MOUTH)
+                )
+            )
         except asyncio.CancelledError:
             logger.info("Talk monitor cancelled")
             raise
         except Exception as e:
             logger.error(f"Talk monitor error: {e}")
 
+    async def _mouth_sync_loop(self, servo: Servo, update_rate: float) -> None:
+        """Set one mouth actuator's position proportionally to the sound level.
+
+        Args:
+            servo: Mouth-role servo to drive
+            update_rate: Loop rate in Hz
+        """
+        loop = asyncio.get_running_loop()
+        ticker = scheduler.ticker(update_rate, f"mouth:{self.bear_id}.{servo.name}")
+        silence_since: float | None = None
+
+        while not self._shutdown:
+            # Nothing to sync while idle or replaying: park until the next job starts
+            if not self.is_busy or self._replaying:
+                silence_since = None
+                await self._busy_event.wait()
+                continue
+
+            # Get proportional mouth position based on amplitude
+            target_position = self.audio_player.get_mouth_position()
+
+            # Move duration comes from the servo's calibration curves
+            with use_trace(self._job_trace):
+                await servo.set_position_percent(target_position)
+
+            # Re-home during envelope silence once drift has built up
+            if target_position == 0:
+                now = loop.time()
+                silence_since = silence_since if silence_since is not None else now
+                if now - silence_since >= self.settings.hardware.rehome_min_silence:
+                    await self._rehome_if_drifted(servo)
+            else:
+                silence_since = None
+
+            await ticker.tick()
+
+    async def _rehome_if_drifted(self, servo: Servo) -> None:
+        """Re-home a servo resting near its closed end-stop if it has drifted.
+
+        Args:
+            servo: Servo to check
+        """
+        threshold = self.settings.hardware.rehome_threshold
+        if servo.position_percent > servo.calibration.deadband or not servo.needs_rehome(threshold):
+            return
+
+        await servo.rehome(State.CLOSED)
+
+    async def _settle_after_job(self) -> None:
+        """Close the mouth after a job, re-homing it if it is already closed."""
+        with span("bear.settle", "bear", bear=self.bear_id):
+            for servo in self.by_role(ActuatorRole.MOUTH):
+                if servo.state != State.CLOSED:
+                    await servo.close()
+                else:
+                    await self._rehome_if_drifted(servo)
+
+    async def _open_eyes(self) -> None:
+        """Ensure all eyes-role actuators are open."""
+        eyes = [servo for servo in self.by_role(ActuatorRole.EYES) if servo.state != State.OPEN]
+        with span("bear.open_eyes", "bear", bear=self.bear_id, moving=len(eyes)):
+            await asyncio.gather(*(servo.open() for servo in eyes))
+
+    def _eyes_open(self) -> bool:
+        """Check whether the rig has eyes and they are all open."""
+        eyes = self.by_role(ActuatorRole.EYES)
+        return bool(eyes) and all(servo.state == State.OPEN for servo in eyes)
+
     async def _blink_monitor(self) -> None:
         """Randomly blink eyes when not busy.
 
@@ -211,66 +433,192 @@ class BearService:
         when the bear is not performing other actions and blinking is enabled.
         """
         logger.info("Blink monitor started")
+        ticker = scheduler.ticker(BLINK_POLL_RATE, f"blink:{self.bear_id}")
 
         try:
             while not self._shutdown:
-                if self.blink_enabled and not self.is_busy and self.eyes.state == State.OPEN:
+                if self.blink_enabled and not self.is_busy and self._eyes_open():
                     # Random delay between blinks (3-7 seconds)
                     delay = random.uniform(3.0, 7.0)
                     logger.debug(f"Blink scheduled in {delay:.1f}s")
                     await asyncio.sleep(delay)
 
                     # Check conditions again after delay
-                    if self.blink_enabled and not self.is_busy and self.eyes.state == State.OPEN:
+                    if self.blink_enabled and not self.is_busy and self._eyes_open():
                         logger.debug("Executing blink")
+                        eyes = self.by_role(ActuatorRole.EYES)
                         # Natural blink: faster for more responsive animation
-                        await self.eyes.close(0.4)    # Close with moderate speed
-                        await asyncio.sleep(0.15)     # Stay closed briefly
-                        await self.eyes.open(0.4)     # Open with moderate speed
+                        await asyncio.gather(*(s.close(0.4) for s in eyes))  # Moderate speed
+                        await asyncio.sleep(0.15)  # Stay closed briefly
+                        await asyncio.gather(*(s.open(0.4) for s in eyes))  # Moderate speed
                         logger.debug("Blink completed")
                     else:
-                        logger.debug(f"Blink cancelled: enabled={self.blink_enabled}, busy={self.is_busy}, eyes={self.eyes.state}")
+                        logger.debug(f"Blink cancelled: enabled={self.blink_enabled}, busy={self.is_busy}, eyes_open={self._eyes_open()}")
                 else:
-                    await asyncio.sleep(0.5)
+                    await ticker.tick()
         except asyncio.CancelledError:
             logger.info("Blink monitor cancelled")
             raise
         except Exception as e:
             logger.error(f"Blink monitor error: {e}")
 
+    def wake(self) -> None:
+        """Note activity, leaving idle mode if the bear is parked.
+
+        Synchronous and cheap, so every command path (including puppet
+        input) calls it before touching the servos: the PWM instances are
+        back and blinking restarts before the command runs.
+        """
+        self._activity.set()
+        if self.power_state != PowerState.IDLE:
+            return
+
+        for servo in self.actuators.values():
+            servo.resume()
+        if not self._shutdown:
+            # Blinking outlives the command waking the bear: keep it out of its trace
+            with use_trace(None):
+                self._blink_task = asyncio.create_task(self._blink_monitor())
+
+        now = asyncio.get_running_loop().time()
+        if self._idle_since is not None:
+            self._idle_seconds += now - self._idle_since
+        self._idle_since = None
+        self.power_state = PowerState.ACTIVE
+        logger.info(f"Bear '{self.bear_id}' woke from idle")
+
+    def client_connected(self) -> None:
+        """Record a client connecting (clients keep the bear out of idle mode)."""
+        self.clients += 1
+        self.wake()
+
+    def client_disconnected(self) -> None:
+        """Record a client disconnecting (restarts the quiet period)."""
+        self.clients = max(0, self.clients - 1)
+        self._activity.set()
+
+    def _quiet(self) -> bool:
+        """Check whether nothing uses the bear: no job, recording, client or move."""
+        return (
+            not self.is_busy
+            and self.recorder is None
+            and self.clients == 0
+            and not any(servo.moving for servo in self.actuators.values())
+        )
+
+    async def _idle_monitor(self) -> None:
+        """Enter idle mode once the bear has been quiet for ``idle_timeout``.
+
+        Sleeps on the activity event: every command, job end and client
+        (dis)connection restarts the quiet period. Disabled with a timeout
+        of 0.
+        """
+        timeout = self.settings.hardware.idle_timeout
+        if not timeout:
+            return
+
+        while not self._shutdown:
+            self._activity.clear()
+            try:
+                # Once idle, nothing runs until a command wakes the bear
+                idle = self.power_state == PowerState.IDLE
+                await asyncio.wait_for(self._activity.wait(), None if idle else timeout)
+                continue
+            except asyncio.TimeoutError:
+                pass
+
+            if self.power_state == PowerState.ACTIVE and self._quiet():
+                await self._enter_idle()
+
+    async def _enter_idle(self) -> None:
+        """Suspend blinking and release PWM until the next command."""
+        if self._blink_task and not self._blink_task.done():
+            self._blink_task.cancel()
+            try:
+                await self._blink_task
+            except asyncio.CancelledError:
+                pass
+
+        # Activity may have arrived while blinking stopped
+        if self._activity.is_set() or not self._quiet():
+            self._blink_task = asyncio.create_task(self._blink_monitor())
+            return
+
+        for servo in self.actuators.values():
+            servo.release()
+        self.power_state = PowerState.IDLE
+        self._idle_since = asyncio.get_running_loop().time()
+        self._idle_entries += 1
+        logger.info(f"Bear '{self.bear_id}' idle: blinking suspended, PWM released")
+
+    def get_power_stats(self) -> dict[str, Any]:
+        """Get idle power mode statistics.
+
+        Returns:
+            Power state, connected clients, idle timeout, times idled and
+            total seconds spent idle
+        """
+        idle_seconds = self._idle_seconds
+        if self._idle_since is not None:
+            idle_seconds += asyncio.get_running_loop().time() - self._idle_since
+        return {
+            "state": self.power_state.value,
+            "clients": self.clients,
+            "idle_timeout": self.settings.hardware.idle_timeout,
+            "idle_entries": self._idle_entries,
+            "idle_seconds": round(idle_seconds, 2),
+        }
+
     async def update_positions(
         self,
         eyes_position: State | None = None,
         mouth_position: State | None = None,
+        actuators: dict[str, State] | None = None,
     ) -> dict[str, Any]:
         """Update servo positions manually.
 
         Args:
-            eyes_position: Target eyes position (OPEN or CLOSED)
-            mouth_position: Target mouth position (OPEN or CLOSED)
+            eyes_position: Target position for all eyes-role actuators
+            mouth_position: Target position for all mouth-role actuators
+            actuators: Target positions keyed by actuator name
 
         Returns:
             Current bear state
 
         Raises:
-            RaspiRuxpinError: If update fails
+            RaspiRuxpinError: If busy, an actuator is unknown, or update fails
         """
+        self.wake()
         if self.is_busy:
             raise RaspiRuxpinError("Bear is busy")
 
+        targets: dict[str, State] = {}
+        if eyes_position is not None:
+            targets.update({s.name: eyes_position for s in self.by_role(ActuatorRole.EYES)})
+        if mouth_position is not None:
+            targets.update({s.name: mouth_position for s in self.by_role(ActuatorRole.MOUTH)})
+        for name, position in (actuators or {}).items():
+            if name not in self.actuators:
+                raise RaspiRuxpinError(f"Unknown actuator: {name}")
+            targets[name] = position
+
         try:
             # Use slower duration for manual movements to show smooth animation
             # Adjusted for responsive feel while allowing old servos to complete movement
-            eyes_manual_duration = 0.5   # Faster, more responsive eyes
-            mouth_manual_duration = 0.5  # Mouth can be a bit faster
+            manual_duration = 0.5
 
-            if eyes_position is not None:
-                await self.eyes.set_position(eyes_position, eyes_manual_duration)
+            if self.recorder:
+                for name, position in targets.items():
+                    self.recorder.servo(name, position, manual_duration)
 
-            if mouth_position is not None:
-                await self.mouth.set_position(mouth_position, mouth_manual_duration)
+            await asyncio.gather(
+                *(
+                    self.actuators[name].set_position(position, manual_duration)
+                    for name, position in targets.items()
+                )
+            )
 
-            logger.info(f"Positions updated: eyes={eyes_position}, mouth={mouth_position}")
+            logger.info(f"Positions updated: {', '.join(f'{n}={p}' for n, p in targets.items())}")
 
             return self.get_state()
         except Exception as e:
@@ -285,6 +633,7 @@ class BearService:
         Raises:
             RaspiRuxpinError: If already busy or speech fails
         """
+        self.wake()
         if self.is_busy:
             raise RaspiRuxpinError("Bear is busy")
 
@@ -292,16 +641,17 @@ class BearService:
             self.is_busy = True
             logger.info(f"Speaking: {text}")
 
+            if self.recorder:
+                self.recorder.speak(text)
+
             # Ensure eyes are open
-            if self.eyes.state != State.OPEN:
-                await self.eyes.open()
+            await self._open_eyes()
 
             # Speak with mouth sync
             await self.audio_player.speak(text)
 
             # Close mouth after speaking
-            if self.mouth.state != State.CLOSED:
-                await self.mouth.close()
+            await self._settle_after_job()
 
         except Exception as e:
             raise RaspiRuxpinError(f"Speech failed: {e}") from e
@@ -317,6 +667,7 @@ class BearService:
         Raises:
             RaspiRuxpinError: If already busy or playback fails
         """
+        self.wake()
         if self.is_busy:
             raise RaspiRuxpinError("Bear is busy")
 
@@ -324,22 +675,132 @@ class BearService:
             self.is_busy = True
             logger.info(f"Playing audio: {sound_name}")
 
+            if self.recorder:
+                self.recorder.play(sound_name)
+
             # Ensure eyes are open
-            if self.eyes.state != State.OPEN:
-                await self.eyes.open()
+            await self._open_eyes()
 
             # Play audio with mouth sync
             await self.audio_player.play_sound(sound_name)
 
             # Close mouth after playing
-            if self.mouth.state != State.CLOSED:
-                await self.mouth.close()
+            await self._settle_after_job()
 
         except Exception as e:
             raise RaspiRuxpinError(f"Audio playback failed: {e}") from e
         finally:
             self.is_busy = False
 
+    def puppet(self, targets: dict[str, int]) -> bool:
+        """Set continuous puppet targets without waiting for the servos.
+
+        Targets are coalesced per actuator and applied on the next control
+        tick, preempting moves still in progress. Input is ignored while the
+        bear is busy (speaking, playing or replaying).
+
+        Args:
+            targets: Position percent (0-100) keyed by actuator name
+
+        Returns:
+            True if the targets were accepted, False if the bear is busy
+
+        Raises:
+            RaspiRuxpinError: If an actuator is unknown
+        """
+        self.wake()
+        for name in targets:
+            if name not in self.actuators:
+                raise RaspiRuxpinError(f"Unknown actuator: {name}")
+
+        if self.is_busy:
+            return False
+
+        self.puppet_channel.set_targets(targets)
+        return True
+
+    def _record_puppet_move(self, name: str, target: int) -> None:
+        """Record a dispatched puppet move when recording."""
+        if self.recorder:
+            self.recorder.servo(name, target)
+
+    def start_recording(self) -> None:
+        """Start capturing servo commands and audio cues.
+
+        Raises:
+            RaspiRuxpinError: If a recording is already in progress
+        """
+        self.wake()
+        if self.recorder:
+            raise RaspiRuxpinError("Already recording")
+
+        self.recorder = SessionRecorder()
+        self._touch()
+        logger.info("Recording started")
+
+    async def stop_recording(self, name: str | None = None) -> Timeline:
+        """Stop capturing and optionally save the recording.
+
+        The file is written in a worker thread. If saving fails the session
+        keeps recording, so the client can retry under another name.
+
+        Args:
+            name: Recording name to save under in the recordings directory
+
+        Returns:
+            Recorded timeline
+
+        Raises:
+            RaspiRuxpinError: If not recording or the name is invalid
+            RecordingError: If the recording cannot be saved
+        """
+        if not self.recorder:
+            raise RaspiRuxpinError("Not recording")
+
+        # Cues up to now; capture goes on in the recorder until the save succeeds
+        recorder = self.recorder
+        timeline = recorder.timeline.copy()
+        if name:
+            await asyncio.to_thread(
+                timeline.save, recording_path(self.settings.recordings_dir, name)
+            )
+
+        if self.recorder is recorder:
+            self.recorder = None
+        self._touch()
+
+        logger.info(f"Recording stopped: {len(timeline)} cues over {timeline.duration:.1f}s")
+        return timeline
+
+    async def replay(self, recording: str | Timeline) -> dict[str, Any]:
+        """Replay a recorded session.
+
+        Args:
+            recording: Recording name in the recordings directory, or a timeline
+
+        Returns:
+            Replay timing statistics
+
+        Raises:
+            RaspiRuxpinError: If busy, the recording is invalid, or replay fails
+        """
+        self.wake()
+        if self.is_busy:
+            raise RaspiRuxpinError("Bear is busy")
+
+        if isinstance(recording, str):
+            path = recording_path(self.settings.recordings_dir, recording)
+            recording = await asyncio.to_thread(Timeline.load, path)
+
+        try:
+            self._replaying = True
+            self.is_busy = True
+            logger.info(f"Replaying {len(recording)} cues over {recording.duration:.1f}s")
+            return await TimelinePlayer(self.actuators, self.audio_player).play(recording)
+        finally:
+            self.is_busy = False
+            self._replaying = False
+
     async def set_volume(self, level: int) -> None:
         """Set audio volume.
 
@@ -349,6 +810,7 @@ class BearService:
         Raises:
             RaspiRuxpinError: If volume setting fails
         """
+        self.wake()
         try:
             await self.audio_player.set_volume(level)
             logger.info(f"Volume set to {level}")
@@ -361,7 +823,9 @@ class BearService:
         Args:
             enabled: True to enable blinking, False to disable
         """
+        self.wake()
         self.blink_enabled = enabled
+        self._touch()
         logger.info(f"Eye blinking {'enabled' if enabled else 'disabled'}")
 
     def set_character(self, character: str) -> None:
@@ -370,13 +834,77 @@ class BearService:
         Args:
             character: Character name (teddy or grubby)
         """
+        self.wake()
         if character not in ["teddy", "grubby"]:
             logger.warning(f"Unknown character: {character}, defaulting to teddy")
             character = "teddy"
 
         self.character = character
+        self._touch()
         logger.info(f"Character set to {character}")
 
+    def publish_state(self) -> tuple[int, dict[str, Any]] | None:
+        """Publish the current state if anything changed since the last publish.
+
+        Cheap when idle: without a mutation since the last call this returns
+        immediately without building the state. A publish that changes
+        anything replaces the shared snapshot.
+
+        Returns:
+            ``(base_seq, changes)`` where ``base_seq`` is the sequence number
+            the changes apply on top of, or None if nothing changed
+        """
+        if self.state_seq == self._checked_seq:
+            return None
+        self._checked_seq = self.state_seq
+
+        base = self.state_history.seq
+        state = self._build_state()
+        changes = self.state_history.record(self.state_seq, state)
+        if not changes:
+            return None
+        self._snapshot = StateSnapshot(
+            seq=self.state_history.seq, epoch=self.state_epoch, data=state
+        )
+        return base, changes
+
+    def get_snapshot(self) -> StateSnapshot:
+        """Get the current state as a shared, immutable snapshot.
+
+        Returns the same object (and cached encodings) until the state
+        changes, so readers cost nothing while the bear is idle.
+
+        Returns:
+            Current state snapshot
+        """
+        self.publish_state()
+        return self._snapshot
+
+    def get_state_snapshot(self) -> tuple[int, dict[str, Any]]:
+        """Get the current full state with its sequence number.
+
+        Returns:
+            ``(seq, state)``; the state is a copy the caller may modify
+        """
+        snapshot = self.get_snapshot()
+        return snapshot.seq, dict(snapshot.data)
+
+    def get_state_since(self, epoch: str, seq: int) -> dict[str, Any] | None:
+        """Get what changed since a client's last applied sequence number.
+
+        Args:
+            epoch: State epoch the client's sequence number belongs to
+            seq: Last sequence number the client applied
+
+        Returns:
+            Merged delta, or None if the client must take a full snapshot
+            (different epoch, or history no longer reaches back to ``seq``)
+        """
+        if epoch != self.state_epoch:
+            return None
+        self.publish_state()
+        return self.state_history.since(seq)
+
     def get_phrases(self) -> dict[str, str]:
         """Get available phrases.
 
@@ -385,18 +913,49 @@ class BearService:
         """
         return self.phrases.copy()
 
+    def get_drift_stats(self) -> dict[str, dict[str, Any]]:
+        """Get position-estimate drift statistics for each servo.
+
+        Returns:
+            Dictionary of servo name to drift statistics
+        """
+        return {name: servo.drift_stats() for name, servo in self.actuators.items()}
+
     def get_state(self) -> dict[str, Any]:
         """Get current bear state.
 
+        Doesn't publish. Readers that don't modify the state should use
+        ``get_snapshot``, which doesn't copy.
+
+        Returns:
+            Dictionary with current state information (a copy)
+        """
+        if self.state_seq == self._checked_seq:
+            return dict(self._snapshot.data)
+        return self._build_state()
+
+    def _build_state(self) -> dict[str, Any]:
+        """Build the state from the actuators and settings.
+
         Returns:
             Dictionary with current state information
         """
+        eyes, mouth = self.eyes, self.mouth
         return {
-            "eyes": self.eyes.state.value,
-            "mouth": self.mouth.state.value,
-            "eyes_position": self.eyes.position_percent,
-            "mouth_position": self.mouth.position_percent,
+            "eyes": eyes.state.value if eyes else State.UNKNOWN.value,
+            "mouth": mouth.state.value if mouth else State.UNKNOWN.value,
+            "eyes_position": eyes.position_percent if eyes else 0,
+            "mouth_position": mouth.position_percent if mouth else 0,
+            "actuators": {
+                name: {
+                    "role": self.actuator_configs[name].role.value,
+                    "state": servo.state.value,
+                    "position": servo.position_percent,
+                }
+                for name, servo in self.actuators.items()
+            },
             "is_busy": self.is_busy,
+            "is_recording": self.recorder is not None,
             "volume": self.audio_player.volume,
             "blink_enabled": self.blink_enabled,
             "character": self.character,
@@ -0,0 +1,155 @@
+"""Continuous analog puppet control.
+
+A puppeteer (slider, touch drag, joystick) streams 0-100 targets per
+actuator at a high rate, often faster than the servos' control loop. The
+``PuppetChannel`` keeps only the latest target per actuator, and once per
+control tick hands each changed target to its servo as a preemptive move:
+a move still in progress stops where it got to and heads for the new
+target, so the jaw follows the input instead of finishing stale moves.
+
+An input arriving while the channel is idle is dispatched immediately;
+inputs arriving within the same tick, and repeats of the target already
+dispatched, are coalesced. The delay from input to the servo starting to
+drive is tracked per move.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+from backend.core.exceptions import ServoError
+from backend.hardware.servo import Servo
+
+logger = logging.getLogger(__name__)
+
+# Latency samples kept for statistics
+_LATENCY_SAMPLES = 256
+
+
+class PuppetChannel:
+    """Latest-wins analog targets driving a bear's actuators.
+
+    Attributes:
+        actuators: Servos keyed by actuator name
+        tick_rate: Control ticks per second
+    """
+
+    def __init__(
+        self,
+        actuators: dict[str, Servo],
+        tick_rate: float,
+        on_move: Callable[[str, int], None] | None = None,
+    ) -> None:
+        """Initialize an idle channel.
+
+        Args:
+            actuators: Servos keyed by actuator name
+            tick_rate: Control ticks per second
+            on_move: Called with (actuator name, target) for every dispatched move
+        """
+        self.actuators = actuators
+        self.tick_rate = tick_rate
+        self._on_move = on_move
+
+        # Latest undispatched target and its input time per actuator
+        self._pending: dict[str, tuple[int, float]] = {}
+        self._ready = asyncio.Event()
+        self._moves: dict[str, asyncio.Task[None]] = {}
+        self._dispatched: dict[str, int] = {}
+
+        self.inputs = 0
+        self.coalesced = 0
+        self.dispatched = 0
+        self._latencies: deque[float] = deque(maxlen=_LATENCY_SAMPLES)
+
+    def set_targets(self, targets: dict[str, int]) -> None:
+        """Set the latest targets (does not wait for the servos).
+
+        Args:
+            targets: Position percent (0-100) keyed by actuator name
+        """
+        now = asyncio.get_running_loop().time()
+        for name, target in targets.items():
+            if name in self._pending:
+                self.coalesced += 1
+            self._pending[name] = (target, now)
+        self.inputs += 1
+        self._ready.set()
+
+    async def run(self) -> None:
+        """Dispatch pending targets once per control tick until cancelled.
+
+        On cancellation, moves still running are cancelled (which brakes
+        them) and awaited before this returns.
+        """
+        loop = asyncio.get_running_loop()
+        interval = 1.0 / self.tick_rate
+
+        try:
+            while True:
+                await self._ready.wait()
+                tick_start = loop.time()
+
+                pending, self._pending = self._pending, {}
+                self._ready.clear()
+                for name, (target, received) in pending.items():
+                    # A held slider repeats its target; don't restart a move
+                    # that is still heading there
+                    move = self._moves.get(name)
+                    if move and not move.done() and self._dispatched.get(name) == target:
+                        self.coalesced += 1
+                        continue
+                    self._dispatched[name] = target
+                    if self._on_move:
+                        self._on_move(name, target)
+                    self._moves[name] = asyncio.create_task(self._drive(name, target, received))
+                    self.dispatched += 1
+
+                await asyncio.sleep(max(0.0, interval - (loop.time() - tick_start)))
+        finally:
+            # Return only once every move cut off mid-gesture has braked
+            moves = list(self._moves.values())
+            for task in moves:
+                task.cancel()
+            await asyncio.gather(*moves, return_exceptions=True)
+
+    async def _drive(self, name: str, target: int, received: float) -> None:
+        """Move one actuator toward a target, preempting its previous move.
+
+        Args:
+            name: Actuator name
+            target: Position percent
+            received: Loop time the input arrived
+        """
+        servo = self.actuators[name]
+        try:
+            await servo.set_position_percent(target, preempt=True)
+        except ServoError as e:
+            logger.warning(f"Puppet move failed: {e}")
+            return
+
+        # Superseded moves either never started or started for a newer target
+        started = servo.last_move_start
+        if self._moves.get(name) is asyncio.current_task() and started and started >= received:
+            self._latencies.append(started - received)
+
+    def stats(self) -> dict[str, Any]:
+        """Get input and latency statistics.
+
+        Returns:
+            Input/coalesced/dispatched counts, control tick and the mean and
+            max input-to-motion latency over recent moves, in ms
+        """
+        latencies = self._latencies
+        return {
+            "inputs": self.inputs,
+            "coalesced": self.coalesced,
+            "dispatched": self.dispatched,
+            "tick_ms": round(1000 / self.tick_rate, 2),
+            "latency_mean_ms": round(1000 * sum(latencies) / len(latencies), 2)
+            if latencies
+            else None,
+            "latency_max_ms": round(1000 * max(latencies), 2) if latencies else None,
+        }
@@ -0,0 +1,254 @@
+"""Adaptive quality of service under CPU pressure.
+
+When TTS synthesis or many clients saturate the Pi's CPU, everything on
+the event loop slows down together and the mouth stutters. The
+``QosController`` watches event-loop lag (how late the control loops'
+ticks fire) and CPU load. It sheds the work clients can live without, one
+step at a time:
+
+1. ``shed_logs``: log batches are flushed at a quarter of the rate
+2. ``shed_telemetry``: state/telemetry updates at half rate, and only
+   warnings and errors are streamed
+3. ``minimal``: state/telemetry at 2Hz, log streaming paused (the log
+   store keeps records for replay)
+
+Mouth sync, servo moves and command handling are never throttled; shedding
+the rest is what protects their deadlines. The controller steps down again
+after a sustained calm period. Every change is logged and counted in its
+statistics.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from backend.core.scheduler import scheduler
+
+logger = logging.getLogger(__name__)
+
+# Load samples per second
+SAMPLE_RATE = 2.0
+
+# Level changes kept for statistics
+_HISTORY = 32
+
+_PROC_STAT = Path("/proc/stat")
+
+
+@dataclass(frozen=True)
+class QosLevel:
+    """What is throttled at one QoS level.
+
+    Attributes:
+        name: Level name
+        telemetry_divisor: Send state/telemetry on every Nth broadcast tick
+        log_divisor: Flush log batches on every Nth flush tick (None pauses
+            log streaming)
+        log_level: Least severe level streamed to clients
+    """
+
+    name: str
+    telemetry_divisor: int
+    log_divisor: int | None
+    log_level: int
+
+
+LEVELS = (
+    QosLevel("normal", telemetry_divisor=1, log_divisor=1, log_level=logging.NOTSET),
+    QosLevel("shed_logs", telemetry_divisor=1, log_divisor=4, log_level=logging.NOTSET),
+    QosLevel("shed_telemetry", telemetry_divisor=2, log_divisor=4, log_level=logging.WARNING),
+    QosLevel("minimal", telemetry_divisor=5, log_divisor=None, log_level=logging.WARNING),
+)
+
+
+class QosController:
+    """Steps work shedding up under load and back down when it eases.
+
+    Attributes:
+        lag_high: Loop lag (seconds) that counts as pressure
+        lag_low: Loop lag below which the loop counts as calm
+        cpu_high: CPU load (0-1) that counts as pressure
+        cpu_low: CPU load below which the CPU counts as calm
+        escalate_after: Consecutive pressured samples before stepping up
+        restore_after: Consecutive calm samples before stepping down
+        level: Current level index into ``LEVELS``
+    """
+
+    def __init__(
+        self,
+        lag_high: float = 0.05,
+        lag_low: float = 0.015,
+        cpu_high: float = 0.9,
+        cpu_low: float = 0.7,
+        escalate_after: int = 2,
+        restore_after: int = 10,
+    ) -> None:
+        """Initialize a controller at the normal level.
+
+        Args:
+            lag_high: Loop lag (seconds) that counts as pressure
+            lag_low: Loop lag below which the loop counts as calm
+            cpu_high: CPU load (0-1) that counts as pressure
+            cpu_low: CPU load below which the CPU counts as calm
+            escalate_after: Consecutive pressured samples before stepping up
+            restore_after: Consecutive calm samples before stepping down
+        """
+        self.lag_high = lag_high
+        self.lag_low = lag_low
+        self.cpu_high = cpu_high
+        self.cpu_low = cpu_low
+        self.escalate_after = escalate_after
+        self.restore_after = restore_after
+        self.level = 0
+
+        self._pressured = 0
+        self._calm = 0
+        self._cpu_last: tuple[float, float] | None = None
+        self.lag = 0.0
+        self.cpu = 0.0
+
+        self.escalations = 0
+        self.restorations = 0
+        self._changes: deque[dict[str, Any]] = deque(maxlen=_HISTORY)
+        self._waiters: list[asyncio.Future[None]] = []
+
+    @property
+    def policy(self) -> QosLevel:
+        """Get the current level's throttling policy."""
+        return LEVELS[self.level]
+
+    def changed(self) -> asyncio.Future[None]:
+        """Get a future resolved at the next level change.
+
+        Returns:
+            Future to await
+        """
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        return future
+
+    def observe(self, lag: float, cpu: float) -> bool:
+        """Feed one load sample and step the level if warranted.
+
+        Args:
+            lag: Worst event-loop lag since the previous sample, in seconds
+            cpu: CPU load since the previous sample (0-1)
+
+        Returns:
+            True if the level changed
+        """
+        self.lag, self.cpu = lag, cpu
+        pressured = lag >= self.lag_high or cpu >= self.cpu_high
+        calm = lag < self.lag_low and cpu < self.cpu_low
+
+        self._pressured = self._pressured + 1 if pressured else 0
+        self._calm = self._calm + 1 if calm else 0
+
+        if self._pressured >= self.escalate_after and self.level < len(LEVELS) - 1:
+            self._step(+1)
+            return True
+        if self._calm >= self.restore_after and self.level > 0:
+            self._step(-1)
+            return True
+        return False
+
+    def _step(self, direction: int) -> None:
+        """Move one level up (+1) or down (-1) and record the change."""
+        previous = LEVELS[self.level].name
+        self.level += direction
+        self._pressured = 0
+        self._calm = 0
+        if direction > 0:
+            self.escalations += 1
+        else:
+            self.restorations += 1
+
+        self._changes.append(
+            {
+                "time": time.time(),
+                "from": previous,
+                "to": self.policy.name,
+                "lag_ms": round(1000 * self.lag, 2),
+                "cpu": round(self.cpu, 3),
+            }
+        )
+        message = (
+            f"QoS {previous} -> {self.policy.name} "
+            f"(loop lag {1000 * self.lag:.1f}ms, cpu {100 * self.cpu:.0f}%)"
+        )
+        if direction > 0:
+            logger.warning(message)
+        else:
+            logger.info(message)
+
+        waiters, self._waiters = self._waiters, []
+        for future in waiters:
+            if not future.done():
+                future.set_result(None)
+
+    def sample_cpu(self) -> float:
+        """Measure CPU load since the previous call.
+
+        Uses system-wide utilization from ``/proc/stat`` (which includes TTS
+        subprocesses), falling back to this process's CPU time elsewhere.
+
+        Returns:
+            CPU load (0-1), 0 on the first call
+        """
+        try:
+            fields = [float(v) for v in _PROC_STAT.read_text().split("\n", 1)[0].split()[1:]]
+            busy, total = sum(fields) - fields[3] - fields[4], sum(fields)
+        except (OSError, ValueError, IndexError):
+            busy, total = time.process_time(), time.monotonic() * (os.cpu_count() or 1)
+
+        last, self._cpu_last = self._cpu_last, (busy, total)
+        if last is None or total <= last[1]:
+            return 0.0
+        return min(1.0, max(0.0, (busy - last[0]) / (total - last[1])))
+
+    async def run(self) -> None:
+        """Sample load and adjust the level until cancelled.
+
+        Loop lag is the latest any control loop tick fired since the
+        previous sample, as seen by the shared scheduler.
+        """
+        ticker = scheduler.ticker(SAMPLE_RATE, "qos")
+        scheduler.take_peak_lateness()
+        self.sample_cpu()
+        try:
+            while True:
+                await ticker.tick()
+                self.observe(scheduler.take_peak_lateness(), self.sample_cpu())
+        except asyncio.CancelledError:
+            logger.debug("QoS controller cancelled")
+            raise
+        except Exception as e:
+            logger.error(f"QoS controller error: {e}")
+
+    def stats(self) -> dict[str, Any]:
+        """Get QoS statistics.
+
+        Returns:
+            Current level, last lag and CPU samples, step counts and recent
+            level changes
+        """
+        policy = self.policy
+        return {
+            "level": policy.name,
+            "telemetry_divisor": policy.telemetry_divisor,
+            "log_divisor": policy.log_divisor,
+            "lag_ms": round(1000 * self.lag, 2),
+            "cpu": round(self.cpu, 3),
+            "escalations": self.escalations,
+            "restorations": self.restorations,
+            "changes": list(self._changes),
+        }
+
+
+# Controller shared by the broadcast and log streaming loops
+qos = QosController()
@@ -0,0 +1,386 @@
+"""Session recording and replay.
+
+A ``SessionRecorder`` captures the servo commands and audio cues of a puppet
+session into a ``Timeline``: parallel typed arrays (one row per cue) plus a
+string table for actuator names, sound names and spoken text. Timelines save
+to a compact binary ``.ruxt`` file.
+
+A ``TimelinePlayer`` drives servos and the audio player from a timeline.
+Every cue is scheduled against an absolute deadline measured from the start
+of the replay, so a slow cue never pushes the rest of the show late and a
+recorded performance repeats with the same timing on every run.
+"""
+
+import asyncio
+import logging
+import math
+import re
+import struct
+import sys
+from array import array
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from backend.core.enums import CueKind, State
+from backend.core.exceptions import RecordingError
+from backend.hardware.audio_player import AudioPlayer
+from backend.hardware.servo import Servo
+
+logger = logging.getLogger(__name__)
+
+# File layout: header, string table (NUL-separated UTF-8), then the arrays
+# in _COLUMNS order, little-endian.
+_MAGIC = b"RUXT"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHII")  # magic, version, cue count, string table bytes
+_COLUMNS = (("times", "d"), ("kinds", "B"), ("refs", "H"), ("values", "b"), ("durations", "f"))
+_KINDS = tuple(CueKind)
+
+_NAME_PATTERN = re.compile(r"^[A-Za-z0-9_-]+$")
+
+
+@dataclass(frozen=True)
+class Cue:
+    """One recorded cue.
+
+    Attributes:
+        time: Seconds since the start of the recording
+        kind: What the cue does
+        target: Actuator name, sound name or text to speak
+        value: Position percent for servo cues (-1 otherwise)
+        duration: Full-travel duration override for servo cues, if any
+    """
+
+    time: float
+    kind: CueKind
+    target: str
+    value: int = -1
+    duration: float | None = None
+
+
+class Timeline:
+    """Array-backed sequence of cues ordered by time.
+
+    Attributes:
+        times: Cue times in seconds from the start
+        kinds: Index into ``CueKind`` per cue
+        refs: Index into ``strings`` per cue
+        values: Position percent per cue (-1 for audio cues)
+        durations: Duration override per cue (NaN when unset)
+        strings: Interned actuator names, sound names and texts
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty timeline."""
+        self.times = array("d")
+        self.kinds = array("B")
+        self.refs = array("H")
+        self.values = array("b")
+        self.durations = array("f")
+        self.strings: list[str] = []
+        self._string_index: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Get the number of cues."""
+        return len(self.times)
+
+    def __iter__(self) -> Iterator[Cue]:
+        """Iterate over cues in time order."""
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, index: int) -> Cue:
+        """Get one cue by position."""
+        duration = self.durations[index]
+        return Cue(
+            time=self.times[index],
+            kind=_KINDS[self.kinds[index]],
+            target=self.strings[self.refs[index]],
+            value=self.values[index],
+            duration=None if math.isnan(duration) else duration,
+        )
+
+    @property
+    def duration(self) -> float:
+        """Get the time of the last cue in seconds."""
+        return self.times[-1] if self.times else 0.0
+
+    def add(
+        self,
+        time: float,
+        kind: CueKind,
+        target: str,
+        value: int = -1,
+        duration: float | None = None,
+    ) -> None:
+        """Append a cue.
+
+        Args:
+            time: Seconds since the start of the recording
+            kind: What the cue does
+            target: Actuator name, sound name or text to speak
+            value: Position percent for servo cues
+            duration: Optional full-travel duration override for servo cues
+
+        Raises:
+            RecordingError: If the cue is earlier than the previous one
+        """
+        if self.times and time < self.times[-1]:
+            raise RecordingError(f"Cue at {time:.3f}s is earlier than previous cue")
+        if "\0" in target:
+            raise RecordingError("Cue target may not contain NUL characters")
+
+        ref = self._string_index.get(target)
+        if ref is None:
+            ref = len(self.strings)
+            self.strings.append(target)
+            self._string_index[target] = ref
+
+        self.times.append(time)
+        self.kinds.append(_KINDS.index(kind))
+        self.refs.append(ref)
+        self.values.append(value)
+        self.durations.append(math.nan if duration is None else duration)
+
+    def copy(self) -> "Timeline":
+        """Copy the timeline, e.g. to save it while capture goes on.
+
+        Returns:
+            Independent timeline with the same cues
+        """
+        timeline = Timeline()
+        for name, _ in _COLUMNS:
+            getattr(timeline, name).extend(getattr(self, name))
+        timeline.strings = list(self.strings)
+        timeline._string_index = dict(self._string_index)
+        return timeline
+
+    def save(self, path: Path) -> None:
+        """Write the timeline to a ``.ruxt`` file.
+
+        Args:
+            path: Destination file
+
+        Raises:
+            RecordingError: If the file cannot be written
+        """
+        strings = "\0".join(self.strings).encode("utf-8")
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(_HEADER.pack(_MAGIC, _VERSION, len(self), len(strings)))
+                f.write(strings)
+                for name, _ in _COLUMNS:
+                    column = getattr(self, name)
+                    if sys.byteorder == "big":
+                        column = array(column.typecode, column)
+                        column.byteswap()
+                    column.tofile(f)
+        except OSError as e:
+            raise RecordingError(f"Failed to save timeline {path}: {e}") from e
+
+        logger.info(f"Saved timeline with {len(self)} cues to {path}")
+
+    @classmethod
+    def load(cls, path: Path) -> "Timeline":
+        """Read a timeline from a ``.ruxt`` file.
+
+        Args:
+            path: Timeline file
+
+        Returns:
+            Loaded timeline
+
+        Raises:
+            RecordingError: If the file is missing or malformed
+        """
+        try:
+            with open(path, "rb") as f:
+                magic, version, count, strings_size = _HEADER.unpack(f.read(_HEADER.size))
+                if magic != _MAGIC or version != _VERSION:
+                    raise RecordingError(f"Not a v{_VERSION} timeline file: {path}")
+
+                timeline = cls()
+                raw = f.read(strings_size).decode("utf-8")
+                timeline.strings = raw.split("\0") if strings_size else []
+                timeline._string_index = {s: i for i, s in enumerate(timeline.strings)}
+
+                for name, _ in _COLUMNS:
+                    column = getattr(timeline, name)
+                    column.fromfile(f, count)
+                    if sys.byteorder == "big":
+                        column.byteswap()
+        except (OSError, EOFError, struct.error, UnicodeDecodeError) as e:
+            raise RecordingError(f"Failed to load timeline {path}: {e}") from e
+
+        if any(ref >= len(timeline.strings) for ref in timeline.refs):
+            raise RecordingError(f"Corrupt string table in timeline {path}")
+
+        return timeline
+
+
+def recording_path(recordings_dir: Path, name: str) -> Path:
+    """Get the file for a named recording.
+
+    Args:
+        recordings_dir: Directory holding recordings
+        name: Recording name (letters, digits, ``-`` and ``_``)
+
+    Returns:
+        Path to the ``.ruxt`` file
+
+    Raises:
+        RecordingError: If the name is not a plain file name
+    """
+    if not _NAME_PATTERN.match(name):
+        raise RecordingError(f"Invalid recording name: {name}")
+    return recordings_dir / f"{name}.ruxt"
+
+
+class SessionRecorder:
+    """Captures cues into a timeline as they happen.
+
+    Attributes:
+        timeline: Timeline being recorded
+    """
+
+    def __init__(self) -> None:
+        """Start recording from now."""
+        self.timeline = Timeline()
+        self._loop = asyncio.get_running_loop()
+        self._start = self._loop.time()
+
+    def _now(self) -> float:
+        """Get seconds since recording started."""
+        return self._loop.time() - self._start
+
+    def servo(self, name: str, position: State | int, duration: float | None = None) -> None:
+        """Record an actuator position command.
+
+        Args:
+            name: Actuator name
+            position: Target state or position percent
+            duration: Full-travel duration override used for the move
+        """
+        if isinstance(position, State):
+            position = 100 if position == State.OPEN else 0
+        self.timeline.add(self._now(), CueKind.SERVO, name, position, duration)
+
+    def play(self, sound_name: str) -> None:
+        """Record a sound playback cue."""
+        self.timeline.add(self._now(), CueKind.PLAY, sound_name)
+
+    def speak(self, text: str) -> None:
+        """Record a text-to-speech cue."""
+        self.timeline.add(self._now(), CueKind.SPEAK, text)
+
+
+class TimelinePlayer:
+    """Replays a timeline on servos and an audio player.
+
+    Attributes:
+        actuators: Servos keyed by actuator name
+        audio_player: Audio player for audio cues
+    """
+
+    def __init__(self, actuators: dict[str, Servo], audio_player: AudioPlayer) -> None:
+        """Initialize the player.
+
+        Args:
+            actuators: Servos keyed by actuator name
+            audio_player: Audio player for audio cues
+        """
+        self.actuators = actuators
+        self.audio_player = audio_player
+
+    def validate(self, timeline: Timeline) -> None:
+        """Check every servo cue targets a known actuator.
+
+        Raises:
+            RecordingError: If the timeline references an unknown actuator
+        """
+        servo = _KINDS.index(CueKind.SERVO)
+        for kind, ref in zip(timeline.kinds, timeline.refs):
+            name = timeline.strings[ref]
+            if kind == servo and name not in self.actuators:
+                raise RecordingError(f"Timeline uses unknown actuator: {name}")
+
+    async def play(self, timeline: Timeline) -> dict[str, Any]:
+        """Replay a timeline, waiting for every cue to finish.
+
+        Each cue starts at ``start + cue.time`` on the loop clock. Cues run as
+        independent tasks so a long move or sound never delays later cues, and
+        servo cues preempt the servo's previous move rather than queue behind
+        it. Lateness is measured when each move actually starts driving, so
+        cues skipped inside the dead-band or superseded before they start are
+        not counted.
+
+        Args:
+            timeline: Timeline to replay
+
+        Returns:
+            Timing statistics (cue count, mean and max start lateness in ms)
+
+        Raises:
+            RecordingError: If the timeline is invalid or a cue fails
+        """
+        self.validate(timeline)
+
+        loop = asyncio.get_running_loop()
+        tasks: list[asyncio.Task[float | None]] = []
+        start = loop.time()
+
+        try:
+            for cue in timeline:
+                deadline = start + cue.time
+                delay = deadline - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                tasks.append(asyncio.create_task(self._run_cue(cue, deadline)))
+
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        except asyncio.CancelledError:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        errors = [r for r in results if isinstance(r, Exception)]
+        if errors:
+            raise RecordingError(f"Replay failed: {errors[0]}") from errors[0]
+
+        lateness = [r for r in results if isinstance(r, float)]
+        stats = {
+            "cues": len(timeline),
+            "lateness_mean_ms": 1000 * sum(lateness) / len(lateness) if lateness else 0.0,
+            "lateness_max_ms": 1000 * max(lateness, default=0.0),
+        }
+        logger.info(
+            f"Replayed {stats['cues']} cues, max lateness {stats['lateness_max_ms']:.1f}ms"
+        )
+        return stats
+
+    async def _run_cue(self, cue: Cue, deadline: float) -> float | None:
+        """Execute one cue.
+
+        Args:
+            cue: Cue to execute
+            deadline: Loop time the cue was due
+
+        Returns:
+            Seconds between the deadline and the cue starting, or None if a
+            servo cue was skipped
+        """
+        if cue.kind == CueKind.SERVO:
+            servo = self.actuators[cue.target]
+            started = await servo.set_position_percent(cue.value, cue.duration, preempt=True)
+            return started - deadline if started is not None else None
+
+        started = asyncio.get_running_loop().time()
+        if cue.kind == CueKind.PLAY:
+            await self.audio_player.play_sound(cue.target)
+        elif cue.kind == CueKind.SPEAK:
+            await self.audio_player.speak(cue.target)
+        return started - deadline
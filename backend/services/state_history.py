@@ -0,0 +1,135 @@
+"""Versioned bear state with delta history.
+
+``BearService`` bumps a sequence number on every mutation. Publishing the
+state records what changed since the last published snapshot, so clients
+can be sent only the changed fields and a reconnecting client can catch up
+from its last sequence number with one merged delta.
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class StateSnapshot:
+    """A published state, shared by every reader until the state changes.
+
+    ``data`` is the same dict for every reader and must not be modified
+    (copy it first). Encodings of the snapshot (e.g. its ``bear_state``
+    frame) are cached in ``encoded``, so each is produced once per change.
+
+    Attributes:
+        seq: Sequence number the state was published at
+        epoch: State epoch of the publishing service
+        data: Full state
+        encoded: Cached encodings keyed by format
+    """
+
+    seq: int
+    epoch: str
+    data: dict[str, Any]
+    encoded: dict[str, Any] = field(default_factory=dict, compare=False, repr=False)
+
+
+def diff_state(old: dict[str, Any], new: dict[str, Any]) -> dict[str, Any]:
+    """Get the fields of ``new`` that differ from ``old``.
+
+    The ``actuators`` map is diffed per actuator, so a delta carries only
+    the actuators that moved.
+
+    Args:
+        old: Previous state
+        new: Current state
+
+    Returns:
+        Changed top-level fields (empty when nothing changed)
+    """
+    changes: dict[str, Any] = {}
+    for key, value in new.items():
+        if key == "actuators" and isinstance(value, dict):
+            previous = old.get(key) or {}
+            moved = {name: a for name, a in value.items() if previous.get(name) != a}
+            if moved:
+                changes[key] = moved
+        elif old.get(key, _MISSING) != value:
+            changes[key] = value
+    return changes
+
+
+def merge_changes(target: dict[str, Any], changes: dict[str, Any]) -> None:
+    """Apply a delta in place (actuators are merged per actuator).
+
+    Args:
+        target: State or accumulated delta to update
+        changes: Delta to apply
+    """
+    for key, value in changes.items():
+        if key == "actuators" and isinstance(target.get(key), dict):
+            target[key] = {**target[key], **value}
+        else:
+            target[key] = value
+
+
+class StateHistory:
+    """Last published snapshot plus a bounded history of deltas.
+
+    Attributes:
+        seq: Sequence number of the last published snapshot
+        snapshot: Last published state
+        max_entries: Number of deltas kept for resuming clients
+    """
+
+    def __init__(self, max_entries: int = 300) -> None:
+        """Initialize an empty history.
+
+        Args:
+            max_entries: Number of deltas kept (300 = 30 s at 10 Hz)
+        """
+        self.seq = 0
+        self.snapshot: dict[str, Any] = {}
+        self.max_entries = max_entries
+        self._entries: deque[tuple[int, int, dict[str, Any]]] = deque(maxlen=max_entries)
+
+    def record(self, seq: int, state: dict[str, Any]) -> dict[str, Any]:
+        """Publish a new state.
+
+        Args:
+            seq: Sequence number the state was taken at
+            state: Current full state
+
+        Returns:
+            Fields that changed since the last published snapshot. When
+            nothing changed the snapshot's sequence number is not advanced,
+            so clients holding it stay current.
+        """
+        changes = diff_state(self.snapshot, state)
+        if changes:
+            self._entries.append((self.seq, seq, changes))
+            self.snapshot = state
+            self.seq = seq
+        return changes
+
+    def since(self, seq: int) -> dict[str, Any] | None:
+        """Get everything that changed after ``seq`` as one delta.
+
+        Args:
+            seq: Last sequence number the client has applied
+
+        Returns:
+            Merged delta (empty if the client is current), or None if ``seq``
+            is unknown or older than the kept history
+        """
+        if seq == self.seq:
+            return {}
+
+        merged: dict[str, Any] = {}
+        found = False
+        for base, entry_seq, changes in self._entries:
+            if base == seq:
+                found = True
+            if found:
+                merge_changes(merged, changes)
+        return merged if found else None
@@ -1,5 +1,7 @@
 """Integration tests for API endpoints."""
 
+import time
+
 import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -52,6 +54,18 @@ def test_app_settings(tmp_path):
     )
 
 
+# Frames streamed independently of requests (interleave with replies)
+STREAM_TYPES = {"log_batch", "bear_state_delta", "gpio_status", "metrics", "job"}
+
+
+def receive_reply(websocket):
+    """Receive the next frame that is not part of a background stream."""
+    while True:
+        data = websocket.receive_json()
+        if data.get("type") not in STREAM_TYPES:
+            return data
+
+
 @pytest.fixture
 def client(test_app_settings):
     """Provide FastAPI test client."""
@@ -61,6 +75,11 @@ def client(test_app_settings):
     app.dependency_overrides[get_settings] = lambda: test_app_settings
 
     with TestClient(app) as test_client:
+        # Startup finishes in the background (eyes opening): wait like a client would
+        deadline = time.monotonic() + 5
+        while test_client.get("/api/ready").status_code != 200:
+            assert time.monotonic() < deadline, "service never became ready"
+            time.sleep(0.02)
         yield test_client
 
     # Clean up
@@ -92,6 +111,36 @@ def test_health_endpoint_structure(client):
     assert data["status"] == "ok"
 
 
+def test_ready_endpoint(client):
+    """Test readiness reports every startup step with its timing."""
+    response = client.get("/api/ready")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["ready"] is True
+    steps = data["steps"]
+    assert steps["default.servos"]["state"] == "ready"
+    assert steps["default.eyes"]["after"] == ["default.servos"]
+    assert steps["default.eyes"]["duration_ms"] > 0
+    assert {"default.loops", "default.idle", "default.mixer", "tts", "envelopes"} <= set(steps)
+
+
+def test_bears_endpoint(client):
+    """Test bears listing and per-bear status."""
+    response = client.get("/api/bears")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["bears"] == ["default"]
+    assert data["default"] == "default"
+
+    status = client.get("/api/bears/default/status")
+    assert status.status_code == 200
+    assert "mouth" in status.json()["bear"]
+
+    assert client.get("/api/bears/missing/status").status_code == 404
+
+
 @pytest.mark.asyncio
 async def test_websocket_connection(client):
     """Test WebSocket connection establishment."""
@@ -100,6 +149,14 @@ async def test_websocket_connection(client):
         assert websocket is not None
 
 
+@pytest.mark.asyncio
+async def test_websocket_bear_route(client):
+    """Test per-bear WebSocket route serves the addressed bear."""
+    with client.websocket_connect("/ws/default") as websocket:
+        data = websocket.receive_json()
+        assert data["type"] == "bear_state"
+
+
 @pytest.mark.asyncio
 async def test_websocket_initial_state(client):
     """Test WebSocket sends initial bear state on connection."""
@@ -131,7 +188,7 @@ async def test_websocket_update_bear(client):
         )
 
         # Should receive updated state
-        response = websocket.receive_json()
+        response = receive_reply(websocket)
         assert response["type"] == "bear_state"
         # State should reflect the update
         assert "eyes" in response["data"]
@@ -166,7 +223,7 @@ async def test_websocket_fetch_phrases(client):
         websocket.send_json({"type": "fetch_phrases"})
 
         # Should receive phrases response
-        response = websocket.receive_json()
+        response = receive_reply(websocket)
         assert response["type"] == "phrases"
         assert "data" in response
         # Data should be a dict of phrases
@@ -194,6 +251,24 @@ async def test_websocket_invalid_message(client):
             pass
 
 
+@pytest.mark.asyncio
+async def test_websocket_invalid_message_keeps_session(client):
+    """Test an invalid message is reported without ending the session."""
+    with client.websocket_connect("/ws") as websocket:
+        websocket.receive_json()
+
+        websocket.send_json({"type": "set_volume", "level": 150})
+        error = receive_reply(websocket)
+        assert error["type"] == "error"
+        assert error["message"].startswith("Invalid message: level")
+
+        websocket.send_text("not json")
+        assert receive_reply(websocket)["type"] == "error"
+
+        websocket.send_json({"type": "fetch_phrases"})
+        assert receive_reply(websocket)["type"] == "phrases"
+
+
 @pytest.mark.asyncio
 async def test_websocket_unknown_message_type(client):
     """Test WebSocket handles unknown message type."""
@@ -233,8 +308,8 @@ async def test_websocket_multiple_clients(client):
             )
 
             # Both clients should receive update
-            response1 = ws1.receive_json()
-            response2 = ws2.receive_json()
+            response1 = receive_reply(ws1)
+            response2 = receive_reply(ws2)
 
             assert response1["type"] == "bear_state"
             assert response2["type"] == "bear_state"
@@ -242,6 +317,251 @@ async def test_websocket_multiple_clients(client):
             assert response2["data"]["eyes"] == "open"
 
 
+@pytest.mark.asyncio
+async def test_websocket_resume_from_sequence(client):
+    """Test a reconnecting client gets a delta instead of a snapshot."""
+    with client.websocket_connect("/ws") as websocket:
+        snapshot = websocket.receive_json()
+        assert snapshot["type"] == "bear_state"
+        epoch, seq = snapshot["epoch"], snapshot["seq"]
+
+    with client.websocket_connect(f"/ws?epoch={epoch}&since={seq}") as websocket:
+        data = websocket.receive_json()
+        assert data["type"] == "bear_state_delta"
+        assert data["base"] == seq
+        assert data["seq"] >= seq
+
+    # Unknown epoch (e.g. after a server restart) falls back to a snapshot
+    with client.websocket_connect(f"/ws?epoch=stale&since={seq}") as websocket:
+        data = websocket.receive_json()
+        assert data["type"] == "bear_state"
+
+
+@pytest.mark.asyncio
+async def test_websocket_binary_telemetry(client):
+    """Test negotiated binary telemetry carries positions as binary frames."""
+    from backend.api.telemetry import TelemetryCodec
+
+    with client.websocket_connect("/ws") as websocket:
+        websocket.receive_json()
+
+        websocket.send_json({"type": "set_telemetry", "format": "binary"})
+        schema = receive_reply(websocket)
+        assert schema["type"] == "telemetry_schema"
+        codec = TelemetryCodec(schema["data"]["actuators"])
+
+        websocket.send_json({"type": "update_bear", "mouth": "open"})
+        while True:
+            message = websocket.receive()
+            if message.get("bytes"):
+                break
+
+        telemetry = codec.decode(message["bytes"])
+        assert set(telemetry["actuators"]) == {"eyes", "mouth"}
+        assert telemetry["seq"] >= telemetry["base"]
+
+
+@pytest.mark.asyncio
+async def test_websocket_control_messages_during_command(client):
+    """Test control messages are answered while a command is still running."""
+    with client.websocket_connect("/ws") as websocket:
+        websocket.receive_json()
+
+        websocket.send_json({"type": "update_bear", "mouth": "open", "id": "move-1"})
+        websocket.send_json({"type": "fetch_phrases"})
+
+        replies = []
+        while not replies or replies[-1]["type"] != "command_complete":
+            reply = receive_reply(websocket)
+            if reply["type"] != "bear_state":
+                replies.append(reply)
+
+        assert [r["type"] for r in replies] == ["ack", "phrases", "command_complete"]
+        assert replies[0]["id"] == replies[2]["id"] == "move-1"
+        assert replies[2]["status"] == "done"
+
+
+@pytest.mark.asyncio
+async def test_websocket_job_state_is_sequenced(client):
+    """Test speak/play/replay jobs only send state through the sequenced snapshot stream."""
+    with client.websocket_connect("/ws") as websocket:
+        snapshot = websocket.receive_json()
+
+        for message in (
+            {"type": "play", "sound": "missing", "id": "play-1"},
+            {"type": "replay", "name": "missing", "id": "replay-1"},
+        ):
+            websocket.send_json(message)
+            states = []
+            while (frame := websocket.receive_json())["type"] != "command_complete":
+                if frame["type"] in ("bear_state", "bear_state_delta"):
+                    states.append(frame)
+
+            assert states
+            assert all(
+                frame["epoch"] == snapshot["epoch"]
+                for frame in states
+                if frame["type"] == "bear_state"
+            )
+            seqs = [frame["seq"] for frame in states]
+            assert seqs == sorted(seqs) and seqs[0] >= snapshot["seq"]
+
+
+@pytest.mark.asyncio
+async def test_websocket_topic_subscriptions(client):
+    """Test clients receive only the topics they subscribe to."""
+    with client.websocket_connect("/ws?topics=gpio") as websocket:
+        websocket.send_json(
+            {"type": "subscribe", "topics": ["state", "metrics"], "max_rate": {"state": 2}}
+        )
+        reply = receive_reply(websocket)
+        assert reply["type"] == "subscriptions"
+        assert reply["data"] == {"gpio": None, "state": 2.0, "metrics": None}
+
+        # Subscribing to state brings the client up to date with a snapshot
+        snapshot = receive_reply(websocket)
+        assert snapshot["type"] == "bear_state"
+
+        websocket.send_json({"type": "unsubscribe", "topics": ["state", "gpio"]})
+        seen = set()
+        while "subscriptions" not in seen or "metrics" not in seen:
+            seen.add(websocket.receive_json()["type"])
+        assert "log_batch" not in seen
+
+
+def test_metrics_endpoint(client):
+    """Test hot-path metrics are served in the Prometheus text format."""
+    response = client.get("/api/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+    assert "# TYPE ruxpin_servo_moves_total counter" in text
+    assert 'ruxpin_servo_move_seconds_bucket{servo="mouth",le="+Inf"}' in text
+    assert "# TYPE ruxpin_websocket_clients gauge" in text
+    assert "ruxpin_gpio_writes_total " in text
+
+
+def test_admin_profile_requires_token(client, test_app_settings):
+    """Test profiling is disabled without a token and refused with a wrong one."""
+    from pydantic import SecretStr
+
+    from backend.dependencies import get_settings
+
+    response = client.post("/api/admin/profile?seconds=0.1")
+    assert response.status_code == 403
+
+    # An empty token (bypassing config validation) still disables the API
+    empty = test_app_settings.model_copy(update={"admin_token": SecretStr("")})
+    app.dependency_overrides[get_settings] = lambda: empty
+    response = client.post("/api/admin/profile?seconds=0.1", headers={"Authorization": "Bearer "})
+    assert response.status_code == 403
+
+    settings = test_app_settings.model_copy(update={"admin_token": SecretStr("s3cret")})
+    app.dependency_overrides[get_settings] = lambda: settings
+    assert client.post("/api/admin/profile?seconds=0.1").status_code == 401
+    response = client.post(
+        "/api/admin/profile?seconds=0.1", headers={"Authorization": "Bearer wrong"}
+    )
+    assert response.status_code == 401
+    assert response.headers["www-authenticate"] == "Bearer"
+
+
+def test_admin_profile_returns_collapsed_stacks(client, test_app_settings):
+    """Test a capture returns flamegraph-ready collapsed stacks of the live process."""
+    from pydantic import SecretStr
+
+    from backend.dependencies import get_settings
+
+    settings = test_app_settings.model_copy(update={"admin_token": SecretStr("s3cret")})
+    app.dependency_overrides[get_settings] = lambda: settings
+
+    response = client.post(
+        "/api/admin/profile?seconds=0.2&interval_ms=5",
+        headers={"Authorization": "Bearer s3cret"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-disposition"].endswith('.folded"')
+    assert int(response.headers["x-profile-samples"]) >= 10
+    lines = response.text.splitlines()
+    assert lines
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    assert any(line.startswith("event-loop;") for line in lines)
+
+
+@pytest.mark.asyncio
+async def test_command_trace_export(client):
+    """Test a command's steps are exported as a Chrome trace under its id."""
+    with client.websocket_connect("/ws") as websocket:
+        websocket.receive_json()
+        websocket.send_json({"type": "update_bear", "mouth": "open", "id": "trace-1"})
+        while receive_reply(websocket)["type"] != "command_complete":
+            pass
+
+    listed = client.get("/api/traces").json()["traces"]
+    assert listed[0]["job_id"] == "trace-1"
+    assert listed[0]["command"] == "update_bear"
+
+    response = client.get("/api/traces/trace-1")
+    assert response.status_code == 200
+    events = response.json()["traceEvents"]
+    names = {event["name"] for event in events if event["ph"] == "X"}
+    assert {"websocket.receive", "update_bear", "servo.open"} <= names
+    lanes = {event["args"]["name"] for event in events if event["name"] == "thread_name"}
+    assert "command:update_bear" in lanes
+
+    assert client.get("/api/traces/unknown").status_code == 404
+
+
+def test_log_history_endpoint(client):
+    """Test log history pages through records by sequence number."""
+    import logging
+
+    for i in range(5):
+        logging.getLogger("test").warning(f"history {i}")
+
+    response = client.get("/api/logs", params={"limit": 3})
+    assert response.status_code == 200
+    data = response.json()
+    seqs = [record["seq"] for record in data["records"]]
+    assert len(seqs) == 3 and seqs == sorted(seqs)
+    assert seqs[-1] == data["last_seq"]
+
+    older = client.get("/api/logs", params={"before": seqs[0], "limit": 2}).json()
+    assert [record["seq"] for record in older["records"]] == [seqs[0] - 2, seqs[0] - 1]
+
+
+@pytest.mark.asyncio
+async def test_websocket_log_history_replay(client):
+    """Test subscribing to logs can replay recent records first."""
+    import logging
+
+    logging.getLogger("test").warning("before subscribing")
+    with client.websocket_connect("/ws?topics=") as websocket:
+        websocket.send_json({"type": "subscribe", "topics": ["logs"], "log_history": 5})
+        reply = websocket.receive_json()
+        assert reply["type"] == "log_history"
+        assert 0 < len(reply["data"]) <= 5
+        assert receive_reply(websocket)["type"] == "subscriptions"
+
+
+@pytest.mark.asyncio
+async def test_websocket_log_level_filter(client):
+    """Test a client's log level filter is applied server-side."""
+    import logging
+
+    with client.websocket_connect("/ws?topics=") as websocket:
+        websocket.send_json({"type": "subscribe", "topics": ["logs"], "log_level": "ERROR"})
+        assert receive_reply(websocket)["type"] == "subscriptions"
+
+        logging.getLogger("test").warning("filtered out")
+        logging.getLogger("test").error("streamed")
+        batch = websocket.receive_json()
+        assert batch["type"] == "log_batch"
+        assert [entry["message"] for entry in batch["data"]] == ["streamed"]
+
+
 @pytest.mark.asyncio
 async def test_websocket_disconnect_cleanup(client):
     """Test WebSocket connection cleanup on disconnect."""
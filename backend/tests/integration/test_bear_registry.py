@@ -0,0 +1,120 @@
+"""Integration tests for hosting several bears in one process."""
+
+import pytest
+
+from backend.config import AppSettings, AudioSettings, BearSettings, HardwareSettings, TTSSettings
+from backend.core.enums import ActuatorRole, State
+from backend.core.exceptions import RaspiRuxpinError
+from backend.hardware.gpio_manager import GPIOManager
+from backend.hardware.models import PinSet, ServoConfig
+from backend.services.bear_registry import BearRegistry
+
+
+def _rig(offset: int) -> list[ServoConfig]:
+    """Build a two-servo rig on pins starting at ``offset``."""
+    return [
+        ServoConfig(
+            name="mouth",
+            role=ActuatorRole.MOUTH,
+            pins=PinSet(pwm=offset, dir=offset + 1, cdir=offset + 2),
+            speed=100,
+            duration=0.05,
+        ),
+        ServoConfig(
+            name="eyes",
+            role=ActuatorRole.EYES,
+            pins=PinSet(pwm=offset + 3, dir=offset + 4, cdir=offset + 5),
+            speed=100,
+            duration=0.05,
+        ),
+    ]
+
+
+@pytest.fixture
+def registry_settings(tmp_path):
+    """Provide base settings without any bears declared."""
+    sounds_dir = tmp_path / "sounds"
+    sounds_dir.mkdir()
+
+    return AppSettings(
+        environment="testing",
+        calibration_file=tmp_path / "calibration.yaml",
+        hardware=HardwareSettings(use_mock_gpio=True, mouth_pwm=25, mouth_dir=7, mouth_cdir=8),
+        audio=AudioSettings(sounds_dir=sounds_dir),
+        tts=TTSSettings(engine="espeak", output_dir=tmp_path / "tts"),
+    )
+
+
+@pytest.fixture
+def two_bear_settings(registry_settings):
+    """Provide settings declaring two bears on distinct pins."""
+    return registry_settings.model_copy(
+        update={
+            "bears": [
+                BearSettings(id="teddy", actuators=_rig(2)),
+                BearSettings(id="grubby", actuators=_rig(14), audio_device="hw:2,0"),
+            ],
+        }
+    )
+
+
+@pytest.fixture
+def gpio_manager():
+    """Provide a mock GPIO manager."""
+    manager = GPIOManager(use_mock=True)
+    manager.initialize()
+    yield manager
+    manager.cleanup_all()
+
+
+@pytest.mark.asyncio
+async def test_registry_hosts_independent_bears(two_bear_settings, gpio_manager):
+    """Test each bear drives its own pins and speaker but shares the cache."""
+    registry = BearRegistry(two_bear_settings, gpio_manager)
+
+    assert registry.ids() == ["teddy", "grubby"]
+    assert registry.default.bear_id == "teddy"
+
+    teddy, grubby = registry.get("teddy"), registry.get("grubby")
+    assert teddy.mouth.pins.pwm != grubby.mouth.pins.pwm
+    assert grubby.audio_player.alsa_device == "hw:2,0"
+    assert teddy.audio_player.cache is grubby.audio_player.cache is registry.audio_cache
+
+    await registry.start()
+    try:
+        await teddy.update_positions(actuators={"mouth": State.OPEN})
+        assert teddy.mouth.state == State.OPEN
+        assert grubby.mouth.state != State.OPEN
+    finally:
+        await registry.stop()
+
+
+@pytest.mark.asyncio
+async def test_registry_unknown_bear(two_bear_settings, gpio_manager):
+    """Test looking up an unknown bear raises."""
+    registry = BearRegistry(two_bear_settings, gpio_manager)
+
+    with pytest.raises(RaspiRuxpinError, match="Unknown bear"):
+        registry.get("missing")
+
+    registry.audio_cache.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_single_bear_fallback(registry_settings, gpio_manager):
+    """Test settings without bears yield one default bear on the legacy rig."""
+    registry = BearRegistry(registry_settings, gpio_manager)
+
+    assert registry.ids() == ["default"]
+    assert registry.default.mouth.pins.pwm == 25
+
+    registry.audio_cache.shutdown()
+
+
+def test_bears_cannot_share_pins():
+    """Test two bears on the same pins are rejected."""
+    with pytest.raises(ValueError, match="pin"):
+        AppSettings(
+            environment="testing",
+            bears=[BearSettings(id="a", actuators=_rig(2)), BearSettings(id="b", actuators=_rig(2))],
+        )
@@ -9,7 +9,10 @@ from backend.services.bear_service import BearService
 from backend.hardware.gpio_manager import GPIOManager
 from backend.hardware.audio_player import AudioPlayer
 from backend.config import AppSettings, HardwareSettings, AudioSettings, TTSSettings
-from backend.core.enums import State
+from backend.core.enums import ActuatorRole, CueKind, PowerState, State
+from backend.core.exceptions import RaspiRuxpinError, RecordingError
+from backend.hardware.models import PinSet, ServoConfig
+from backend.services.recorder import Timeline
 
 
 @pytest.fixture
@@ -25,6 +28,7 @@ def integration_test_settings(tmp_path):
         debug=True,
         host="127.0.0.1",
         port=8080,
+        recordings_dir=tmp_path / "recordings",
         hardware=HardwareSettings(
             use_mock_gpio=True,
             eyes_pwm=21,
@@ -377,3 +381,195 @@ async def test_bear_service_servo_integration(bear_service):
 
     await bear_service.mouth.open()
     assert bear_service.mouth.state == State.OPEN
+
+
+@pytest.mark.asyncio
+async def test_bear_service_generic_actuator_rig(
+    integration_test_settings, mock_gpio_manager, mock_audio_player
+):
+    """Test a declared actuator rig is driven and reported generically."""
+    integration_test_settings.hardware.actuators = [
+        ServoConfig(name="jaw", role=ActuatorRole.MOUTH, pins=PinSet(pwm=25, dir=7, cdir=8)),
+        ServoConfig(name="eyes", role=ActuatorRole.EYES, pins=PinSet(pwm=21, dir=16, cdir=20)),
+        ServoConfig(
+            name="head",
+            role=ActuatorRole.HEAD,
+            pins=PinSet(pwm=12, dir=5, cdir=6),
+            duration=0.2,
+        ),
+    ]
+    service = BearService(
+        settings=integration_test_settings,
+        gpio_manager=mock_gpio_manager,
+        audio_player=mock_audio_player,
+    )
+    for servo in service.actuators.values():
+        await servo.initialize()
+
+    assert service.mouth is service.actuators["jaw"]
+
+    state = await service.update_positions(actuators={"head": State.OPEN})
+
+    assert state["actuators"]["head"] == {"role": "head", "state": "open", "position": 100}
+    assert state["actuators"]["jaw"]["role"] == "mouth"
+
+    with pytest.raises(Exception, match="Unknown actuator"):
+        await service.update_positions(actuators={"tail": State.OPEN})
+
+
+@pytest.mark.asyncio
+async def test_bear_service_failed_save_keeps_recording(bear_service, tmp_path):
+    """Test a recording that can't be saved is kept, and saved on retry."""
+    await bear_service.start()
+    blocked = tmp_path / "blocked"
+    blocked.write_text("not a directory")
+    bear_service.settings.recordings_dir = blocked
+
+    bear_service.start_recording()
+    await bear_service.update_positions(mouth_position=State.OPEN)
+
+    with pytest.raises(RecordingError):
+        await bear_service.stop_recording("session")
+    assert bear_service.get_state()["is_recording"] is True
+
+    bear_service.settings.recordings_dir = tmp_path / "recordings"
+    timeline = await bear_service.stop_recording("session")
+    assert [cue.target for cue in timeline] == ["mouth"]
+    assert (tmp_path / "recordings" / "session.ruxt").exists()
+    assert bear_service.get_state()["is_recording"] is False
+
+
+@pytest.mark.asyncio
+async def test_bear_service_record_and_replay(bear_service, mock_gpio_manager):
+    """Test a recorded session replays the same commands on simulated GPIO."""
+    bear_service.audio_player.play_sound = AsyncMock()
+    await bear_service.start()
+
+    bear_service.start_recording()
+    assert bear_service.get_state()["is_recording"] is True
+
+    await bear_service.update_positions(mouth_position=State.OPEN)
+    await bear_service.play_audio("hello")
+    await bear_service.update_positions(eyes_position=State.CLOSED, mouth_position=State.CLOSED)
+
+    timeline = await bear_service.stop_recording("session")
+    assert [cue.target for cue in timeline] == ["mouth", "hello", "eyes", "mouth"]
+    assert (bear_service.settings.recordings_dir / "session.ruxt").exists()
+
+    await bear_service.update_positions(eyes_position=State.OPEN)
+    stats = await bear_service.replay("session")
+
+    assert stats["cues"] == 4
+    assert bear_service.mouth.state == State.CLOSED
+    assert bear_service.eyes.state == State.CLOSED
+    assert bear_service.audio_player.play_sound.await_count == 2
+    assert bear_service.is_busy is False
+
+
+@pytest.mark.asyncio
+async def test_bear_service_replay_owns_the_mouth(bear_service):
+    """Test amplitude mouth sync stays parked while a replay drives the mouth."""
+    await bear_service.start()
+    timeline = Timeline()
+    timeline.add(0.0, CueKind.SERVO, "mouth", 70)
+    timeline.add(0.2, CueKind.SERVO, "mouth", 40)
+
+    mouth = bear_service.mouth
+    targets = []
+    set_position_percent = mouth.set_position_percent
+
+    async def record_target(target_percent, *args, **kwargs):
+        targets.append(target_percent)
+        return await set_position_percent(target_percent, *args, **kwargs)
+
+    with patch.object(mouth, "set_position_percent", side_effect=record_target):
+        await bear_service.replay(timeline)
+
+    assert targets == [70, 40]
+    assert bear_service.is_busy is False
+
+
+@pytest.mark.asyncio
+async def test_bear_service_versioned_state(bear_service):
+    """Test mutations bump the sequence number and idle ticks publish nothing."""
+    await bear_service.start()
+    bear_service.publish_state()
+    seq = bear_service.state_history.seq
+
+    assert bear_service.publish_state() is None
+
+    await bear_service.update_positions(mouth_position=State.OPEN)
+    base, changes = bear_service.publish_state()
+
+    assert base == seq
+    assert changes["mouth"] == "open"
+    assert "eyes" not in changes
+    assert set(changes["actuators"]) == {"mouth"}
+    assert bear_service.get_state_since(bear_service.state_epoch, seq) == changes
+    assert bear_service.get_state_since("other", seq) is None
+
+
+@pytest.mark.asyncio
+async def test_bear_service_shared_snapshot(bear_service):
+    """Test readers share one snapshot until the state actually changes."""
+    await bear_service.start()
+    snapshot = bear_service.get_snapshot()
+
+    assert bear_service.get_snapshot() is snapshot
+    assert bear_service.get_state() == snapshot.data
+    assert bear_service.get_state() is not snapshot.data
+
+    bear_service.set_blink_enabled(not snapshot.data["blink_enabled"])
+    changed = bear_service.get_snapshot()
+    assert changed is not snapshot
+    assert changed.seq > snapshot.seq
+    assert changed.data["blink_enabled"] != snapshot.data["blink_enabled"]
+
+
+@pytest.mark.asyncio
+async def test_bear_service_puppet(bear_service):
+    """Test analog puppet targets move actuators and are ignored while busy."""
+    await bear_service.start()
+
+    assert bear_service.puppet({"mouth": 60}) is True
+    await asyncio.sleep(0.4)
+    mouth = bear_service.actuators["mouth"]
+    assert abs(mouth.position_percent - 60) <= mouth.calibration.deadband
+
+    bear_service.is_busy = True
+    assert bear_service.puppet({"mouth": 0}) is False
+    bear_service.is_busy = False
+
+    with pytest.raises(RaspiRuxpinError, match="Unknown actuator"):
+        bear_service.puppet({"tail": 50})
+
+    await bear_service.stop()
+
+
+@pytest.mark.asyncio
+async def test_bear_service_idle_power_mode(bear_service):
+    """Test a quiet bear parks blinking and PWM, and wakes on the next command."""
+    bear_service.settings.hardware.idle_timeout = 0.2
+    await bear_service.start()
+    bear_service.set_blink_enabled(True)
+
+    await asyncio.sleep(0.4)
+    assert bear_service.power_state == PowerState.IDLE
+    assert all(servo.released for servo in bear_service.actuators.values())
+    assert bear_service._blink_task.done()
+
+    assert bear_service.puppet({"mouth": 40}) is True
+    assert bear_service.power_state == PowerState.ACTIVE
+    assert not any(servo.released for servo in bear_service.actuators.values())
+    assert not bear_service._blink_task.done()
+
+    # A connected client keeps the bear active
+    bear_service.client_connected()
+    await asyncio.sleep(0.4)
+    assert bear_service.power_state == PowerState.ACTIVE
+
+    bear_service.client_disconnected()
+    await asyncio.sleep(0.4)
+    stats = bear_service.get_power_stats()
+    assert stats["state"] == "idle"
+    assert stats["idle_entries"] == 2
@@ -0,0 +1,129 @@
+"""Tests for the shared audio cache."""
+
+import asyncio
+import pytest
+
+from backend.hardware.audio_cache import AudioCache, Envelope
+
+
+@pytest.fixture
+def cache():
+    """Provide an audio cache and shut its worker pool down afterwards."""
+    cache = AudioCache(max_tts_entries=2, max_envelopes=2)
+    yield cache
+    cache.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_tts_concurrent_requests_synthesize_once(cache, tmp_path):
+    """Test concurrent requests for one phrase share a single synthesis."""
+    calls = 0
+
+    async def synthesize():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        path = tmp_path / "hello.wav"
+        path.write_bytes(b"RIFF")
+        return path
+
+    key = cache.tts_key("hello", "espeak", "en+m3")
+    paths = await asyncio.gather(*(cache.get_tts(key, synthesize) for _ in range(5)))
+    again = await cache.get_tts(key, synthesize)
+
+    assert calls == 1
+    assert set(paths) == {again}
+    assert cache.stats()["tts_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_leaves_shared_synthesis_running(cache, tmp_path):
+    """Test one caller leaving does not cancel the synthesis others wait for."""
+    calls = 0
+
+    async def synthesize():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        path = tmp_path / "hello.wav"
+        path.write_bytes(b"RIFF")
+        return path
+
+    key = cache.tts_key("hello", "espeak", "en+m3")
+    first = asyncio.create_task(cache.get_tts(key, synthesize))
+    await asyncio.sleep(0.01)
+    second = asyncio.create_task(cache.get_tts(key, synthesize))
+    await asyncio.sleep(0.01)
+    first.cancel()
+
+    assert await second == tmp_path / "hello.wav"
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    assert calls == 1
+    assert cache.stats()["tts_entries"] == 1
+
+
+@pytest.mark.asyncio
+async def test_tts_eviction_removes_file(cache, tmp_path):
+    """Test evicted TTS files are deleted from disk."""
+    paths = []
+    for text in ("one", "two", "three"):
+        path = tmp_path / f"{text}.wav"
+
+        async def synthesize(path=path):
+            path.write_bytes(b"RIFF")
+            return path
+
+        paths.append(await cache.get_tts(cache.tts_key(text), synthesize))
+
+    assert not paths[0].exists()
+    assert paths[1].exists() and paths[2].exists()
+    assert cache.stats()["tts_entries"] == 2
+
+
+def test_tts_key_depends_on_parameters():
+    """Test the key changes with voice parameters."""
+    assert AudioCache.tts_key("hi", "en+m3") != AudioCache.tts_key("hi", "en+f3")
+    assert AudioCache.tts_key("hi", "en+m3") == AudioCache.tts_key("hi", "en+m3")
+
+
+@pytest.mark.asyncio
+async def test_envelope_cached_until_file_changes(cache, tmp_path):
+    """Test envelopes are analyzed once per file version."""
+    audio_file = tmp_path / "sound.wav"
+    audio_file.write_bytes(b"a")
+    calls = 0
+
+    def analyze(path):
+        nonlocal calls
+        calls += 1
+        return Envelope(amplitudes=[calls], duration=0.1)
+
+    first = await cache.get_envelope(audio_file, analyze)
+    second = await cache.get_envelope(audio_file, analyze)
+    assert calls == 1
+    assert second is first
+
+    audio_file.write_bytes(b"ab")
+    third = await cache.get_envelope(audio_file, analyze)
+    assert calls == 2
+    assert third.amplitudes == [2]
+
+
+@pytest.mark.asyncio
+async def test_failed_synthesis_is_not_cached(cache, tmp_path):
+    """Test a failed synthesis propagates and is retried next time."""
+
+    async def fail():
+        raise RuntimeError("engine missing")
+
+    with pytest.raises(RuntimeError):
+        await cache.get_tts("key", fail)
+
+    path = tmp_path / "ok.wav"
+    path.write_bytes(b"RIFF")
+
+    async def succeed():
+        return path
+
+    assert await cache.get_tts("key", succeed) == path
@@ -0,0 +1,276 @@
+"""Tests for the WebSocket broadcast fan-out."""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import patch
+
+from backend.api import websocket as ws_module
+from backend.api.broadcast import BYTES_SENT, ClientChannel, encode_frame
+from backend.api.websocket import ConnectionManager
+
+
+class FakeWebSocket:
+    """Minimal WebSocket stand-in recording sent frames."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.frames: list[str] = []
+        self.closed = False
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, frame: str) -> None:
+        await asyncio.sleep(self.delay)
+        self.frames.append(frame)
+
+    async def close(self, code: int = 1000) -> None:
+        self.closed = True
+
+
+def test_encode_frame_is_compact_json():
+    """Test frames decode back to the original message."""
+    message = {"type": "bear_state", "data": {"eyes": "open", "pins": {21: True}}}
+
+    decoded = json.loads(encode_frame(message))
+
+    assert decoded["data"]["eyes"] == "open"
+    assert decoded["data"]["pins"] == {"21": True}
+
+
+@pytest.mark.asyncio
+async def test_channel_counts_bytes_sent():
+    """Test text frames are counted by their UTF-8 size, not their length."""
+    socket = FakeWebSocket()
+    channel = ClientChannel(socket, on_close=lambda c: None)
+    before = BYTES_SENT._unlabelled.value
+
+    channel.enqueue('{"type":"speak","text":"Grüße 🐻"}')
+    channel.enqueue("ascii")
+    await asyncio.sleep(0.05)
+
+    expected = sum(len(frame.encode("utf-8")) for frame in socket.frames)
+    assert BYTES_SENT._unlabelled.value - before == expected
+    assert expected > sum(len(frame) for frame in socket.frames)
+    channel.close()
+
+
+@pytest.mark.asyncio
+async def test_channel_latest_wins_for_keyed_frames():
+    """Test a newer keyed frame replaces the queued one in place."""
+    socket = FakeWebSocket(delay=0.05)
+    channel = ClientChannel(socket, on_close=lambda c: None)
+
+    channel.enqueue("first")
+    await asyncio.sleep(0)  # writer picks up "first"
+    channel.enqueue("state-1", key="state")
+    channel.enqueue("log")
+    channel.enqueue("state-2", key="state")
+    await asyncio.sleep(0.25)
+
+    assert socket.frames == ["first", "state-2", "log"]
+    assert channel.coalesced == 1
+    channel.close()
+
+
+@pytest.mark.asyncio
+async def test_channel_drops_oldest_when_full():
+    """Test a full queue discards its oldest frame."""
+    socket = FakeWebSocket(delay=0.05)
+    channel = ClientChannel(socket, on_close=lambda c: None, max_size=2)
+
+    channel.enqueue("a")
+    await asyncio.sleep(0)
+    for frame in ("b", "c", "d"):
+        channel.enqueue(frame)
+    await asyncio.sleep(0.25)
+
+    assert socket.frames == ["a", "c", "d"]
+    assert channel.dropped == 1
+    channel.close()
+
+
+@pytest.mark.asyncio
+async def test_stalled_client_is_disconnected():
+    """Test a client whose send stalls past the heartbeat timeout is dropped."""
+    manager = ConnectionManager(heartbeat_timeout=0.05)
+    slow, fast = FakeWebSocket(delay=10), FakeWebSocket()
+    await manager.connect(slow)
+    await manager.connect(fast)
+
+    await manager.broadcast({"type": "bear_state"})
+    await asyncio.sleep(0.15)
+
+    assert slow.closed
+    assert manager.active_connections == [fast]
+    assert len(fast.frames) == 1
+    manager.disconnect(fast)
+
+
+@pytest.mark.asyncio
+async def test_broadcast_serializes_once():
+    """Test a broadcast encodes its message once regardless of client count."""
+    manager = ConnectionManager()
+    sockets = [FakeWebSocket() for _ in range(10)]
+    for socket in sockets:
+        await manager.connect(socket)
+
+    with patch.object(ws_module, "encode_frame", wraps=encode_frame) as encoder:
+        await manager.broadcast({"type": "bear_state", "data": {}})
+    await asyncio.sleep(0.01)
+
+    assert encoder.call_count == 1
+    assert all(len(s.frames) == 1 for s in sockets)
+    assert manager.stats()["sent"] == 10
+
+    for socket in sockets:
+        manager.disconnect(socket)
+
+
+@pytest.mark.asyncio
+async def test_idle_client_channel_is_found():
+    """Test per-client operations reach a channel whose queue is empty."""
+    manager = ConnectionManager()
+    socket = FakeWebSocket()
+    await manager.connect(socket)
+    channel = manager.channels[socket]
+    assert len(channel) == 0
+
+    manager.set_telemetry(socket, "binary")
+    assert manager.count_telemetry("binary") == 1
+
+    manager.disconnect(socket)
+    await asyncio.sleep(0)
+    assert channel.closed
+    assert manager.channels == {}
+
+
+@pytest.mark.asyncio
+async def test_channel_topic_rate_cap():
+    """Test a rate-capped topic is due again only after its interval."""
+    channel = ClientChannel(FakeWebSocket(), on_close=lambda c: None)
+    assert channel.due("state", 0.0)
+    assert not channel.due("metrics", 0.0)
+
+    channel.subscribe("state", max_rate=2)
+    channel.mark_sent("state", 10.0)
+    assert not channel.due("state", 10.2)
+    assert channel.due("state", 10.5)
+
+    channel.unsubscribe("state")
+    assert not channel.due("state", 20.0)
+    channel.close()
+
+
+@pytest.mark.asyncio
+async def test_broadcast_skips_unsubscribed_topics():
+    """Test topic messages reach subscribers only and aren't encoded without any."""
+    manager = ConnectionManager()
+    logs_only, everything = FakeWebSocket(), FakeWebSocket()
+    await manager.connect(logs_only)
+    await manager.connect(everything)
+    manager.unsubscribe(logs_only, "gpio")
+
+    await manager.broadcast({"type": "gpio_status", "data": {"pins": {}}})
+    with patch.object(ws_module, "encode_frame", wraps=encode_frame) as encoder:
+        await manager.broadcast({"type": "metrics", "data": {}})
+    await asyncio.sleep(0.01)
+
+    assert encoder.call_count == 0
+    assert logs_only.frames == []
+    assert len(everything.frames) == 1
+
+    manager.disconnect(logs_only)
+    manager.disconnect(everything)
+
+
+@pytest.mark.asyncio
+async def test_log_stream_batches_bursts():
+    """Test a log burst goes out as one batch, bounded and counting drops."""
+    from backend.logging_config import log_store
+
+    manager = ws_module.get_manager("log-stream-test")
+    socket = FakeWebSocket()
+    await manager.connect(socket)
+    stream = asyncio.create_task(ws_module.log_stream_loop())
+    await asyncio.sleep(0)
+
+    for i in range(ws_module.LOG_BACKLOG + 50):
+        log_store.append({"level": "INFO", "message": f"burst {i}"})
+    await asyncio.sleep(ws_module.LOG_FLUSH_INTERVAL * 3)
+
+    stream.cancel()
+    await asyncio.gather(stream, return_exceptions=True)
+    manager.disconnect(socket)
+    ws_module.managers.pop("log-stream-test")
+
+    batches = [json.loads(frame) for frame in socket.frames]
+    assert len(batches) == 1
+    assert batches[0]["type"] == "log_batch"
+    assert len(batches[0]["data"]) == ws_module.LOG_BACKLOG
+    assert batches[0]["dropped"] >= 50
+    assert batches[0]["data"][-1]["message"] == f"burst {ws_module.LOG_BACKLOG + 49}"
+
+
+@pytest.mark.asyncio
+async def test_log_stream_pauses_at_minimal(monkeypatch):
+    """Test log streaming holds records while paused and resumes when restored."""
+    from backend.logging_config import log_store
+    from backend.services.qos import LEVELS, QosController
+
+    controller = QosController(escalate_after=1, restore_after=1)
+    for _ in range(len(LEVELS) - 1):
+        controller.observe(0.2, 0.5)
+    monkeypatch.setattr(ws_module, "qos", controller)
+
+    manager = ws_module.get_manager("qos-test")
+    socket = FakeWebSocket()
+    await manager.connect(socket)
+    stream = asyncio.create_task(ws_module.log_stream_loop())
+    await asyncio.sleep(0)
+
+    log_store.append({"level": "ERROR", "message": "held back"})
+    await asyncio.sleep(ws_module.LOG_FLUSH_INTERVAL * 3)
+    paused_frames = list(socket.frames)
+
+    controller.observe(0.001, 0.1)
+    await asyncio.sleep(ws_module.LOG_FLUSH_INTERVAL * 10)
+
+    stream.cancel()
+    await asyncio.gather(stream, return_exceptions=True)
+    manager.disconnect(socket)
+    ws_module.managers.pop("qos-test")
+
+    assert paused_frames == []
+    batches = [json.loads(frame) for frame in socket.frames]
+    assert [entry["message"] for entry in batches[0]["data"]] == ["held back"]
+
+
+@pytest.mark.asyncio
+async def test_state_snapshot_encoded_once():
+    """Test a snapshot's frame is shared by every broadcast until the state changes."""
+    from backend.services.state_history import StateSnapshot
+
+    manager = ConnectionManager()
+    sockets = [FakeWebSocket() for _ in range(3)]
+    for socket in sockets:
+        await manager.connect(socket)
+    snapshot = StateSnapshot(seq=5, epoch="e1", data={"eyes": "open"})
+
+    with patch.object(ws_module, "encode_frame", wraps=encode_frame) as encoder:
+        manager.broadcast_state(snapshot)
+        manager.broadcast_state(snapshot)
+    await asyncio.sleep(0.01)
+
+    assert encoder.call_count == 1
+    assert all(channel.state_seq == 5 for channel in manager.channels.values())
+    assert json.loads(sockets[0].frames[0]) == {
+        "type": "bear_state",
+        "seq": 5,
+        "epoch": "e1",
+        "data": {"eyes": "open"},
+    }
+
+    for socket in sockets:
+        manager.disconnect(socket)
@@ -0,0 +1,132 @@
+"""Tests for servo calibration."""
+
+import pytest
+from pathlib import Path
+
+from backend.core.enums import Direction, RezeroStrategy, State
+from backend.core.exceptions import ConfigurationError
+from backend.hardware.calibration import (
+    ServoCalibration,
+    load_calibrations,
+    save_calibrations,
+)
+from backend.hardware.models import PinSet
+from backend.hardware.servo import Servo
+
+
+@pytest.fixture
+def calibration():
+    """Provide a non-linear, asymmetric calibration."""
+    return ServoCalibration(
+        open_curve=[(0, 0.0), (50, 0.2), (100, 0.3)],
+        close_curve=[(0, 0.2), (50, 0.1), (100, 0.0)],
+        startup_slack=0.02,
+        reversal_slack=0.01,
+        deadband=2,
+        rezero=RezeroStrategy.REMAINING,
+        rezero_overdrive=0.05,
+    )
+
+
+def test_linear_matches_legacy_timing():
+    """Test linear calibration reproduces duration * delta / 100."""
+    cal = ServoCalibration.linear(0.3)
+
+    assert cal.travel_time(0, 50) == pytest.approx(0.15)
+    assert cal.travel_time(80, 20) == pytest.approx(0.18)
+    assert cal.move_duration(10, 30) == pytest.approx(0.06)
+
+
+def test_travel_time_uses_table_lookup(calibration):
+    """Test travel time is interpolated from the direction's curve."""
+    # Opening is slow at the start of the curve, closing is uniform
+    assert calibration.travel_time(0, 25) == pytest.approx(0.1)
+    assert calibration.travel_time(50, 75) == pytest.approx(0.05)
+    assert calibration.travel_time(75, 50) == pytest.approx(0.05)
+
+
+def test_move_duration_adds_slack(calibration):
+    """Test startup, reversal and end-stop overdrive are added."""
+    assert calibration.move_duration(0, 50) == pytest.approx(0.22)
+    assert calibration.move_duration(0, 50, reversing=True) == pytest.approx(0.23)
+    assert calibration.move_duration(50, 0) == pytest.approx(0.1 + 0.02 + 0.05)
+
+
+def test_endstop_duration_strategy(calibration):
+    """Test re-zero strategy picks remaining or full travel."""
+    remaining = calibration.endstop_duration(Direction.OPENING, 50, known=True)
+    unknown = calibration.endstop_duration(Direction.OPENING, 50, known=False)
+
+    assert remaining == pytest.approx(0.1 + 0.02 + 0.05)
+    assert unknown == pytest.approx(0.3 + 0.02 + 0.05)
+
+
+def test_position_at_inverts_curve(calibration):
+    """Test position estimate follows the curve during a move."""
+    assert calibration.position_at(Direction.OPENING, 0, 0.1) == pytest.approx(25)
+    assert calibration.position_at(Direction.CLOSING, 100, 0.05) == pytest.approx(75)
+    assert calibration.position_at(Direction.CLOSING, 100, 1.0) == 0
+
+
+def test_curve_validation():
+    """Test curves must span 0-100% and be monotonic."""
+    with pytest.raises(ValueError, match="0 and 100"):
+        ServoCalibration(open_curve=[(0, 0.0), (50, 0.1)], close_curve=[(0, 0.1), (100, 0.0)])
+
+    with pytest.raises(ValueError, match="increase"):
+        ServoCalibration(
+            open_curve=[(0, 0.0), (50, 0.2), (100, 0.1)], close_curve=[(0, 0.1), (100, 0.0)]
+        )
+
+
+def test_save_and_load_roundtrip(tmp_path, calibration):
+    """Test calibrations persist to YAML and load back."""
+    path = tmp_path / "calibration.yaml"
+    save_calibrations(path, {"mouth": calibration})
+
+    loaded = load_calibrations(path)
+
+    assert loaded["mouth"] == calibration
+
+
+def test_load_missing_file(tmp_path):
+    """Test missing calibration file yields no calibrations."""
+    assert load_calibrations(tmp_path / "missing.yaml") == {}
+
+
+def test_load_invalid_file(tmp_path):
+    """Test invalid calibration file raises ConfigurationError."""
+    path = tmp_path / "calibration.yaml"
+    path.write_text("servos:\n  mouth:\n    open_curve: [[0, 0.0]]\n")
+
+    with pytest.raises(ConfigurationError):
+        load_calibrations(path)
+
+
+def test_example_calibration_loads():
+    """Test the shipped example calibration is valid."""
+    calibrations = load_calibrations(Path("config/calibration.example.yaml"))
+
+    assert set(calibrations) == {"mouth", "eyes"}
+
+
+@pytest.mark.asyncio
+async def test_servo_short_move_uses_calibration(mock_gpio_manager, calibration):
+    """Test short moves honor the calibrated dead-band and land on target."""
+    servo = Servo(
+        name="mouth",
+        pins=PinSet(pwm=25, dir=7, cdir=8),
+        speed=100,
+        default_duration=0.3,
+        gpio_manager=mock_gpio_manager,
+        calibration=calibration,
+    )
+    await servo.initialize()
+
+    # Below the legacy 8% dead-band, but above the calibrated one
+    await servo.set_position_percent(5)
+    assert servo.position_percent == 5
+
+    await servo.close()
+    assert servo.position_percent == 0
+    assert servo.state == State.CLOSED
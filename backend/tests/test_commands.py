@@ -0,0 +1,70 @@
+"""Tests for per-connection background commands."""
+
+import asyncio
+
+import pytest
+
+from backend.api.commands import CommandRunner
+
+
+@pytest.mark.asyncio
+async def test_runner_runs_commands_in_background():
+    """Test submit returns immediately and the task is tracked until done."""
+    runner = CommandRunner()
+    finished = asyncio.Event()
+
+    async def command():
+        await asyncio.sleep(0.05)
+        finished.set()
+
+    task = runner.submit("speak", command())
+
+    assert task is not None
+    assert runner.running == 1
+    assert not finished.is_set()
+
+    await task
+    assert finished.is_set()
+    assert runner.running == 0
+
+
+@pytest.mark.asyncio
+async def test_runner_rejects_commands_over_limit():
+    """Test commands beyond the limit are rejected without running."""
+    runner = CommandRunner(limit=2)
+    started = []
+
+    async def command(n):
+        started.append(n)
+        await asyncio.sleep(1)
+
+    assert runner.submit("play", command(1)) is not None
+    assert runner.submit("play", command(2)) is not None
+    assert runner.submit("play", command(3)) is None
+    await asyncio.sleep(0)
+
+    assert started == [1, 2]
+    runner.cancel_all()
+
+
+@pytest.mark.asyncio
+async def test_cancel_all_stops_running_commands():
+    """Test cancel_all cancels every running command."""
+    runner = CommandRunner()
+    cleaned_up = []
+
+    async def command():
+        try:
+            await asyncio.sleep(10)
+        finally:
+            cleaned_up.append(True)
+
+    tasks = [runner.submit("replay", command()) for _ in range(3)]
+    await asyncio.sleep(0)
+
+    runner.cancel_all()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert all(task.cancelled() for task in tasks)
+    assert cleaned_up == [True, True, True]
+    assert runner.running == 0
@@ -4,6 +4,7 @@ import pytest
 from pathlib import Path
 
 from backend.config import AppSettings, HardwareSettings, AudioSettings, TTSSettings
+from backend.core.enums import ActuatorRole
 
 
 def test_app_settings_defaults(monkeypatch):
@@ -112,3 +113,55 @@ def test_audio_paths_are_paths(tmp_path):
 
     assert isinstance(settings.sounds_dir, Path)
     assert settings.sounds_dir.exists()
+
+
+def test_actuator_configs_default_to_classic_rig():
+    """Test the flat eyes/mouth fields build the default actuator rig."""
+    settings = HardwareSettings(eyes_pwm=20, mouth_pwm=23)
+
+    actuators = {a.name: a for a in settings.get_actuator_configs()}
+
+    assert set(actuators) == {"eyes", "mouth"}
+    assert actuators["eyes"].role == ActuatorRole.EYES
+    assert actuators["eyes"].pins.pwm == 20
+    assert actuators["mouth"].role == ActuatorRole.MOUTH
+    assert actuators["mouth"].pins.pwm == 23
+
+
+def test_actuators_from_yaml(tmp_path):
+    """Test an actuator rig can be declared in YAML."""
+    yaml_file = tmp_path / "hardware.yaml"
+    yaml_file.write_text(
+        "hardware:\n"
+        "  actuators:\n"
+        "    - {name: mouth, role: mouth, pins: {pwm: 25, dir: 7, cdir: 8}}\n"
+        "    - {name: head, role: head, pins: {pwm: 12, dir: 5, cdir: 6}, update_rate: 10}\n"
+    )
+
+    settings = AppSettings(hardware_config_file=yaml_file)
+    settings.load_yaml_overrides()
+
+    actuators = settings.hardware.get_actuator_configs()
+    assert [a.name for a in actuators] == ["mouth", "head"]
+    assert actuators[1].role == ActuatorRole.HEAD
+    assert actuators[1].update_rate == 10
+
+
+def test_actuators_reject_shared_pins():
+    """Test actuators may not share GPIO pins."""
+    with pytest.raises(ValueError, match="share GPIO pins"):
+        HardwareSettings(
+            actuators=[
+                {"name": "mouth", "role": "mouth", "pins": {"pwm": 25, "dir": 7, "cdir": 8}},
+                {"name": "head", "role": "head", "pins": {"pwm": 25, "dir": 5, "cdir": 6}},
+            ]
+        )
+
+
+def test_empty_admin_token_disables_admin_api(monkeypatch):
+    """Test an empty ADMIN_TOKEN is treated as unset rather than as a token."""
+    monkeypatch.setenv("ADMIN_TOKEN", "")
+    assert AppSettings().admin_token is None
+
+    monkeypatch.setenv("ADMIN_TOKEN", "s3cret")
+    assert AppSettings().admin_token.get_secret_value() == "s3cret"
@@ -0,0 +1,78 @@
+"""Tests for the log record ring buffer and streaming handler."""
+
+import logging
+
+from backend.logging_config import LogStore, WebSocketHandler, log_store
+
+
+def fill(store: LogStore, count: int) -> None:
+    """Append ``count`` numbered records."""
+    for i in range(count):
+        store.append({"message": f"record {i}"})
+
+
+def test_records_get_increasing_sequence_numbers():
+    """Test appends are stamped 1, 2, 3, ... and reads don't consume."""
+    store = LogStore(capacity=10)
+    fill(store, 3)
+
+    assert [r["seq"] for r in store.read()] == [1, 2, 3]
+    assert [r["seq"] for r in store.read()] == [1, 2, 3]
+    assert len(store) == 3
+
+
+def test_ring_overwrites_oldest():
+    """Test a full store keeps the newest records."""
+    store = LogStore(capacity=5)
+    fill(store, 12)
+
+    assert store.first_seq == 8
+    assert store.last_seq == 12
+    assert [r["message"] for r in store.read()] == [f"record {i}" for i in range(7, 12)]
+
+
+def test_cursor_reads():
+    """Test forward and backward paging from a cursor."""
+    store = LogStore(capacity=100)
+    fill(store, 20)
+
+    assert [r["seq"] for r in store.read(after=5, limit=3)] == [6, 7, 8]
+    assert [r["seq"] for r in store.read(before=5, limit=3)] == [2, 3, 4]
+    assert [r["seq"] for r in store.read(limit=2)] == [19, 20]
+    assert store.read(after=20) == []
+
+
+def test_stale_cursor_reads_from_oldest_kept():
+    """Test a reader that fell behind resumes at the oldest kept record."""
+    store = LogStore(capacity=4)
+    fill(store, 10)
+
+    assert [r["seq"] for r in store.read(after=2)] == [7, 8, 9, 10]
+
+
+def test_handler_level_follows_subscribers():
+    """Test records below every subscriber's level are never built."""
+    handler = WebSocketHandler()
+    test_logger = logging.getLogger("test_log_store.handler")
+    test_logger.setLevel(logging.DEBUG)
+    test_logger.propagate = False
+    test_logger.addHandler(handler)
+
+    try:
+        before = log_store.last_seq
+        test_logger.debug("nobody is listening")
+        test_logger.info("nobody is listening")
+        assert log_store.last_seq == before
+
+        # History level records are kept regardless
+        test_logger.warning("kept for history")
+        assert log_store.last_seq == before + 1
+
+        handler.set_listener_level(logging.DEBUG)
+        test_logger.debug("someone is listening")
+        assert log_store.read(limit=1)[0]["message"] == "someone is listening"
+
+        handler.set_listener_level(None)
+        assert handler.level == logging.WARNING
+    finally:
+        test_logger.removeHandler(handler)
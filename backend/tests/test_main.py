@@ -0,0 +1,42 @@
+"""Tests for the application factory."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from backend.config import AppSettings
+from backend.main import create_app
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def test_import_has_no_side_effects(tmp_path):
+    """Test importing the app module loads no settings and defers optional packages."""
+    code = (
+        "import sys, backend.main; "
+        "print(' '.join(m for m in ('yaml', 'piper', 'alsaaudio', 'uvicorn') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=tmp_path,
+        env={"PYTHONPATH": str(ROOT), "PATH": ""},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == ""
+    # Settings would have created the config directory
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_create_app_uses_given_settings(tmp_path):
+    """Test the factory builds an app around the settings it is given."""
+    settings = AppSettings(environment="testing", config_dir=tmp_path / "config")
+
+    app = create_app(settings)
+
+    assert app.state.settings is settings
+    assert {"/api/ready", "/api/health"} <= set(app.openapi()["paths"])
+    assert app.url_path_for("bear_websocket_route", bear_id="bear1") == "/ws/bear1"
+    assert create_app(settings) is not app
@@ -0,0 +1,55 @@
+"""Tests for WebSocket message parsing and dispatch."""
+
+import typing
+
+import pytest
+from pydantic import ValidationError
+
+from backend.api.websocket import (
+    MESSAGE_HANDLERS,
+    ClientMessage,
+    SpeakMessage,
+    UpdateBearMessage,
+    describe_validation_error,
+    parse_message,
+)
+from backend.core.enums import State
+
+
+def test_every_message_type_has_a_handler():
+    """Test the handler registry covers the message union exactly."""
+    union = typing.get_args(ClientMessage)[0]
+    message_types = {model.model_fields["type"].default for model in typing.get_args(union)}
+
+    assert message_types == set(MESSAGE_HANDLERS)
+
+
+def test_parse_selects_model_by_type():
+    """Test frames parse into the model named by their type."""
+    message = parse_message('{"type": "update_bear", "actuators": {"mouth": "open"}}')
+    assert isinstance(message, UpdateBearMessage)
+    assert message.actuators == {"mouth": State.OPEN}
+
+    message = parse_message(b'{"type": "speak", "text": "Hello"}')
+    assert isinstance(message, SpeakMessage)
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ('{"type": "dance"}', "Unknown message type: dance"),
+        ('{"data": {}}', "Invalid message: missing 'type'"),
+        ('{"type": "set_volume", "level": 150}', "Invalid message: level:"),
+        ("not json", "Invalid message: Invalid JSON"),
+        (
+            '{"type": "subscribe", "topics": ["logs"], "max_rate": {"state": 2}}',
+            "Invalid message: Value error, max_rate for topics not subscribed: state",
+        ),
+    ],
+)
+def test_invalid_messages_are_described(raw, expected):
+    """Test validation errors become short client-facing messages."""
+    with pytest.raises(ValidationError) as exc_info:
+        parse_message(raw)
+
+    assert describe_validation_error(exc_info.value).startswith(expected)
@@ -0,0 +1,67 @@
+"""Tests for the Prometheus metrics registry."""
+
+import pytest
+
+from backend.core.metrics import MetricsRegistry
+
+
+def test_counter_and_gauge_exposition():
+    """Test counters and gauges render one sample per label set."""
+    registry = MetricsRegistry()
+    moves = registry.counter("moves_total", "Moves", ["servo"])
+    clients = registry.gauge("clients", "Clients")
+
+    moves.labels("mouth").inc()
+    moves.labels("mouth").inc(2)
+    moves.labels("eyes").inc()
+    clients.inc()
+    clients.inc()
+    clients.dec()
+
+    assert registry.exposition() == (
+        "# HELP moves_total Moves\n"
+        "# TYPE moves_total counter\n"
+        'moves_total{servo="mouth"} 3\n'
+        'moves_total{servo="eyes"} 1\n'
+        "# HELP clients Clients\n"
+        "# TYPE clients gauge\n"
+        "clients 1\n"
+    )
+
+
+def test_histogram_buckets_are_cumulative():
+    """Test histogram buckets count observations at or below each bound."""
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+
+    for value in (0.05, 0.1, 0.5, 3.0):
+        latency.observe(value)
+
+    lines = registry.exposition().splitlines()
+    assert lines[2:] == [
+        'latency_seconds_bucket{le="0.1"} 2',
+        'latency_seconds_bucket{le="1"} 3',
+        'latency_seconds_bucket{le="+Inf"} 4',
+        "latency_seconds_sum 3.65",
+        "latency_seconds_count 4",
+    ]
+
+
+def test_label_values_are_escaped():
+    """Test quotes, backslashes and newlines in label values are escaped."""
+    registry = MetricsRegistry()
+    registry.counter("events_total", "Events", ["name"]).labels('a "b"\\\n').inc()
+
+    assert 'events_total{name="a \\"b\\"\\\\\\n"} 1' in registry.exposition()
+
+
+def test_registration_is_idempotent():
+    """Test re-registering returns the same metric and conflicting definitions fail."""
+    registry = MetricsRegistry()
+    counter = registry.counter("moves_total", "Moves", ["servo"])
+
+    assert registry.counter("moves_total", "Moves", ["servo"]) is counter
+    with pytest.raises(ValueError):
+        registry.gauge("moves_total", "Moves", ["servo"])
+    with pytest.raises(ValueError):
+        counter.labels("mouth", "extra")
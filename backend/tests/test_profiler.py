@@ -0,0 +1,96 @@
+"""Tests for the sampling profiler."""
+
+import threading
+import time
+
+import pytest
+
+from backend.core.exceptions import ProfilerError
+from backend.core.profiler import ELIDED, TRUNCATED, SamplingProfiler
+
+
+def spin(stop: threading.Event) -> None:
+    """Keep a thread busy in a recognizable function."""
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def recurse(depth: int, stop: threading.Event) -> None:
+    """Wait at the bottom of a deep stack."""
+    if depth:
+        recurse(depth - 1, stop)
+    else:
+        stop.wait()
+
+
+@pytest.fixture
+def running():
+    """Run a function in a named thread for the length of a test."""
+    stop = threading.Event()
+    threads = []
+
+    def start(target, *args, name: str) -> threading.Thread:
+        thread = threading.Thread(target=target, args=(*args, stop), name=name, daemon=True)
+        thread.start()
+        threads.append(thread)
+        return thread
+
+    yield start
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+
+def test_collapsed_stacks_name_thread_and_functions(running):
+    """Test other threads' stacks are counted root first under their thread name."""
+    running(spin, name="gpio worker")
+    loop = running(recurse, 0, name="loop")
+
+    result = SamplingProfiler().capture(0.2, interval=0.005, loop_thread=loop.ident)
+
+    assert result.samples >= 10
+    spinning = [s for s in result.stacks if s.startswith("gpio_worker;")]
+    assert spinning and all(f"{__name__}:spin" in s for s in spinning)
+    assert sum(result.stacks[s] for s in spinning) == result.samples
+    waiting = [s for s in result.stacks if s.startswith("event-loop;")]
+    assert waiting and all(f"{__name__}:recurse" in s for s in waiting)
+    # The sampling thread leaves itself out
+    assert not any(f"{__name__}:test_" in s for s in result.stacks)
+
+    line = result.collapsed().splitlines()[0]
+    stack, count = line.rsplit(" ", 1)
+    assert result.stacks[stack] == int(count)
+
+
+def test_capture_is_bounded(running):
+    """Test stacks are cut to the depth limit and new stacks past the limit truncated."""
+    running(recurse, 50, name="deep")
+    running(spin, name="busy")
+
+    result = SamplingProfiler(max_stacks=1, max_depth=10).capture(0.05, interval=0.005)
+
+    assert len(result.stacks) == 2
+    assert result.stacks[TRUNCATED] >= result.samples - 1
+    deep = SamplingProfiler(max_depth=10).capture(0.05, interval=0.005)
+    (stack,) = [s for s in deep.stacks if s.startswith("deep;")]
+    assert stack.split(";")[1] == ELIDED
+    assert len(stack.split(";")) == 12
+
+
+def test_one_capture_at_a_time():
+    """Test a second capture is refused while one runs and arguments are checked."""
+    profiler = SamplingProfiler()
+    capture = threading.Thread(target=profiler.capture, args=(0.2,))
+    capture.start()
+    time.sleep(0.05)
+
+    assert profiler.busy
+    with pytest.raises(ProfilerError):
+        profiler.capture(0.1)
+    capture.join()
+    assert not profiler.busy
+
+    with pytest.raises(ValueError):
+        profiler.capture(0)
+    with pytest.raises(ValueError):
+        profiler.capture(1, interval=0.0001)
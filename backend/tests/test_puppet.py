@@ -0,0 +1,81 @@
+"""Tests for continuous puppet control."""
+
+import asyncio
+
+import pytest
+
+from backend.hardware.models import PinSet
+from backend.hardware.servo import Servo
+from backend.services.puppet import PuppetChannel
+
+
+@pytest.fixture
+async def mouth(mock_gpio_manager):
+    """Provide an initialized, closed mouth servo."""
+    servo = Servo(
+        name="mouth",
+        pins=PinSet(pwm=25, dir=7, cdir=8),
+        speed=100,
+        default_duration=0.3,
+        gpio_manager=mock_gpio_manager,
+    )
+    await servo.initialize()
+    await servo.close()
+    return servo
+
+
+@pytest.fixture
+async def channel(mouth):
+    """Provide a running puppet channel at 25 Hz."""
+    moves = []
+    channel = PuppetChannel({"mouth": mouth}, tick_rate=25, on_move=lambda *m: moves.append(m))
+    channel.moves = moves
+    task = asyncio.create_task(channel.run())
+    yield channel
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_targets_within_a_tick_are_coalesced(channel, mouth):
+    """Test only the latest target per actuator is dispatched."""
+    for target in (20, 40, 60):
+        channel.set_targets({"mouth": target})
+    await asyncio.sleep(0.5)
+
+    assert channel.moves == [("mouth", 60)]
+    assert channel.stats()["coalesced"] == 2
+    assert abs(mouth.position_percent - 60) <= mouth.calibration.deadband
+
+
+@pytest.mark.asyncio
+async def test_stream_follows_input_within_a_tick(channel, mouth):
+    """Test a 60 Hz input stream drives the servo with sub-tick latency."""
+    for i in range(30):
+        channel.set_targets({"mouth": 80 if (i // 10) % 2 == 0 else 20})
+        await asyncio.sleep(1 / 60)
+    await asyncio.sleep(0.5)
+
+    stats = channel.stats()
+    assert stats["dispatched"] < stats["inputs"]
+    assert stats["latency_max_ms"] is not None
+    assert stats["latency_max_ms"] < stats["tick_ms"]
+    assert abs(mouth.position_percent - 80) <= mouth.calibration.deadband
+
+
+@pytest.mark.asyncio
+async def test_stream_ending_mid_gesture_brakes(mouth, mock_gpio_manager):
+    """Test stopping the channel mid-move returns only once the actuator has braked."""
+    channel = PuppetChannel({"mouth": mouth}, tick_rate=25)
+    task = asyncio.create_task(channel.run())
+    channel.set_targets({"mouth": 100})
+    await asyncio.sleep(0.1)
+    assert mouth.moving
+
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert not mouth.moving
+    assert mock_gpio_manager.pin_states[7] is False
+    assert mock_gpio_manager.pin_states[8] is False
+    assert all(move.done() for move in channel._moves.values())
@@ -0,0 +1,96 @@
+"""Tests for the adaptive QoS controller."""
+
+import logging
+
+import pytest
+
+from backend.services.qos import LEVELS, QosController
+
+CALM = (0.001, 0.1)
+PRESSURED = (0.2, 0.5)
+
+
+def test_escalates_one_step_after_sustained_pressure():
+    """Test a single pressured sample is tolerated and a sustained one sheds a level."""
+    controller = QosController(escalate_after=2)
+
+    assert controller.observe(*PRESSURED) is False
+    assert controller.observe(*CALM) is False
+    assert controller.observe(*PRESSURED) is False
+    assert controller.observe(*PRESSURED) is True
+
+    assert controller.policy.name == "shed_logs"
+    assert controller.escalations == 1
+
+
+def test_steps_through_levels_and_stops_at_minimal():
+    """Test levels are shed in order and the last level holds."""
+    controller = QosController(escalate_after=1)
+
+    names = []
+    for _ in range(len(LEVELS) + 2):
+        controller.observe(0.0, 0.99)
+        names.append(controller.policy.name)
+
+    assert names[: len(LEVELS) - 1] == [level.name for level in LEVELS[1:]]
+    assert names[-1] == "minimal"
+    assert controller.policy.log_divisor is None
+    assert controller.escalations == len(LEVELS) - 1
+
+
+def test_restores_only_after_calm_period():
+    """Test a level is restored after sustained calm, and load in between resets it."""
+    controller = QosController(escalate_after=1, restore_after=3)
+    controller.observe(*PRESSURED)
+
+    controller.observe(*CALM)
+    controller.observe(*CALM)
+    controller.observe(0.03, 0.1)  # Neither pressured nor calm
+    controller.observe(*CALM)
+    controller.observe(*CALM)
+    assert controller.policy.name == "shed_logs"
+
+    assert controller.observe(*CALM) is True
+    assert controller.policy.name == "normal"
+
+    stats = controller.stats()
+    assert stats["escalations"] == 1
+    assert stats["restorations"] == 1
+    assert [(c["from"], c["to"]) for c in stats["changes"]] == [
+        ("normal", "shed_logs"),
+        ("shed_logs", "normal"),
+    ]
+
+
+def test_level_changes_are_logged(caplog):
+    """Test escalations log a warning and restorations an info record."""
+    controller = QosController(escalate_after=1, restore_after=1)
+
+    with caplog.at_level(logging.INFO, logger="backend.services.qos"):
+        controller.observe(*PRESSURED)
+        controller.observe(*CALM)
+
+    assert [r.levelno for r in caplog.records] == [logging.WARNING, logging.INFO]
+    assert "normal -> shed_logs" in caplog.records[0].getMessage()
+
+
+@pytest.mark.asyncio
+async def test_changed_resolves_on_level_change():
+    """Test waiters for a level change wake when the level steps."""
+    controller = QosController(escalate_after=1)
+    changed = controller.changed()
+
+    controller.observe(*CALM)
+    assert not changed.done()
+    controller.observe(*PRESSURED)
+    assert changed.done()
+
+
+def test_sample_cpu_is_a_fraction():
+    """Test CPU samples stay within 0-1."""
+    controller = QosController()
+
+    assert controller.sample_cpu() == 0.0
+    sum(range(200_000))
+    assert 0.0 <= controller.sample_cpu() <= 1.0
+
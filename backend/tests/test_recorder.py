@@ -0,0 +1,130 @@
+"""Tests for session timelines and replay."""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from backend.core.enums import CueKind, State
+from backend.core.exceptions import RecordingError
+from backend.hardware.models import PinSet
+from backend.hardware.servo import Servo
+from backend.services.recorder import Timeline, TimelinePlayer, recording_path
+
+
+@pytest.fixture
+def timeline():
+    """Provide a short timeline with servo and audio cues."""
+    timeline = Timeline()
+    timeline.add(0.0, CueKind.SERVO, "mouth", 100, 0.05)
+    timeline.add(0.05, CueKind.PLAY, "hello")
+    timeline.add(0.1, CueKind.SERVO, "mouth", 40)
+    timeline.add(0.15, CueKind.SPEAK, "Hi there, friend")
+    timeline.add(0.2, CueKind.SERVO, "mouth", 0, 0.05)
+    return timeline
+
+
+def test_timeline_interns_strings(timeline):
+    """Test repeated targets share one string table entry."""
+    assert len(timeline) == 5
+    assert timeline.strings == ["mouth", "hello", "Hi there, friend"]
+    assert timeline.duration == pytest.approx(0.2)
+
+    cue = timeline[2]
+    assert cue.kind == CueKind.SERVO
+    assert cue.value == 40
+    assert cue.duration is None
+
+
+def test_timeline_save_load_roundtrip(tmp_path, timeline):
+    """Test timelines survive a save/load cycle."""
+    path = tmp_path / "show.ruxt"
+    timeline.save(path)
+
+    loaded = Timeline.load(path)
+
+    assert list(loaded) == list(timeline)
+
+
+def test_timeline_rejects_out_of_order_cues(timeline):
+    """Test cues must be appended in time order."""
+    with pytest.raises(RecordingError, match="earlier"):
+        timeline.add(0.1, CueKind.PLAY, "late")
+
+
+def test_timeline_load_invalid(tmp_path):
+    """Test malformed files raise RecordingError."""
+    path = tmp_path / "bad.ruxt"
+    path.write_bytes(b"nope")
+
+    with pytest.raises(RecordingError):
+        Timeline.load(path)
+
+    with pytest.raises(RecordingError):
+        Timeline.load(tmp_path / "missing.ruxt")
+
+
+def test_recording_path_rejects_traversal(tmp_path):
+    """Test recording names cannot escape the recordings directory."""
+    assert recording_path(tmp_path, "show_1") == tmp_path / "show_1.ruxt"
+
+    with pytest.raises(RecordingError):
+        recording_path(tmp_path, "../etc/passwd")
+
+
+@pytest.mark.asyncio
+async def test_player_replays_on_schedule(mock_gpio_manager, timeline):
+    """Test replay hits each cue's absolute deadline on simulated GPIO."""
+    servo = Servo(
+        name="mouth",
+        pins=PinSet(pwm=25, dir=7, cdir=8),
+        speed=100,
+        default_duration=0.05,
+        gpio_manager=mock_gpio_manager,
+    )
+    await servo.initialize()
+    audio_player = MagicMock()
+    audio_player.play_sound = AsyncMock()
+    audio_player.speak = AsyncMock()
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    stats = await TimelinePlayer({"mouth": servo}, audio_player).play(timeline)
+
+    assert stats["cues"] == 5
+    assert stats["lateness_max_ms"] < 20
+    assert loop.time() - start >= timeline.duration
+    audio_player.play_sound.assert_awaited_once_with("hello")
+    audio_player.speak.assert_awaited_once_with("Hi there, friend")
+    assert servo.state == State.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_player_rejects_unknown_actuator(timeline):
+    """Test replay validates actuator names before starting."""
+    with pytest.raises(RecordingError, match="unknown actuator"):
+        await TimelinePlayer({}, MagicMock()).play(timeline)
+
+
+@pytest.mark.asyncio
+async def test_player_dense_timeline_keeps_pace(mock_gpio_manager):
+    """Test puppet-rate servo cues preempt each other instead of queueing."""
+    servo = Servo(
+        name="mouth",
+        pins=PinSet(pwm=25, dir=7, cdir=8),
+        speed=100,
+        default_duration=0.3,
+        gpio_manager=mock_gpio_manager,
+    )
+    await servo.initialize()
+    timeline = Timeline()
+    for i in range(26):
+        timeline.add(i * 0.04, CueKind.SERVO, "mouth", 70 if i % 2 else 20)
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    stats = await TimelinePlayer({"mouth": servo}, MagicMock()).play(timeline)
+    elapsed = loop.time() - start
+
+    # Each move is far longer than the cue spacing, so queued moves would run seconds late
+    assert elapsed < timeline.duration + 0.5
+    assert stats["lateness_max_ms"] < 50
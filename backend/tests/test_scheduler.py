@@ -0,0 +1,83 @@
+"""Tests for the shared tick scheduler."""
+
+import asyncio
+import time
+
+import pytest
+
+from backend.core.scheduler import TickScheduler
+
+
+@pytest.mark.asyncio
+async def test_ticks_are_phase_aligned_across_groups():
+    """Test ticks land on multiples of the period, shared by slower groups."""
+    scheduler = TickScheduler()
+    fast = scheduler.ticker(20, "fast")
+    slow = scheduler.ticker(10, "slow")
+    loop = asyncio.get_running_loop()
+
+    woke: dict[str, list[float]] = {"fast": [], "slow": []}
+
+    async def run(ticker, name, count):
+        for _ in range(count):
+            await ticker.tick()
+            woke[name].append(loop.time())
+
+    await asyncio.gather(run(fast, "fast", 6), run(slow, "slow", 3))
+
+    for name, period in (("fast", 0.05), ("slow", 0.1)):
+        for when in woke[name]:
+            offset = when % period
+            assert min(offset, period - offset) < 0.02
+    # Every slow tick is also a fast tick
+    for when in woke["slow"]:
+        assert min(abs(when - other) for other in woke["fast"]) < 0.005
+
+
+@pytest.mark.asyncio
+async def test_group_holds_no_timer_without_waiters():
+    """Test the scheduler sleeps completely once no loop waits."""
+    scheduler = TickScheduler()
+    ticker = scheduler.ticker(50, "loop")
+    group = scheduler.group(50)
+
+    await ticker.tick()
+    assert group._handle is None
+
+    task = asyncio.create_task(ticker.tick())
+    await asyncio.sleep(0)
+    assert group._handle is not None
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    assert group._handle is None
+    assert group.stats()["waiting"] == 0
+
+
+@pytest.mark.asyncio
+async def test_wait_gives_up_at_until():
+    """Test a wait capped by a loop time earlier than the tick returns then."""
+    scheduler = TickScheduler()
+    ticker = scheduler.ticker(1, "slow")
+    loop = asyncio.get_running_loop()
+
+    start = loop.time()
+    assert await ticker.tick(until=start + 0.02) is False
+    assert loop.time() - start < 0.5
+
+
+@pytest.mark.asyncio
+async def test_overrun_and_jitter_stats():
+    """Test work spilling past the next tick counts as an overrun."""
+    scheduler = TickScheduler()
+    ticker = scheduler.ticker(50, "busy")
+
+    await ticker.tick()
+    await ticker.tick()
+    time.sleep(0.05)  # Work longer than two periods
+    await ticker.tick()
+
+    stats = scheduler.stats()["50Hz"]
+    assert stats["members"] == ["busy"]
+    assert stats["ticks"] == 3
+    assert stats["overruns"] == 1
+    assert stats["jitter_max_ms"] is not None
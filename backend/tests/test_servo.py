@@ -199,3 +199,137 @@ def test_pin_set_validation():
     # Invalid PWM (negative)
     with pytest.raises(ValueError):
         PinSet(pwm=-1, dir=16, cdir=20)
+
+
+@pytest.mark.asyncio
+async def test_servo_drift_accumulates_and_rehome_resets(servo):
+    """Test partial moves add uncertainty and re-homing clears it."""
+    await servo.close()
+    assert servo.position_uncertainty == 0
+
+    await servo.set_position_percent(60, duration=0.1)
+    await servo.set_position_percent(30, duration=0.1)
+    assert servo.position_uncertainty > 0
+    assert servo.needs_rehome(0.5)
+
+    await servo.set_position_percent(3, duration=0.1)
+    assert servo.position_percent == 3
+
+    await servo.rehome(State.CLOSED)
+
+    stats = servo.drift_stats()
+    assert servo.position_percent == 0
+    assert servo.state == State.CLOSED
+    assert stats["uncertainty"] == 0
+    assert stats["rehome_count"] == 1
+    assert stats["moves_since_home"] == 0
+    assert stats["drift_corrected"] > 0
+
+
+@pytest.mark.asyncio
+async def test_servo_preemptive_move_stops_previous_move(servo):
+    """Test a preemptive target cuts short the move in progress."""
+    import asyncio
+
+    await servo.close()
+    loop = asyncio.get_running_loop()
+
+    first = asyncio.create_task(servo.set_position_percent(90, preempt=True))
+    await asyncio.sleep(0.1)
+    preempted_at = loop.time()
+    await servo.set_position_percent(10, preempt=True)
+    await first
+
+    # The first move stopped well short of 90% and the second started promptly
+    assert servo.last_move_start - preempted_at < 0.05
+    assert servo.state == State.UNKNOWN
+    assert abs(servo.position_percent - 10) <= servo.calibration.deadband
+
+
+@pytest.mark.asyncio
+async def test_servo_superseded_preemptive_move_is_skipped(servo):
+    """Test a preemptive move superseded before it starts never runs."""
+    import asyncio
+
+    await servo.close()
+    moves = []
+    original = servo._move_to_percent
+
+    async def record(direction, target, *args):
+        moves.append(target)
+        return await original(direction, target, *args)
+
+    servo._move_to_percent = record
+    await asyncio.gather(
+        servo.set_position_percent(30, preempt=True),
+        servo.set_position_percent(60, preempt=True),
+        servo.set_position_percent(50, preempt=True),
+    )
+
+    # 30 starts at once and is preempted; 60 is superseded while waiting
+    assert moves == [30, 50]
+
+
+@pytest.mark.asyncio
+async def test_servo_cancelled_move_brakes(servo, mock_gpio_manager, pin_set):
+    """Test cancelling a move mid-way stops the PWM and brakes at once."""
+    import asyncio
+
+    await servo.close()
+    servo.pwm.stop.reset_mock()
+    move = asyncio.create_task(servo.open(0.5))
+    await asyncio.sleep(0.1)
+    assert mock_gpio_manager.pin_states[pin_set.dir] is True
+
+    move.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await move
+
+    servo.pwm.stop.assert_called()
+    assert mock_gpio_manager.pin_states[pin_set.dir] is False
+    assert mock_gpio_manager.pin_states[pin_set.cdir] is False
+
+
+@pytest.mark.asyncio
+async def test_servo_move_is_watched_before_it_drives(servo, mock_gpio_manager, pin_set):
+    """Test a move cancelled while its PWM starts is watched, then braked and disarmed."""
+    import asyncio
+    import time
+
+    from backend.core.watchdog import watchdog
+
+    await servo.close()
+    servo.pwm.start.side_effect = lambda duty: time.sleep(0.1)
+    move = asyncio.create_task(servo.open(0.5))
+    await asyncio.sleep(0.03)
+    assert servo._watch_key in watchdog._deadlines
+
+    move.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await move
+
+    assert servo._watch_key not in watchdog._deadlines
+    assert mock_gpio_manager.pin_states[pin_set.dir] is False
+
+
+@pytest.mark.asyncio
+async def test_servo_slow_pwm_start_is_not_force_braked(servo):
+    """Test the deadline counts from when the PWM started, not from before it."""
+    import time
+
+    from backend.core.watchdog import watchdog
+
+    await servo.close()
+    servo.pwm.start.side_effect = lambda duty: time.sleep(0.1)
+    forced = watchdog.forced_brakes
+    servo.force_brake = MagicMock()
+
+    watchdog.start()
+    try:
+        await servo.open(0.1)
+    finally:
+        watchdog.stop()
+
+    assert watchdog.forced_brakes == forced
+    servo.force_brake.assert_not_called()
+    assert servo.state == State.OPEN
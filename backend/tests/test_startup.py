@@ -0,0 +1,92 @@
+"""Tests for dependency-ordered startup and shutdown steps."""
+
+import asyncio
+import time
+
+import pytest
+
+from backend.core.exceptions import RaspiRuxpinError
+from backend.core.startup import StepGraph
+
+
+def step(log: list[str], name: str, seconds: float = 0.05, fail: bool = False):
+    """Make a step that sleeps, logs its start and end, and optionally fails."""
+
+    async def run() -> None:
+        log.append(f"{name} start")
+        await asyncio.sleep(seconds)
+        if fail:
+            raise RuntimeError(f"{name} broke")
+        log.append(f"{name} end")
+
+    return run
+
+
+@pytest.mark.asyncio
+async def test_independent_steps_run_concurrently_after_dependencies():
+    """Test steps start together unless they depend on each other."""
+    log: list[str] = []
+    graph = StepGraph("startup")
+    graph.add("servos", step(log, "servos"))
+    graph.add("eyes", step(log, "eyes"), after=["servos"])
+    graph.add("phrases", step(log, "phrases"))
+
+    start = time.perf_counter()
+    await graph.run()
+
+    # servos then eyes (0.1s), with phrases alongside rather than after (0.15s)
+    assert time.perf_counter() - start < 0.14
+    assert log.index("servos end") < log.index("eyes start")
+    assert log.index("phrases start") < log.index("servos end")
+    status = graph.status()
+    assert status["ready"] is True
+    assert status["steps"]["eyes"]["start_ms"] >= 50
+    assert status["steps"]["eyes"]["state"] == "ready"
+
+
+@pytest.mark.asyncio
+async def test_failures_skip_dependents_and_fail_required():
+    """Test a required failure skips its dependents; an optional one does not."""
+    log: list[str] = []
+    graph = StepGraph("startup")
+    graph.add("servos", step(log, "servos", fail=True))
+    graph.add("eyes", step(log, "eyes"), after=["servos"])
+    graph.add("mixer", step(log, "mixer", fail=True), required=False)
+    graph.add("volume", step(log, "volume"), after=["mixer"])
+
+    with pytest.raises(RaspiRuxpinError, match="servos broke"):
+        await graph.run()
+
+    steps = graph.status()["steps"]
+    assert steps["eyes"]["state"] == "skipped"
+    assert steps["mixer"]["state"] == "failed"
+    assert steps["volume"]["state"] == "ready"
+    assert not graph.ready
+
+
+@pytest.mark.asyncio
+async def test_wait_for_some_steps_and_cancel_the_rest():
+    """Test waiting only for the steps needed to serve, then cancelling the others."""
+    log: list[str] = []
+    graph = StepGraph("startup")
+    graph.add("servos", step(log, "servos", 0.01))
+    graph.add("tts", step(log, "tts", 10), required=False)
+
+    graph.start()
+    await graph.wait(["servos"])
+    assert not graph.ready
+    await graph.cancel()
+
+    assert graph.status()["steps"]["tts"]["state"] == "skipped"
+    assert graph.done
+
+
+def test_steps_only_come_after_known_steps():
+    """Test unknown dependencies and duplicate names are rejected."""
+    graph = StepGraph("startup")
+    graph.add("servos", step([], "servos"))
+
+    with pytest.raises(ValueError):
+        graph.add("eyes", step([], "eyes"), after=["servo"])
+    with pytest.raises(ValueError):
+        graph.add("servos", step([], "servos"))
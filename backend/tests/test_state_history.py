@@ -0,0 +1,73 @@
+"""Tests for versioned state history."""
+
+from backend.services.state_history import StateHistory, diff_state, merge_changes
+
+
+def _state(mouth: int = 0, volume: int = 80) -> dict:
+    return {
+        "mouth_position": mouth,
+        "volume": volume,
+        "actuators": {
+            "mouth": {"role": "mouth", "position": mouth},
+            "eyes": {"role": "eyes", "position": 100},
+        },
+    }
+
+
+def test_diff_state_only_changed_fields():
+    """Test diffs carry changed fields and only the actuators that moved."""
+    changes = diff_state(_state(mouth=0), _state(mouth=40))
+
+    assert changes == {
+        "mouth_position": 40,
+        "actuators": {"mouth": {"role": "mouth", "position": 40}},
+    }
+    assert diff_state(_state(), _state()) == {}
+
+
+def test_merge_changes_merges_actuators():
+    """Test merging a delta keeps untouched actuators."""
+    state = _state()
+    merge_changes(state, {"actuators": {"mouth": {"role": "mouth", "position": 70}}})
+
+    assert state["actuators"]["mouth"]["position"] == 70
+    assert state["actuators"]["eyes"]["position"] == 100
+
+
+def test_record_skips_unchanged_states():
+    """Test the published sequence number only advances on real changes."""
+    history = StateHistory()
+    history.record(1, _state())
+
+    assert history.record(2, _state()) == {}
+    assert history.seq == 1
+
+    assert history.record(3, _state(volume=50)) == {"volume": 50}
+    assert history.seq == 3
+
+
+def test_since_merges_deltas():
+    """Test resuming merges every delta after the client's sequence number."""
+    history = StateHistory()
+    history.record(1, _state())
+    history.record(2, _state(mouth=30))
+    history.record(5, _state(mouth=60, volume=70))
+
+    assert history.since(5) == {}
+    assert history.since(2) == {
+        "mouth_position": 60,
+        "volume": 70,
+        "actuators": {"mouth": {"role": "mouth", "position": 60}},
+    }
+    assert history.since(1)["mouth_position"] == 60
+
+
+def test_since_unknown_or_expired_sequence():
+    """Test sequences outside the kept history require a full snapshot."""
+    history = StateHistory(max_entries=2)
+    for seq in range(1, 5):
+        history.record(seq, _state(mouth=seq))
+
+    assert history.since(1) is None
+    assert history.since(2) is not None
+    assert history.since(99) is None
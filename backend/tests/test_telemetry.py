@@ -0,0 +1,65 @@
+"""Tests for binary telemetry frames."""
+
+import json
+
+from backend.api.telemetry import TelemetryCodec
+from backend.core.enums import State
+
+
+def test_telemetry_roundtrip():
+    """Test frames decode back to the encoded values."""
+    codec = TelemetryCodec(["mouth", "eyes", "head"])
+    frame = codec.encode(
+        seq=1234,
+        base=1230,
+        positions=[(42, State.UNKNOWN), (100, State.OPEN), (0, State.CLOSED)],
+        amplitude=3150,
+        pins={25: True, 7: True, 8: False, 21: False},
+        busy=True,
+        timestamp=1700000000.25,
+    )
+
+    decoded = codec.decode(frame)
+
+    assert len(frame) == codec.size
+    assert decoded["seq"] == 1234
+    assert decoded["base"] == 1230
+    assert decoded["busy"] is True
+    assert decoded["amplitude"] == 3150
+    assert decoded["timestamp"] == 1700000000.25
+    assert decoded["actuators"]["mouth"] == {"position": 42, "state": "unknown"}
+    assert decoded["actuators"]["eyes"] == {"position": 100, "state": "open"}
+    assert decoded["pins"] == {7: True, 8: False, 21: False, 25: True}
+
+
+def test_telemetry_clamps_out_of_range_values():
+    """Test positions and amplitude are clamped to their field widths."""
+    codec = TelemetryCodec(["mouth"])
+    frame = codec.encode(seq=1, base=0, positions=[(140, State.OPEN)], amplitude=99999)
+    decoded = codec.decode(frame)
+
+    assert decoded["actuators"]["mouth"]["position"] == 100
+    assert decoded["amplitude"] == 0xFFFF
+
+
+def test_telemetry_frame_smaller_than_json():
+    """Test a binary frame is several times smaller than the JSON equivalent."""
+    codec = TelemetryCodec(["mouth", "eyes"])
+    frame = codec.encode(
+        seq=10, base=9, positions=[(40, State.UNKNOWN), (100, State.OPEN)], pins={25: True}
+    )
+    as_json = json.dumps(
+        {"type": "bear_state_delta", "seq": 10, "base": 9, "data": codec.decode(frame)}
+    )
+
+    assert len(frame) * 4 < len(as_json)
+
+
+def test_schema_describes_layout():
+    """Test the schema lists actuator order and frame size."""
+    codec = TelemetryCodec(["mouth", "eyes"])
+    schema = codec.schema()
+
+    assert schema["actuators"] == ["mouth", "eyes"]
+    assert schema["size"] == codec.size
+    assert schema["states"]["open"] == 1
@@ -0,0 +1,103 @@
+"""Tests for job span tracing."""
+
+import asyncio
+
+import pytest
+
+from backend.core.tracing import Tracer, current_trace, mark, span, use_trace
+
+
+def test_spans_outside_a_job_are_not_recorded():
+    """Test spans and marks are no-ops without a traced job."""
+    with span("step", "test"):
+        mark("event", "test")
+
+    assert current_trace() is None
+
+
+@pytest.mark.asyncio
+async def test_spans_join_the_job_across_tasks_and_threads():
+    """Test spans in child tasks and worker threads are recorded in the job's trace."""
+    tracer = Tracer()
+
+    def blocking() -> None:
+        with span("worker", "test"):
+            pass
+
+    async def child() -> None:
+        with span("child", "test", n=1):
+            await asyncio.to_thread(blocking)
+
+    with tracer.trace("job-1", "speak") as trace:
+        with span("parent", "test"):
+            await asyncio.create_task(child(), name="child-task")
+        mark("done", "test")
+
+    assert [s.name for s in trace.spans] == ["worker", "child", "parent", "done"]
+    assert trace.spans[1].lane == "child-task"
+    assert trace.spans[1].args == {"n": 1}
+    assert trace.spans[0].lane.startswith("asyncio_")
+    assert trace.end is not None
+    assert current_trace() is None
+
+
+def test_chrome_export():
+    """Test spans are exported as complete and instant events with named rows."""
+    tracer = Tracer()
+    with tracer.trace("job-1", "play") as trace:
+        trace.record("tts", "audio", trace.start + 0.01, trace.start + 0.03, engine="espeak")
+        trace.record("audio.started", "audio", trace.start + 0.05, trace.start + 0.05)
+
+    exported = trace.chrome()
+
+    events = [e for e in exported["traceEvents"] if e["ph"] != "M"]
+    assert events[0] == {
+        "name": "tts",
+        "cat": "audio",
+        "ph": "X",
+        "ts": 10000.0,
+        "dur": 20000.0,
+        "pid": 1,
+        "tid": 1,
+        "args": {"engine": "espeak"},
+    }
+    assert events[1]["ph"] == "i"
+    assert events[1]["ts"] == 50000.0
+    rows = [e for e in exported["traceEvents"] if e["name"] == "thread_name"]
+    assert rows == [
+        {"name": "thread_name", "ph": "M", "pid": 1, "tid": 1, "args": {"name": "MainThread"}}
+    ]
+    assert exported["otherData"]["job_id"] == "job-1"
+
+
+def test_traces_and_spans_are_bounded():
+    """Test only the newest traces are kept, each with a bounded number of spans."""
+    tracer = Tracer(max_traces=2)
+    for n in range(3):
+        with tracer.trace(f"job-{n}", "speak") as trace:
+            trace.max_spans = 2
+            for _ in range(5):
+                with span("step", "test"):
+                    pass
+
+    assert tracer.get("job-0") is None
+    assert [t["job_id"] for t in tracer.recent()] == ["job-2", "job-1"]
+    assert len(trace.spans) == 2
+    assert trace.dropped == 3
+
+
+@pytest.mark.asyncio
+async def test_use_trace_attaches_code_outside_the_job():
+    """Test a long-running loop can record into the trace of the job it serves."""
+    tracer = Tracer()
+    with tracer.trace("job-1", "speak") as trace:
+        pass
+
+    with use_trace(trace):
+        with span("servo.move", "servo"):
+            pass
+    with use_trace(None):
+        with span("ignored", "servo"):
+            pass
+
+    assert [s.name for s in trace.spans] == ["servo.move"]
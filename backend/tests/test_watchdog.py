@@ -0,0 +1,108 @@
+"""Tests for the event-loop and servo deadline watchdog."""
+
+import asyncio
+import logging
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from backend.core.scheduler import TickScheduler
+from backend.core.watchdog import Watchdog
+from backend.hardware.models import PinSet
+from backend.hardware.servo import Servo
+
+
+def test_brakes_moves_past_deadline_and_grace():
+    """Test only moves overrunning their deadline by more than the grace are braked."""
+    watchdog = Watchdog(grace=0.05)
+    late, on_time = MagicMock(), MagicMock()
+    watchdog.arm("late", 10.0, late)
+    watchdog.arm("on_time", 10.1, on_time)
+
+    watchdog.check(now=10.1)
+
+    late.assert_called_once()
+    on_time.assert_not_called()
+    stats = watchdog.stats()
+    assert stats["forced_brakes"] == 1
+    assert stats["armed"] == 1
+    assert stats["events"][0]["key"] == "late"
+
+
+def test_disarmed_moves_are_not_braked():
+    """Test a move that stopped on its own is forgotten."""
+    watchdog = Watchdog()
+    brake = MagicMock()
+    watchdog.arm("servo", 1.0, brake)
+    watchdog.disarm("servo")
+
+    watchdog.check(now=100.0)
+
+    brake.assert_not_called()
+    assert watchdog.forced_brakes == 0
+
+
+def blocking_call(seconds: float) -> None:
+    """Stand-in for a synchronous call made on the event loop."""
+    time.sleep(seconds)
+
+
+@pytest.mark.asyncio
+async def test_stall_is_logged_with_blocking_stack(caplog):
+    """Test a stalled loop is detected from its overdue ticks and logged with the stack."""
+    ticks = TickScheduler()
+    watchdog = Watchdog(stall_threshold=0.05, ticks=ticks)
+    ticker = ticks.ticker(50, "control")
+
+    async def control_loop() -> None:
+        while True:
+            await ticker.tick()
+
+    task = asyncio.create_task(control_loop())
+    await asyncio.sleep(0.05)
+    with caplog.at_level(logging.WARNING, logger="backend.core.watchdog"):
+        watchdog.start()
+        blocking_call(0.3)
+        await asyncio.sleep(0.15)
+        watchdog.stop()
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert watchdog.stalls == 1
+    assert watchdog.max_lag >= 0.2
+    messages = [record.getMessage() for record in caplog.records]
+    assert "blocking_call" in messages[0]
+    assert "test_stall_is_logged_with_blocking_stack" in messages[0]
+    assert "recovered" in messages[1]
+    assert watchdog.stats()["events"][0]["kind"] == "stall"
+
+
+@pytest.mark.asyncio
+async def test_servo_braked_while_loop_stalled(mock_gpio_manager):
+    """Test a move left driving by a stalled loop is braked from the watchdog thread."""
+    servo = Servo(
+        name="mouth",
+        pins=PinSet(pwm=21, dir=16, cdir=20),
+        speed=100,
+        default_duration=0.4,
+        gpio_manager=mock_gpio_manager,
+    )
+    await servo.initialize()
+    watchdog = Watchdog(grace=0.02)
+
+    with patch("backend.hardware.servo.watchdog", watchdog):
+        move = asyncio.create_task(servo.set_position_percent(100, duration=0.1))
+        await asyncio.sleep(0.02)
+        assert mock_gpio_manager.pin_states[16] is True
+
+        watchdog.start()
+        blocking_call(0.3)
+        braked = dict(mock_gpio_manager.pin_states)
+        await move
+        watchdog.stop()
+
+    assert braked[16] is False and braked[20] is False
+    assert watchdog.forced_brakes == 1
+    assert watchdog.stats()["armed"] == 0
+    assert servo.position_percent == 100
@@ -0,0 +1 @@
+"""Performance benchmarks for Raspi Ruxpin (run with ``make bench``)."""
@@ -0,0 +1,134 @@
+"""Benchmark per-bear overhead as the number of hosted bears grows.
+
+Starts N bears on mock GPIO, lets them idle (talk monitor polling, blink
+monitor) and then has every bear speak the same phrase at once. Reports
+event-loop lag, start-up time and how many TTS syntheses the shared cache
+actually ran.
+
+Usage:
+    HARDWARE__USE_MOCK_GPIO=true python -m benchmarks.bench_bears [max_bears]
+"""
+
+import asyncio
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from backend.config import AppSettings, AudioSettings, BearSettings, TTSSettings
+from backend.core.enums import ActuatorRole
+from backend.hardware.gpio_manager import GPIOManager
+from backend.hardware.models import PinSet, ServoConfig
+from backend.services.bear_registry import BearRegistry
+
+
+def build_settings(n: int, workdir: Path) -> AppSettings:
+    """Build settings for ``n`` bears on distinct (virtual) pins.
+
+    Pin numbers go past the header's 27 GPIOs, which mock GPIO does not mind,
+    so pin sets are constructed without range validation.
+    """
+    bears = []
+    for i in range(n):
+        base = i * 6
+        bears.append(
+            BearSettings(
+                id=f"bear{i}",
+                actuators=[
+                    ServoConfig(
+                        name="mouth",
+                        role=ActuatorRole.MOUTH,
+                        pins=PinSet.model_construct(pwm=base, dir=base + 1, cdir=base + 2),
+                        duration=0.05,
+                    ),
+                    ServoConfig(
+                        name="eyes",
+                        role=ActuatorRole.EYES,
+                        pins=PinSet.model_construct(pwm=base + 3, dir=base + 4, cdir=base + 5),
+                        duration=0.05,
+                    ),
+                ],
+            )
+        )
+
+    sounds_dir = workdir / "sounds"
+    sounds_dir.mkdir(exist_ok=True)
+    return AppSettings(
+        environment="testing",
+        calibration_file=workdir / "calibration.yaml",
+        audio=AudioSettings(sounds_dir=sounds_dir),
+        tts=TTSSettings(engine="espeak", output_dir=workdir / "tts"),
+        bears=bears,
+    )
+
+
+async def measure_lag(duration: float, interval: float = 0.01) -> list[float]:
+    """Sample event-loop lag (ms) for ``duration`` seconds."""
+    loop = asyncio.get_running_loop()
+    samples = []
+    end = loop.time() + duration
+    while loop.time() < end:
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        samples.append((loop.time() - expected) * 1000)
+    return samples
+
+
+async def run(n: int, workdir: Path) -> dict[str, float]:
+    """Run one benchmark round with ``n`` bears."""
+    gpio_manager = GPIOManager(use_mock=True)
+    gpio_manager.initialize()
+    registry = BearRegistry(build_settings(n, workdir), gpio_manager)
+
+    synth_calls = 0
+
+    async def fake_synthesize(text: str, output_file: Path) -> None:
+        nonlocal synth_calls
+        synth_calls += 1
+        await asyncio.sleep(0.05)
+        output_file.write_bytes(b"")
+
+    for bear in registry.bears.values():
+        bear.audio_player._synthesize = fake_synthesize
+
+    started = time.perf_counter()
+    await registry.start()
+    start_ms = (time.perf_counter() - started) * 1000
+
+    lag = await measure_lag(1.0)
+
+    await asyncio.gather(
+        *(bear.audio_player.generate_tts("hello there") for bear in registry.bears.values())
+    )
+
+    await registry.stop()
+    gpio_manager.cleanup_all()
+
+    return {
+        "start_ms": start_ms,
+        "lag_mean_ms": statistics.mean(lag),
+        "lag_max_ms": max(lag),
+        "tts_runs": synth_calls,
+    }
+
+
+async def main(max_bears: int) -> None:
+    """Run the benchmark for 1..max_bears bears (doubling)."""
+    logging.disable(logging.CRITICAL)
+    print(f"{'bears':>5} {'start ms':>9} {'lag mean ms':>12} {'lag max ms':>11} {'tts runs':>9}")
+
+    n = 1
+    while n <= max_bears:
+        with TemporaryDirectory() as tmp:
+            result = await run(n, Path(tmp))
+        print(
+            f"{n:>5} {result['start_ms']:>9.1f} {result['lag_mean_ms']:>12.2f} "
+            f"{result['lag_max_ms']:>11.2f} {result['tts_runs']:>9}"
+        )
+        n *= 2
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 8))
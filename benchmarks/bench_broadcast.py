@@ -0,0 +1,124 @@
+"""Benchmark WebSocket broadcast fan-out with many simulated clients.
+
+Compares the previous sequential ``send_json`` loop with the serialize-once,
+per-client-queued ``ConnectionManager``. One client in every round is slow
+(bad Wi-Fi); the rest are fast. Reports how long each broadcast call holds up
+the caller (the 10 Hz state loop) and the delivery latency seen by fast
+clients.
+
+Usage:
+    python -m benchmarks.bench_broadcast
+"""
+
+import asyncio
+import logging
+import statistics
+import time
+from typing import Any
+
+from backend.api.websocket import ConnectionManager
+
+FRAMES = 20
+FAST_SEND = 0.0002
+SLOW_SEND = 0.05
+
+
+class SimulatedClient:
+    """Client whose sends take a fixed time and record delivery latency."""
+
+    def __init__(self, send_time: float) -> None:
+        self.send_time = send_time
+        self.latencies: list[float] = []
+
+    async def accept(self) -> None:
+        pass
+
+    async def close(self, code: int = 1000) -> None:
+        pass
+
+    async def _deliver(self, sent_at: float) -> None:
+        await asyncio.sleep(self.send_time)
+        self.latencies.append(time.perf_counter() - sent_at)
+
+    async def send_json(self, message: dict[str, Any]) -> None:
+        await self._deliver(message["data"]["sent_at"])
+
+    async def send_text(self, frame: str) -> None:
+        # sent_at is the last field of the frame
+        await self._deliver(float(frame.rsplit(":", 1)[1].rstrip("}")))
+
+
+def make_state(sent_at: float) -> dict[str, Any]:
+    """Build a state frame similar in size to ``get_state()``."""
+    return {
+        "type": "bear_state",
+        "data": {
+            "eyes": "open",
+            "mouth": "closed",
+            "eyes_position": 100,
+            "mouth_position": 12,
+            "actuators": {
+                "mouth": {"role": "mouth", "state": "closed", "position": 12},
+                "eyes": {"role": "eyes", "state": "open", "position": 100},
+            },
+            "is_busy": False,
+            "volume": 80,
+            "blink_enabled": True,
+            "character": "teddy",
+            "sent_at": sent_at,
+        },
+    }
+
+
+async def sequential_broadcast(clients: list[SimulatedClient], message: dict[str, Any]) -> None:
+    """Previous implementation: await each client's send_json in turn."""
+    for client in clients:
+        await client.send_json(message)
+
+
+async def run(n: int, mode: str) -> dict[str, float]:
+    """Broadcast FRAMES frames at 10 Hz to ``n`` clients (one slow)."""
+    clients = [SimulatedClient(SLOW_SEND)] + [SimulatedClient(FAST_SEND) for _ in range(n - 1)]
+    manager = ConnectionManager()
+    if mode == "fanout":
+        for client in clients:
+            await manager.connect(client)
+
+    call_times = []
+    for _ in range(FRAMES):
+        started = time.perf_counter()
+        message = make_state(started)
+        if mode == "fanout":
+            await manager.broadcast(message, key="bear_state")
+        else:
+            await sequential_broadcast(clients, message)
+        call_times.append(time.perf_counter() - started)
+        await asyncio.sleep(max(0.0, 0.1 - call_times[-1]))
+
+    await asyncio.sleep(0.2)
+    for client in clients:
+        manager.disconnect(client)
+
+    fast = [latency for client in clients[1:] for latency in client.latencies]
+    return {
+        "call_ms": 1000 * statistics.mean(call_times),
+        "fast_p50_ms": 1000 * statistics.median(fast),
+        "fast_p95_ms": 1000 * statistics.quantiles(fast, n=20)[-1],
+    }
+
+
+async def main() -> None:
+    """Run both implementations for increasing client counts."""
+    logging.disable(logging.CRITICAL)
+    print(f"{'clients':>7} {'mode':>10} {'call ms':>9} {'fast p50 ms':>12} {'fast p95 ms':>12}")
+    for n in (10, 50, 100, 200):
+        for mode in ("sequential", "fanout"):
+            result = await run(n, mode)
+            print(
+                f"{n:>7} {mode:>10} {result['call_ms']:>9.2f} "
+                f"{result['fast_p50_ms']:>12.2f} {result['fast_p95_ms']:>12.2f}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
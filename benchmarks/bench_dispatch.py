@@ -0,0 +1,93 @@
+"""Benchmark WebSocket message parse and dispatch overhead.
+
+Compares the previous routing (``json.loads``, an ``if/elif`` chain on
+``type`` and ``Model(**data)``) with the pre-built discriminated-union
+``TypeAdapter`` and handler registry, for high-rate puppet input
+(``update_bear``, first in the chain) and a message at the end of the chain.
+
+Usage:
+    python -m benchmarks.bench_dispatch
+"""
+
+import json
+import timeit
+
+from pydantic import BaseModel
+
+from backend.api.websocket import (
+    MESSAGE_HANDLERS,
+    FetchPhrasesMessage,
+    GetGPIOStatusMessage,
+    PlayMessage,
+    ReplayMessage,
+    ResumeMessage,
+    SetBlinkEnabledMessage,
+    SetCharacterMessage,
+    SetLogLevelMessage,
+    SetTelemetryMessage,
+    SetVolumeMessage,
+    SpeakMessage,
+    StartRecordingMessage,
+    StopRecordingMessage,
+    UpdateBearMessage,
+    parse_message,
+)
+
+ITERATIONS = 50000
+
+# Order of the previous if/elif chain
+CHAIN: list[tuple[str, type[BaseModel]]] = [
+    ("update_bear", UpdateBearMessage),
+    ("speak", SpeakMessage),
+    ("play", PlayMessage),
+    ("set_volume", SetVolumeMessage),
+    ("fetch_phrases", FetchPhrasesMessage),
+    ("set_blink_enabled", SetBlinkEnabledMessage),
+    ("set_character", SetCharacterMessage),
+    ("set_log_level", SetLogLevelMessage),
+    ("get_gpio_status", GetGPIOStatusMessage),
+    ("set_telemetry", SetTelemetryMessage),
+    ("resume", ResumeMessage),
+    ("start_recording", StartRecordingMessage),
+    ("stop_recording", StopRecordingMessage),
+    ("replay", ReplayMessage),
+]
+
+MESSAGES = {
+    "update_bear": json.dumps(
+        {"type": "update_bear", "actuators": {"mouth": "open", "eyes": "closed"}}
+    ),
+    "replay": json.dumps({"type": "replay", "name": "greeting"}),
+}
+
+
+def chain_dispatch(raw: str) -> BaseModel:
+    """Route a message the way the previous ``if/elif`` chain did."""
+    data = json.loads(raw)
+    message_type = data.get("type")
+    for name, model in CHAIN:
+        if message_type == name:
+            return model(**data)
+    raise ValueError(message_type)
+
+
+def registry_dispatch(raw: str) -> BaseModel:
+    """Route a message through the adapter and handler registry."""
+    message = parse_message(raw)
+    MESSAGE_HANDLERS[message.type]
+    return message
+
+
+def main() -> None:
+    """Measure both routings per message type."""
+    print(f"{'message':<14} {'if/elif us':>11} {'registry us':>12}")
+    for name, raw in MESSAGES.items():
+        chain = timeit.timeit(lambda: chain_dispatch(raw), number=ITERATIONS)
+        registry = timeit.timeit(lambda: registry_dispatch(raw), number=ITERATIONS)
+        print(
+            f"{name:<14} {1e6 * chain / ITERATIONS:>11.2f} {1e6 * registry / ITERATIONS:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
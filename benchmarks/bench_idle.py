@@ -0,0 +1,89 @@
+"""Benchmark an unused bear with and without idle power mode.
+
+Starts one bear on mock GPIO with no client connected and nothing playing,
+and measures it once the quiet period is over:
+
+- idle mode off (``idle_timeout=0``): blinking keeps polling and moving the
+  eyes, and the PWM instances stay allocated
+- idle mode on: blinking is suspended and the PWM instances released
+
+Each is run with blinking enabled and disabled. Reports blocking
+event-loop wakeups and CPU time per second and the PWM instances held,
+then how long the next command takes to wake the bear.
+
+Usage:
+    HARDWARE__USE_MOCK_GPIO=true python -m benchmarks.bench_idle
+"""
+
+import asyncio
+import logging
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from backend.core.enums import PowerState
+from backend.hardware.gpio_manager import GPIOManager
+from backend.services.bear_registry import BearRegistry
+from benchmarks.bench_bears import build_settings
+from benchmarks.bench_scheduler import count_sleeps
+
+IDLE_TIMEOUT = 0.5
+DURATION = 8.0
+
+
+async def run(idle_mode: bool, blink: bool, workdir: Path) -> dict[str, float]:
+    """Measure one unused bear."""
+    settings = build_settings(1, workdir)
+    settings.hardware.idle_timeout = IDLE_TIMEOUT if idle_mode else 0
+    gpio_manager = GPIOManager(use_mock=True)
+    gpio_manager.initialize()
+    registry = BearRegistry(settings, gpio_manager)
+    await registry.start()
+    bear = registry.default
+    bear.set_blink_enabled(blink)
+
+    await asyncio.sleep(IDLE_TIMEOUT + 0.5)
+    wakeups = count_sleeps(asyncio.get_running_loop())
+    start = wakeups[0]
+    cpu_start = time.process_time()
+    await asyncio.sleep(DURATION)
+    cpu = time.process_time() - cpu_start
+    result = {
+        "wakeups": (wakeups[0] - start) / DURATION,
+        "cpu_ms_per_s": 1000 * cpu / DURATION,
+        "pwms": len(gpio_manager.active_pwms),
+        "wake_us": 0.0,
+    }
+
+    if bear.power_state == PowerState.IDLE:
+        wake_start = time.perf_counter()
+        bear.puppet({"mouth": 50})
+        result["wake_us"] = 1e6 * (time.perf_counter() - wake_start)
+
+    await registry.stop()
+    gpio_manager.cleanup_all()
+    return result
+
+
+async def main() -> None:
+    """Run every combination."""
+    logging.disable(logging.CRITICAL)
+    print(f"One unused bear, measured for {DURATION:.0f}s after a {IDLE_TIMEOUT}s quiet period\n")
+    print(
+        f"{'idle mode':<10} {'blink':<6} {'wakeups/s':>10} {'cpu ms/s':>9} {'PWMs held':>10} "
+        f"{'wake us':>8}"
+    )
+    for blink in (True, False):
+        for idle_mode in (False, True):
+            with TemporaryDirectory() as tmp:
+                result = await run(idle_mode, blink, Path(tmp))
+            wake = f"{result['wake_us']:.0f}" if result["wake_us"] else "-"
+            print(
+                f"{'on' if idle_mode else 'off':<10} {'on' if blink else 'off':<6} "
+                f"{result['wakeups']:>10.1f} {result['cpu_ms_per_s']:>9.2f} "
+                f"{result['pwms']:>10} {wake:>8}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,94 @@
+"""Benchmark the cold start of the backend against its import budget.
+
+Imports ``backend.main`` in fresh interpreters with ``python -X importtime``
+and reports, best of a few runs:
+
+- the total import time, and the share spent in the backend's own modules
+  (the rest is FastAPI, Pydantic and the standard library)
+- the slowest backend modules and third-party packages
+- the time ``create_app`` takes once imported (loading settings)
+
+The budget is a share rather than milliseconds so it holds on a desktop
+and on a Pi Zero alike. Importing must also not load the packages that
+are only needed when configured (YAML overrides, Piper, ALSA mixer) or by
+the CLI (uvicorn). Exits with status 1 when over budget.
+
+Usage:
+    HARDWARE__USE_MOCK_GPIO=true python -m benchmarks.bench_import
+"""
+
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+RUNS = 5
+TOP = 5
+
+# Largest share of the import time the backend's own modules may take
+BACKEND_SHARE_BUDGET = 0.25
+
+# Packages importing the app must not load
+DEFERRED = ("yaml", "piper", "alsaaudio", "uvicorn")
+
+IMPORT = "import backend.main"
+CREATE = (
+    "import time, backend.main as m; "
+    "start = time.perf_counter(); m.create_app(); print(time.perf_counter() - start)"
+)
+
+
+def import_times(code: str) -> tuple[dict[str, int], str]:
+    """Run code in a fresh interpreter, returning each module's self time (us) and stdout."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line.removeprefix("import time:").split("|")
+        modules[name.strip()] = int(self_us)
+    return modules, result.stdout
+
+
+def main() -> None:
+    """Measure the import a few times and check it against the budget."""
+    runs = [import_times(IMPORT)[0] for _ in range(RUNS)]
+    best = min(runs, key=lambda modules: sum(modules.values()))
+    total = sum(best.values()) / 1000
+    own = {name: us for name, us in best.items() if name.startswith("backend")}
+    share = sum(own.values()) / 1000 / total
+
+    packages: dict[str, int] = defaultdict(int)
+    for name, us in best.items():
+        if not name.startswith("backend"):
+            packages[name.split(".")[0]] += us
+
+    create = min(float(import_times(CREATE)[1]) for _ in range(RUNS))
+    loaded = [name for name in DEFERRED if name in best]
+
+    print(f"Import of backend.main, best of {RUNS} runs\n")
+    print(f"{'total':<32} {total:>8.1f} ms")
+    print(f"{'backend modules':<32} {sum(own.values()) / 1000:>8.1f} ms ({100 * share:.0f}%)")
+    print(f"{'create_app()':<32} {1000 * create:>8.1f} ms\n")
+    for title, times in (("Slowest backend modules", own), ("Slowest packages", packages)):
+        print(title)
+        for name, us in sorted(times.items(), key=lambda item: -item[1])[:TOP]:
+            print(f"  {name:<30} {us / 1000:>8.1f} ms")
+        print()
+
+    over = share > BACKEND_SHARE_BUDGET
+    print(f"Backend share {100 * share:.0f}% (budget {100 * BACKEND_SHARE_BUDGET:.0f}%)")
+    print(f"Deferred packages loaded: {', '.join(loaded) or 'none'}")
+    if over or loaded:
+        print("OVER BUDGET")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
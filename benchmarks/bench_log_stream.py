@@ -0,0 +1,119 @@
+"""Benchmark log streaming wakeups and frames.
+
+Compares the previous 50 ms polling streamer (one frame per record) with
+the event-driven ``log_stream_loop`` (one ``log_batch`` per flush):
+
+- idle: event-loop wakeups per second with a client connected and no logs
+- burst: frames and bytes sent for a burst of records
+
+Usage:
+    python -m benchmarks.bench_log_stream
+"""
+
+import asyncio
+import logging
+
+from backend.api import websocket as ws_module
+from backend.api.broadcast import encode_frame
+from backend.logging_config import log_store
+
+IDLE_SECONDS = 2.0
+BURST = 500
+
+
+class CountingClient:
+    """Client counting the frames and bytes it receives."""
+
+    def __init__(self) -> None:
+        self.frames = 0
+        self.bytes = 0
+
+    async def accept(self) -> None:
+        pass
+
+    async def close(self, code: int = 1000) -> None:
+        pass
+
+    async def send_text(self, frame: str) -> None:
+        self.frames += 1
+        self.bytes += len(frame)
+
+
+async def polling_stream(manager: ws_module.ConnectionManager) -> None:
+    """Previous implementation: poll for records every 50 ms, one frame each."""
+    cursor = log_store.last_seq
+    while True:
+        entries = log_store.read(after=cursor, limit=1)
+        if not entries:
+            await asyncio.sleep(0.05)
+            continue
+        cursor = entries[0]["seq"]
+        manager.broadcast_frame(encode_frame({"type": "log", "data": entries[0]}))
+
+
+def count_wakeups(loop: asyncio.AbstractEventLoop) -> list[int]:
+    """Count selector wakeups (event-loop iterations that waited for I/O or timers)."""
+    counter = [0]
+    selector = loop._selector  # type: ignore[attr-defined]
+    select = selector.select
+
+    def counting_select(timeout: float | None = None):  # type: ignore[no-untyped-def]
+        counter[0] += 1
+        return select(timeout)
+
+    selector.select = counting_select
+    return counter
+
+
+async def run(mode: str) -> dict[str, float]:
+    """Measure one streamer."""
+    manager = ws_module.get_manager(f"bench-{mode}")
+    client = CountingClient()
+    await manager.connect(client)
+
+    if mode == "polling":
+        stream = asyncio.create_task(polling_stream(manager))
+    else:
+        stream = asyncio.create_task(ws_module.log_stream_loop())
+    await asyncio.sleep(0.1)
+
+    wakeups = count_wakeups(asyncio.get_running_loop())
+    start = wakeups[0]
+    await asyncio.sleep(IDLE_SECONDS)
+    idle = (wakeups[0] - start) / IDLE_SECONDS
+
+    for i in range(BURST):
+        log_store.append({"level": "INFO", "message": f"servo step {i}", "logger": "bench"})
+    await asyncio.sleep(0.5)
+    stats = manager.stats()
+
+    stream.cancel()
+    await asyncio.gather(stream, return_exceptions=True)
+    manager.disconnect(client)
+    ws_module.managers.pop(f"bench-{mode}")
+    return {
+        "idle_wakeups": idle,
+        "frames": stats["sent"] + stats["dropped"],
+        "queue_dropped": stats["dropped"],
+        "bytes": client.bytes,
+    }
+
+
+async def main() -> None:
+    """Run both streamers."""
+    logging.disable(logging.CRITICAL)
+    print(f"{BURST}-record burst to one client (queue size {ws_module.DEFAULT_QUEUE_SIZE})\n")
+    print(
+        f"{'streamer':<9} {'idle wakeups/s':>15} {'frames':>7} {'queue drops':>12} "
+        f"{'bytes sent':>11}"
+    )
+    for mode in ("polling", "batched"):
+        result = await run(mode)
+        print(
+            f"{mode:<9} {result['idle_wakeups']:>15.1f} {result['frames']:>7} "
+            f"{result['queue_dropped']:>12} {result['bytes']:>11}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,67 @@
+"""Benchmark the cost of recording and exposing metrics.
+
+Measures, per call:
+
+- counter increments and histogram observations on a kept series (how the
+  servo and WebSocket hot paths record)
+- the same through a ``labels`` lookup each time
+- a whole GPIO write on mock GPIO, which counts into ``ruxpin_gpio_writes_total``
+
+and the time to render ``/api/metrics`` with every metric of the app
+registered.
+
+Usage:
+    python -m benchmarks.bench_metrics
+"""
+
+import logging
+import timeit
+
+import backend.main  # noqa: F401  (registers every metric of the app)
+from backend.core.metrics import MetricsRegistry, metrics
+from backend.hardware.gpio_manager import GPIOManager
+
+CALLS = 200_000
+
+
+def per_call(stmt: str, setup: dict[str, object]) -> float:
+    """Time one statement in nanoseconds per call (best of 5)."""
+    timer = timeit.Timer(stmt, globals=setup)
+    return min(timer.repeat(5, CALLS)) / CALLS * 1e9
+
+
+def main() -> None:
+    """Run every measurement."""
+    logging.disable(logging.CRITICAL)
+    registry = MetricsRegistry()
+    counter = registry.counter("bench_total", "Bench", ["servo"])
+    histogram = registry.histogram("bench_seconds", "Bench", ["servo"])
+    env = {
+        "counter": counter,
+        "histogram": histogram,
+        "series": counter.labels("mouth"),
+        "hseries": histogram.labels("mouth"),
+    }
+
+    print(f"{'operation':<40} {'ns/call':>8}")
+    for name, stmt in (
+        ("counter inc (kept series)", "series.inc()"),
+        ("histogram observe (kept series)", "hseries.observe(0.003)"),
+        ("counter inc via labels()", "counter.labels('mouth').inc()"),
+        ("histogram observe via labels()", "histogram.labels('mouth').observe(0.003)"),
+    ):
+        print(f"{name:<40} {per_call(stmt, env):>8.0f}")
+
+    manager = GPIOManager(use_mock=True)
+    manager.initialize()
+    manager.setup_pin(16, "OUT")
+    write = per_call("manager.output(16, True)", {"manager": manager})
+    print(f"{'GPIO write on mock GPIO (counted)':<40} {write:>8.0f}")
+
+    families = len(metrics.exposition().split("# TYPE")) - 1
+    render = min(timeit.repeat(metrics.exposition, number=100, repeat=5)) / 100 * 1e6
+    print(f"\n/api/metrics render ({families} metrics): {render:.0f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Benchmark what a live profile capture costs a running show.
+
+Runs a 25Hz mouth loop on the shared scheduler next to a few executor
+threads doing bursts of Python work (standing in for TTS, envelope analysis
+and GPIO calls), and captures a profile of the process for a range of sampling
+intervals. Reports the mouth ticks' lateness (mean, p99, max), the CPU the
+sampling used, and the size of the capture.
+
+Usage:
+    python -m benchmarks.bench_profiler
+"""
+
+import asyncio
+import logging
+import statistics
+import threading
+
+from backend.core.profiler import SamplingProfiler
+from backend.core.scheduler import scheduler
+
+DURATION = 4.0
+INTERVALS = (None, 0.01, 0.005, 0.001)
+WORKERS = 4
+
+# Each worker sorts this many items (about 1ms on a Pi 4), then waits
+WORKER_ITEMS = 2000
+WORKER_WAIT = 0.01
+
+
+def work(stop: threading.Event) -> None:
+    """Alternate bursts of Python work with waits, like an executor thread of the show."""
+    while not stop.wait(WORKER_WAIT):
+        sorted(range(WORKER_ITEMS), key=lambda x: -x)
+
+
+async def run(interval: float | None) -> dict[str, float]:
+    """Run the mouth loop for one configuration, profiling it if an interval is given."""
+    loop = asyncio.get_running_loop()
+    lateness: list[float] = []
+    stop = threading.Event()
+
+    async def mouth() -> None:
+        ticker = scheduler.ticker(25, "mouth")
+        group = scheduler.group(25)
+        while True:
+            index = await ticker.next_tick()
+            lateness.append(loop.time() - index * group.period)  # type: ignore[operator]
+
+    workers = [asyncio.create_task(asyncio.to_thread(work, stop)) for _ in range(WORKERS)]
+    task = asyncio.create_task(mouth())
+    result = {"overhead": 0.0, "samples": 0, "stacks": 0, "kb": 0.0}
+    if interval is None:
+        await asyncio.sleep(DURATION)
+    else:
+        profile = await asyncio.to_thread(
+            SamplingProfiler().capture,
+            DURATION,
+            interval,
+            loop_thread=threading.get_ident(),
+        )
+        result.update(
+            overhead=profile.overhead,
+            samples=profile.samples,
+            stacks=len(profile.stacks),
+            kb=len(profile.collapsed()) / 1024,
+        )
+    stop.set()
+    task.cancel()
+    await asyncio.gather(task, *workers, return_exceptions=True)
+
+    lateness.sort()
+    return {
+        "mean": 1000 * statistics.fmean(lateness),
+        "p99": 1000 * lateness[int(0.99 * (len(lateness) - 1))],
+        "max": 1000 * lateness[-1],
+        **result,
+    }
+
+
+async def main() -> None:
+    """Run every sampling interval and a baseline without profiling."""
+    logging.disable(logging.CRITICAL)
+    print(f"25Hz mouth loop, {WORKERS} executor threads, {DURATION:.0f}s per run\n")
+    print(
+        f"{'interval':<10} {'mean ms':>8} {'p99 ms':>7} {'max ms':>7} "
+        f"{'CPU %':>6} {'samples':>8} {'stacks':>7} {'KiB':>6}"
+    )
+    for interval in INTERVALS:
+        r = await run(interval)
+        label = "off" if interval is None else f"{1000 * interval:g}ms"
+        print(
+            f"{label:<10} {r['mean']:>8.2f} {r['p99']:>7.2f} {r['max']:>7.2f} "
+            f"{100 * r['overhead']:>6.1f} {r['samples']:>8.0f} {r['stacks']:>7.0f} {r['kb']:>6.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
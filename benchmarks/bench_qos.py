@@ -0,0 +1,113 @@
+"""Benchmark mouth sync timing under load with and without QoS shedding.
+
+Simulates a saturated event loop: a 25Hz mouth loop that does almost no
+work next to a 10Hz telemetry loop and a 20Hz log flush loop that each
+burn CPU per tick (standing in for encoding frames to many clients). With
+QoS on, ``QosController`` samples the scheduler's tick lateness and the
+telemetry and log loops follow its policy like the real broadcast loops.
+
+Reports how late mouth ticks fired (mean, p99, max) and how many
+telemetry and log ticks actually did work, plus the level QoS settled at.
+
+Usage:
+    python -m benchmarks.bench_qos
+"""
+
+import asyncio
+import logging
+import statistics
+import time
+
+from backend.core.scheduler import scheduler
+from backend.services.qos import QosController
+
+DURATION = 8.0
+
+# Busy time per working tick, in seconds
+TELEMETRY_WORK = 0.045
+LOG_WORK = 0.03
+
+
+def burn(seconds: float) -> None:
+    """Keep the CPU busy without yielding to the event loop."""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+async def run(controller: QosController | None) -> dict[str, float | str]:
+    """Run the loops for one configuration."""
+    loop = asyncio.get_running_loop()
+    lateness: list[float] = []
+    worked = {"telemetry": 0, "logs": 0}
+
+    async def mouth() -> None:
+        ticker = scheduler.ticker(25, "mouth")
+        group = scheduler.group(25)
+        while True:
+            index = await ticker.next_tick()
+            lateness.append(loop.time() - index * group.period)  # type: ignore[operator]
+
+    async def telemetry() -> None:
+        ticker = scheduler.ticker(10, "telemetry")
+        counter = 0
+        while True:
+            await ticker.tick()
+            divisor = controller.policy.telemetry_divisor if controller else 1
+            counter = (counter + 1) % divisor
+            if counter == 0:
+                burn(TELEMETRY_WORK)
+                worked["telemetry"] += 1
+
+    async def logs() -> None:
+        ticker = scheduler.ticker(20, "logs")
+        while True:
+            divisor = controller.policy.log_divisor if controller else 1
+            for _ in range(divisor or 1):
+                await ticker.tick()
+            while controller and controller.policy.log_divisor is None:
+                await controller.changed()
+            burn(LOG_WORK)
+            worked["logs"] += 1
+
+    tasks = [asyncio.create_task(coro) for coro in (mouth(), telemetry(), logs())]
+    if controller:
+        tasks.append(asyncio.create_task(controller.run()))
+    await asyncio.sleep(DURATION)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    late = sorted(lateness)
+    return {
+        "mean_ms": 1000 * statistics.fmean(late),
+        "p99_ms": 1000 * late[int(0.99 * (len(late) - 1))],
+        "max_ms": 1000 * late[-1],
+        "telemetry": worked["telemetry"] / DURATION,
+        "logs": worked["logs"] / DURATION,
+        "level": controller.policy.name if controller else "-",
+    }
+
+
+async def main() -> None:
+    """Run without and with the QoS controller."""
+    logging.disable(logging.CRITICAL)
+    print(
+        f"Busy loop: {1000 * TELEMETRY_WORK:.0f}ms per telemetry tick at 10Hz, "
+        f"{1000 * LOG_WORK:.0f}ms per log flush at 20Hz, {DURATION:.0f}s\n"
+    )
+    print(
+        f"{'qos':<4} {'mouth late ms':>14} {'p99':>7} {'max':>7} {'telemetry/s':>12} "
+        f"{'logs/s':>7} {'level':>15}"
+    )
+    for controller in (None, QosController()):
+        result = await run(controller)
+        print(
+            f"{'on' if controller else 'off':<4} {result['mean_ms']:>14.1f} "
+            f"{result['p99_ms']:>7.1f} {result['max_ms']:>7.1f} {result['telemetry']:>12.1f} "
+            f"{result['logs']:>7.1f} {result['level']:>15}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
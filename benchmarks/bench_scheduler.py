@@ -0,0 +1,115 @@
+"""Benchmark event-loop wakeups of the periodic control loops.
+
+Runs the control loop timings of one bear as empty loops, once with
+independent ``asyncio.sleep`` timers started at arbitrary phases (the
+previous behaviour) and once on the shared ``TickScheduler``:
+
+- idle: a client connected, nothing playing (before: the mouth sync loop
+  kept ticking; now it is parked until a job starts)
+- talking: amplitude updates, mouth sync, servo position tracking, state
+  broadcast, log flushing and blink polling all active
+
+Reports wakeups (blocking selector calls) and CPU time per second, and for the scheduler
+the worst tick lateness.
+
+Usage:
+    python -m benchmarks.bench_scheduler
+"""
+
+import asyncio
+import logging
+import random
+import time
+
+from backend.core.scheduler import TickScheduler
+
+DURATION = 3.0
+
+TALKING = {"amplitude": 50, "mouth": 25, "servo": 20, "broadcast": 10, "logs": 20, "blink": 2}
+
+# Profile -> (loops before, loops on the scheduler), as loop name -> rate in Hz
+PROFILES: dict[str, tuple[dict[str, float], dict[str, float]]] = {
+    "idle": ({"mouth": 25, "broadcast": 10, "blink": 2}, {"broadcast": 10, "blink": 2}),
+    "talking": (TALKING, TALKING),
+}
+
+
+def count_sleeps(loop: asyncio.AbstractEventLoop) -> list[int]:
+    """Count selector calls that block (the process actually went to sleep)."""
+    counter = [0]
+    selector = loop._selector  # type: ignore[attr-defined]
+    select = selector.select
+
+    def counting_select(timeout: float | None = None):  # type: ignore[no-untyped-def]
+        if timeout is None or timeout > 0:
+            counter[0] += 1
+        return select(timeout)
+
+    selector.select = counting_select
+    return counter
+
+
+async def sleeping_loop(rate: float) -> None:
+    """Previous implementation: sleep a fixed interval from an arbitrary phase."""
+    interval = 1.0 / rate
+    await asyncio.sleep(random.uniform(0, interval))
+    while True:
+        await asyncio.sleep(interval)
+
+
+async def run(loops: dict[str, float], scheduler: TickScheduler | None) -> dict[str, float]:
+    """Run one set of loops and measure wakeups and CPU."""
+    if scheduler is None:
+        tasks = [asyncio.create_task(sleeping_loop(rate)) for rate in loops.values()]
+    else:
+
+        async def ticking_loop(name: str, rate: float) -> None:
+            ticker = scheduler.ticker(rate, name)
+            while True:
+                await ticker.tick()
+
+        tasks = [asyncio.create_task(ticking_loop(n, r)) for n, r in loops.items()]
+    await asyncio.sleep(0.2)
+
+    wakeups = count_sleeps(asyncio.get_running_loop())
+    start = wakeups[0]
+    cpu_start = time.process_time()
+    await asyncio.sleep(DURATION)
+    cpu = time.process_time() - cpu_start
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    jitter = 0.0
+    if scheduler is not None:
+        jitter = max(g["jitter_max_ms"] or 0.0 for g in scheduler.stats().values())
+    return {
+        "wakeups": (wakeups[0] - start) / DURATION,
+        "cpu_ms_per_s": 1000 * cpu / DURATION,
+        "jitter_max_ms": jitter,
+    }
+
+
+async def main() -> None:
+    """Run every profile with both timer implementations."""
+    logging.disable(logging.CRITICAL)
+    print(
+        f"{'profile':<8} {'timers':<10} {'loops':>5} {'wakeups/s':>10} {'cpu ms/s':>9} "
+        f"{'max late ms':>12}"
+    )
+    for profile, (before, after) in PROFILES.items():
+        for timers, loops, scheduler in (
+            ("sleep", before, None),
+            ("scheduler", after, TickScheduler()),
+        ):
+            result = await run(loops, scheduler)
+            late = f"{result['jitter_max_ms']:.2f}" if scheduler else "-"
+            print(
+                f"{profile:<8} {timers:<10} {len(loops):>5} {result['wakeups']:>10.1f} "
+                f"{result['cpu_ms_per_s']:>9.2f} {late:>12}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,53 @@
+"""Benchmark reading and serializing the bear state while idle.
+
+Compares, per reader call on an idle bear:
+- the previous path: ``get_state()`` dict build, wrapped in a
+  ``BearStateResponse``, ``model_dump()``ed and encoded,
+- the shared snapshot: ``get_snapshot()`` plus its cached ``bear_state`` frame.
+
+Usage:
+    HARDWARE__USE_MOCK_GPIO=true python -m benchmarks.bench_snapshot
+"""
+
+import asyncio
+import logging
+import timeit
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from backend.api.broadcast import encode_frame
+from backend.api.websocket import BearStateResponse, snapshot_frame
+from backend.hardware.gpio_manager import GPIOManager
+from backend.services.bear_registry import BearRegistry
+from benchmarks.bench_bears import build_settings
+
+ITERATIONS = 20000
+
+
+async def main() -> None:
+    """Measure both read paths on one idle bear."""
+    logging.disable(logging.CRITICAL)
+    with TemporaryDirectory() as tmp:
+        gpio_manager = GPIOManager(use_mock=True)
+        gpio_manager.initialize()
+        registry = BearRegistry(build_settings(1, Path(tmp)), gpio_manager)
+        bear = next(iter(registry.bears.values()))
+
+        def previous() -> str:
+            state = bear._build_state()
+            response = BearStateResponse(seq=bear.state_seq, epoch=bear.state_epoch, data=state)
+            return encode_frame(response.model_dump())
+
+        def shared() -> str:
+            return snapshot_frame(bear.get_snapshot())
+
+        print(f"{'read path':<28} {'us/call':>8}")
+        for name, read in (("get_state + model (previous)", previous), ("shared snapshot", shared)):
+            seconds = timeit.timeit(read, number=ITERATIONS)
+            print(f"{name:<28} {1e6 * seconds / ITERATIONS:>8.2f}")
+
+        gpio_manager.cleanup_all()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,82 @@
+"""Benchmark startup run step by step against the dependency graph.
+
+Starts bears on mock GPIO, with the startup steps (servos, mouth loops,
+eyes, phrases, mixer, TTS warm-up, envelope preload) run:
+
+- one after another, in the order they are declared, serving once every
+  bear has fully started (the old startup)
+- concurrently as their dependencies allow, serving once every bear's
+  servos and loops are up and finishing the rest in the background
+
+Reports the time until commands can be taken and until every step is done.
+
+Usage:
+    HARDWARE__USE_MOCK_GPIO=true python -m benchmarks.bench_startup
+"""
+
+import asyncio
+import logging
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from backend.core.startup import StepGraph
+from backend.hardware.gpio_manager import GPIOManager
+from backend.services.bear_registry import BearRegistry
+from benchmarks.bench_bears import build_settings
+
+BEAR_COUNTS = (1, 3)
+RUNS = 3
+
+
+async def run(bears: int, concurrent: bool, workdir: Path) -> dict[str, float]:
+    """Start and stop one registry, timing serving and readiness."""
+    gpio_manager = GPIOManager(use_mock=True)
+    gpio_manager.initialize()
+    registry = BearRegistry(build_settings(bears, workdir), gpio_manager)
+
+    start = time.perf_counter()
+    if concurrent:
+        await registry.start(wait_for_ready=False)
+        serving = time.perf_counter() - start
+        await registry.startup.wait()
+    else:
+        graph = StepGraph("sequential")
+        for bear in registry.bears.values():
+            bear.add_startup_steps(graph)
+        player = registry.default.audio_player
+        graph.add("tts", player.warm_up, required=False)
+        graph.add("envelopes", player.preload_envelopes, required=False)
+        for step in graph.steps.values():
+            if step.name == "tts":
+                # Every bear fully started, as ``BearService.start`` used to
+                serving = time.perf_counter() - start
+            try:
+                await step.run()
+            except Exception:
+                if step.required:
+                    raise
+    ready = time.perf_counter() - start
+
+    await registry.stop()
+    gpio_manager.cleanup_all()
+    return {"serving": 1000 * serving, "ready": 1000 * ready}
+
+
+async def main() -> None:
+    """Run every bear count both ways, keeping the best of a few runs."""
+    logging.disable(logging.CRITICAL)
+    print(f"Best of {RUNS} runs\n")
+    print(f"{'bears':>5} {'startup':<11} {'serving ms':>11} {'ready ms':>9}")
+    with TemporaryDirectory() as tmp:
+        for bears in BEAR_COUNTS:
+            for concurrent in (False, True):
+                results = [await run(bears, concurrent, Path(tmp)) for _ in range(RUNS)]
+                serving = min(r["serving"] for r in results)
+                ready = min(r["ready"] for r in results)
+                label = "graph" if concurrent else "sequential"
+                print(f"{bears:>5} {label:<11} {serving:>11.1f} {ready:>9.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,79 @@
+"""Benchmark bytes and CPU per telemetry frame.
+
+Compares what a client receives for one moving-mouth tick:
+- the previous full ``bear_state`` JSON frame (pydantic model + json),
+- a ``bear_state_delta`` JSON frame (``encode_frame``),
+- a binary telemetry frame (``TelemetryCodec``).
+
+Run on the target board (e.g. a Pi Zero) for representative CPU numbers.
+
+Usage:
+    python -m benchmarks.bench_telemetry
+"""
+
+import json
+import timeit
+
+from backend.api.broadcast import encode_frame
+from backend.api.telemetry import TelemetryCodec
+from backend.api.websocket import BearStateDeltaResponse, BearStateResponse
+from backend.core.enums import State
+
+ITERATIONS = 20000
+
+ACTUATORS = ["mouth", "eyes", "head", "left_arm"]
+PINS = {pin: pin % 2 == 0 for pin in (25, 7, 8, 21, 16, 20, 12, 5, 6, 13, 19, 26)}
+
+
+def full_state(mouth: int) -> dict:
+    """Build a full ``get_state()`` dict for a four-actuator rig."""
+    return {
+        "eyes": "open",
+        "mouth": "unknown",
+        "eyes_position": 100,
+        "mouth_position": mouth,
+        "actuators": {
+            "mouth": {"role": "mouth", "state": "unknown", "position": mouth},
+            "eyes": {"role": "eyes", "state": "open", "position": 100},
+            "head": {"role": "head", "state": "closed", "position": 0},
+            "left_arm": {"role": "arms", "state": "closed", "position": 0},
+        },
+        "is_busy": True,
+        "is_recording": False,
+        "volume": 80,
+        "blink_enabled": True,
+        "character": "teddy",
+    }
+
+
+def main() -> None:
+    """Measure each format."""
+    codec = TelemetryCodec(ACTUATORS)
+    state = full_state(42)
+    delta = {
+        "mouth_position": 42,
+        "actuators": {"mouth": {"role": "mouth", "state": "unknown", "position": 42}},
+    }
+    positions = [(42, State.UNKNOWN), (100, State.OPEN), (0, State.CLOSED), (0, State.CLOSED)]
+
+    formats = {
+        "json full (previous)": lambda: json.dumps(BearStateResponse(data=state).model_dump()),
+        "json delta": lambda: encode_frame(
+            BearStateDeltaResponse(seq=1001, base=1000, data=delta).model_dump()
+        ),
+        "binary": lambda: codec.encode(
+            seq=1001, base=1000, positions=positions, amplitude=2400, pins=PINS, busy=True
+        ),
+    }
+
+    print(f"{'format':<22} {'bytes':>6} {'us/frame':>9}")
+    for name, build in formats.items():
+        size = len(build())
+        seconds = timeit.timeit(build, number=ITERATIONS)
+        print(f"{name:<22} {size:>6} {1e6 * seconds / ITERATIONS:>9.2f}")
+
+    print(f"\nbinary frame layout: {codec.schema()['format']} ({codec.size} bytes)")
+
+
+if __name__ == "__main__":
+    main()
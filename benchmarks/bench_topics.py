@@ -0,0 +1,119 @@
+"""Benchmark state loop cost and traffic by client topic subscriptions.
+
+Runs one bear on mock GPIO with its state broadcast loop and a set of
+simulated clients while the mouth is puppeted continuously, once per
+subscription profile:
+
+- everything: the default topics (state, gpio, logs), as before topics existed
+- gpio panel: dashboards only showing GPIO status
+- state 2Hz: state rate-capped to 2 updates per second
+
+Reports the CPU time spent in the process per second and the frames and
+bytes each client received per second.
+
+Usage:
+    HARDWARE__USE_MOCK_GPIO=true python -m benchmarks.bench_topics [clients]
+"""
+
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from backend.api import websocket as ws_module
+from backend.hardware.gpio_manager import GPIOManager
+from backend.services.bear_registry import BearRegistry
+from benchmarks.bench_bears import build_settings
+
+DURATION = 3.0
+
+PROFILES: dict[str, dict[str, float | None]] = {
+    "everything": {"state": None, "gpio": None, "logs": None},
+    "gpio panel": {"gpio": None},
+    "state 2Hz": {"state": 2.0},
+}
+
+
+class CountingClient:
+    """Client counting the frames and bytes it receives."""
+
+    def __init__(self) -> None:
+        self.frames = 0
+        self.bytes = 0
+
+    async def accept(self) -> None:
+        pass
+
+    async def close(self, code: int = 1000) -> None:
+        pass
+
+    async def send_text(self, frame: str) -> None:
+        self.frames += 1
+        self.bytes += len(frame)
+
+    async def send_bytes(self, frame: bytes) -> None:
+        self.frames += 1
+        self.bytes += len(frame)
+
+
+async def run(clients: int, topics: dict[str, float | None], workdir: Path) -> dict[str, float]:
+    """Run one profile and measure CPU and traffic."""
+    gpio_manager = GPIOManager(use_mock=True)
+    gpio_manager.initialize()
+    registry = BearRegistry(build_settings(1, workdir), gpio_manager)
+    await registry.start()
+    bear = next(iter(registry.bears.values()))
+
+    manager = ws_module.get_manager(bear.bear_id)
+    sockets = [CountingClient() for _ in range(clients)]
+    for socket in sockets:
+        await manager.connect(socket)
+        channel = manager.channels[socket]
+        for topic in list(channel.topics):
+            channel.unsubscribe(topic)
+        for topic, rate in topics.items():
+            channel.subscribe(topic, rate)
+
+    loop_task = asyncio.create_task(ws_module.state_broadcast_loop(bear))
+    cpu_start = time.process_time()
+    end = time.perf_counter() + DURATION
+    target = 0
+    while time.perf_counter() < end:
+        target = (target + 7) % 101
+        bear.puppet({"mouth": target})
+        await asyncio.sleep(1 / 30)
+    cpu = time.process_time() - cpu_start
+
+    loop_task.cancel()
+    await asyncio.gather(loop_task, return_exceptions=True)
+    for socket in sockets:
+        manager.disconnect(socket)
+    ws_module.managers.pop(bear.bear_id, None)
+    await registry.stop()
+    gpio_manager.cleanup_all()
+
+    return {
+        "cpu_ms_per_s": 1000 * cpu / DURATION,
+        "frames_per_s": sum(s.frames for s in sockets) / clients / DURATION,
+        "bytes_per_s": sum(s.bytes for s in sockets) / clients / DURATION,
+    }
+
+
+async def main(clients: int) -> None:
+    """Run every subscription profile."""
+    logging.disable(logging.CRITICAL)
+    print(f"{clients} clients, mouth puppeted at 30Hz for {DURATION:.0f}s\n")
+    print(f"{'profile':<12} {'cpu ms/s':>9} {'frames/s':>9} {'bytes/s':>9}  (per client)")
+    for name, topics in PROFILES.items():
+        with TemporaryDirectory() as tmp:
+            result = await run(clients, topics, Path(tmp))
+        print(
+            f"{name:<12} {result['cpu_ms_per_s']:>9.1f} {result['frames_per_s']:>9.1f} "
+            f"{result['bytes_per_s']:>9.0f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 10))
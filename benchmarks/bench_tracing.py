@@ -0,0 +1,55 @@
+"""Benchmark the cost of job span tracing.
+
+Measures, per call:
+
+- a span outside any traced job (every servo move and TTS request made
+  without a job, e.g. puppet input)
+- a span and an instant event recorded into a job's trace
+- exporting a full trace (``MAX_SPANS`` spans) in the Chrome trace format
+
+Usage:
+    python -m benchmarks.bench_tracing
+"""
+
+import json
+import timeit
+
+from backend.core.tracing import MAX_SPANS, Tracer, mark, span, use_trace
+
+CALLS = 200_000
+
+
+def per_call(stmt: str, setup: dict[str, object], calls: int = CALLS) -> float:
+    """Time one statement in nanoseconds per call (best of 5)."""
+    timer = timeit.Timer(stmt, globals=setup)
+    return min(timer.repeat(5, calls)) / calls * 1e9
+
+
+def main() -> None:
+    """Run every measurement."""
+    tracer = Tracer()
+    with tracer.trace("bench", "speak") as trace:
+        pass
+    # Keep recording: the span limit would otherwise turn records into drops
+    trace.max_spans = 10 * CALLS
+    env = {"span": span, "mark": mark}
+
+    print(f"{'operation':<40} {'ns/call':>8}")
+    off = per_call("with span('servo.move', 'servo', servo='mouth'): pass", env)
+    print(f"{'span outside a job':<40} {off:>8.0f}")
+    with use_trace(trace):
+        for name, stmt in (
+            ("span in a job", "with span('servo.move', 'servo', servo='mouth'): pass"),
+            ("instant event in a job", "mark('audio.started', 'audio')"),
+        ):
+            trace.spans.clear()
+            print(f"{name:<40} {per_call(stmt, env):>8.0f}")
+
+    trace.spans = trace.spans[:MAX_SPANS]
+    export = per_call("json.dumps(trace.chrome())", {"json": json, "trace": trace}, calls=20)
+    size = len(json.dumps(trace.chrome())) / 1024
+    print(f"\nChrome export of {MAX_SPANS} spans: {export / 1e6:.1f} ms, {size:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Benchmark servo overrun during event-loop stalls, with and without the watchdog.
+
+Starts a 100ms mouth move on mock GPIO, then blocks the event loop (like a
+synchronous file read or ALSA call would) for a range of stall lengths.
+Reports how long the servo kept driving past its planned stop time: without
+the watchdog until the loop comes back, with it until the watchdog thread
+brakes it.
+
+Also reports the watchdog thread's CPU cost per second while nothing moves.
+
+Usage:
+    python -m benchmarks.bench_watchdog
+"""
+
+import asyncio
+import logging
+import statistics
+import time
+from collections.abc import Callable
+
+from backend.core.watchdog import Watchdog
+from backend.hardware import servo as servo_module
+from backend.hardware.gpio_manager import GPIOManager
+from backend.hardware.models import PinSet
+from backend.hardware.servo import Servo
+
+MOVE = 0.1
+STALLS = (0.05, 0.2, 0.5, 1.0)
+RUNS = 5
+IDLE_DURATION = 3.0
+
+
+async def overrun(stall: float, watchdog: Watchdog | None) -> float:
+    """Measure how long one move drives past its stop time."""
+    gpio_manager = GPIOManager(use_mock=True)
+    gpio_manager.initialize()
+    servo = Servo("mouth", PinSet(pwm=21, dir=16, cdir=20), 100, 0.4, gpio_manager)
+    await servo.initialize()
+
+    braked_at: list[float] = []
+    output = gpio_manager.output
+
+    def recording_output(pin: int, value: bool) -> None:
+        if pin == servo.pins.dir and not value and not braked_at:
+            braked_at.append(time.monotonic())
+        output(pin, value)
+
+    gpio_manager.output = recording_output  # type: ignore[method-assign]
+
+    if watchdog:
+        servo_module.watchdog = watchdog
+        watchdog.start()
+
+    deadlines: list[float] = []
+    target = servo_module.watchdog
+    arm = target.arm
+
+    def recording_arm(key: str, deadline: float, brake: Callable[[], None]) -> None:
+        deadlines.append(deadline)
+        arm(key, deadline, brake)
+
+    target.arm = recording_arm  # type: ignore[method-assign]
+
+    move = asyncio.create_task(servo.set_position_percent(100, duration=MOVE))
+    await asyncio.sleep(0.01)
+    braked_at.clear()
+    time.sleep(stall)  # Blocking call on the event loop
+    await move
+
+    del target.arm
+    if watchdog:
+        watchdog.stop()
+    gpio_manager.cleanup_all()
+    return max(0.0, braked_at[0] - deadlines[0])
+
+
+async def idle_cost() -> float:
+    """Measure the watchdog thread's CPU time per second with nothing armed."""
+    watchdog = Watchdog()
+    watchdog.start()
+    cpu_start = time.process_time()
+    await asyncio.sleep(IDLE_DURATION)
+    watchdog.stop()
+    return 1000 * (time.process_time() - cpu_start) / IDLE_DURATION
+
+
+async def main() -> None:
+    """Run every stall length with and without the watchdog."""
+    logging.disable(logging.CRITICAL)
+    print(f"{1000 * MOVE:.0f}ms servo move, event loop blocked during it, {RUNS} runs\n")
+    print(f"{'stall ms':>8} {'watchdog':<9} {'overrun ms':>11} {'max':>7}")
+    for stall in STALLS:
+        for enabled in (False, True):
+            results = [
+                1000 * await overrun(stall, Watchdog() if enabled else None) for _ in range(RUNS)
+            ]
+            print(
+                f"{1000 * stall:>8.0f} {'on' if enabled else 'off':<9} "
+                f"{statistics.fmean(results):>11.1f} {max(results):>7.1f}"
+            )
+    servo_module.watchdog = Watchdog()
+
+    print(f"\nWatchdog CPU with nothing moving: {await idle_cost():.3f} ms/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -10,6 +10,7 @@ import type {
   Phrases,
   WebSocketMessage,
   BearStateMessage,
+  BearStateDeltaMessage,
   PhrasesMessage,
   ErrorMessage,
 } from '@/types/websocket'
@@ -57,6 +58,10 @@ export function useBear(): BearComposable {
     character: 'teddy',
   })
 
+  // Position in the server's versioned state stream (for deltas and resume)
+  let stateEpoch: string | null = null
+  let stateSeq: number | null = null
+
   // UI state
   const phrases = ref<Phrases>({})
   const currentMode = ref<Mode>(Mode.CONTROL)
@@ -216,11 +221,16 @@ export function useBear(): BearComposable {
     switch (data.type) {
       case 'bear_state':
         const stateMsg = data as BearStateMessage
+        if (stateMsg.seq !== undefined && stateMsg.epoch !== undefined) {
+          stateEpoch = stateMsg.epoch
+          stateSeq = stateMsg.seq
+        }
         bearState.value = {
           eyes: stateMsg.data.eyes,
           mouth: stateMsg.data.mouth,
           eyes_position: stateMsg.data.eyes_position ?? 0,
           mouth_position: stateMsg.data.mouth_position ?? 0,
+          actuators: stateMsg.data.actuators,
           is_busy: stateMsg.data.is_busy,
           volume: stateMsg.data.volume,
           blink_enabled: stateMsg.data.blink_enabled ?? true,
@@ -228,6 +238,26 @@ export function useBear(): BearComposable {
         }
         break
 
+      case 'bear_state_delta':
+        const deltaMsg = data as BearStateDeltaMessage
+        if (deltaMsg.base !== stateSeq) {
+          // Missed a delta (dropped or reconnected): ask for what changed since our seq
+          if (stateEpoch !== null && stateSeq !== null) {
+            ws.send({ type: 'resume', epoch: stateEpoch, seq: stateSeq })
+          }
+          break
+        }
+        const { actuators, ...fields } = deltaMsg.data
+        bearState.value = {
+          ...bearState.value,
+          ...fields,
+          actuators: actuators
+            ? { ...bearState.value.actuators, ...actuators }
+            : bearState.value.actuators,
+        }
+        stateSeq = deltaMsg.seq
+        break
+
       case 'phrases':
         const phrasesMsg = data as PhrasesMessage
         phrases.value = phrasesMsg.data
@@ -275,6 +305,13 @@ export function useBear(): BearComposable {
     // Preload all bear images immediately
     preloadImages()
 
+    // Resume from the last applied state on reconnect instead of a full snapshot
+    ws.setQueryProvider(() =>
+      stateEpoch !== null && stateSeq !== null
+        ? { epoch: stateEpoch, since: String(stateSeq) }
+        : {}
+    )
+
     // Connect to WebSocket
     ws.connect()
 
@@ -13,6 +13,7 @@ export interface WebSocketComposable {
   send: (message: any) => void
   on: (event: string, callback: (data: any) => void) => void
   off: (event: string, callback?: (data: any) => void) => void
+  setQueryProvider: (provider: (() => Record<string, string>) | null) => void
 }
 
 // Shared WebSocket instance (singleton)
@@ -24,6 +25,8 @@ let reconnectAttempts = 0
 const maxReconnectDelay = 5000
 const baseReconnectDelay = 1000
 let shouldReconnect = true
+// Extra query parameters added on every (re)connect, e.g. state resume position
+let queryProvider: (() => Record<string, string>) | null = null
 
 /**
  * Composable for managing WebSocket connection (singleton pattern)
@@ -46,7 +49,8 @@ export function useWebSocket(url: string = '/ws'): WebSocketComposable {
     // Build WebSocket URL
     const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:'
     const host = window.location.host
-    const wsUrl = `${protocol}//${host}${url}`
+    const query = queryProvider ? new URLSearchParams(queryProvider()).toString() : ''
+    const wsUrl = `${protocol}//${host}${url}${query ? `?${query}` : ''}`
 
     console.log('Connecting to WebSocket:', wsUrl)
 
@@ -167,6 +171,13 @@ export function useWebSocket(url: string = '/ws'): WebSocketComposable {
     }
   }
 
+  /**
+   * Set a provider for extra query parameters sent on every (re)connect
+   */
+  const setQueryProvider = (provider: (() => Record<string, string>) | null) => {
+    queryProvider = provider
+  }
+
   // Note: Don't auto-disconnect on unmount for singleton pattern
   // The connection should persist across component lifecycle
 
@@ -178,5 +189,6 @@ export function useWebSocket(url: string = '/ws'): WebSocketComposable {
     send,
     on,
     off,
+    setQueryProvider,
   }
 }
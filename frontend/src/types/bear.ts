@@ -18,10 +18,18 @@ export interface BearPosition {
   mouth: State
 }
 
+export interface ActuatorState {
+  role: 'mouth' | 'eyes' | 'head' | 'arms'
+  state: State
+  position: number // 0-100
+}
+
 export interface BearState extends BearPosition {
   eyes_position: number // 0-100
   mouth_position: number // 0-100
+  actuators?: Record<string, ActuatorState>
   is_busy: boolean
+  is_recording?: boolean
   volume: number
   blink_enabled: boolean
   character: string // 'teddy' or 'grubby'
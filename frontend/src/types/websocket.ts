@@ -2,10 +2,11 @@
  * WebSocket message types
  */
 
-import type { State } from './bear'
+import type { ActuatorState, State } from './bear'
 
 export enum MessageType {
   UPDATE_BEAR = 'update_bear',
+  PUPPET = 'puppet',
   SPEAK = 'speak',
   PLAY = 'play',
   SET_VOLUME = 'set_volume',
@@ -14,12 +15,27 @@ export enum MessageType {
   SET_CHARACTER = 'set_character',
   SET_LOG_LEVEL = 'set_log_level',
   GET_GPIO_STATUS = 'get_gpio_status',
+  START_RECORDING = 'start_recording',
+  STOP_RECORDING = 'stop_recording',
+  REPLAY = 'replay',
+  RESUME = 'resume',
+  SET_TELEMETRY = 'set_telemetry',
+  TELEMETRY_SCHEMA = 'telemetry_schema',
+  SUBSCRIBE = 'subscribe',
+  UNSUBSCRIBE = 'unsubscribe',
+  SUBSCRIPTIONS = 'subscriptions',
+  METRICS = 'metrics',
+  JOB = 'job',
+  ACK = 'ack',
+  COMMAND_COMPLETE = 'command_complete',
   BEAR_STATE = 'bear_state',
+  BEAR_STATE_DELTA = 'bear_state_delta',
   PHRASES = 'phrases',
   GPIO_STATUS = 'gpio_status',
   ERROR = 'error',
   SUCCESS = 'success',
-  LOG = 'log',
+  LOG_BATCH = 'log_batch',
+  LOG_HISTORY = 'log_history',
 }
 
 // Outgoing messages
@@ -27,16 +43,25 @@ export interface UpdateBearMessage {
   type: MessageType.UPDATE_BEAR
   eyes?: State
   mouth?: State
+  actuators?: Record<string, State>
+  id?: string
+}
+
+export interface PuppetMessage {
+  type: MessageType.PUPPET
+  targets: Record<string, number>
 }
 
 export interface SpeakMessage {
   type: MessageType.SPEAK
   text: string
+  id?: string
 }
 
 export interface PlayMessage {
   type: MessageType.PLAY
   sound: string
+  id?: string
 }
 
 export interface SetVolumeMessage {
@@ -67,8 +92,50 @@ export interface GetGPIOStatusMessage {
   type: MessageType.GET_GPIO_STATUS
 }
 
+export interface ResumeMessage {
+  type: MessageType.RESUME
+  epoch: string
+  seq: number
+}
+
+export interface SetTelemetryMessage {
+  type: MessageType.SET_TELEMETRY
+  format: 'json' | 'binary'
+}
+
+export type Topic = 'state' | 'gpio' | 'logs' | 'metrics' | 'jobs'
+
+export interface SubscribeMessage {
+  type: MessageType.SUBSCRIBE
+  topics: Topic[]
+  max_rate?: Partial<Record<'state' | 'gpio' | 'metrics', number>>
+  log_history?: number
+  log_level?: 'DEBUG' | 'INFO' | 'WARNING' | 'ERROR' | 'CRITICAL'
+}
+
+export interface UnsubscribeMessage {
+  type: MessageType.UNSUBSCRIBE
+  topics: Topic[]
+}
+
+export interface StartRecordingMessage {
+  type: MessageType.START_RECORDING
+}
+
+export interface StopRecordingMessage {
+  type: MessageType.STOP_RECORDING
+  name?: string
+}
+
+export interface ReplayMessage {
+  type: MessageType.REPLAY
+  name: string
+  id?: string
+}
+
 // Incoming messages
 export interface LogMessage {
+  seq: number
   timestamp: number
   level: string
   logger: string
@@ -80,18 +147,29 @@ export interface LogMessage {
 }
 export interface BearStateMessage {
   type: MessageType.BEAR_STATE
+  seq?: number
+  epoch?: string
   data: {
     eyes: State
     mouth: State
     eyes_position: number
     mouth_position: number
+    actuators: Record<string, ActuatorState>
     is_busy: boolean
+    is_recording: boolean
     volume: number
     blink_enabled: boolean
     character: string
   }
 }
 
+export interface BearStateDeltaMessage {
+  type: MessageType.BEAR_STATE_DELTA
+  seq: number
+  base: number
+  data: Partial<BearStateMessage['data']>
+}
+
 export interface PhrasesMessage {
   type: MessageType.PHRASES
   data: Phrases
@@ -107,9 +185,15 @@ export interface SuccessMessage {
   message: string
 }
 
-export interface LogMessageResponse {
-  type: MessageType.LOG
-  data: LogMessage
+export interface LogBatchMessage {
+  type: MessageType.LOG_BATCH
+  data: LogMessage[]
+  dropped: number
+}
+
+export interface LogHistoryMessage {
+  type: MessageType.LOG_HISTORY
+  data: LogMessage[]
 }
 
 export interface GPIOStatusMessage {
@@ -119,12 +203,62 @@ export interface GPIOStatusMessage {
   }
 }
 
+export interface TelemetrySchemaMessage {
+  type: MessageType.TELEMETRY_SCHEMA
+  data: {
+    version: number
+    format: string
+    size: number
+    actuators: string[]
+    states: Record<State, number>
+  }
+}
+
+export interface CommandAckMessage {
+  type: MessageType.ACK
+  id: string
+  command: string
+}
+
+export interface CommandCompleteMessage {
+  type: MessageType.COMMAND_COMPLETE
+  id: string
+  command: string
+  status: 'done' | 'failed' | 'rejected'
+  error?: string | null
+}
+
+export interface SubscriptionsMessage {
+  type: MessageType.SUBSCRIPTIONS
+  data: Partial<Record<Topic, number | null>>
+}
+
+export interface MetricsMessage {
+  type: MessageType.METRICS
+  data: Record<string, unknown>
+}
+
+export interface JobMessage {
+  type: MessageType.JOB
+  id: string | null
+  command: string
+  status: 'running' | 'done' | 'failed'
+}
+
 export type WebSocketMessage =
   | BearStateMessage
+  | BearStateDeltaMessage
   | PhrasesMessage
   | GPIOStatusMessage
   | ErrorMessage
   | SuccessMessage
-  | LogMessageResponse
+  | LogBatchMessage
+  | LogHistoryMessage
+  | TelemetrySchemaMessage
+  | CommandAckMessage
+  | CommandCompleteMessage
+  | SubscriptionsMessage
+  | MetricsMessage
+  | JobMessage
 
 export type Phrases = Record<string, string>